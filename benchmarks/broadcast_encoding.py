@@ -0,0 +1,112 @@
+"""
+Compare the CPU cost of encoding one broadcast per recipient against encoding it once for the whole room.
+
+The per recipient path is what `send_json` did for every client, `model_dump(mode="json")` once and then `json.dumps`
+for each socket. The encode once path is `EncodedWebSocketMessage.encode` followed by queueing the same text for every
+socket. Both are timed for a cursor move and an element patch, against the room size. Needs no database.
+
+Usage:
+    python -m benchmarks.broadcast_encoding [iterations]
+"""
+
+import collections
+import json
+import statistics
+import sys
+import time
+import typing as t
+
+from src.common.models import ElementPatchModel, ShapeType, UserRole
+from src.common.websocket.message import (
+    CursorPosition,
+    EncodedWebSocketMessage,
+    IWebSocketMessage,
+    Sender,
+    UserCursor,
+    WebSocketMessage,
+    WebSocketMessagePayload,
+)
+from src.utils.common import generate_uuid
+
+ROOM_SIZES = (1, 10, 50, 200)
+
+
+def make_sender() -> Sender:
+    return Sender(id=generate_uuid(), username="user", email="user@example.com", role=UserRole.OrganizationMember)
+
+
+def make_messages() -> dict[str, IWebSocketMessage]:
+    sender = make_sender()
+    return {
+        "cursor": WebSocketMessage.ReceiveUserCursorUpdatedMessage(
+            payload=WebSocketMessagePayload.ReceiveUserCursorUpdatedMessagePayload(
+                sender=sender,
+                user_cursor=UserCursor(
+                    id=generate_uuid(),
+                    user_id=sender.id,
+                    email=sender.email,
+                    username=sender.username,
+                    position=CursorPosition(x=412.5, y=-87.25),
+                ),
+            )
+        ),
+        "patch": WebSocketMessage.ReceiveElementPatchedMessage(
+            payload=WebSocketMessagePayload.ReceiveElementPatchedMessagePayload(
+                sender=sender,
+                patched_element_id=generate_uuid(),
+                patch=ElementPatchModel(
+                    shape_type=ShapeType.Line, changes={"x": 10, "y": 20, "points": list(range(200))}
+                ),
+            )
+        ),
+    }
+
+
+def send_per_recipient(message: IWebSocketMessage, sockets: list[collections.deque]) -> None:
+    data = message.model_dump(mode="json", by_alias=False, exclude_none=True)
+    for socket in sockets:
+        # NOTE: what `WebSocket.send_json` runs before writing the text
+        socket.append(json.dumps(data, separators=(",", ":"), ensure_ascii=False))
+
+
+def send_encoded_once(message: IWebSocketMessage, sockets: list[collections.deque]) -> None:
+    encoded_message = EncodedWebSocketMessage.encode(message)
+    for socket in sockets:
+        socket.append(encoded_message.text)
+
+
+def measure(iterations: int, fn: t.Callable[[], t.Any]) -> list[float]:
+    durations: list[float] = []
+    for _ in range(iterations):
+        start = time.process_time()
+        fn()
+        durations.append((time.process_time() - start) * 1_000_000)
+    return durations
+
+
+def report(label: str, durations: list[float]) -> None:
+    quantiles = statistics.quantiles(durations, n=100)
+    print(
+        f"{label:<32} mean={statistics.mean(durations):9.1f}us "
+        f"p50={quantiles[49]:9.1f}us p95={quantiles[94]:9.1f}us p99={quantiles[98]:9.1f}us"
+    )
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    for name, message in make_messages().items():
+        for room_size in ROOM_SIZES:
+            # NOTE: bounded like the outbound queues, so memory stays flat whatever the iteration count
+            sockets = [collections.deque(maxlen=16) for _ in range(room_size)]
+            report(
+                f"per recipient {name} ({room_size})",
+                measure(iterations, lambda: send_per_recipient(message, sockets)),
+            )
+            report(
+                f"encode once {name} ({room_size})",
+                measure(iterations, lambda: send_encoded_once(message, sockets)),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Compare element write latency of the embedded `design_projects.elements` array against the `design_elements`
+collection as a project grows.
+
+Usage:
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.design_element_writes [iterations]
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import typing as t
+
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.common.models import RectangleModel
+from src.constants.mongo import CollectionName
+from src.utils.common import generate_uuid
+from src.utils.design_element import to_element_document
+
+DATABASE_NAME = "benchmark_design_element_writes"
+ELEMENT_COUNTS = (100, 10_000, 100_000)
+INSERT_BATCH_SIZE = 10_000
+# NOTE: larger canvases no longer fit in one 16 MB project document, which is the point of the collection
+MAX_EMBEDDED_ELEMENTS = 50_000
+
+
+async def seed(db: AsyncDatabase, count: int) -> tuple[t.Any, list[t.Any]]:
+    await db.drop_collection(CollectionName.DESIGN_PROJECTS)
+    await db.drop_collection(CollectionName.DESIGN_ELEMENTS)
+
+    project_id = generate_uuid()
+    organization_id = generate_uuid()
+    elements = [RectangleModel(x=i, y=i, width=10, height=10) for i in range(count)]
+
+    if count <= MAX_EMBEDDED_ELEMENTS:
+        await db[CollectionName.DESIGN_PROJECTS].insert_one(
+            {
+                "_id": project_id,
+                "organization_id": organization_id,
+                "elements": [element.model_dump(by_alias=True, exclude_none=True) for element in elements],
+            }
+        )
+    for start in range(0, count, INSERT_BATCH_SIZE):
+        await db[CollectionName.DESIGN_ELEMENTS].insert_many(
+            [
+                to_element_document(element, project_id, organization_id)
+                for element in elements[start : start + INSERT_BATCH_SIZE]
+            ]
+        )
+    await db[CollectionName.DESIGN_ELEMENTS].create_index([("project_id", 1), ("_id", 1)], unique=True)
+    return project_id, [element.id for element in elements]
+
+
+async def embedded_update(db: AsyncDatabase, project_id: t.Any, element_id: t.Any) -> None:
+    await db[CollectionName.DESIGN_PROJECTS].update_one(
+        {"_id": project_id, "elements._id": element_id}, {"$set": {"elements.$.x": random.random()}}
+    )
+
+
+async def collection_update(db: AsyncDatabase, project_id: t.Any, element_id: t.Any) -> None:
+    await db[CollectionName.DESIGN_ELEMENTS].update_one(
+        {"_id": element_id, "project_id": project_id}, {"$set": {"x": random.random()}}
+    )
+
+
+async def measure(
+    iterations: int,
+    fn: t.Callable[[AsyncDatabase, t.Any, t.Any], t.Awaitable[None]],
+    db: AsyncDatabase,
+    project_id: t.Any,
+    element_ids: list[t.Any],
+) -> list[float]:
+    durations: list[float] = []
+    for _ in range(iterations):
+        element_id = random.choice(element_ids)
+        start = time.perf_counter()
+        await fn(db, project_id, element_id)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def report(label: str, durations: list[float]) -> None:
+    quantiles = statistics.quantiles(durations, n=100)
+    print(
+        f"{label:<28} mean={statistics.mean(durations):9.3f}ms "
+        f"p50={quantiles[49]:9.3f}ms p95={quantiles[94]:9.3f}ms p99={quantiles[98]:9.3f}ms"
+    )
+
+
+async def main() -> None:
+    uri = os.environ.get("MONGO_URI", "mongodb://localhost:27017")
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    client: AsyncMongoClient = AsyncMongoClient(uri)
+    db = client.get_database(
+        DATABASE_NAME,
+        codec_options=CodecOptions(uuid_representation=UuidRepresentation.STANDARD, tz_aware=True),
+    )
+    try:
+        for count in ELEMENT_COUNTS:
+            project_id, element_ids = await seed(db, count)
+            if count <= MAX_EMBEDDED_ELEMENTS:
+                report(f"embedded ({count})", await measure(iterations, embedded_update, db, project_id, element_ids))
+            else:
+                print(f"embedded ({count})".ljust(28), "skipped, exceeds the 16 MB document limit")
+            report(f"collection ({count})", await measure(iterations, collection_update, db, project_id, element_ids))
+    finally:
+        await client.drop_database(DATABASE_NAME)
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
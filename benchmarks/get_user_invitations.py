@@ -0,0 +1,156 @@
+"""
+Compare the per-invitation lookups of the previous `GetUserInvitations` against the single `$lookup` aggregation.
+
+Seeds a scratch database with N pending invitations for one receiver, each from a distinct organization and sender,
+then times both strategies.
+
+Usage:
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.get_user_invitations [iterations]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import time
+import typing as t
+from datetime import timedelta
+
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.common.models import JoinOrganizationInvitationModel, OrganizationModel, UserModel
+from src.constants.mongo import CollectionName
+from src.utils.common import generate_uuid, get_utc_now
+
+DATABASE_NAME = "benchmark_get_user_invitations"
+INVITATION_COUNTS = (10, 100, 1000)
+
+
+async def seed(db: AsyncDatabase, count: int) -> t.Any:
+    for collection_name in (
+        CollectionName.USERS,
+        CollectionName.ORGANIZATIONS,
+        CollectionName.JOIN_ORGANIZATION_INVITATIONS,
+    ):
+        await db.drop_collection(collection_name)
+
+    receiver_id = generate_uuid()
+    users = [
+        UserModel(username=f"sender-{i}", email=f"sender-{i}@example.com", hashed_password="hashed_password")
+        for i in range(count)
+    ]
+    organizations = [OrganizationModel(name=f"organization-{i}", owner_id=users[i].id) for i in range(count)]
+    invitations = [
+        JoinOrganizationInvitationModel(
+            organization_id=organizations[i].id,
+            sender_id=users[i].id,
+            receiver_id=receiver_id,
+            expires_at=get_utc_now() + timedelta(days=3),
+        )
+        for i in range(count)
+    ]
+    await db[CollectionName.USERS].insert_many([user.model_dump(by_alias=True) for user in users])
+    await db[CollectionName.ORGANIZATIONS].insert_many(
+        [organization.model_dump(by_alias=True) for organization in organizations]
+    )
+    await db[CollectionName.JOIN_ORGANIZATION_INVITATIONS].insert_many(
+        [invitation.model_dump(by_alias=True) for invitation in invitations]
+    )
+    await db[CollectionName.JOIN_ORGANIZATION_INVITATIONS].create_index(
+        [("receiver_id", 1), ("taken_action", 1), ("expires_at", 1)]
+    )
+    return receiver_id
+
+
+def make_query(receiver_id: t.Any) -> dict:
+    return {"receiver_id": receiver_id, "taken_action": None, "expires_at": {"$gt": get_utc_now()}, "is_deleted": False}
+
+
+async def per_invitation_lookups(db: AsyncDatabase, receiver_id: t.Any) -> int:
+    # NOTE: mirrors the previous behaviour, one organization and one sender query per invitation
+    invitations = await db[CollectionName.JOIN_ORGANIZATION_INVITATIONS].find(make_query(receiver_id)).to_list()
+    resolved = 0
+    for invitation in invitations:
+        organization = await db[CollectionName.ORGANIZATIONS].find_one(
+            {"_id": invitation["organization_id"], "is_deleted": False}
+        )
+        sender = await db[CollectionName.USERS].find_one({"_id": invitation["sender_id"], "is_deleted": False})
+        if organization and sender:
+            resolved += 1
+    return resolved
+
+
+async def single_aggregation(db: AsyncDatabase, receiver_id: t.Any) -> int:
+    # NOTE: same pipeline as `GetUserInvitations._make_pipeline` with the page size lifted to every invitation
+    pipeline: list[dict] = [
+        {"$match": make_query(receiver_id)},
+        {"$sort": {"expires_at": -1}},
+        *(
+            {
+                "$lookup": {
+                    "from": from_collection,
+                    "let": {"id": f"${local_field}"},
+                    "pipeline": [
+                        {"$match": {"$expr": {"$eq": ["$_id", "$$id"]}, "is_deleted": False}},
+                        {"$project": {"_id": 0, field: 1}},
+                    ],
+                    "as": as_field,
+                }
+            }
+            for from_collection, local_field, as_field, field in (
+                (CollectionName.ORGANIZATIONS, "organization_id", "organization", "name"),
+                (CollectionName.USERS, "sender_id", "sender", "username"),
+            )
+        ),
+        {"$unwind": "$organization"},
+        {"$unwind": "$sender"},
+    ]
+    cursor = await db[CollectionName.JOIN_ORGANIZATION_INVITATIONS].aggregate(pipeline)
+    return len(await cursor.to_list())
+
+
+async def measure(
+    iterations: int, fn: t.Callable[[AsyncDatabase, t.Any], t.Awaitable[int]], db: AsyncDatabase, receiver_id: t.Any
+) -> list[float]:
+    durations: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn(db, receiver_id)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def report(label: str, durations: list[float]) -> None:
+    quantiles = statistics.quantiles(durations, n=100)
+    print(
+        f"{label:<28} mean={statistics.mean(durations):9.3f}ms "
+        f"p50={quantiles[49]:9.3f}ms p95={quantiles[94]:9.3f}ms p99={quantiles[98]:9.3f}ms"
+    )
+
+
+async def main() -> None:
+    uri = os.environ.get("MONGO_URI", "mongodb://localhost:27017")
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+    client: AsyncMongoClient = AsyncMongoClient(uri)
+    db = client.get_database(
+        DATABASE_NAME,
+        codec_options=CodecOptions(uuid_representation=UuidRepresentation.STANDARD, tz_aware=True),
+    )
+    try:
+        for count in INVITATION_COUNTS:
+            receiver_id = await seed(db, count)
+            assert await per_invitation_lookups(db, receiver_id) == await single_aggregation(db, receiver_id) == count
+
+            report(f"per invitation ({count})", await measure(iterations, per_invitation_lookups, db, receiver_id))
+            report(f"aggregation ({count})", await measure(iterations, single_aggregation, db, receiver_id))
+    finally:
+        await client.drop_database(DATABASE_NAME)
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
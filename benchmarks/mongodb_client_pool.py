@@ -0,0 +1,65 @@
+"""
+Compare per-request latency of a MongoClient created per request against one shared pooled client.
+
+Usage:
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.mongodb_client_pool [iterations]
+"""
+
+import os
+import statistics
+import sys
+import time
+import typing as t
+
+from pymongo.mongo_client import MongoClient
+from pymongo.server_api import ServerApi
+
+DATABASE_NAME = "database"
+COLLECTION_NAME = "users"
+
+
+def client_per_request(uri: str) -> None:
+    # NOTE: mirrors the previous behaviour of `create_mongodb_database`
+    client: MongoClient = MongoClient(uri, server_api=ServerApi("1"))
+    client.admin.command("ping")
+    client.get_database(DATABASE_NAME).get_collection(COLLECTION_NAME).find_one({})
+    client.close()
+
+
+def pooled_client(client: MongoClient) -> None:
+    client.get_database(DATABASE_NAME).get_collection(COLLECTION_NAME).find_one({})
+
+
+def measure(iterations: int, fn: t.Callable[[], None]) -> list[float]:
+    durations: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def report(label: str, durations: list[float]) -> None:
+    quantiles = statistics.quantiles(durations, n=100)
+    print(
+        f"{label:<20} mean={statistics.mean(durations):8.3f}ms "
+        f"p50={quantiles[49]:8.3f}ms p95={quantiles[94]:8.3f}ms p99={quantiles[98]:8.3f}ms"
+    )
+
+
+def main() -> None:
+    uri = os.environ.get("MONGO_URI", "mongodb://localhost:27017")
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    report("client per request", measure(iterations, lambda: client_per_request(uri)))
+
+    client: MongoClient = MongoClient(uri, server_api=ServerApi("1"), minPoolSize=10)
+    client.admin.command("ping")
+    try:
+        report("pooled client", measure(iterations, lambda: pooled_client(client)))
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
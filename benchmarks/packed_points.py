@@ -0,0 +1,71 @@
+"""
+Compare storing and loading Line `points` as a BSON array of doubles against the packed `PackedPoints` binary.
+
+Measures the BSON size of one stroke and the time to decode its document and validate it into a `LineModel`, as a
+read of the element would. Needs no database.
+
+Usage:
+    python -m benchmarks.packed_points [iterations]
+"""
+
+import random
+import statistics
+import sys
+import time
+import typing as t
+
+import bson
+
+from src.common.models import LineModel, PackedPoints
+
+POINT_COUNTS = (100, 1_000, 10_000)
+
+
+def make_coordinates(count: int, is_integral: bool) -> list[float]:
+    # NOTE: pointer positions on an unzoomed stage are whole or half pixels, zoomed or smoothed strokes are not
+    if is_integral:
+        return [float(random.randint(0, 4000)) / 2 for _ in range(2 * count)]
+    return [random.uniform(0, 2000) for _ in range(2 * count)]
+
+
+def measure(iterations: int, fn: t.Callable[[], t.Any]) -> list[float]:
+    durations: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def report(label: str, size: int, durations: list[float]) -> None:
+    quantiles = statistics.quantiles(durations, n=100)
+    print(
+        f"{label:<32} size={size:9d}B mean={statistics.mean(durations):9.3f}ms "
+        f"p50={quantiles[49]:9.3f}ms p95={quantiles[94]:9.3f}ms"
+    )
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    for count in POINT_COUNTS:
+        for is_integral in (True, False):
+            coordinates = make_coordinates(count, is_integral)
+            label = f"{count} {'half-pixel' if is_integral else 'fractional'}"
+            array_document = bson.encode({"shapeType": "Line", "points": coordinates})
+            packed_document = bson.encode(
+                {"shapeType": "Line", "points": PackedPoints.from_values(coordinates).to_binary()}
+            )
+            report(
+                f"array ({label})",
+                len(array_document),
+                measure(iterations, lambda: LineModel.model_validate(bson.decode(array_document))),
+            )
+            report(
+                f"packed ({label})",
+                len(packed_document),
+                measure(iterations, lambda: LineModel.model_validate(bson.decode(packed_document))),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+"""
+Compare transforming a selection element by element against the vectorized `BaseTransformElements`.
+
+The compute section times the geometry math alone, a scalar Python loop against the NumPy columns, and needs no
+database. The write section seeds a scratch database with the selection and times one `update_one` per element against
+one `BaseTransformElements` execution.
+
+Usage:
+    MONGO_URI=mongodb://localhost:27017 python -m benchmarks.transform_elements [iterations] [--compute-only]
+"""
+
+import asyncio
+import copy
+import logging
+import math
+import os
+import statistics
+import sys
+import time
+import typing as t
+
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+
+from src.common.models import AffineTransformModel, LineModel, PackedPoints, RectangleModel, get_points_array
+from src.components.design_projects.elements import BaseTransformElements, MigrateProjectElements
+from src.constants.mongo import CollectionName
+from src.utils.affine_transform import make_transform_updates
+from src.utils.bounding_box import to_bounding_box_document
+from src.utils.common import generate_uuid, get_utc_now
+from src.utils.design_element import to_element_document
+
+DATABASE_NAME = "benchmark_transform_elements"
+SELECTION_SIZES = (10, 1_000, 50_000)
+INSERT_BATCH_SIZE = 10_000
+# NOTE: rotate the selection by 30 degrees, scale it by 1.5 and move it
+TRANSFORM = AffineTransformModel(
+    a=1.5 * math.cos(math.pi / 6),
+    b=1.5 * math.sin(math.pi / 6),
+    c=-1.5 * math.sin(math.pi / 6),
+    d=1.5 * math.cos(math.pi / 6),
+    e=120,
+    f=-40,
+)
+
+
+def make_elements(count: int) -> list[RectangleModel | LineModel]:
+    return [
+        (
+            LineModel(x=i, y=-i, points=[0, 0, 10, 5, 20, 0])
+            if i % 4 == 0
+            else RectangleModel(x=i, y=i, width=10, height=10, rotation=i % 360)
+        )
+        for i in range(count)
+    ]
+
+
+def scalar_transform(element_data: dict[str, t.Any], transform: AffineTransformModel) -> dict[str, t.Any]:
+    """The same geometry math as `BaseTransformElements`, one element at a time, bounding box included."""
+    x, y = element_data.get("x", 0.0), element_data.get("y", 0.0)
+    fields: dict[str, t.Any] = {
+        "x": transform.a * x + transform.c * y + transform.e,
+        "y": transform.b * x + transform.d * y + transform.f,
+    }
+    radians = math.radians(element_data.get("rotation", 0.0))
+    cos, sin = math.cos(radians), math.sin(radians)
+    scale_x, scale_y = element_data.get("scaleX", 1.0), element_data.get("scaleY", 1.0)
+    node_a, node_b, node_c, node_d = cos * scale_x, sin * scale_x, -sin * scale_y, cos * scale_y
+    a = transform.a * node_a + transform.c * node_b
+    b = transform.b * node_a + transform.d * node_b
+    c = transform.a * node_c + transform.c * node_d
+    d = transform.b * node_c + transform.d * node_d
+    if "points" in element_data:
+        determinant = node_a * node_d - node_b * node_c
+        inverse = (node_d / determinant, -node_b / determinant, -node_c / determinant, node_a / determinant)
+        local = (
+            inverse[0] * a + inverse[2] * b,
+            inverse[1] * a + inverse[3] * b,
+            inverse[0] * c + inverse[2] * d,
+            inverse[1] * c + inverse[3] * d,
+        )
+        points = get_points_array(element_data["points"]).tolist()
+        fields["points"] = PackedPoints.from_values(
+            [
+                coordinate
+                for point_x, point_y in zip(points[0::2], points[1::2])
+                for coordinate in (local[0] * point_x + local[2] * point_y, local[1] * point_x + local[3] * point_y)
+            ]
+        ).to_binary()
+        fields["bbox"] = to_bounding_box_document({**element_data, **fields})
+        return fields
+    new_scale_x = math.hypot(a, b)
+    new_scale_y = (a * d - b * c) / new_scale_x
+    fields["rotation"] = math.degrees(math.atan2(b, a))
+    fields["scaleX"] = new_scale_x
+    fields["scaleY"] = new_scale_y
+    fields["skewX"] = (a * c + b * d) / (new_scale_x * new_scale_y)
+    fields["bbox"] = to_bounding_box_document({**element_data, **fields})
+    return fields
+
+
+def measure_compute(iterations: int, fn: t.Callable[[], t.Any]) -> list[float]:
+    durations: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+async def measure(iterations: int, fn: t.Callable[[], t.Awaitable[t.Any]]) -> list[float]:
+    durations: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await fn()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def report(label: str, durations: list[float]) -> None:
+    quantiles = statistics.quantiles(durations, n=100)
+    print(
+        f"{label:<28} mean={statistics.mean(durations):9.3f}ms "
+        f"p50={quantiles[49]:9.3f}ms p95={quantiles[94]:9.3f}ms p99={quantiles[98]:9.3f}ms"
+    )
+
+
+def run_compute(iterations: int) -> None:
+    for count in SELECTION_SIZES:
+        elements_data = [element.model_dump(by_alias=True, exclude_none=True) for element in make_elements(count)]
+        # NOTE: `make_transform_updates` transforms its input in place, which keeps the cost of every iteration the same
+        vectorized_elements_data = copy.deepcopy(elements_data)
+        compute_iterations = max(5, iterations // max(1, count // 1_000))
+        report(
+            f"scalar compute ({count})",
+            measure_compute(
+                compute_iterations,
+                lambda: [scalar_transform(element_data, TRANSFORM) for element_data in elements_data],
+            ),
+        )
+        report(
+            f"vectorized compute ({count})",
+            measure_compute(
+                compute_iterations,
+                lambda: make_transform_updates(vectorized_elements_data, TRANSFORM, get_utc_now()),
+            ),
+        )
+
+
+async def seed(db: AsyncDatabase, count: int) -> tuple[t.Any, t.Any, list[dict[str, t.Any]]]:
+    await db.drop_collection(CollectionName.DESIGN_ELEMENTS)
+
+    project_id = generate_uuid()
+    organization_id = generate_uuid()
+    elements = make_elements(count)
+    for start in range(0, count, INSERT_BATCH_SIZE):
+        await db[CollectionName.DESIGN_ELEMENTS].insert_many(
+            [
+                to_element_document(element, project_id, organization_id)
+                for element in elements[start : start + INSERT_BATCH_SIZE]
+            ]
+        )
+    await db[CollectionName.DESIGN_ELEMENTS].create_index([("project_id", 1), ("_id", 1)], unique=True)
+    return project_id, organization_id, [element.model_dump(by_alias=True, exclude_none=True) for element in elements]
+
+
+async def run_writes(iterations: int, logger: logging.Logger) -> None:
+    uri = os.environ.get("MONGO_URI", "mongodb://localhost:27017")
+    client: AsyncMongoClient = AsyncMongoClient(uri)
+    db = client.get_database(
+        DATABASE_NAME,
+        codec_options=CodecOptions(uuid_representation=UuidRepresentation.STANDARD, tz_aware=True),
+    )
+    base_transform_elements = BaseTransformElements(
+        db=db, logger=logger, migrate_project_elements=MigrateProjectElements(db=db, logger=logger)
+    )
+    try:
+        for count in SELECTION_SIZES:
+            project_id, organization_id, elements_data = await seed(db, count)
+            element_ids = [element_data["_id"] for element_data in elements_data]
+            write_iterations = max(3, iterations // max(1, count // 100))
+
+            async def update_each_element() -> None:
+                for element_data in elements_data:
+                    await db[CollectionName.DESIGN_ELEMENTS].update_one(
+                        {"_id": element_data["_id"], "project_id": project_id},
+                        {"$set": scalar_transform(element_data, TRANSFORM)},
+                    )
+
+            async def transform_elements() -> None:
+                await base_transform_elements.aexecute(
+                    BaseTransformElements.Request(
+                        organization_id=organization_id,
+                        project_id=project_id,
+                        element_ids=element_ids,
+                        transform=TRANSFORM,
+                    )
+                )
+
+            report(f"per element ({count})", await measure(write_iterations, update_each_element))
+            report(f"transform elements ({count})", await measure(write_iterations, transform_elements))
+    finally:
+        await client.drop_database(DATABASE_NAME)
+        await client.close()
+
+
+async def main() -> None:
+    arguments = [argument for argument in sys.argv[1:] if not argument.startswith("--")]
+    iterations = int(arguments[0]) if arguments else 50
+    logger = logging.getLogger(__name__)
+
+    run_compute(iterations)
+    if "--compute-only" not in sys.argv:
+        await run_writes(iterations, logger)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+import bson
+import pydantic as p
+import pytest
+from bson.binary import Binary
+
+from ....common.models import (
+    APPENDED_POINTS_FIELD,
+    ArrowModel,
+    BoundingBox,
+    ElementPatchModel,
+    LineModel,
+    PackedPoints,
+    PointsDtype,
+    ShapeType,
+)
+from ....utils.bounding_box import compute_bounding_box
+from ....utils.common import generate_uuid
+from ....utils.design_element import to_element
+
+
+class TestPackedPoints:
+    def test_values_exact_in_float32_should_be_packed_as_float32(self) -> None:
+        # Act
+        points = PackedPoints.from_values([0, 1.5, -20, 1024.25])
+
+        # Assert
+        assert points.dtype == PointsDtype.Float32
+        assert len(points.to_binary()) == 4 * 4
+        assert points.to_list() == [0, 1.5, -20, 1024.25]
+
+    def test_values_inexact_in_float32_should_be_packed_as_float64(self) -> None:
+        # Act
+        points = PackedPoints.from_values([0.1, 0.2])
+
+        # Assert
+        assert points.dtype == PointsDtype.Float64
+        assert points.to_list() == [0.1, 0.2]
+
+    def test_stored_binary_should_be_decoded_on_first_read(self) -> None:
+        # Arrange
+        binary = PackedPoints.from_values([1, 2, 3, 4]).to_binary()
+
+        # Act
+        element = LineModel.model_validate({"points": binary})
+
+        # Assert
+        assert element.points is not None
+        assert element.points._array is None
+        assert element.points.to_list() == [1, 2, 3, 4]
+        assert element.points._array is not None
+
+    def test_model_dumps_binary_for_documents_and_numbers_for_clients(self) -> None:
+        # Arrange
+        element = LineModel(points=[1, 2, 3, 4])
+
+        # Act
+        element_data = element.model_dump(by_alias=True, exclude_none=True)
+        element_json_data = element.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+        # Assert
+        assert isinstance(element_data["points"], Binary)
+        assert element_json_data["points"] == [1, 2, 3, 4]
+        assert LineModel.model_validate(element_data) == element
+
+    def test_base64_typed_array_should_be_accepted(self) -> None:
+        # Arrange
+        typed_array = PackedPoints.from_values([5, 6]).to_base64()
+
+        # Act
+        element = ArrowModel.model_validate({"points": typed_array})
+
+        # Assert
+        assert typed_array["dtype"] == PointsDtype.Float32
+        assert element.points.to_list() == [5, 6]
+
+    @pytest.mark.parametrize(
+        "points",
+        [["a", 1], [[1, 2]], {"dtype": "int8", "data": ""}, Binary(b"\x00\x00", 0x80), "1,2"],
+    )
+    def test_invalid_points_should_be_rejected(self, points: object) -> None:
+        # Act & Assert
+        with pytest.raises(p.ValidationError):
+            LineModel.model_validate({"points": points})
+
+    def test_packed_points_should_be_several_times_smaller_than_an_array_of_doubles(self) -> None:
+        # Arrange
+        coordinates = [float(i % 1000) + 0.5 for i in range(2000)]
+
+        # Act
+        array_size = len(bson.encode({"points": coordinates}))
+        packed_size = len(bson.encode({"points": PackedPoints.from_values(coordinates).to_binary()}))
+
+        # Assert
+        assert packed_size * 3 < array_size
+
+    def test_patched_points_should_be_sent_as_numbers(self) -> None:
+        # Arrange
+        patch = ElementPatchModel(shape_type=ShapeType.Line, changes={"points": [1, 2]})
+
+        # Act
+        patch_json_data = patch.model_dump(mode="json")
+
+        # Assert
+        assert isinstance(patch.changes["points"], Binary)
+        assert patch_json_data["changes"] == {"points": [1, 2]}
+
+    def test_appended_points_should_be_read_after_the_stored_points(self) -> None:
+        # Arrange
+        element_data = {
+            "_id": generate_uuid(),
+            "shapeType": ShapeType.Line,
+            "points": PackedPoints.from_values([0, 0, 1, 1]).to_binary(),
+            APPENDED_POINTS_FIELD: [PackedPoints.from_values([2, 2.1]).to_binary()],
+        }
+
+        # Act
+        element = to_element(element_data)
+
+        # Assert
+        assert isinstance(element, LineModel)
+        assert element.points is not None
+        assert element.points.to_list() == [0, 0, 1, 1, 2, 2.1]
+        assert compute_bounding_box(element_data) == BoundingBox(min_x=0, min_y=0, max_x=2, max_y=2.1)
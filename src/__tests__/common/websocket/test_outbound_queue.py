@@ -0,0 +1,232 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import status
+from fastapi.websockets import WebSocket
+
+from ....common.models import PackedPoints, UserRole
+from ....common.websocket.connection_manager import ClientConnectionManager
+from ....common.websocket.message import (
+    CursorPosition,
+    EncodedWebSocketMessage,
+    Sender,
+    UserCursor,
+    WebSocketMessage,
+    WebSocketMessagePayload,
+)
+from ....common.websocket.outbound_queue import ClientOutboundQueue
+from ....constants.websocket import OutboundOverflowPolicy, WebSocketEvent
+from ....utils.common import generate_uuid
+
+CURSOR_MESSAGE = EncodedWebSocketMessage(
+    WebSocketEvent.ReceiveUserCursorUpdated, '{"event":"ReceiveUserCursorUpdated"}'
+)
+ELEMENT_MESSAGE = EncodedWebSocketMessage(WebSocketEvent.ReceiveElementPatched, '{"event":"ReceiveElementPatched"}')
+
+
+class TestEncodedWebSocketMessage:
+    def test_encode_writes_the_json_of_the_message(self) -> None:
+        # Arrange
+        message = WebSocketMessage.ReceivePointsAppendedMessage(
+            payload=WebSocketMessagePayload.ReceivePointsAppendedMessagePayload(
+                sender=Sender(
+                    id=generate_uuid(), username="user", email="user@example.com", role=UserRole.OrganizationMember
+                ),
+                element_id=generate_uuid(),
+                points=PackedPoints.from_values([1, 2.5]),
+            )
+        )
+
+        # Act
+        encoded_message = EncodedWebSocketMessage.encode(message)
+
+        # Assert
+        assert encoded_message.event == WebSocketEvent.ReceivePointsAppended
+        assert json.loads(encoded_message.text) == message.model_dump(mode="json", by_alias=False, exclude_none=True)
+
+
+def create_websocket() -> Mock:
+    return Mock(spec=WebSocket, accept=AsyncMock(), send_text=AsyncMock(), close=AsyncMock())
+
+
+class TestClientOutboundQueue:
+    @pytest.mark.asyncio
+    async def test_put_with_drop_oldest_cursor_policy_drops_the_oldest_cursor_frame(self, mock_logger: Mock) -> None:
+        # Arrange
+        outbound_queue = ClientOutboundQueue(
+            create_websocket(), 2, OutboundOverflowPolicy.DropOldestCursor, mock_logger
+        )
+        outbound_queue.put(CURSOR_MESSAGE)
+        outbound_queue.put(ELEMENT_MESSAGE)
+
+        # Act
+        is_queued = outbound_queue.put(CURSOR_MESSAGE)
+
+        # Assert
+        assert is_queued
+        assert len(outbound_queue) == 2
+        assert not outbound_queue.is_closed
+
+    @pytest.mark.asyncio
+    async def test_put_with_drop_oldest_cursor_policy_drops_a_cursor_frame_when_no_cursor_is_queued(
+        self, mock_logger: Mock
+    ) -> None:
+        # Arrange
+        outbound_queue = ClientOutboundQueue(
+            create_websocket(), 1, OutboundOverflowPolicy.DropOldestCursor, mock_logger
+        )
+        outbound_queue.put(ELEMENT_MESSAGE)
+
+        # Act
+        is_queued = outbound_queue.put(CURSOR_MESSAGE)
+
+        # Assert
+        assert not is_queued
+        assert not outbound_queue.is_closed
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "overflow_policy, queued_message",
+        [
+            (OutboundOverflowPolicy.DropOldestCursor, ELEMENT_MESSAGE),
+            (OutboundOverflowPolicy.Disconnect, CURSOR_MESSAGE),
+        ],
+    )
+    async def test_put_on_overflow_disconnects_the_client(
+        self, mock_logger: Mock, overflow_policy: OutboundOverflowPolicy, queued_message: dict
+    ) -> None:
+        # Arrange
+        websocket = create_websocket()
+        outbound_queue = ClientOutboundQueue(websocket, 1, overflow_policy, mock_logger)
+        outbound_queue.put(queued_message)
+
+        # Act
+        is_queued = outbound_queue.put(ELEMENT_MESSAGE)
+        outbound_queue.start()
+        await asyncio.sleep(0)
+
+        # Assert
+        assert not is_queued
+        assert outbound_queue.is_closed
+        websocket.send_text.assert_not_called()
+        websocket.close.assert_awaited_once_with(code=status.WS_1013_TRY_AGAIN_LATER)
+
+
+async def never_send(text: str) -> None:
+    await asyncio.Event().wait()
+
+
+class TestClientConnectionManagerFanOut:
+    @pytest.mark.asyncio
+    async def test_broadcast_is_not_delayed_by_a_slow_client(self) -> None:
+        # Arrange
+        manager = ClientConnectionManager(elements_sync_interval_seconds=3600)
+        design_project_id = generate_uuid()
+        websockets = {}
+        for _ in range(3):
+            client = Sender(
+                id=generate_uuid(), username="user", email="user@example.com", role=UserRole.OrganizationMember
+            )
+            websockets[client.id] = create_websocket()
+            await manager.connect(design_project_id, client, websockets[client.id])
+        sender_id, slow_id, fast_id = websockets.keys()
+        websockets[slow_id].send_text.side_effect = never_send
+
+        # Act
+        await asyncio.wait_for(manager.broadcast(design_project_id, sender_id, ELEMENT_MESSAGE), timeout=1)
+        await manager.broadcast(design_project_id, sender_id, CURSOR_MESSAGE)
+        await asyncio.sleep(0)
+
+        # Assert
+        websockets[slow_id].send_text.assert_awaited_once_with(ELEMENT_MESSAGE.text)
+        assert websockets[fast_id].send_text.await_args_list == [((ELEMENT_MESSAGE.text,),), ((CURSOR_MESSAGE.text,),)]
+        for client_id in websockets:
+            await manager.disconnect(design_project_id, client_id)
+
+    @pytest.mark.asyncio
+    async def test_send_to_client_is_written_after_the_queued_messages_by_the_writer_task(self) -> None:
+        # Arrange
+        manager = ClientConnectionManager(elements_sync_interval_seconds=3600)
+        design_project_id = generate_uuid()
+        websockets = {}
+        for _ in range(2):
+            client = Sender(
+                id=generate_uuid(), username="user", email="user@example.com", role=UserRole.OrganizationMember
+            )
+            websockets[client.id] = create_websocket()
+            await manager.connect(design_project_id, client, websockets[client.id])
+        sender_id, receiver_id = websockets.keys()
+        can_send = asyncio.Event()
+        sent_texts: list[str] = []
+
+        async def send_when_allowed(text: str) -> None:
+            await can_send.wait()
+            sent_texts.append(text)
+
+        websockets[receiver_id].send_text.side_effect = send_when_allowed
+
+        # Act
+        await manager.broadcast(design_project_id, sender_id, ELEMENT_MESSAGE)
+        await asyncio.sleep(0)
+        await asyncio.wait_for(manager.send_to_client(design_project_id, receiver_id, CURSOR_MESSAGE), timeout=1)
+        can_send.set()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        # Assert
+        assert sent_texts == [ELEMENT_MESSAGE.text, CURSOR_MESSAGE.text]
+        websockets[sender_id].send_text.assert_not_called()
+        for client_id in websockets:
+            await manager.disconnect(design_project_id, client_id)
+
+    @pytest.mark.asyncio
+    async def test_flush_user_cursors_sends_the_latest_cursors_as_one_frame(self) -> None:
+        # Arrange
+        manager = ClientConnectionManager(elements_sync_interval_seconds=3600, cursor_flush_interval_seconds=3600)
+        design_project_id = generate_uuid()
+        websockets = {}
+        for _ in range(3):
+            client = Sender(
+                id=generate_uuid(), username="user", email="user@example.com", role=UserRole.OrganizationMember
+            )
+            websockets[client.id] = create_websocket()
+            await manager.connect(design_project_id, client, websockets[client.id])
+        first_id, second_id, idle_id = websockets.keys()
+        cursors = {
+            client_id: [
+                UserCursor(
+                    id=generate_uuid(),
+                    user_id=client_id,
+                    email="user@example.com",
+                    username="user",
+                    position=CursorPosition(x=x, y=x),
+                )
+                for x in range(3)
+            ]
+            for client_id in (first_id, second_id)
+        }
+
+        # Act
+        for client_id in (first_id, second_id):
+            for user_cursor in cursors[client_id]:
+                manager.update_user_cursor(design_project_id, client_id, user_cursor)
+        manager.flush_user_cursors(design_project_id)
+        manager.update_user_cursor(design_project_id, first_id, cursors[first_id][0])
+        manager.flush_user_cursors(design_project_id)
+        manager.flush_user_cursors(design_project_id)
+        await asyncio.sleep(0)
+
+        # Assert
+        batched_frame = json.loads(websockets[idle_id].send_text.await_args_list[0].args[0])
+        assert batched_frame["event"] == WebSocketEvent.ReceiveUserCursorsUpdated
+        assert [cursor["position"]["x"] for cursor in batched_frame["payload"]["user_cursors"]] == [2, 2]
+        for client_id, other_id in ((first_id, second_id), (second_id, first_id)):
+            own_frame = json.loads(websockets[client_id].send_text.await_args_list[0].args[0])
+            assert [cursor["user_id"] for cursor in own_frame["payload"]["user_cursors"]] == [str(other_id)]
+        assert websockets[idle_id].send_text.await_count == 2
+        assert websockets[second_id].send_text.await_count == 2
+        assert websockets[first_id].send_text.await_count == 1
+        for client_id in websockets:
+            await manager.disconnect(design_project_id, client_id)
@@ -0,0 +1,195 @@
+import asyncio
+import collections
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import status
+from fastapi.websockets import WebSocket
+from starlette.datastructures import URL, Headers
+from websockets.asyncio.server import ServerConnection, serve
+
+from ....common.websocket.room_affinity import ROOM_AFFINITY_FORWARDED_HEADER, RoomAffinity, RoomAffinityRing
+from ....utils.common import generate_uuid
+
+WORKER_SECRET = "secret"
+WORKER_URLS = {"worker-0": "ws://127.0.0.1:8001", "worker-1": "ws://127.0.0.1:8002", "worker-2": "ws://127.0.0.1:8003"}
+
+
+def create_websocket(path: str, headers: dict[str, str] | None = None) -> Mock:
+    return Mock(
+        spec=WebSocket,
+        url=URL(f"ws://127.0.0.1:8000{path}"),
+        headers=Headers(headers or {}),
+        accept=AsyncMock(),
+        send_text=AsyncMock(),
+        send_bytes=AsyncMock(),
+        close=AsyncMock(),
+    )
+
+
+class TestRoomAffinityRing:
+    def test_get_worker_id_spreads_rooms_evenly_and_agrees_across_workers(self) -> None:
+        # Arrange
+        rings = [RoomAffinityRing(WORKER_URLS), RoomAffinityRing(reversed(list(WORKER_URLS)))]
+        design_project_ids = [generate_uuid() for _ in range(3000)]
+
+        # Act
+        owners = [[ring.get_worker_id(design_project_id) for design_project_id in design_project_ids] for ring in rings]
+
+        # Assert
+        assert owners[0] == owners[1]
+        for room_count in collections.Counter(owners[0]).values():
+            assert 700 < room_count < 1300
+
+    def test_adding_a_worker_only_moves_rooms_to_it(self) -> None:
+        # Arrange
+        ring = RoomAffinityRing(WORKER_URLS)
+        grown_ring = RoomAffinityRing([*WORKER_URLS, "worker-3"])
+        design_project_ids = [generate_uuid() for _ in range(1000)]
+
+        # Act
+        moved_owners = [
+            grown_ring.get_worker_id(design_project_id)
+            for design_project_id in design_project_ids
+            if ring.get_worker_id(design_project_id) != grown_ring.get_worker_id(design_project_id)
+        ]
+
+        # Assert
+        assert set(moved_owners) == {"worker-3"}
+        assert len(moved_owners) < 400
+
+    def test_init_without_workers_raises_value_error(self) -> None:
+        with pytest.raises(ValueError):
+            RoomAffinityRing([])
+
+
+class TestRoomAffinity:
+    def test_get_owner_url_points_to_the_owner_of_the_room(self, mock_logger: Mock) -> None:
+        # Arrange
+        design_project_id = generate_uuid()
+        owner_id = RoomAffinityRing(WORKER_URLS).get_worker_id(design_project_id)
+        other_id = next(worker_id for worker_id in WORKER_URLS if worker_id != owner_id)
+        path = f"/ws/design-projects/{design_project_id}"
+
+        # Act
+        owner_url = RoomAffinity(other_id, WORKER_URLS, WORKER_SECRET, mock_logger).get_owner_url(
+            design_project_id, create_websocket(f"{path}?access_token=token")
+        )
+
+        # Assert
+        assert owner_url == f"{WORKER_URLS[owner_id]}{path}?access_token=token"
+
+    @pytest.mark.parametrize("is_forwarded, is_owner", [(False, True), (True, False)])
+    def test_get_owner_url_serves_locally_the_owned_and_forwarded_connections(
+        self, is_forwarded: bool, is_owner: bool, mock_logger: Mock
+    ) -> None:
+        # Arrange
+        design_project_id = generate_uuid()
+        owner_id = RoomAffinityRing(WORKER_URLS).get_worker_id(design_project_id)
+        worker_id = owner_id if is_owner else next(worker_id for worker_id in WORKER_URLS if worker_id != owner_id)
+        headers = {ROOM_AFFINITY_FORWARDED_HEADER: WORKER_SECRET} if is_forwarded else {}
+
+        # Act
+        owner_url = RoomAffinity(worker_id, WORKER_URLS, WORKER_SECRET, mock_logger).get_owner_url(
+            design_project_id, create_websocket(f"/ws/design-projects/{design_project_id}", headers)
+        )
+
+        # Assert
+        assert owner_url is None
+
+    @pytest.mark.parametrize("forwarded", ["", "worker-0", f"{WORKER_SECRET}x"])
+    def test_get_owner_url_routes_the_forwarded_connections_without_the_secret(
+        self, forwarded: str, mock_logger: Mock
+    ) -> None:
+        # Arrange
+        design_project_id = generate_uuid()
+        owner_id = RoomAffinityRing(WORKER_URLS).get_worker_id(design_project_id)
+        other_id = next(worker_id for worker_id in WORKER_URLS if worker_id != owner_id)
+        path = f"/ws/design-projects/{design_project_id}"
+
+        # Act
+        owner_url = RoomAffinity(other_id, WORKER_URLS, WORKER_SECRET, mock_logger).get_owner_url(
+            design_project_id, create_websocket(path, {ROOM_AFFINITY_FORWARDED_HEADER: forwarded})
+        )
+
+        # Assert
+        assert owner_url == f"{WORKER_URLS[owner_id]}{path}"
+
+    def test_owns_room_only_on_the_owner_of_the_room(self, mock_logger: Mock) -> None:
+        # Arrange
+        design_project_id = generate_uuid()
+        owner_id = RoomAffinityRing(WORKER_URLS).get_worker_id(design_project_id)
+
+        # Act
+        owned_by = [
+            worker_id
+            for worker_id in WORKER_URLS
+            if RoomAffinity(worker_id, WORKER_URLS, WORKER_SECRET, mock_logger).owns_room(design_project_id)
+        ]
+
+        # Assert
+        assert owned_by == [owner_id]
+        assert not RoomAffinity("", WORKER_URLS, "", mock_logger).owns_room(design_project_id)
+
+    def test_init_without_secret_raises_value_error(self, mock_logger: Mock) -> None:
+        with pytest.raises(ValueError):
+            RoomAffinity("worker-0", WORKER_URLS, "", mock_logger)
+
+    def test_get_owner_url_without_worker_id_serves_every_room_locally(self, mock_logger: Mock) -> None:
+        design_project_id = generate_uuid()
+
+        owner_url = RoomAffinity("", WORKER_URLS, "", mock_logger).get_owner_url(
+            design_project_id, create_websocket(f"/ws/design-projects/{design_project_id}")
+        )
+
+        assert owner_url is None
+
+    @pytest.mark.asyncio
+    async def test_proxy_relays_frames_both_ways_and_the_close_code_of_the_owner(self, mock_logger: Mock) -> None:
+        # Arrange
+        forwarded_by: list[str | None] = []
+
+        async def serve_room(connection: ServerConnection) -> None:
+            forwarded_by.append(connection.request.headers.get(ROOM_AFFINITY_FORWARDED_HEADER))
+            message = await connection.recv()
+            await connection.send(f"echo:{message}")
+            await connection.close(code=status.WS_1013_TRY_AGAIN_LATER)
+
+        client_messages = [{"type": "websocket.receive", "text": "hello"}]
+        client_disconnected = asyncio.Event()
+
+        async def receive() -> dict:
+            if client_messages:
+                return client_messages.pop(0)
+            await client_disconnected.wait()
+            return {"type": "websocket.disconnect"}
+
+        websocket = create_websocket("/ws/design-projects/room")
+        websocket.receive = receive
+
+        async with serve(serve_room, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+
+            # Act
+            await asyncio.wait_for(
+                RoomAffinity("worker-0", WORKER_URLS, WORKER_SECRET, mock_logger).proxy(
+                    websocket, f"ws://127.0.0.1:{port}/room"
+                ),
+                timeout=5,
+            )
+
+        # Assert
+        assert forwarded_by == [WORKER_SECRET]
+        websocket.accept.assert_awaited_once()
+        websocket.send_text.assert_awaited_once_with("echo:hello")
+        websocket.close.assert_awaited_once_with(code=status.WS_1013_TRY_AGAIN_LATER)
+
+    @pytest.mark.asyncio
+    async def test_proxy_closes_the_client_when_the_owner_is_unreachable(self, mock_logger: Mock) -> None:
+        websocket = create_websocket("/ws/design-projects/room")
+
+        await RoomAffinity("worker-0", WORKER_URLS, WORKER_SECRET, mock_logger).proxy(
+            websocket, "ws://127.0.0.1:1/room"
+        )
+
+        websocket.close.assert_awaited_once_with(code=status.WS_1013_TRY_AGAIN_LATER)
@@ -0,0 +1,284 @@
+import asyncio
+import contextlib
+import os
+import tempfile
+import typing as t
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.websockets import WebSocket
+
+from ....common.models import BoundingBox, UserRole
+from ....common.websocket.connection_manager import ClientConnectionManager
+from ....common.websocket.message import EncodedWebSocketMessage, Sender
+from ....common.websocket.room_affinity import RoomAffinity, RoomAffinityRing
+from ....common.websocket.room_bus import (
+    InProcessRoomBus,
+    InProcessRoomHub,
+    LocalRoomBroker,
+    RespRoomBus,
+    RoomBus,
+    RoomBusMessage,
+    UnixSocketRoomBus,
+    resp,
+)
+from ....common.websocket.spatial_index import ElementBoundsChange, ElementBoundsChangeType
+from ....constants.websocket import WebSocketEvent
+from ....utils.common import generate_uuid
+
+CHANNEL = "design-project:test"
+WORKER_URLS = {"worker-0": "ws://127.0.0.1:8001", "worker-1": "ws://127.0.0.1:8002"}
+ELEMENT_MESSAGE = EncodedWebSocketMessage(WebSocketEvent.ReceiveElementCreated, '{"event":"ReceiveElementCreated"}')
+
+
+@pytest.fixture
+def socket_path() -> t.Iterator[str]:
+    # NOTE: not `tmp_path`, its paths can outgrow the length limit of Unix socket paths
+    with tempfile.TemporaryDirectory() as directory:
+        yield os.path.join(directory, "rooms.sock")
+
+
+def create_sender() -> Sender:
+    return Sender(id=generate_uuid(), username="user", email="user@example.com", role=UserRole.OrganizationMember)
+
+
+async def publish_until_received(publisher: RoomBus, received: list[tuple[str, bytes]], data: bytes) -> None:
+    # NOTE: the subscription of the other connection may not have reached the server yet, so publish until it has
+    for _ in range(100):
+        publisher.publish(CHANNEL, data)
+        await asyncio.sleep(0.01)
+        if received:
+            return
+    raise AssertionError("The message never reached the subscriber.")
+
+
+class TestRoomBusMessage:
+    def test_from_bytes_reads_back_to_bytes(self) -> None:
+        # Arrange
+        room_bus_message = RoomBusMessage(
+            origin="worker",
+            message=ELEMENT_MESSAGE,
+            sender_id=generate_uuid(),
+            changes=[
+                ElementBoundsChange(
+                    generate_uuid(),
+                    ElementBoundsChangeType.Moved,
+                    BoundingBox(min_x=1, min_y=2.5, max_x=3, max_y=4),
+                ),
+                ElementBoundsChange(generate_uuid(), ElementBoundsChangeType.Removed),
+            ],
+        )
+
+        # Act
+        decoded_message = RoomBusMessage.from_bytes(room_bus_message.to_bytes())
+
+        # Assert
+        assert decoded_message.origin == room_bus_message.origin
+        assert decoded_message.message == room_bus_message.message
+        assert decoded_message.sender_id == room_bus_message.sender_id
+        assert list(decoded_message.changes or []) == list(room_bus_message.changes or [])
+
+
+class TestClientConnectionManagerRoomBus:
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_the_clients_of_the_room_on_other_managers(self) -> None:
+        # Arrange
+        hub: InProcessRoomHub = {}
+        managers = [
+            ClientConnectionManager(elements_sync_interval_seconds=3600, room_bus=InProcessRoomBus(hub))
+            for _ in range(2)
+        ]
+        design_project_id = generate_uuid()
+        clients = [create_sender() for _ in range(3)]
+        websockets = {client.id: Mock(spec=WebSocket, accept=AsyncMock(), send_text=AsyncMock()) for client in clients}
+        await managers[0].connect(design_project_id, clients[0], websockets[clients[0].id])
+        for client in clients[1:]:
+            await managers[1].connect(design_project_id, client, websockets[client.id])
+        watching_id, elsewhere_id = clients[1].id, clients[2].id
+        await managers[1].update_viewport(
+            design_project_id, watching_id, BoundingBox(min_x=0, min_y=0, max_x=9, max_y=9)
+        )
+        await managers[1].update_viewport(
+            design_project_id, elsewhere_id, BoundingBox(min_x=90, min_y=90, max_x=99, max_y=99)
+        )
+
+        # Act
+        await managers[0].broadcast(
+            design_project_id,
+            clients[0].id,
+            EncodedWebSocketMessage(WebSocketEvent.ReceiveElementPatched, '{"event":"ReceiveElementPatched"}'),
+        )
+        await managers[0].broadcast_element_changes(
+            design_project_id,
+            clients[0].id,
+            ELEMENT_MESSAGE,
+            [
+                ElementBoundsChange(
+                    generate_uuid(), ElementBoundsChangeType.Created, BoundingBox(min_x=1, min_y=1, max_x=2, max_y=2)
+                )
+            ],
+        )
+        # NOTE: one iteration for the bus delivery, one for the writer tasks
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        # Assert
+        websockets[clients[0].id].send_text.assert_not_called()
+        assert [call.args[0] for call in websockets[watching_id].send_text.await_args_list] == [
+            '{"event":"ReceiveElementPatched"}',
+            ELEMENT_MESSAGE.text,
+        ]
+        websockets[elsewhere_id].send_text.assert_awaited_once_with('{"event":"ReceiveElementPatched"}')
+        for manager in managers:
+            for client in clients:
+                await manager.disconnect(design_project_id, client.id)
+        assert hub == {}
+
+    @pytest.mark.asyncio
+    async def test_broadcast_in_a_room_owned_by_the_worker_is_not_published(self, mock_logger: Mock) -> None:
+        # Arrange
+        room_bus = Mock(spec=RoomBus)
+        design_project_id = generate_uuid()
+        owner_id = RoomAffinityRing(WORKER_URLS).get_worker_id(design_project_id)
+        other_id = next(worker_id for worker_id in WORKER_URLS if worker_id != owner_id)
+        managers = [
+            ClientConnectionManager(
+                elements_sync_interval_seconds=3600,
+                room_bus=room_bus,
+                room_affinity=RoomAffinity(worker_id, WORKER_URLS, "secret", mock_logger),
+            )
+            for worker_id in (owner_id, other_id)
+        ]
+        clients = [create_sender() for _ in managers]
+        for manager, client in zip(managers, clients):
+            await manager.connect(design_project_id, client, Mock(spec=WebSocket, accept=AsyncMock()))
+
+        # Act
+        for manager, client in zip(managers, clients):
+            await manager.broadcast(design_project_id, client.id, ELEMENT_MESSAGE)
+
+        # Assert
+        room_bus.publish.assert_called_once()
+        for manager, client in zip(managers, clients):
+            await manager.disconnect(design_project_id, client.id)
+
+    @pytest.mark.asyncio
+    async def test_malformed_room_bus_messages_do_not_stop_the_delivery(self) -> None:
+        # Arrange
+        manager = ClientConnectionManager(elements_sync_interval_seconds=3600)
+        design_project_id = generate_uuid()
+        client = create_sender()
+        websocket = Mock(spec=WebSocket, accept=AsyncMock(), send_text=AsyncMock())
+        await manager.connect(design_project_id, client, websocket)
+        channel = f"design-project:{design_project_id}"
+        room_bus_message = RoomBusMessage(origin="worker", message=ELEMENT_MESSAGE)
+
+        # Act
+        for data in (b'{"origin":"worker"}\n{}', b'{"changes":[1]}\n{}', b"\xff", room_bus_message.to_bytes()):
+            manager._receive_room_message(channel, data)
+        await asyncio.sleep(0)
+
+        # Assert
+        websocket.send_text.assert_awaited_once_with(ELEMENT_MESSAGE.text)
+        await manager.disconnect(design_project_id, client.id)
+
+
+class TestUnixSocketRoomBus:
+    @pytest.mark.asyncio
+    async def test_publish_reaches_the_other_workers_through_the_broker_of_the_first(
+        self, socket_path: str, mock_logger: Mock
+    ) -> None:
+        # Arrange
+        buses = [UnixSocketRoomBus(socket_path, mock_logger) for _ in range(2)]
+        received: list[tuple[str, bytes]] = []
+        await buses[0].start(lambda channel, data: None)
+        await buses[1].start(lambda channel, data: received.append((channel, data)))
+        await buses[1].subscribe(CHANNEL)
+
+        try:
+            # Act
+            await publish_until_received(buses[0], received, b"message")
+
+            # Assert
+            assert received[0] == (CHANNEL, b"message")
+        finally:
+            for bus in buses:
+                await bus.close()
+        assert not os.path.exists(socket_path)
+
+
+class TestRespRoomBus:
+    @pytest.mark.asyncio
+    async def test_publish_reaches_the_subscribers_of_the_channel(self, socket_path: str, mock_logger: Mock) -> None:
+        # Arrange
+        broker = LocalRoomBroker(socket_path, mock_logger)
+        await broker.start()
+        url = f"unix://{socket_path}"
+        publisher, subscriber, other_subscriber = (RespRoomBus(url, mock_logger) for _ in range(3))
+        received: list[tuple[str, bytes]] = []
+        other_received: list[tuple[str, bytes]] = []
+        await publisher.start(lambda channel, data: None)
+        await subscriber.start(lambda channel, data: received.append((channel, data)))
+        await other_subscriber.start(lambda channel, data: other_received.append((channel, data)))
+        await subscriber.subscribe(CHANNEL)
+        await other_subscriber.subscribe("design-project:other")
+
+        try:
+            # Act
+            await publish_until_received(publisher, received, b"\r\nbinary\x00")
+
+            # Assert
+            assert received[0] == (CHANNEL, b"\r\nbinary\x00")
+            assert other_received == []
+        finally:
+            for bus in (publisher, subscriber, other_subscriber):
+                await bus.close()
+            await broker.close()
+
+    @pytest.mark.asyncio
+    async def test_subscriber_goes_on_after_a_failing_handler_and_reconnects_after_a_protocol_error(
+        self, socket_path: str, mock_logger: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        # Arrange
+        monkeypatch.setattr(resp, "RECONNECT_DELAY_SECONDS", 0.01)
+        subscription_count = 0
+
+        async def serve_subscriber(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            nonlocal subscription_count
+            with contextlib.suppress(ConnectionError, asyncio.IncompleteReadError):
+                while True:
+                    command = await resp.read_reply(reader)
+                    if not isinstance(command, list) or command[0] != b"SUBSCRIBE":
+                        continue
+                    subscription_count += 1
+                    if subscription_count == 1:
+                        writer.write(b":not-a-number\r\n")
+                        continue
+                    for data in (b"fails", b"delivered"):
+                        writer.write(resp.encode_command(b"message", CHANNEL, data))
+
+        server = await asyncio.start_unix_server(serve_subscriber, socket_path)
+        received: list[tuple[str, bytes]] = []
+
+        def handle_message(channel: str, data: bytes) -> None:
+            if data == b"fails":
+                raise KeyError("event")
+            received.append((channel, data))
+
+        subscriber = RespRoomBus(f"unix://{socket_path}", mock_logger)
+        await subscriber.start(handle_message)
+
+        try:
+            # Act
+            await subscriber.subscribe(CHANNEL)
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if received:
+                    break
+
+            # Assert
+            assert subscription_count == 2
+            assert received == [(CHANNEL, b"delivered")]
+        finally:
+            await subscriber.close()
+            server.close()
@@ -0,0 +1,144 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.websockets import WebSocket
+
+from ....common.models import BoundingBox, UserRole
+from ....common.websocket.connection_manager import ClientConnectionManager
+from ....common.websocket.message import EncodedWebSocketMessage, Sender
+from ....common.websocket.spatial_index import (
+    ElementBoundsChange,
+    ElementBoundsChangeType,
+    RoomSpatialIndex,
+    UniformGridIndex,
+)
+from ....constants.websocket import WebSocketEvent
+from ....utils.common import generate_uuid
+
+
+def create_bounding_box(min_x: float, min_y: float, max_x: float, max_y: float) -> BoundingBox:
+    return BoundingBox(min_x=min_x, min_y=min_y, max_x=max_x, max_y=max_y)
+
+
+class TestUniformGridIndex:
+    def test_query_returns_intersecting_keys_only(self) -> None:
+        grid_index: UniformGridIndex[str] = UniformGridIndex(cell_size=100)
+        grid_index.insert("near", create_bounding_box(0, 0, 50, 50))
+        grid_index.insert("same_cell", create_bounding_box(60, 60, 90, 90))
+        grid_index.insert("far", create_bounding_box(1000, 1000, 1100, 1100))
+
+        assert grid_index.query(create_bounding_box(10, 10, 55, 55)) == {"near"}
+
+    def test_insert_moves_existing_key(self) -> None:
+        grid_index: UniformGridIndex[str] = UniformGridIndex(cell_size=100)
+        grid_index.insert("key", create_bounding_box(0, 0, 10, 10))
+        grid_index.insert("key", create_bounding_box(500, 500, 510, 510))
+
+        assert grid_index.query(create_bounding_box(0, 0, 10, 10)) == set()
+        assert grid_index.query(create_bounding_box(505, 505, 506, 506)) == {"key"}
+
+    def test_oversized_entries_are_always_candidates(self) -> None:
+        grid_index: UniformGridIndex[str] = UniformGridIndex(cell_size=1)
+        grid_index.insert("zoomed_out", create_bounding_box(-10_000, -10_000, 10_000, 10_000))
+
+        assert grid_index.query(create_bounding_box(5, 5, 6, 6)) == {"zoomed_out"}
+        assert grid_index.remove("zoomed_out") is not None
+        assert grid_index.query(create_bounding_box(5, 5, 6, 6)) == set()
+
+
+class TestRoomSpatialIndex:
+    def test_route_skips_clients_looking_elsewhere(self) -> None:
+        spatial_index = RoomSpatialIndex(cell_size=100)
+        watching_id, elsewhere_id, unreported_id = generate_uuid(), generate_uuid(), generate_uuid()
+        spatial_index.set_viewport(watching_id, create_bounding_box(0, 0, 200, 200))
+        spatial_index.set_viewport(elsewhere_id, create_bounding_box(5000, 5000, 5200, 5200))
+        element_id = generate_uuid()
+
+        recipient_ids = spatial_index.route(
+            [watching_id, elsewhere_id, unreported_id],
+            [ElementBoundsChange(element_id, ElementBoundsChangeType.Created, create_bounding_box(10, 10, 20, 20))],
+        )
+
+        assert recipient_ids == {watching_id, unreported_id}
+        assert spatial_index.pop_stale_element_ids(elsewhere_id) == {element_id}
+        assert spatial_index.pop_stale_element_ids(elsewhere_id) == set()
+
+    def test_route_reaches_viewports_an_element_leaves(self) -> None:
+        spatial_index = RoomSpatialIndex(cell_size=100)
+        client_id = generate_uuid()
+        spatial_index.set_viewport(client_id, create_bounding_box(0, 0, 200, 200))
+        element_id = generate_uuid()
+        spatial_index.route(
+            [], [ElementBoundsChange(element_id, ElementBoundsChangeType.Created, create_bounding_box(10, 10, 20, 20))]
+        )
+
+        recipient_ids = spatial_index.route(
+            [client_id],
+            [ElementBoundsChange(element_id, ElementBoundsChangeType.Moved, create_bounding_box(900, 900, 910, 910))],
+        )
+
+        assert recipient_ids == {client_id}
+
+    @pytest.mark.parametrize(
+        "change_type, bounding_box",
+        [
+            (ElementBoundsChangeType.Touched, None),
+            (ElementBoundsChangeType.Removed, None),
+            (ElementBoundsChangeType.Created, None),
+        ],
+    )
+    def test_route_unknown_bounds_reach_everyone(
+        self, change_type: ElementBoundsChangeType, bounding_box: BoundingBox | None
+    ) -> None:
+        spatial_index = RoomSpatialIndex(cell_size=100)
+        client_id = generate_uuid()
+        spatial_index.set_viewport(client_id, create_bounding_box(0, 0, 200, 200))
+
+        recipient_ids = spatial_index.route(
+            [client_id], [ElementBoundsChange(generate_uuid(), change_type, bounding_box)]
+        )
+
+        assert recipient_ids == {client_id}
+
+
+class TestClientConnectionManager:
+    @pytest.mark.asyncio
+    async def test_broadcast_element_changes_routes_by_viewport_and_syncs_the_rest(self) -> None:
+        # Arrange
+        manager = ClientConnectionManager(elements_sync_interval_seconds=3600)
+        design_project_id = generate_uuid()
+        websockets = {}
+        for _ in range(3):
+            client = Sender(
+                id=generate_uuid(), username="user", email="user@example.com", role=UserRole.OrganizationMember
+            )
+            websockets[client.id] = Mock(spec=WebSocket, accept=AsyncMock(), send_text=AsyncMock())
+            await manager.connect(design_project_id, client, websockets[client.id])
+        sender_id, watching_id, elsewhere_id = websockets.keys()
+        await manager.update_viewport(design_project_id, watching_id, create_bounding_box(0, 0, 100, 100))
+        await manager.update_viewport(design_project_id, elsewhere_id, create_bounding_box(500, 500, 600, 600))
+        element_id = generate_uuid()
+
+        # Act
+        await manager.broadcast_element_changes(
+            design_project_id,
+            sender_id,
+            EncodedWebSocketMessage(WebSocketEvent.ReceiveElementCreated, '{"event":"ReceiveElementCreated"}'),
+            [ElementBoundsChange(element_id, ElementBoundsChangeType.Created, create_bounding_box(1, 1, 2, 2))],
+        )
+        await manager.update_viewport(design_project_id, elsewhere_id, create_bounding_box(0, 0, 100, 100))
+        # NOTE: let the writer tasks drain the outbound queues
+        await asyncio.sleep(0)
+
+        # Assert
+        websockets[sender_id].send_text.assert_not_called()
+        websockets[watching_id].send_text.assert_awaited_once_with('{"event":"ReceiveElementCreated"}')
+        websockets[elsewhere_id].send_text.assert_awaited_once()
+        assert json.loads(websockets[elsewhere_id].send_text.await_args.args[0]) == {
+            "event": "ReceiveElementsSync",
+            "payload": {"stale_element_ids": [str(element_id)]},
+        }
+        for client_id in websockets:
+            await manager.disconnect(design_project_id, client_id)
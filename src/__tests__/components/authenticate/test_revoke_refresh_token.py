@@ -17,7 +17,7 @@ def mocks() -> MockSetUp:
     mock_jwt_service = Mock()
     mock_db = Mock()
     mock_logger = Mock()
-    mock_collection = Mock()
+    mock_collection = AsyncMock()
     mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
     return mock_jwt_service, mock_db, mock_logger, mock_collection
 
@@ -37,7 +37,7 @@ class TestRevokeRefreshToken:
         )
 
         # Mock collection
-        mock_collection.configure_mock(find_one=Mock(return_value=refresh_token.model_dump(by_alias=True)))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=refresh_token.model_dump(by_alias=True)))
 
         # Mock jwt_service
         mock_jwt_service.configure_mock(
@@ -74,7 +74,7 @@ class TestRevokeRefreshToken:
         mock_refresh_token_id = UUID("3f7c4e8b-5e4d-4326-9fd7-bcf8d470cb10")
 
         # Mock collection
-        mock_collection.configure_mock(find_one=Mock(return_value=None))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=None))
 
         # Mock jwt_service
         mock_jwt_service.configure_mock(
@@ -111,7 +111,7 @@ class TestRevokeRefreshToken:
         )
 
         # Mock collection
-        mock_collection.configure_mock(find_one=Mock(return_value=refresh_token.model_dump(by_alias=True)))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=refresh_token.model_dump(by_alias=True)))
 
         # Mock jwt_service
         mock_jwt_service.configure_mock(
@@ -149,7 +149,7 @@ class TestRevokeRefreshToken:
         )
 
         # Mock collection
-        mock_collection.configure_mock(find_one=Mock(return_value=refresh_token.model_dump(by_alias=True)))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=refresh_token.model_dump(by_alias=True)))
 
         # Mock jwt_service
         mock_jwt_service.configure_mock(
@@ -188,7 +188,7 @@ class TestRevokeRefreshToken:
         )
 
         # Mock collection
-        mock_collection.configure_mock(find_one=Mock(return_value=refresh_token.model_dump(by_alias=True)))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=refresh_token.model_dump(by_alias=True)))
 
         # Mock jwt_service
         mock_jwt_service.configure_mock(
@@ -0,0 +1,269 @@
+from unittest.mock import AsyncMock, Mock
+
+import pydantic as p
+import pytest
+
+from .....common.models import APPENDED_POINTS_FIELD, PackedPoints, ShapeType
+from .....components.design_projects.elements import BaseAppendPoints, ResolveElementWriteMiss
+from .....components.design_projects.elements.base_append_points import (
+    APPENDED_CHUNK_COUNT_FIELD,
+    MAX_APPENDED_POINTS_CHUNKS,
+)
+from .....exceptions import NotFoundError
+from .....utils.common import generate_uuid
+
+
+def configure_collection(mock_db: Mock, mock_collection: Mock, appended_element_data: list[dict | None]) -> None:
+    mock_collection.configure_mock(
+        find_one_and_update=AsyncMock(side_effect=appended_element_data),
+        find_one=AsyncMock(return_value=None),
+        update_one=AsyncMock(return_value=Mock(matched_count=1)),
+    )
+    mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+
+
+class TestBaseAppendPoints:
+    @pytest.mark.asyncio
+    async def test_aexecute_pushes_only_the_new_points_and_grows_the_bounding_box(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        element_id = generate_uuid()
+        points = PackedPoints.from_values([20, 5, 30, -5])
+        element_data = {
+            "_id": element_id,
+            "shapeType": ShapeType.Line,
+            "x": 100,
+            "y": 100,
+            "bbox": {"min_x": 100.0, "min_y": 100.0, "max_x": 110.0, "max_y": 110.0},
+            APPENDED_CHUNK_COUNT_FIELD: 1,
+        }
+        configure_collection(mock_db, mock_collection, [element_data])
+        base_append_points = BaseAppendPoints(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        response = await base_append_points.aexecute(
+            BaseAppendPoints.Request(
+                organization_id=organization_id, project_id=project_id, element_id=element_id, points=points
+            )
+        )
+
+        # Assert
+        assert response.points == points
+        assert response.bbox is not None
+        assert response.bbox.model_dump() == {"min_x": 100.0, "min_y": 95.0, "max_x": 130.0, "max_y": 110.0}
+        (element_filter, update), kwargs = mock_collection.find_one_and_update.call_args
+        assert element_filter == {
+            "_id": element_id,
+            "project_id": project_id,
+            "organization_id": organization_id,
+            "shapeType": {"$in": [ShapeType.Line, ShapeType.Arrow]},
+        }
+        assert update == {
+            "$push": {APPENDED_POINTS_FIELD: points.to_binary()},
+            "$set": {"updated_at": response.updated_at},
+        }
+        assert "points" not in kwargs["projection"]
+        assert APPENDED_POINTS_FIELD not in kwargs["projection"]
+        mock_collection.update_one.assert_awaited_once_with(
+            {"_id": element_id, "updated_at": response.updated_at},
+            {"$min": {"bbox.min_x": 100.0, "bbox.min_y": 95.0}, "$max": {"bbox.max_x": 130.0, "bbox.max_y": 110.0}},
+        )
+        mock_collection.find_one.assert_not_called()
+        mock_resolve_element_write_miss.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_after_a_later_write_recomputes_the_bounding_box(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        element_id = generate_uuid()
+        element_data = {
+            "_id": element_id,
+            "shapeType": ShapeType.Line,
+            "bbox": {"min_x": 0.0, "min_y": 0.0, "max_x": 10.0, "max_y": 10.0},
+            APPENDED_CHUNK_COUNT_FIELD: 1,
+        }
+        configure_collection(mock_db, mock_collection, [element_data])
+        later_updated_at = Mock()
+        mock_collection.configure_mock(
+            update_one=AsyncMock(side_effect=[Mock(matched_count=0), Mock(matched_count=1)]),
+            find_one=AsyncMock(
+                return_value={
+                    "_id": element_id,
+                    "shapeType": ShapeType.Line,
+                    "points": PackedPoints.from_values([0, 0, 40, 40]).to_binary(),
+                    "updated_at": later_updated_at,
+                }
+            ),
+        )
+        base_append_points = BaseAppendPoints(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        response = await base_append_points.aexecute(
+            BaseAppendPoints.Request(
+                organization_id=generate_uuid(),
+                project_id=generate_uuid(),
+                element_id=element_id,
+                points=PackedPoints.from_values([20, 20]),
+            )
+        )
+
+        # Assert
+        assert response.bbox is not None
+        assert response.bbox.model_dump() == {"min_x": 0.0, "min_y": 0.0, "max_x": 40.0, "max_y": 40.0}
+        assert mock_collection.find_one.await_args.args[0] == {"_id": element_id}
+        assert mock_collection.update_one.await_args.args == (
+            {"_id": element_id, "updated_at": later_updated_at},
+            {"$set": {"bbox": {"min_x": 0.0, "min_y": 0.0, "max_x": 40.0, "max_y": 40.0}}},
+        )
+
+    @pytest.mark.asyncio
+    async def test_aexecute_inside_the_bounding_box_writes_nothing_else(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        element_id = generate_uuid()
+        element_data = {
+            "_id": element_id,
+            "shapeType": ShapeType.Line,
+            "bbox": {"min_x": 0.0, "min_y": 0.0, "max_x": 10.0, "max_y": 10.0},
+            APPENDED_CHUNK_COUNT_FIELD: 1,
+        }
+        configure_collection(mock_db, mock_collection, [element_data])
+        base_append_points = BaseAppendPoints(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        await base_append_points.aexecute(
+            BaseAppendPoints.Request(
+                organization_id=generate_uuid(),
+                project_id=generate_uuid(),
+                element_id=element_id,
+                points=PackedPoints.from_values([2, 2, 8, 8]),
+            )
+        )
+
+        # Assert
+        mock_collection.update_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_folds_the_chunks_back_into_points(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        element_id = generate_uuid()
+        element_data = {
+            "_id": element_id,
+            "shapeType": ShapeType.Line,
+            "bbox": {"min_x": 0.0, "min_y": 0.0, "max_x": 10.0, "max_y": 10.0},
+            APPENDED_CHUNK_COUNT_FIELD: MAX_APPENDED_POINTS_CHUNKS,
+        }
+        configure_collection(mock_db, mock_collection, [element_data])
+        mock_collection.find_one.return_value = {
+            "_id": element_id,
+            "points": PackedPoints.from_values([0, 0, 1, 1]).to_binary(),
+            APPENDED_POINTS_FIELD: [
+                PackedPoints.from_values([2, 2]).to_binary(),
+                PackedPoints.from_values([3, 3.1]).to_binary(),
+            ],
+        }
+        base_append_points = BaseAppendPoints(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        response = await base_append_points.aexecute(
+            BaseAppendPoints.Request(
+                organization_id=generate_uuid(),
+                project_id=generate_uuid(),
+                element_id=element_id,
+                points=PackedPoints.from_values([3, 3.1]),
+            )
+        )
+
+        # Assert
+        (element_filter, update), _ = mock_collection.update_one.call_args
+        assert element_filter == {"_id": element_id, "updated_at": response.updated_at}
+        assert PackedPoints(update["$set"]["points"]).to_list() == [0, 0, 1, 1, 2, 2, 3, 3.1]
+        assert update["$unset"] == {APPENDED_POINTS_FIELD: ""}
+
+    @pytest.mark.asyncio
+    async def test_aexecute_retries_after_migrating_embedded_elements(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        element_id = generate_uuid()
+        element_data = {
+            "_id": element_id,
+            "shapeType": ShapeType.Line,
+            "bbox": {"min_x": 0.0, "min_y": 0.0, "max_x": 10.0, "max_y": 10.0},
+            APPENDED_CHUNK_COUNT_FIELD: 1,
+        }
+        configure_collection(mock_db, mock_collection, [None, element_data])
+        mock_resolve_element_write_miss.configure_mock(
+            aexecute=AsyncMock(return_value=ResolveElementWriteMiss.Response(migrated_count=3))
+        )
+        base_append_points = BaseAppendPoints(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        response = await base_append_points.aexecute(
+            BaseAppendPoints.Request(
+                organization_id=organization_id,
+                project_id=project_id,
+                element_id=element_id,
+                points=PackedPoints.from_values([1, 1]),
+            )
+        )
+
+        # Assert
+        assert response.element_id == element_id
+        assert mock_collection.find_one_and_update.await_count == 2
+        mock_resolve_element_write_miss.aexecute.assert_awaited_once_with(
+            ResolveElementWriteMiss.Request(
+                organization_id=organization_id, project_id=project_id, element_id=element_id
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_aexecute_missing_element_should_raise(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        configure_collection(mock_db, mock_collection, [None, None])
+        mock_resolve_element_write_miss.configure_mock(
+            aexecute=AsyncMock(return_value=ResolveElementWriteMiss.Response(migrated_count=1))
+        )
+        base_append_points = BaseAppendPoints(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await base_append_points.aexecute(
+                BaseAppendPoints.Request(
+                    organization_id=generate_uuid(),
+                    project_id=generate_uuid(),
+                    element_id=generate_uuid(),
+                    points=PackedPoints.from_values([1, 1]),
+                )
+            )
+        mock_resolve_element_write_miss.aexecute.assert_awaited_once()
+
+    @pytest.mark.parametrize("points", [[], [1, 2, 3]])
+    def test_request_with_incomplete_points_should_raise(self, points: list[float]) -> None:
+        with pytest.raises(p.ValidationError):
+            BaseAppendPoints.Request(
+                organization_id=generate_uuid(), project_id=generate_uuid(), element_id=generate_uuid(), points=points
+            )
@@ -0,0 +1,292 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from .....common.models import AffineTransformModel, CircleModel, PackedPoints, RectangleModel, ShapeType
+from .....components.design_projects.elements import (
+    BaseDeleteBatchElements,
+    BaseTransformElements,
+    BaseUpdateBatchElements,
+    MigrateProjectElements,
+)
+from .....utils.common import generate_uuid, get_utc_now
+
+
+def configure_migrate_project_elements(mock_migrate_project_elements: Mock, migrated_count: int) -> None:
+    mock_migrate_project_elements.configure_mock(
+        aexecute=AsyncMock(return_value=MigrateProjectElements.Response(migrated_count=migrated_count))
+    )
+
+
+class TestBaseUpdateBatchElements:
+    @pytest.mark.asyncio
+    async def test_aexecute_replaces_every_element_in_one_bulk_write(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        elements = [
+            CircleModel(x=1, y=1, radius=1, order_key="zz"),
+            RectangleModel(x=2, y=2, width=2, height=2, order_key="zy"),
+        ]
+        created_at = get_utc_now()
+        mock_collection.configure_mock(
+            bulk_write=AsyncMock(return_value=Mock(matched_count=2)),
+            find=Mock(
+                return_value=Mock(
+                    to_list=AsyncMock(
+                        return_value=[
+                            {"_id": element.id, "order_key": order_key, "created_at": created_at}
+                            for element, order_key in zip(elements, ["a1", "a0"])
+                        ]
+                    )
+                )
+            ),
+        )
+        base_update_batch_elements = BaseUpdateBatchElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        response = await base_update_batch_elements.aexecute(
+            BaseUpdateBatchElements.Request(elements=elements, organization_id=organization_id, project_id=project_id)
+        )
+
+        # Assert
+        assert [element.id for element in response.updated_elements] == [element.id for element in elements]
+        assert [element.order_key for element in response.updated_elements] == ["a1", "a0"]
+        assert [element.created_at for element in response.updated_elements] == [created_at, created_at]
+        mock_collection.bulk_write.assert_awaited_once()
+        replace_requests = mock_collection.bulk_write.call_args.args[0]
+        assert [replace_request._filter for replace_request in replace_requests] == [
+            {"_id": element.id, "project_id": project_id, "organization_id": organization_id} for element in elements
+        ]
+        mock_migrate_project_elements.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_some_elements_are_missing_should_skip_them(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        elements = [CircleModel(x=1, y=1, radius=1), CircleModel(x=2, y=2, radius=2)]
+        mock_collection.configure_mock(
+            bulk_write=AsyncMock(return_value=Mock(matched_count=1)),
+            find=Mock(return_value=Mock(to_list=AsyncMock(return_value=[{"_id": elements[1].id}]))),
+        )
+        configure_migrate_project_elements(mock_migrate_project_elements, 0)
+        base_update_batch_elements = BaseUpdateBatchElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        response = await base_update_batch_elements.aexecute(
+            BaseUpdateBatchElements.Request(
+                elements=elements, organization_id=generate_uuid(), project_id=generate_uuid()
+            )
+        )
+
+        # Assert
+        assert [element.id for element in response.updated_elements] == [elements[1].id]
+        assert mock_collection.bulk_write.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_another_write_migrated_the_project_should_retry(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        elements = [CircleModel(x=1, y=1, radius=1), CircleModel(x=2, y=2, radius=2)]
+        mock_collection.configure_mock(
+            bulk_write=AsyncMock(side_effect=[Mock(matched_count=0), Mock(matched_count=2)]),
+            find=Mock(return_value=Mock(to_list=AsyncMock(return_value=[{"_id": element.id} for element in elements]))),
+        )
+        configure_migrate_project_elements(mock_migrate_project_elements, 0)
+        base_update_batch_elements = BaseUpdateBatchElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        response = await base_update_batch_elements.aexecute(
+            BaseUpdateBatchElements.Request(
+                elements=elements, organization_id=generate_uuid(), project_id=generate_uuid()
+            )
+        )
+
+        # Assert
+        assert [element.id for element in response.updated_elements] == [element.id for element in elements]
+        assert mock_collection.bulk_write.await_count == 2
+
+
+class TestBaseDeleteBatchElements:
+    @pytest.mark.asyncio
+    async def test_aexecute_deletes_every_element_in_one_write(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        element_ids = [generate_uuid(), generate_uuid()]
+        mock_collection.configure_mock(
+            find=Mock(
+                return_value=Mock(to_list=AsyncMock(return_value=[{"_id": element_id} for element_id in element_ids]))
+            ),
+            delete_many=AsyncMock(return_value=Mock(deleted_count=2)),
+        )
+        base_delete_batch_elements = BaseDeleteBatchElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        response = await base_delete_batch_elements.aexecute(
+            BaseDeleteBatchElements.Request(
+                element_ids=[*element_ids, element_ids[0]], organization_id=organization_id, project_id=project_id
+            )
+        )
+
+        # Assert
+        assert response.deleted_element_ids == element_ids
+        mock_collection.delete_many.assert_awaited_once_with(
+            {"_id": {"$in": element_ids}, "project_id": project_id, "organization_id": organization_id}
+        )
+        mock_migrate_project_elements.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_some_elements_are_missing_or_forbidden_should_leave_them_out(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        element_ids = [generate_uuid(), generate_uuid(), generate_uuid()]
+        mock_collection.configure_mock(
+            find=Mock(return_value=Mock(to_list=AsyncMock(return_value=[{"_id": element_ids[1]}]))),
+            delete_many=AsyncMock(return_value=Mock(deleted_count=1)),
+        )
+        configure_migrate_project_elements(mock_migrate_project_elements, 0)
+        base_delete_batch_elements = BaseDeleteBatchElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        response = await base_delete_batch_elements.aexecute(
+            BaseDeleteBatchElements.Request(
+                element_ids=element_ids, organization_id=organization_id, project_id=project_id
+            )
+        )
+
+        # Assert
+        assert response.deleted_element_ids == [element_ids[1]]
+        mock_collection.delete_many.assert_awaited_once_with(
+            {"_id": {"$in": [element_ids[1]]}, "project_id": project_id, "organization_id": organization_id}
+        )
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_nothing_matches_should_not_delete(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        mock_collection.configure_mock(find=Mock(return_value=Mock(to_list=AsyncMock(return_value=[]))))
+        configure_migrate_project_elements(mock_migrate_project_elements, 0)
+        base_delete_batch_elements = BaseDeleteBatchElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        response = await base_delete_batch_elements.aexecute(
+            BaseDeleteBatchElements.Request(
+                element_ids=[generate_uuid()], organization_id=generate_uuid(), project_id=generate_uuid()
+            )
+        )
+
+        # Assert
+        assert response.deleted_element_ids == []
+        mock_collection.delete_many.assert_not_called()
+
+
+class TestBaseTransformElements:
+    @pytest.mark.asyncio
+    async def test_aexecute_transforms_every_element_in_one_bulk_write(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        rectangle_id, line_id = generate_uuid(), generate_uuid()
+        elements_data = [
+            {"_id": rectangle_id, "shapeType": ShapeType.Rectangle, "x": 10, "y": 20, "width": 4, "height": 2},
+            {"_id": line_id, "shapeType": ShapeType.Line, "x": 0, "y": 0, "points": [0, 0, 10, 0], "rotationDeg": 0},
+        ]
+        mock_collection.configure_mock(
+            find=Mock(return_value=Mock(to_list=AsyncMock(return_value=elements_data))),
+            bulk_write=AsyncMock(return_value=Mock(matched_count=2)),
+        )
+        base_transform_elements = BaseTransformElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+        # NOTE: rotate by 90 degrees around the origin, then move right by 5
+        transform = AffineTransformModel(a=0, b=1, c=-1, d=0, e=5, f=0)
+
+        # Act
+        response = await base_transform_elements.aexecute(
+            BaseTransformElements.Request(
+                organization_id=organization_id,
+                project_id=project_id,
+                element_ids=[rectangle_id, line_id, rectangle_id],
+                transform=transform,
+            )
+        )
+
+        # Assert
+        assert response.transformed_element_ids == [rectangle_id, line_id]
+        assert response.transform == transform
+        mock_collection.find.assert_called_once()
+        assert mock_collection.find.call_args.args[0]["_id"] == {"$in": [rectangle_id, line_id]}
+        mock_collection.bulk_write.assert_awaited_once()
+        rectangle_update, line_update = mock_collection.bulk_write.call_args.args[0]
+        assert rectangle_update._filter == {
+            "_id": rectangle_id,
+            "project_id": project_id,
+            "organization_id": organization_id,
+        }
+        rectangle_fields = rectangle_update._doc["$set"]
+        assert (rectangle_fields["x"], rectangle_fields["y"]) == (-15, 10)
+        assert rectangle_fields["rotation"] == pytest.approx(90)
+        assert (rectangle_fields["scaleX"], rectangle_fields["scaleY"]) == (pytest.approx(1), pytest.approx(1))
+        assert "skewX" not in rectangle_fields
+        assert rectangle_fields["bbox"] == pytest.approx({"min_x": -17, "min_y": 10, "max_x": -15, "max_y": 14})
+        line_fields = line_update._doc["$set"]
+        assert (line_fields["x"], line_fields["y"]) == (5, 0)
+        assert PackedPoints(line_fields["points"]).to_list() == pytest.approx([0, 0, 0, 10])
+        assert "rotation" not in line_fields
+        assert "$unset" not in line_update._doc
+        assert [bounding_box is not None for bounding_box in response.bounding_boxes] == [True, True]
+        mock_migrate_project_elements.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_elements_are_missing_should_migrate_and_skip_them(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        mock_collection.configure_mock(
+            find=Mock(return_value=Mock(to_list=AsyncMock(return_value=[]))),
+            bulk_write=AsyncMock(),
+        )
+        configure_migrate_project_elements(mock_migrate_project_elements, 0)
+        base_transform_elements = BaseTransformElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        response = await base_transform_elements.aexecute(
+            BaseTransformElements.Request(
+                organization_id=generate_uuid(),
+                project_id=generate_uuid(),
+                element_ids=[generate_uuid()],
+                transform=AffineTransformModel(e=1),
+            )
+        )
+
+        # Assert
+        assert response.transformed_element_ids == []
+        mock_migrate_project_elements.aexecute.assert_awaited_once()
+        mock_collection.bulk_write.assert_not_called()
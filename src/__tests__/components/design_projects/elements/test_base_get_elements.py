@@ -0,0 +1,143 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from .....common.models import BoundingBox, CircleModel
+from .....components.design_projects.elements import BaseGetElements, MigrateProjectElements
+from .....exceptions import BadRequestError
+from .....utils.common import generate_uuid
+from .....utils.design_element import to_element_document
+
+
+def configure_collection(mock_db: Mock, mock_collection: Mock, project_data: dict | None, elements_data: list[dict]):
+    mock_collection.configure_mock(
+        find_one=AsyncMock(return_value=project_data),
+        find=Mock(return_value=Mock(sort=Mock(return_value=Mock(to_list=AsyncMock(return_value=elements_data))))),
+    )
+    mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+
+
+class TestBaseGetElements:
+    @pytest.mark.asyncio
+    async def test_aexecute_reads_elements_collection(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        project_id = generate_uuid()
+        organization_id = generate_uuid()
+        mock_element = CircleModel(x=1, y=2, radius=3)
+        configure_collection(
+            mock_db,
+            mock_collection,
+            {"_id": project_id, "organization_id": organization_id, "has_embedded_elements": False},
+            [to_element_document(mock_element, project_id, organization_id)],
+        )
+        base_get_elements = BaseGetElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        response = await base_get_elements.aexecute(
+            BaseGetElements.Request(organization_id=organization_id, project_id=project_id)
+        )
+
+        # Assert
+        assert response.elements == [mock_element]
+        mock_collection.find.assert_called_once_with({"project_id": project_id})
+        mock_migrate_project_elements.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_with_viewport_filters_by_bounding_box(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        project_id = generate_uuid()
+        organization_id = generate_uuid()
+        configure_collection(
+            mock_db,
+            mock_collection,
+            {"_id": project_id, "organization_id": organization_id, "has_embedded_elements": False},
+            [],
+        )
+        base_get_elements = BaseGetElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        await base_get_elements.aexecute(
+            BaseGetElements.Request(
+                organization_id=organization_id,
+                project_id=project_id,
+                viewport=BoundingBox(min_x=0, min_y=10, max_x=100, max_y=200),
+            )
+        )
+
+        # Assert
+        mock_collection.find.assert_called_once_with(
+            {
+                "project_id": project_id,
+                "$or": [
+                    {"bbox.min_x": None},
+                    {
+                        "bbox.min_x": {"$lte": 100},
+                        "bbox.max_x": {"$gte": 0},
+                        "bbox.min_y": {"$lte": 200},
+                        "bbox.max_y": {"$gte": 10},
+                    },
+                ],
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_aexecute_migrates_embedded_elements_first(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        project_id = generate_uuid()
+        organization_id = generate_uuid()
+        configure_collection(
+            mock_db,
+            mock_collection,
+            {"_id": project_id, "organization_id": organization_id, "has_embedded_elements": True},
+            [],
+        )
+        mock_migrate_project_elements.configure_mock(
+            aexecute=AsyncMock(return_value=MigrateProjectElements.Response(migrated_count=2))
+        )
+        base_get_elements = BaseGetElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act
+        await base_get_elements.aexecute(
+            BaseGetElements.Request(organization_id=organization_id, project_id=project_id)
+        )
+
+        # Assert
+        mock_migrate_project_elements.aexecute.assert_awaited_once_with(
+            MigrateProjectElements.Request(project_id=project_id)
+        )
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_project_belongs_to_another_organization_should_raise(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        project_id = generate_uuid()
+        configure_collection(
+            mock_db,
+            mock_collection,
+            {"_id": project_id, "organization_id": generate_uuid(), "has_embedded_elements": True},
+            [],
+        )
+        base_get_elements = BaseGetElements(
+            db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+        )
+
+        # Act & Assert
+        with pytest.raises(BadRequestError):
+            await base_get_elements.aexecute(
+                BaseGetElements.Request(organization_id=generate_uuid(), project_id=project_id)
+            )
+        mock_migrate_project_elements.aexecute.assert_not_called()
+        mock_collection.find.assert_not_called()
@@ -0,0 +1,224 @@
+from unittest.mock import AsyncMock, Mock
+
+import pydantic as p
+import pytest
+
+from .....common.models import BoundingBox, ElementPatchModel, ShapeType
+from .....components.design_projects.elements import BasePatchElement, ResolveElementWriteMiss
+from .....exceptions import ForbiddenError
+from .....utils.common import generate_uuid
+
+
+def configure_collection(mock_db: Mock, mock_collection: Mock, matched_counts: list[int]) -> None:
+    mock_collection.configure_mock(
+        update_one=AsyncMock(side_effect=[Mock(matched_count=matched_count) for matched_count in matched_counts]),
+    )
+    mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+
+
+class TestElementPatchModel:
+    def test_changes_are_validated_against_the_concrete_model(self) -> None:
+        patch = ElementPatchModel(shape_type=ShapeType.Circle, changes={"x": "1", "radius": 3, "fill": None})
+
+        assert patch.changes == {"x": 1.0, "radius": 3.0, "fill": None}
+
+    @pytest.mark.parametrize(
+        "shape_type, changes",
+        [
+            (ShapeType.Rectangle, {"radius": 3}),
+            (ShapeType.Circle, {"_id": str(generate_uuid())}),
+            (ShapeType.Circle, {"shapeType": ShapeType.Rectangle}),
+            (ShapeType.Circle, {"x": "left"}),
+            (ShapeType.Image, {"image": None}),
+            (ShapeType.Circle, {}),
+        ],
+    )
+    def test_invalid_changes_should_raise(self, shape_type: ShapeType, changes: dict) -> None:
+        with pytest.raises(p.ValidationError):
+            ElementPatchModel(shape_type=shape_type, changes=changes)
+
+
+class TestBasePatchElement:
+    @pytest.mark.asyncio
+    async def test_aexecute_sets_only_changed_fields(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        element_id = generate_uuid()
+        patch = ElementPatchModel(shape_type=ShapeType.Circle, changes={"fill": "red", "opacity": 0.5, "stroke": None})
+        configure_collection(mock_db, mock_collection, [1])
+        base_patch_element = BasePatchElement(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        response = await base_patch_element.aexecute(
+            BasePatchElement.Request(
+                patch=patch, organization_id=organization_id, project_id=project_id, element_id=element_id
+            )
+        )
+
+        # Assert
+        assert response.patched_element_id == element_id
+        assert response.patch == patch
+        mock_collection.update_one.assert_awaited_once_with(
+            {
+                "_id": element_id,
+                "project_id": project_id,
+                "organization_id": organization_id,
+                "shapeType": ShapeType.Circle,
+            },
+            {"$set": {"fill": "red", "opacity": 0.5, "updated_at": response.updated_at}, "$unset": {"stroke": ""}},
+        )
+        mock_collection.count_documents.assert_not_called()
+        mock_resolve_element_write_miss.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_with_position_changes_shifts_the_bounding_box_in_the_same_write(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        element_id = generate_uuid()
+        patch = ElementPatchModel(shape_type=ShapeType.Text, changes={"x": 10, "fill": "$y"})
+        stored_bounding_box = {"min_x": 5.0, "min_y": 15.0, "max_x": 15.0, "max_y": 25.0}
+        mock_collection.configure_mock(
+            find_one_and_update=AsyncMock(return_value={"_id": element_id, "bbox": stored_bounding_box})
+        )
+        mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+        base_patch_element = BasePatchElement(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        response = await base_patch_element.aexecute(
+            BasePatchElement.Request(
+                patch=patch, organization_id=generate_uuid(), project_id=generate_uuid(), element_id=element_id
+            )
+        )
+
+        # Assert
+        assert response.bbox == BoundingBox.model_validate(stored_bounding_box)
+        [pipeline] = [call.args[1] for call in mock_collection.find_one_and_update.await_args_list]
+        [stage] = pipeline
+        assert stage["$set"]["x"] == {"$literal": 10.0}
+        assert stage["$set"]["fill"] == {"$literal": "$y"}
+        assert stage["$set"]["bbox"]["$cond"][2]["min_x"] == {
+            "$add": ["$bbox.min_x", {"$subtract": [10.0, {"$ifNull": ["$x", 0.0]}]}]
+        }
+        assert stage["$set"]["bbox"]["$cond"][2]["min_y"] == {"$add": ["$bbox.min_y", 0.0]}
+        mock_collection.update_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_with_geometry_changes_stores_the_new_bounding_box(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        element_id = generate_uuid()
+        patch = ElementPatchModel(shape_type=ShapeType.Circle, changes={"radius": 5})
+        mock_collection.configure_mock(
+            find_one_and_update=AsyncMock(
+                return_value={"_id": element_id, "shapeType": ShapeType.Circle, "x": 10, "y": 20, "radius": 5}
+            )
+        )
+        mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+        base_patch_element = BasePatchElement(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        response = await base_patch_element.aexecute(
+            BasePatchElement.Request(
+                patch=patch, organization_id=generate_uuid(), project_id=generate_uuid(), element_id=element_id
+            )
+        )
+
+        # Assert
+        mock_collection.find_one_and_update.assert_awaited_once()
+        assert mock_collection.find_one_and_update.await_args.args[1]["$set"]["bbox"] is None
+        mock_collection.update_one.assert_awaited_once_with(
+            {"_id": element_id, "updated_at": response.updated_at},
+            {"$set": {"bbox": {"min_x": 5.0, "min_y": 15.0, "max_x": 15.0, "max_y": 25.0}}},
+        )
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_nothing_changes_should_not_resolve_a_miss(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        mock_collection.configure_mock(update_one=AsyncMock(return_value=Mock(matched_count=1, modified_count=0)))
+        base_patch_element = BasePatchElement(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        await base_patch_element.aexecute(
+            BasePatchElement.Request(
+                patch=ElementPatchModel(shape_type=ShapeType.Rectangle, changes={"fill": "blue"}),
+                organization_id=generate_uuid(),
+                project_id=generate_uuid(),
+                element_id=generate_uuid(),
+            )
+        )
+
+        # Assert
+        mock_collection.update_one.assert_awaited_once()
+        mock_resolve_element_write_miss.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_retries_after_migrating_embedded_elements(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        element_id = generate_uuid()
+        configure_collection(mock_db, mock_collection, [0, 1])
+        mock_resolve_element_write_miss.configure_mock(
+            aexecute=AsyncMock(return_value=ResolveElementWriteMiss.Response(migrated_count=3))
+        )
+        base_patch_element = BasePatchElement(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        await base_patch_element.aexecute(
+            BasePatchElement.Request(
+                patch=ElementPatchModel(shape_type=ShapeType.Rectangle, changes={"fill": "blue"}),
+                organization_id=organization_id,
+                project_id=project_id,
+                element_id=element_id,
+            )
+        )
+
+        # Assert
+        assert mock_collection.update_one.await_count == 2
+        mock_resolve_element_write_miss.aexecute.assert_awaited_once_with(
+            ResolveElementWriteMiss.Request(
+                organization_id=organization_id, project_id=project_id, element_id=element_id
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_write_misses_should_raise_resolved_error(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        configure_collection(mock_db, mock_collection, [0])
+        mock_resolve_element_write_miss.configure_mock(aexecute=AsyncMock(side_effect=ForbiddenError("forbidden")))
+        base_patch_element = BasePatchElement(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act & Assert
+        with pytest.raises(ForbiddenError):
+            await base_patch_element.aexecute(
+                BasePatchElement.Request(
+                    patch=ElementPatchModel(shape_type=ShapeType.Text, changes={"fontStyle": "bold"}),
+                    organization_id=generate_uuid(),
+                    project_id=generate_uuid(),
+                    element_id=generate_uuid(),
+                )
+            )
+        mock_collection.update_one.assert_awaited_once()
@@ -0,0 +1,238 @@
+from unittest.mock import AsyncMock, Mock
+
+import pydantic as p
+import pytest
+
+from .....common.models import ElementPlacement, ElementPlacementModel
+from .....components.design_projects.elements import BaseGetBoundaryOrderKey, BaseReorderElement
+from .....exceptions import BadRequestError, NotFoundError
+from .....utils.common import generate_uuid
+
+
+def create_base_reorder_element(
+    mock_db: Mock,
+    mock_collection: Mock,
+    mock_logger: Mock,
+    mock_base_get_boundary_order_key: Mock,
+    mock_resolve_element_write_miss: Mock,
+    boundary_order_key: str | None = None,
+    matched_counts: list[int] = [1],
+) -> BaseReorderElement:
+    mock_collection.configure_mock(
+        update_one=AsyncMock(side_effect=[Mock(matched_count=matched_count) for matched_count in matched_counts]),
+    )
+    mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+    mock_base_get_boundary_order_key.configure_mock(
+        aexecute=AsyncMock(return_value=BaseGetBoundaryOrderKey.Response(order_key=boundary_order_key))
+    )
+    return BaseReorderElement(
+        db=mock_db,
+        logger=mock_logger,
+        base_get_boundary_order_key=mock_base_get_boundary_order_key,
+        resolve_element_write_miss=mock_resolve_element_write_miss,
+    )
+
+
+class TestElementPlacementModel:
+    @pytest.mark.parametrize(
+        "placement, has_target_element_id",
+        [
+            (ElementPlacement.Front, True),
+            (ElementPlacement.Back, True),
+            (ElementPlacement.Above, False),
+            (ElementPlacement.Below, False),
+        ],
+    )
+    def test_invalid_target_element_id_should_raise(
+        self, placement: ElementPlacement, has_target_element_id: bool
+    ) -> None:
+        with pytest.raises(p.ValidationError):
+            ElementPlacementModel(
+                placement=placement, target_element_id=generate_uuid() if has_target_element_id else None
+            )
+
+
+class TestBaseReorderElement:
+    @pytest.mark.asyncio
+    async def test_aexecute_to_front_writes_a_key_after_the_front_most_one(
+        self,
+        mock_db: Mock,
+        mock_collection: Mock,
+        mock_logger: Mock,
+        mock_base_get_boundary_order_key: Mock,
+        mock_resolve_element_write_miss: Mock,
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        element_id = generate_uuid()
+        base_reorder_element = create_base_reorder_element(
+            mock_db,
+            mock_collection,
+            mock_logger,
+            mock_base_get_boundary_order_key,
+            mock_resolve_element_write_miss,
+            boundary_order_key="a5",
+        )
+
+        # Act
+        response = await base_reorder_element.aexecute(
+            BaseReorderElement.Request(
+                organization_id=organization_id,
+                project_id=project_id,
+                element_id=element_id,
+                placement=ElementPlacementModel(placement=ElementPlacement.Front),
+            )
+        )
+
+        # Assert
+        assert response.reordered_element_id == element_id
+        assert response.order_key > "a5"
+        element_filter, update = mock_collection.update_one.call_args.args
+        assert element_filter == {"_id": element_id, "project_id": project_id, "organization_id": organization_id}
+        assert update["$set"]["order_key"] == response.order_key
+        mock_resolve_element_write_miss.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "placement, neighbor_order_key",
+        [(ElementPlacement.Above, "a2"), (ElementPlacement.Above, None), (ElementPlacement.Below, "Zz")],
+    )
+    async def test_aexecute_relative_to_target_writes_a_key_between_target_and_neighbor(
+        self,
+        mock_db: Mock,
+        mock_collection: Mock,
+        mock_logger: Mock,
+        mock_base_get_boundary_order_key: Mock,
+        mock_resolve_element_write_miss: Mock,
+        placement: ElementPlacement,
+        neighbor_order_key: str | None,
+    ) -> None:
+        # Arrange
+        target_order_key = "a0"
+        base_reorder_element = create_base_reorder_element(
+            mock_db, mock_collection, mock_logger, mock_base_get_boundary_order_key, mock_resolve_element_write_miss
+        )
+        neighbor_elements_data = [{"order_key": neighbor_order_key}] if neighbor_order_key else []
+        mock_collection.configure_mock(
+            find_one=AsyncMock(return_value={"order_key": target_order_key}),
+            find=Mock(
+                return_value=Mock(
+                    sort=Mock(
+                        return_value=Mock(
+                            limit=Mock(return_value=Mock(to_list=AsyncMock(return_value=neighbor_elements_data)))
+                        )
+                    )
+                )
+            ),
+        )
+
+        # Act
+        response = await base_reorder_element.aexecute(
+            BaseReorderElement.Request(
+                organization_id=generate_uuid(),
+                project_id=generate_uuid(),
+                element_id=generate_uuid(),
+                placement=ElementPlacementModel(placement=placement, target_element_id=generate_uuid()),
+            )
+        )
+
+        # Assert
+        if placement == ElementPlacement.Above:
+            assert target_order_key < response.order_key
+            assert neighbor_order_key is None or response.order_key < neighbor_order_key
+        else:
+            assert response.order_key < target_order_key
+            assert neighbor_order_key is None or neighbor_order_key < response.order_key
+        mock_base_get_boundary_order_key.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_relative_to_itself_should_raise_bad_request(
+        self,
+        mock_db: Mock,
+        mock_collection: Mock,
+        mock_logger: Mock,
+        mock_base_get_boundary_order_key: Mock,
+        mock_resolve_element_write_miss: Mock,
+    ) -> None:
+        # Arrange
+        element_id = generate_uuid()
+        base_reorder_element = create_base_reorder_element(
+            mock_db, mock_collection, mock_logger, mock_base_get_boundary_order_key, mock_resolve_element_write_miss
+        )
+
+        # Act & Assert
+        with pytest.raises(BadRequestError):
+            await base_reorder_element.aexecute(
+                BaseReorderElement.Request(
+                    organization_id=generate_uuid(),
+                    project_id=generate_uuid(),
+                    element_id=element_id,
+                    placement=ElementPlacementModel(placement=ElementPlacement.Below, target_element_id=element_id),
+                )
+            )
+        mock_collection.update_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_target_is_missing_should_raise_not_found(
+        self,
+        mock_db: Mock,
+        mock_collection: Mock,
+        mock_logger: Mock,
+        mock_base_get_boundary_order_key: Mock,
+        mock_resolve_element_write_miss: Mock,
+    ) -> None:
+        # Arrange
+        base_reorder_element = create_base_reorder_element(
+            mock_db, mock_collection, mock_logger, mock_base_get_boundary_order_key, mock_resolve_element_write_miss
+        )
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=None))
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await base_reorder_element.aexecute(
+                BaseReorderElement.Request(
+                    organization_id=generate_uuid(),
+                    project_id=generate_uuid(),
+                    element_id=generate_uuid(),
+                    placement=ElementPlacementModel(
+                        placement=ElementPlacement.Above, target_element_id=generate_uuid()
+                    ),
+                )
+            )
+        mock_collection.update_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_retries_after_migrating_embedded_elements(
+        self,
+        mock_db: Mock,
+        mock_collection: Mock,
+        mock_logger: Mock,
+        mock_base_get_boundary_order_key: Mock,
+        mock_resolve_element_write_miss: Mock,
+    ) -> None:
+        # Arrange
+        base_reorder_element = create_base_reorder_element(
+            mock_db,
+            mock_collection,
+            mock_logger,
+            mock_base_get_boundary_order_key,
+            mock_resolve_element_write_miss,
+            matched_counts=[0, 1],
+        )
+        mock_resolve_element_write_miss.configure_mock(aexecute=AsyncMock())
+
+        # Act
+        await base_reorder_element.aexecute(
+            BaseReorderElement.Request(
+                organization_id=generate_uuid(),
+                project_id=generate_uuid(),
+                element_id=generate_uuid(),
+                placement=ElementPlacementModel(placement=ElementPlacement.Back),
+            )
+        )
+
+        # Assert
+        assert mock_collection.update_one.await_count == 2
+        assert mock_base_get_boundary_order_key.aexecute.await_count == 2
+        mock_resolve_element_write_miss.aexecute.assert_awaited_once()
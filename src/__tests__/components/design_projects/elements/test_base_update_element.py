@@ -0,0 +1,65 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from .....common.models import CircleModel
+from .....components.design_projects.elements import BaseUpdateElement, ResolveElementWriteMiss
+from .....exceptions import NotFoundError
+from .....utils.common import generate_uuid
+
+
+class TestBaseUpdateElement:
+    @pytest.mark.asyncio
+    async def test_aexecute_when_the_element_matches_should_not_resolve_a_miss(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        element = CircleModel(x=1, y=1, radius=1)
+        mock_collection.configure_mock(
+            find_one_and_update=AsyncMock(return_value={"_id": element.id, "order_key": "a0"})
+        )
+        base_update_element = BaseUpdateElement(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act
+        response = await base_update_element.aexecute(
+            BaseUpdateElement.Request(
+                element=element, organization_id=organization_id, project_id=project_id, element_id=element.id
+            )
+        )
+
+        # Assert
+        assert response.updated_element.order_key == "a0"
+        mock_collection.find_one_and_update.assert_awaited_once()
+        assert mock_collection.find_one_and_update.await_args.args[0] == {
+            "_id": element.id,
+            "project_id": project_id,
+            "organization_id": organization_id,
+        }
+        mock_resolve_element_write_miss.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_the_write_misses_twice_should_raise_not_found(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_resolve_element_write_miss: Mock
+    ) -> None:
+        # Arrange
+        element = CircleModel(x=1, y=1, radius=1)
+        mock_collection.configure_mock(find_one_and_update=AsyncMock(return_value=None))
+        mock_resolve_element_write_miss.configure_mock(
+            aexecute=AsyncMock(return_value=ResolveElementWriteMiss.Response(migrated_count=1))
+        )
+        base_update_element = BaseUpdateElement(
+            db=mock_db, logger=mock_logger, resolve_element_write_miss=mock_resolve_element_write_miss
+        )
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await base_update_element.aexecute(
+                BaseUpdateElement.Request(
+                    element=element, organization_id=generate_uuid(), project_id=generate_uuid(), element_id=element.id
+                )
+            )
+        assert mock_collection.find_one_and_update.await_count == 2
@@ -0,0 +1,99 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+from .....common.models import CircleModel, RectangleModel
+from .....components.design_projects.elements import MigrateProjectElements
+from .....components.design_projects.elements.migrate_project_elements import DUPLICATE_KEY_ERROR_CODE
+from .....utils.common import generate_uuid
+
+
+@pytest.fixture
+def mock_elements_data() -> list[dict]:
+    return [
+        CircleModel(x=1, y=2, radius=3).model_dump(by_alias=True, exclude_none=True),
+        RectangleModel(x=4, y=5).model_dump(by_alias=True, exclude_none=True),
+    ]
+
+
+class TestMigrateProjectElements:
+    @pytest.mark.asyncio
+    async def test_aexecute_moves_embedded_elements(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_elements_data: list[dict]
+    ) -> None:
+        # Arrange
+        project_id = generate_uuid()
+        organization_id = generate_uuid()
+        mock_collection.configure_mock(
+            find_one=AsyncMock(
+                return_value={"_id": project_id, "organization_id": organization_id, "elements": mock_elements_data}
+            )
+        )
+        migrate_project_elements = MigrateProjectElements(db=mock_db, logger=mock_logger)
+
+        # Act
+        response = await migrate_project_elements.aexecute(MigrateProjectElements.Request(project_id=project_id))
+
+        # Assert
+        assert response.migrated_count == len(mock_elements_data)
+        element_documents = mock_collection.insert_many.call_args.args[0]
+        assert [document["_id"] for document in element_documents] == [data["_id"] for data in mock_elements_data]
+        for document in element_documents:
+            assert document["project_id"] == project_id
+            assert document["organization_id"] == organization_id
+        # NOTE: the first embedded element was the front-most one, so it gets the greatest order key
+        order_keys = [document["order_key"] for document in element_documents]
+        assert order_keys == sorted(order_keys, reverse=True)
+        mock_collection.update_one.assert_awaited_once_with({"_id": project_id}, {"$unset": {"elements": ""}})
+
+    @pytest.mark.asyncio
+    async def test_aexecute_without_embedded_elements_is_noop(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock
+    ) -> None:
+        # Arrange
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=None))
+        migrate_project_elements = MigrateProjectElements(db=mock_db, logger=mock_logger)
+
+        # Act
+        response = await migrate_project_elements.aexecute(MigrateProjectElements.Request(project_id=generate_uuid()))
+
+        # Assert
+        assert response.migrated_count == 0
+        mock_collection.insert_many.assert_not_called()
+        mock_collection.update_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_rekeys_elements_shared_with_another_project(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_elements_data: list[dict]
+    ) -> None:
+        # Arrange
+        project_id = generate_uuid()
+        already_migrated_id = mock_elements_data[0]["_id"]
+        shared_id = mock_elements_data[1]["_id"]
+        duplicate_key_error = BulkWriteError(
+            {
+                "writeErrors": [
+                    {"index": 0, "code": DUPLICATE_KEY_ERROR_CODE, "errmsg": "duplicate key"},
+                    {"index": 1, "code": DUPLICATE_KEY_ERROR_CODE, "errmsg": "duplicate key"},
+                ]
+            }
+        )
+        mock_collection.configure_mock(
+            find_one=AsyncMock(
+                return_value={"_id": project_id, "organization_id": generate_uuid(), "elements": mock_elements_data}
+            ),
+            insert_many=AsyncMock(side_effect=[duplicate_key_error, None]),
+            find=Mock(return_value=Mock(to_list=AsyncMock(return_value=[{"_id": already_migrated_id}]))),
+        )
+        migrate_project_elements = MigrateProjectElements(db=mock_db, logger=mock_logger)
+
+        # Act
+        response = await migrate_project_elements.aexecute(MigrateProjectElements.Request(project_id=project_id))
+
+        # Assert
+        assert response.migrated_count == 1
+        rekeyed_documents = mock_collection.insert_many.call_args.args[0]
+        assert len(rekeyed_documents) == 1
+        assert rekeyed_documents[0]["_id"] not in (already_migrated_id, shared_id)
+        mock_collection.update_one.assert_awaited_once()
@@ -0,0 +1,146 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from .....components.design_projects.elements import MigrateProjectElements, ResolveElementWriteMiss
+from .....exceptions import BadRequestError, ForbiddenError, NotFoundError
+from .....utils.common import generate_uuid
+
+
+def create_resolve_element_write_miss(
+    mock_db: Mock,
+    mock_collection: Mock,
+    mock_logger: Mock,
+    mock_migrate_project_elements: Mock,
+    element_data: dict | None,
+    migrated_count: int = 0,
+) -> ResolveElementWriteMiss:
+    mock_collection.configure_mock(find_one=AsyncMock(return_value=element_data))
+    mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+    mock_migrate_project_elements.configure_mock(
+        aexecute=AsyncMock(return_value=MigrateProjectElements.Response(migrated_count=migrated_count))
+    )
+    return ResolveElementWriteMiss(
+        db=mock_db, logger=mock_logger, migrate_project_elements=mock_migrate_project_elements
+    )
+
+
+class TestResolveElementWriteMiss:
+    @pytest.mark.asyncio
+    async def test_aexecute_when_element_belongs_to_another_organization_should_raise_forbidden(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        element_id = generate_uuid()
+        resolve_element_write_miss = create_resolve_element_write_miss(
+            mock_db,
+            mock_collection,
+            mock_logger,
+            mock_migrate_project_elements,
+            {"_id": element_id, "organization_id": generate_uuid()},
+        )
+
+        # Act & Assert
+        with pytest.raises(ForbiddenError):
+            await resolve_element_write_miss.aexecute(
+                ResolveElementWriteMiss.Request(
+                    organization_id=generate_uuid(), project_id=generate_uuid(), element_id=element_id
+                )
+            )
+        mock_migrate_project_elements.aexecute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_element_does_not_match_write_should_raise_bad_request(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        element_id = generate_uuid()
+        resolve_element_write_miss = create_resolve_element_write_miss(
+            mock_db,
+            mock_collection,
+            mock_logger,
+            mock_migrate_project_elements,
+            {"_id": element_id, "organization_id": organization_id},
+        )
+
+        # Act & Assert
+        with pytest.raises(BadRequestError):
+            await resolve_element_write_miss.aexecute(
+                ResolveElementWriteMiss.Request(
+                    organization_id=organization_id, project_id=generate_uuid(), element_id=element_id
+                )
+            )
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_element_missing_should_raise_not_found(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        resolve_element_write_miss = create_resolve_element_write_miss(
+            mock_db, mock_collection, mock_logger, mock_migrate_project_elements, None
+        )
+
+        # Act & Assert
+        with pytest.raises(NotFoundError):
+            await resolve_element_write_miss.aexecute(
+                ResolveElementWriteMiss.Request(
+                    organization_id=generate_uuid(), project_id=generate_uuid(), element_id=generate_uuid()
+                )
+            )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("migrated_count", [2, 0])
+    async def test_aexecute_when_element_exists_once_migrated_should_return(
+        self,
+        migrated_count: int,
+        mock_db: Mock,
+        mock_collection: Mock,
+        mock_logger: Mock,
+        mock_migrate_project_elements: Mock,
+    ) -> None:
+        # Arrange
+        organization_id = generate_uuid()
+        project_id = generate_uuid()
+        element_id = generate_uuid()
+        resolve_element_write_miss = create_resolve_element_write_miss(
+            mock_db, mock_collection, mock_logger, mock_migrate_project_elements, None, migrated_count=migrated_count
+        )
+        # NOTE: with no migrated element, a concurrent write migrated the project first
+        mock_collection.configure_mock(
+            find_one=AsyncMock(side_effect=[None, {"_id": element_id, "organization_id": organization_id}])
+        )
+
+        # Act
+        response = await resolve_element_write_miss.aexecute(
+            ResolveElementWriteMiss.Request(
+                organization_id=organization_id, project_id=project_id, element_id=element_id
+            )
+        )
+
+        # Assert
+        assert response.migrated_count == migrated_count
+        mock_migrate_project_elements.aexecute.assert_awaited_once_with(
+            MigrateProjectElements.Request(project_id=project_id)
+        )
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_migrated_element_belongs_to_another_organization_should_raise_forbidden(
+        self, mock_db: Mock, mock_collection: Mock, mock_logger: Mock, mock_migrate_project_elements: Mock
+    ) -> None:
+        # Arrange
+        element_id = generate_uuid()
+        resolve_element_write_miss = create_resolve_element_write_miss(
+            mock_db, mock_collection, mock_logger, mock_migrate_project_elements, None, migrated_count=1
+        )
+        mock_collection.configure_mock(
+            find_one=AsyncMock(side_effect=[None, {"_id": element_id, "organization_id": generate_uuid()}])
+        )
+
+        # Act & Assert
+        with pytest.raises(ForbiddenError):
+            await resolve_element_write_miss.aexecute(
+                ResolveElementWriteMiss.Request(
+                    organization_id=generate_uuid(), project_id=generate_uuid(), element_id=element_id
+                )
+            )
@@ -1,11 +1,11 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 from uuid import UUID
 
 import pytest
 
-from ....common.models import DesignProjectModel, UserRole
+from ....common.models import CircleModel, DesignProjectModel, UserRole
 from ....components.design_projects import CreateDesignProject
-from ....exceptions import BadRequestError, InternalServerError
+from ....exceptions import BadRequestError
 from ....utils.common import generate_uuid
 
 
@@ -48,7 +48,6 @@ def mock_project(mock_user_id, mock_organization_id):
         thumbnail_url="https://s3-figma-hubfile-images-production.figma.com/hub/file/carousel/img/238a7016bbc93dbc4aa491c39f0f9c4595f31dee",
         owner_id=mock_user_id,
         organization_id=mock_organization_id,
-        elements=[],
     )
 
 
@@ -63,10 +62,7 @@ class TestCreateDesignProject:
         mock_project: DesignProjectModel,
     ) -> None:
         # Arrange
-        mock_collection.configure_mock(
-            find_one=Mock(return_value=mock_project.model_dump(by_alias=True)),
-            insert_one=Mock(return_value=Mock(inserted_id=mock_project.id)),
-        )
+        mock_collection.configure_mock(insert_model=AsyncMock(side_effect=lambda model: model))
         create_design_project = CreateDesignProject(
             db=mock_db, logger=mock_logger, user_context=mock_user_context_admin
         )
@@ -82,56 +78,84 @@ class TestCreateDesignProject:
         assert response.created_project.name == mock_project.name
         assert response.created_project.owner_id == mock_project.owner_id
         assert response.created_project.organization_id == mock_project.organization_id
-        assert response.created_project.thumbnail_url == mock_project.thumbnail_url
-        mock_collection.insert_one.assert_called_once()
-        mock_collection.find_one.assert_called_once_with({"_id": mock_project.id})
+        assert response.created_project.thumbnail_url == request.thumbnail_url
+        mock_collection.insert_model.assert_called_once_with(response.created_project)
+        mock_collection.insert_many.assert_not_called()
+        mock_collection.find_one.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_aexecute_when_user_is_not_admin_should_raise_bad_request(
+    async def test_aexecute_with_elements_should_insert_them_with_fresh_ids(
         self,
         mock_db: Mock,
         mock_logger: Mock,
         mock_collection: Mock,
-        mock_user_context_non_admin: Mock,
+        mock_user_context_admin: Mock,
         mock_project: DesignProjectModel,
     ) -> None:
         # Arrange
+        mock_collection.configure_mock(insert_model=AsyncMock(side_effect=lambda model: model))
+        mock_element = CircleModel(x=1, y=2, radius=3)
         create_design_project = CreateDesignProject(
-            db=mock_db, logger=mock_logger, user_context=mock_user_context_non_admin
+            db=mock_db, logger=mock_logger, user_context=mock_user_context_admin
         )
 
-        # Act & Assert
-        request = CreateDesignProject.Request(
-            name=mock_project.name, thumbnail_url="https://example.com/thumbnail.png", elements=[]
-        )
-        with pytest.raises(BadRequestError):
-            await create_design_project.aexecute(request)
-        mock_collection.find_one.assert_not_called()
-        mock_collection.insert_one.assert_not_called()
+        # Act
+        request = CreateDesignProject.Request(name=mock_project.name, elements=[mock_element])
+        response = await create_design_project.aexecute(request)
+
+        # Assert
+        element_documents = mock_collection.insert_many.call_args.args[0]
+        assert len(element_documents) == 1
+        assert element_documents[0]["_id"] != mock_element.id
+        assert element_documents[0]["project_id"] == response.created_project.id
+        assert element_documents[0]["organization_id"] == mock_project.organization_id
 
     @pytest.mark.asyncio
-    async def test_aexecute_when_inserted_but_not_found_should_raise_internal_server_error(
+    @pytest.mark.parametrize(
+        "order_keys, expected_order_keys", [(["a1", "a0"], ["a1", "a0"]), (["a1", "a0!"], ["a1", "a0"])]
+    )
+    async def test_aexecute_keeps_client_order_keys_only_when_all_are_valid(
         self,
+        order_keys: list[str],
+        expected_order_keys: list[str],
         mock_db: Mock,
         mock_logger: Mock,
         mock_collection: Mock,
         mock_user_context_admin: Mock,
-        mock_project: DesignProjectModel,
     ) -> None:
         # Arrange
-        mock_collection.configure_mock(
-            find_one=Mock(return_value=None),
-            insert_one=Mock(return_value=Mock(inserted_id=mock_project.id)),
-        )
+        mock_collection.configure_mock(insert_model=AsyncMock(side_effect=lambda model: model))
+        elements = [CircleModel(x=1, y=2, radius=3, order_key=order_key) for order_key in order_keys]
         create_design_project = CreateDesignProject(
             db=mock_db, logger=mock_logger, user_context=mock_user_context_admin
         )
 
+        # Act
+        await create_design_project.aexecute(CreateDesignProject.Request(name="Project", elements=elements))
+
+        # Assert
+        element_documents = mock_collection.insert_many.call_args.args[0]
+        assert [document["order_key"] for document in element_documents] == expected_order_keys
+
+    @pytest.mark.asyncio
+    async def test_aexecute_when_user_is_not_admin_should_raise_bad_request(
+        self,
+        mock_db: Mock,
+        mock_logger: Mock,
+        mock_collection: Mock,
+        mock_user_context_non_admin: Mock,
+        mock_project: DesignProjectModel,
+    ) -> None:
+        # Arrange
+        create_design_project = CreateDesignProject(
+            db=mock_db, logger=mock_logger, user_context=mock_user_context_non_admin
+        )
+
         # Act & Assert
         request = CreateDesignProject.Request(
             name=mock_project.name, thumbnail_url="https://example.com/thumbnail.png", elements=[]
         )
-        with pytest.raises(InternalServerError):
+        with pytest.raises(BadRequestError):
             await create_design_project.aexecute(request)
-        mock_collection.insert_one.assert_called_once()
-        mock_collection.find_one.assert_called_once_with({"_id": mock_project.id})
+        mock_collection.find_one.assert_not_called()
+        mock_collection.insert_model.assert_not_called()
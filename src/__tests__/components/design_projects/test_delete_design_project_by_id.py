@@ -0,0 +1,51 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from ....common.models import DesignProjectModel, UserRole
+from ....components.design_projects import DeleteDesignProjectById
+from ....utils.common import generate_uuid
+
+
+@pytest.fixture
+def mock_project() -> DesignProjectModel:
+    return DesignProjectModel(
+        name="Test Project",
+        thumbnail_url="https://example.com/thumbnail.png",
+        owner_id=generate_uuid(),
+        organization_id=generate_uuid(),
+    )
+
+
+class TestDeleteDesignProjectById:
+    @pytest.mark.asyncio
+    async def test_aexecute_soft_deletes_the_elements_of_the_project(
+        self,
+        mock_db: Mock,
+        mock_logger: Mock,
+        mock_collection: Mock,
+        mock_user_context: Mock,
+        mock_project: DesignProjectModel,
+    ) -> None:
+        # Arrange
+        mock_user_context.configure_mock(
+            user_id=mock_project.owner_id,
+            organization_id=mock_project.organization_id,
+            role=UserRole.OrganizationAdmin,
+        )
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=mock_project.model_dump(by_alias=True)))
+        delete_design_project_by_id = DeleteDesignProjectById(
+            db=mock_db, logger=mock_logger, user_context=mock_user_context
+        )
+
+        # Act
+        response = await delete_design_project_by_id.aexecute(
+            DeleteDesignProjectById.Request(project_id=mock_project.id)
+        )
+
+        # Assert
+        assert response.deleted_project.is_deleted
+        mock_collection.update_many.assert_awaited_once_with(
+            {"project_id": mock_project.id},
+            {"$set": {"is_deleted": True, "deleted_at": response.deleted_project.deleted_at}},
+        )
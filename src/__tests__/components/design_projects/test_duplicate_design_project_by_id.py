@@ -2,8 +2,9 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from ....common.models import DesignProjectModel
+from ....common.models import CircleModel, DesignProjectModel
 from ....components.design_projects import CreateDesignProject, DuplicateDesignProject, GetDesignProjectById
+from ....components.design_projects.elements import BaseGetElements
 from ....exceptions import BadRequestError
 from ....utils.common import generate_uuid
 
@@ -15,7 +16,6 @@ def mock_project():
         thumbnail_url="https://s3-figma-hubfile-images-production.figma.com/hub/file/carousel/img/238a7016bbc93dbc4aa491c39f0f9c4595f31dee",
         owner_id=generate_uuid(),
         organization_id=generate_uuid(),
-        elements=[],
     )
 
 
@@ -28,10 +28,15 @@ class TestDuplicateDesignProject:
         mock_user_context: Mock,
         mock_create_design_project: Mock,
         mock_get_design_project_by_id: Mock,
+        mock_base_get_elements: Mock,
         mock_project,
     ):
         # Arrange
         mock_user_context.configure_mock(organization_id=mock_project.organization_id)
+        mock_element = CircleModel(x=1, y=2, radius=3)
+        mock_base_get_elements.configure_mock(
+            aexecute=AsyncMock(return_value=BaseGetElements.Response(elements=[mock_element]))
+        )
         mock_get_design_project_by_id.configure_mock(
             aexecute=AsyncMock(return_value=GetDesignProjectById.Response(design_project=mock_project))
         )
@@ -40,7 +45,6 @@ class TestDuplicateDesignProject:
             thumbnail_url=mock_project.thumbnail_url,
             owner_id=mock_project.owner_id,
             organization_id=mock_project.organization_id,
-            elements=mock_project.elements,
         )
         mock_create_design_project.configure_mock(
             aexecute=AsyncMock(return_value=CreateDesignProject.Response(created_project=duplicated_project))
@@ -51,6 +55,7 @@ class TestDuplicateDesignProject:
             user_context=mock_user_context,
             create_design_project=mock_create_design_project,
             get_design_project_by_id=mock_get_design_project_by_id,
+            base_get_elements=mock_base_get_elements,
         )
         request = duplicate_design_project.Request(project_id=mock_project.id)
         # Act
@@ -61,6 +66,10 @@ class TestDuplicateDesignProject:
         assert response.duplicated_project.thumbnail_url == mock_project.thumbnail_url
         mock_get_design_project_by_id.aexecute.assert_called_once()
         mock_create_design_project.aexecute.assert_called_once()
+        copied_elements = mock_create_design_project.Request.call_args.kwargs["elements"]
+        assert len(copied_elements) == 1
+        assert copied_elements[0].id != mock_element.id
+        assert copied_elements[0].radius == mock_element.radius
 
     @pytest.mark.asyncio
     async def test_aexecute_no_permission(
@@ -70,6 +79,7 @@ class TestDuplicateDesignProject:
         mock_user_context: Mock,
         mock_create_design_project: Mock,
         mock_get_design_project_by_id: Mock,
+        mock_base_get_elements: Mock,
         mock_project,
     ):
         # Arrange: user org does not match project org
@@ -83,10 +93,12 @@ class TestDuplicateDesignProject:
             user_context=mock_user_context,
             create_design_project=mock_create_design_project,
             get_design_project_by_id=mock_get_design_project_by_id,
+            base_get_elements=mock_base_get_elements,
         )
         request = duplicate_design_project.Request(project_id=mock_project.id)
         # Act & Assert
         with pytest.raises(BadRequestError):
             await duplicate_design_project.aexecute(request)
         mock_get_design_project_by_id.aexecute.assert_called_once()
+        mock_base_get_elements.aexecute.assert_not_called()
         mock_create_design_project.aexecute.assert_not_called()
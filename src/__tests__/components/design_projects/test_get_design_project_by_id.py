@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -28,7 +28,7 @@ class TestGetDesignProjectById:
         mock_project: DesignProjectModel,
     ) -> None:
         # Arrange
-        mock_collection.configure_mock(find_one=Mock(return_value=mock_project.model_dump(by_alias=True)))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=mock_project.model_dump(by_alias=True)))
         create_design_project = GetDesignProjectById(db=mock_db, logger=mock_logger)
 
         # Act
@@ -52,7 +52,7 @@ class TestGetDesignProjectById:
         mock_collection: Mock,
     ) -> None:
         # Arrange
-        mock_collection.configure_mock(find_one=Mock(return_value=None))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=None))
         create_design_project = GetDesignProjectById(db=mock_db, logger=mock_logger)
 
         # Act & Assert
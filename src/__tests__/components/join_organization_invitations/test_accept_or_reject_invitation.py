@@ -100,10 +100,12 @@ class TestAcceptOrRejectInvitation:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_receiver_id)
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
 
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=mock_unexpired_invitation.model_dump()))
+        mock_invitation_collection.configure_mock(
+            find_one=AsyncMock(return_value=mock_unexpired_invitation.model_dump())
+        )
 
         mock_organization.members = []
         mock_get_organization_by_id.configure_mock(
@@ -161,10 +163,12 @@ class TestAcceptOrRejectInvitation:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_receiver_id)
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
 
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=mock_unexpired_invitation.model_dump()))
+        mock_invitation_collection.configure_mock(
+            find_one=AsyncMock(return_value=mock_unexpired_invitation.model_dump())
+        )
 
         mock_organization.members = []
         mock_get_organization_by_id.configure_mock(
@@ -210,11 +214,11 @@ class TestAcceptOrRejectInvitation:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_receiver_id)
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
 
         # Simulate no invitation found
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=None))
+        mock_invitation_collection.configure_mock(find_one=AsyncMock(return_value=None))
 
         accept_or_reject_invitation = AcceptOrRejectInvitation(
             get_user_by_id=mock_get_user_by_id,
@@ -250,9 +254,9 @@ class TestAcceptOrRejectInvitation:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_receiver_id)
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=mock_expired_invitation.model_dump()))
+        mock_invitation_collection.configure_mock(find_one=AsyncMock(return_value=mock_expired_invitation.model_dump()))
 
         accept_or_reject_invitation = AcceptOrRejectInvitation(
             get_user_by_id=mock_get_user_by_id,
@@ -289,9 +293,11 @@ class TestAcceptOrRejectInvitation:
         mock_unauthorized_user_id = generate_uuid()
         mock_user_context.configure_mock(user_id=mock_unauthorized_user_id)
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=mock_unexpired_invitation.model_dump()))
+        mock_invitation_collection.configure_mock(
+            find_one=AsyncMock(return_value=mock_unexpired_invitation.model_dump())
+        )
 
         accept_or_reject_invitation = AcceptOrRejectInvitation(
             get_user_by_id=mock_get_user_by_id,
@@ -327,9 +333,11 @@ class TestAcceptOrRejectInvitation:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_receiver_id)
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=mock_unexpired_invitation.model_dump()))
+        mock_invitation_collection.configure_mock(
+            find_one=AsyncMock(return_value=mock_unexpired_invitation.model_dump())
+        )
 
         # Simulate no organization found
         mock_get_organization_by_id.configure_mock(
@@ -372,9 +380,11 @@ class TestAcceptOrRejectInvitation:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_receiver_id)
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=mock_unexpired_invitation.model_dump()))
+        mock_invitation_collection.configure_mock(
+            find_one=AsyncMock(return_value=mock_unexpired_invitation.model_dump())
+        )
 
         # Simulate no user found
         mock_get_user_by_id.configure_mock(aexecute=AsyncMock(return_value=GetUserById.Response(user=None)))
@@ -417,9 +427,11 @@ class TestAcceptOrRejectInvitation:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_receiver_id)
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=mock_unexpired_invitation.model_dump()))
+        mock_invitation_collection.configure_mock(
+            find_one=AsyncMock(return_value=mock_unexpired_invitation.model_dump())
+        )
 
         mock_organization.members = []
         mock_get_organization_by_id.configure_mock(
@@ -473,9 +485,11 @@ class TestAcceptOrRejectInvitation:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_receiver_id)
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=mock_unexpired_invitation.model_dump()))
+        mock_invitation_collection.configure_mock(
+            find_one=AsyncMock(return_value=mock_unexpired_invitation.model_dump())
+        )
 
         # Simulate organization where the receiver is already a member
         mock_organization.members = [
@@ -532,9 +546,9 @@ class TestAcceptOrRejectInvitation:
         non_pending_invitation = mock_unexpired_invitation.model_copy()
         non_pending_invitation.status = InvitationStatus.Completed
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=non_pending_invitation.model_dump()))
+        mock_invitation_collection.configure_mock(find_one=AsyncMock(return_value=non_pending_invitation.model_dump()))
 
         accept_or_reject_invitation = AcceptOrRejectInvitation(
             get_user_by_id=mock_get_user_by_id,
@@ -580,9 +594,11 @@ class TestAcceptOrRejectInvitation:
             taken_at=get_utc_now(),
         )
 
-        mock_invitation_collection = Mock()
+        mock_invitation_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(return_value=mock_invitation_collection))
-        mock_invitation_collection.configure_mock(find_one=Mock(return_value=invitation_with_taken_action.model_dump()))
+        mock_invitation_collection.configure_mock(
+            find_one=AsyncMock(return_value=invitation_with_taken_action.model_dump())
+        )
 
         accept_or_reject_invitation = AcceptOrRejectInvitation(
             get_user_by_id=mock_get_user_by_id,
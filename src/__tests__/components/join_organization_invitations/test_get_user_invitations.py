@@ -3,10 +3,9 @@ from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from ....common.models import JoinOrganizationInvitationModel, OrganizationModel, UserModel
+from ....common.models import JoinOrganizationInvitationModel
 from ....components.join_organization_invitations import GetUserInvitations
-from ....components.organizations import GetOrganizationById
-from ....components.users import GetUserById
+from ....constants.mongo import CollectionName
 from ...utils.common import generate_uuid, get_utc_now
 
 
@@ -25,12 +24,28 @@ def mock_invitation() -> JoinOrganizationInvitationModel:
     return invitation
 
 
+def make_invitation_data(invitation: JoinOrganizationInvitationModel, **joined_fields) -> dict:
+    return {
+        "id": invitation.id,
+        "status": invitation.status,
+        "expires_at": invitation.expires_at,
+        "created_at": invitation.created_at,
+        "is_read": invitation.is_read,
+        **joined_fields,
+    }
+
+
+def configure_aggregate(mock_db: Mock, mock_collection: Mock, invitations_data: list[dict]) -> None:
+    mock_collection.configure_mock(
+        aggregate=AsyncMock(return_value=Mock(to_list=AsyncMock(return_value=invitations_data)))
+    )
+    mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+
+
 class TestGetUserInvitations:
     @pytest.mark.asyncio
     async def test_aexecute_success(
         self,
-        mock_get_organization_by_id: Mock,
-        mock_get_user_by_id: Mock,
         mock_db: Mock,
         mock_collection: Mock,
         mock_logger: Mock,
@@ -38,68 +53,35 @@ class TestGetUserInvitations:
         mock_invitation: JoinOrganizationInvitationModel,
     ) -> None:
         # Arrange
-        mock_organization_id = mock_invitation.organization_id
-        mock_sender_id = mock_invitation.sender_id
-        mock_receiver_id = mock_invitation.receiver_id
-
-        mock_invitations = [mock_invitation]
-        mock_invitations_data = [invitation.model_dump(by_alias=True) for invitation in mock_invitations]
-        mock_collection.configure_mock(find=Mock(return_value=mock_invitations_data))
-        mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
-
-        mock_organization = OrganizationModel(
-            _id=mock_organization_id,
-            name="Test Organization",
-            avatar_url="http://example.com/avatar.png",
-            owner_id=mock_sender_id,
-        )
-        mock_get_organization_by_id.configure_mock(
-            aexecute=AsyncMock(return_value=GetOrganizationById.Response(organization=mock_organization))
-        )
-
-        mock_user = UserModel(
-            _id=mock_sender_id,
-            username="sender",
-            email="sender@gmail.com",
-            hashed_password="hashed_password",
-        )
-        mock_get_user_by_id.configure_mock(aexecute=AsyncMock(return_value=GetUserById.Response(user=mock_user)))
-
-        mock_user_context.configure_mock(user_id=mock_receiver_id)
+        mock_invitations_data = [
+            make_invitation_data(
+                mock_invitation, organization={"name": "Test Organization"}, sender={"username": "sender"}
+            )
+        ]
+        configure_aggregate(mock_db, mock_collection, mock_invitations_data)
+        mock_user_context.configure_mock(user_id=mock_invitation.receiver_id)
 
         # Act
-        get_user_invitations = GetUserInvitations(
-            get_organization_by_id=mock_get_organization_by_id,
-            get_user_by_id=mock_get_user_by_id,
-            db=mock_db,
-            logger=mock_logger,
-            user_context=mock_user_context,
-        )
-        response = await get_user_invitations.aexecute()
+        get_user_invitations = GetUserInvitations(db=mock_db, logger=mock_logger, user_context=mock_user_context)
+        response = await get_user_invitations.aexecute(GetUserInvitations.Request())
 
         # Assert
-        assert response.invitations is not None
-        assert len(response.invitations) == len(mock_invitations)
+        assert len(response.invitations) == 1
+        assert response.has_more is False
 
         invitation = response.invitations[0]
         assert invitation.id == mock_invitation.id
-        assert invitation.organization.name == mock_organization.name
-        assert invitation.sender.username == mock_user.username
+        assert invitation.organization.name == "Test Organization"
+        assert invitation.sender.username == "sender"
         assert invitation.status == mock_invitation.status
         assert invitation.expires_at == mock_invitation.expires_at
         assert invitation.created_at == mock_invitation.created_at
 
-        mock_collection.find.assert_called_once()
-        mock_get_organization_by_id.aexecute.assert_called_once_with(
-            GetOrganizationById.Request(id=mock_organization_id)
-        )
-        mock_get_user_by_id.aexecute.assert_called_once_with(GetUserById.Request(user_id=mock_sender_id))
+        mock_collection.aggregate.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_aexecute_with_organization_not_found(
+    async def test_aexecute_builds_single_paginated_pipeline(
         self,
-        mock_get_organization_by_id: Mock,
-        mock_get_user_by_id: Mock,
         mock_db: Mock,
         mock_collection: Mock,
         mock_logger: Mock,
@@ -107,47 +89,75 @@ class TestGetUserInvitations:
         mock_invitation: JoinOrganizationInvitationModel,
     ) -> None:
         # Arrange
-        mock_organization_id = mock_invitation.organization_id
-        mock_receiver_id = mock_invitation.receiver_id
+        configure_aggregate(mock_db, mock_collection, [])
+        mock_user_context.configure_mock(user_id=mock_invitation.receiver_id)
 
-        mock_invitations = [mock_invitation]
-        mock_invitations_data = [invitation.model_dump(by_alias=True) for invitation in mock_invitations]
-        mock_collection.configure_mock(find=Mock(return_value=mock_invitations_data))
-        mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+        # Act
+        get_user_invitations = GetUserInvitations(db=mock_db, logger=mock_logger, user_context=mock_user_context)
+        await get_user_invitations.aexecute(GetUserInvitations.Request(skip=20, limit=10))
 
-        # Simulate organization not found
-        mock_get_organization_by_id.configure_mock(
-            aexecute=AsyncMock(return_value=GetOrganizationById.Response(organization=None))
-        )
+        # Assert
+        pipeline = mock_collection.aggregate.call_args.args[0]
+        assert pipeline[0]["$match"]["receiver_id"] == mock_invitation.receiver_id
+        assert {"$skip": 20} in pipeline
+        assert {"$limit": 11} in pipeline
 
-        mock_user_context.configure_mock(user_id=mock_receiver_id)
+        lookups = [stage["$lookup"] for stage in pipeline if "$lookup" in stage]
+        assert [lookup["from"] for lookup in lookups] == [CollectionName.ORGANIZATIONS, CollectionName.USERS]
+        assert lookups[0]["pipeline"][-1] == {"$project": {"_id": 0, "name": 1}}
+        assert lookups[1]["pipeline"][-1] == {"$project": {"_id": 0, "username": 1}}
+
+    @pytest.mark.asyncio
+    async def test_aexecute_with_more_invitations_than_limit(
+        self,
+        mock_db: Mock,
+        mock_collection: Mock,
+        mock_logger: Mock,
+        mock_user_context: Mock,
+        mock_invitation: JoinOrganizationInvitationModel,
+    ) -> None:
+        # Arrange
+        mock_invitations_data = [
+            make_invitation_data(mock_invitation, organization={"name": "Organization"}, sender={"username": "sender"})
+            for _ in range(3)
+        ]
+        configure_aggregate(mock_db, mock_collection, mock_invitations_data)
+        mock_user_context.configure_mock(user_id=mock_invitation.receiver_id)
 
         # Act
-        get_user_invitations = GetUserInvitations(
-            get_organization_by_id=mock_get_organization_by_id,
-            get_user_by_id=mock_get_user_by_id,
-            db=mock_db,
-            logger=mock_logger,
-            user_context=mock_user_context,
-        )
-        response = await get_user_invitations.aexecute()
+        get_user_invitations = GetUserInvitations(db=mock_db, logger=mock_logger, user_context=mock_user_context)
+        response = await get_user_invitations.aexecute(GetUserInvitations.Request(limit=2))
 
         # Assert
-        assert response.invitations is not None
-        assert len(response.invitations) == 0
+        assert len(response.invitations) == 2
+        assert response.has_more is True
 
-        mock_collection.find.assert_called_once()
-        mock_get_organization_by_id.aexecute.assert_called_once_with(
-            GetOrganizationById.Request(id=mock_organization_id)
+    @pytest.mark.asyncio
+    async def test_aexecute_with_organization_not_found(
+        self,
+        mock_db: Mock,
+        mock_collection: Mock,
+        mock_logger: Mock,
+        mock_user_context: Mock,
+        mock_invitation: JoinOrganizationInvitationModel,
+    ) -> None:
+        # Arrange
+        configure_aggregate(
+            mock_db, mock_collection, [make_invitation_data(mock_invitation, sender={"username": "sender"})]
         )
-        mock_logger.error.assert_called_once_with(f"Organization with id {mock_organization_id} not found.")
-        mock_get_user_by_id.aexecute.assert_not_called()
+        mock_user_context.configure_mock(user_id=mock_invitation.receiver_id)
+
+        # Act
+        get_user_invitations = GetUserInvitations(db=mock_db, logger=mock_logger, user_context=mock_user_context)
+        response = await get_user_invitations.aexecute(GetUserInvitations.Request())
+
+        # Assert
+        assert len(response.invitations) == 0
+        mock_logger.error.assert_called_once_with(f"Organization of invitation with id {mock_invitation.id} not found.")
 
     @pytest.mark.asyncio
     async def test_aexecute_with_user_not_found(
         self,
-        mock_get_organization_by_id: Mock,
-        mock_get_user_by_id: Mock,
         mock_db: Mock,
         mock_collection: Mock,
         mock_logger: Mock,
@@ -155,47 +165,15 @@ class TestGetUserInvitations:
         mock_invitation: JoinOrganizationInvitationModel,
     ):
         # Arrange
-        mock_organization_id = mock_invitation.organization_id
-        mock_sender_id = mock_invitation.sender_id
-        mock_receiver_id = mock_invitation.receiver_id
-
-        mock_invitations = [mock_invitation]
-        mock_invitations_data = [invitation.model_dump(by_alias=True) for invitation in mock_invitations]
-        mock_collection.configure_mock(find=Mock(return_value=mock_invitations_data))
-        mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
-
-        mock_organization = OrganizationModel(
-            _id=mock_organization_id,
-            name="Test Organization",
-            avatar_url="http://example.com/avatar.png",
-            owner_id=mock_sender_id,
+        configure_aggregate(
+            mock_db, mock_collection, [make_invitation_data(mock_invitation, organization={"name": "Organization"})]
         )
-        mock_get_organization_by_id.configure_mock(
-            aexecute=AsyncMock(return_value=GetOrganizationById.Response(organization=mock_organization))
-        )
-
-        # Simulate user not found
-        mock_get_user_by_id.configure_mock(aexecute=AsyncMock(return_value=GetUserById.Response(user=None)))
-
-        mock_user_context.configure_mock(user_id=mock_receiver_id)
+        mock_user_context.configure_mock(user_id=mock_invitation.receiver_id)
 
         # Act
-        get_user_invitations = GetUserInvitations(
-            get_organization_by_id=mock_get_organization_by_id,
-            get_user_by_id=mock_get_user_by_id,
-            db=mock_db,
-            logger=mock_logger,
-            user_context=mock_user_context,
-        )
-        response = await get_user_invitations.aexecute()
+        get_user_invitations = GetUserInvitations(db=mock_db, logger=mock_logger, user_context=mock_user_context)
+        response = await get_user_invitations.aexecute(GetUserInvitations.Request())
 
         # Assert
-        assert response.invitations is not None
         assert len(response.invitations) == 0
-
-        mock_collection.find.assert_called_once()
-        mock_get_organization_by_id.aexecute.assert_called_once_with(
-            GetOrganizationById.Request(id=mock_organization_id)
-        )
-        mock_get_user_by_id.aexecute.assert_called_once_with(GetUserById.Request(user_id=mock_sender_id))
-        mock_logger.error.assert_called_once_with(f"User with id {mock_sender_id} not found.")
+        mock_logger.error.assert_called_once_with(f"Sender of invitation with id {mock_invitation.id} not found.")
@@ -23,7 +23,7 @@ def mock_setup() -> MockSetUp:
     mock_logger = Mock()
     mock_user_context = Mock()
 
-    mock_collection = Mock()
+    mock_collection = AsyncMock()
     mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
     return (mock_get_organization_by_id, mock_get_user_by_id, mock_db, mock_logger, mock_user_context, mock_collection)
 
@@ -32,7 +32,7 @@ class TestMarkInvitationReadOrUnread:
     @pytest.mark.asyncio
     async def test_aexecute_success(self, mock_setup: MockSetUp) -> None:
         # Arrange
-        (mock_get_organization_by_id, mock_get_user_by_id, mock_db, mock_logger, mock_user_context, mock_collection) = (
+        mock_get_organization_by_id, mock_get_user_by_id, mock_db, mock_logger, mock_user_context, mock_collection = (
             mock_setup
         )
 
@@ -50,9 +50,9 @@ class TestMarkInvitationReadOrUnread:
         )
         mock_invitation_data = mock_invitation.model_dump(by_alias=True)
 
-        mock_collection.configure_mock(find_one=Mock(return_value=mock_invitation_data))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=mock_invitation_data))
         mock_update_one_result = MockUpdateResult(modified_count=1)
-        mock_collection.configure_mock(update_one=Mock(return_value=mock_update_one_result))
+        mock_collection.configure_mock(update_one=AsyncMock(return_value=mock_update_one_result))
 
         mock_collection.update_one.return_value.modified_count = 1
 
@@ -77,14 +77,14 @@ class TestMarkInvitationReadOrUnread:
     @pytest.mark.asyncio
     async def test_aexecute_invitation_not_found(self, mock_setup: MockSetUp) -> None:
         # Arrange
-        (mock_get_organization_by_id, mock_get_user_by_id, mock_db, mock_logger, mock_user_context, mock_collection) = (
+        mock_get_organization_by_id, mock_get_user_by_id, mock_db, mock_logger, mock_user_context, mock_collection = (
             mock_setup
         )
 
         mock_user_context.configure_mock(user_id=generate_uuid())
         mock_invitation_id = generate_uuid()
 
-        mock_collection.configure_mock(find_one=Mock(return_value=None))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=None))
 
         mark_invitation_read_or_unread = MarkInvitationReadOrUnread(
             get_organization_by_id=mock_get_organization_by_id,
@@ -108,7 +108,7 @@ class TestMarkInvitationReadOrUnread:
     @pytest.mark.asyncio
     async def test_aexecute_invitation_not_belong_to_user(self, mock_setup: MockSetUp) -> None:
         # Arrange
-        (mock_get_organization_by_id, mock_get_user_by_id, mock_db, mock_logger, mock_user_context, mock_collection) = (
+        mock_get_organization_by_id, mock_get_user_by_id, mock_db, mock_logger, mock_user_context, mock_collection = (
             mock_setup
         )
 
@@ -127,7 +127,7 @@ class TestMarkInvitationReadOrUnread:
         )
         mock_invitation_data = mock_invitation.model_dump(by_alias=True)
 
-        mock_collection.configure_mock(find_one=Mock(return_value=mock_invitation_data))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=mock_invitation_data))
 
         mark_invitation_read_or_unread = MarkInvitationReadOrUnread(
             get_organization_by_id=mock_get_organization_by_id,
@@ -153,7 +153,7 @@ class TestMarkInvitationReadOrUnread:
     @pytest.mark.asyncio
     async def test_aexecute_update_failed(self, mock_setup: MockSetUp) -> None:
         # Arrange
-        (mock_get_organization_by_id, mock_get_user_by_id, mock_db, mock_logger, mock_user_context, mock_collection) = (
+        mock_get_organization_by_id, mock_get_user_by_id, mock_db, mock_logger, mock_user_context, mock_collection = (
             mock_setup
         )
 
@@ -172,9 +172,9 @@ class TestMarkInvitationReadOrUnread:
         )
         mock_invitation_data = mock_invitation.model_dump(by_alias=True)
 
-        mock_collection.configure_mock(find_one=Mock(return_value=mock_invitation_data))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=mock_invitation_data))
         mock_update_one_result = MockUpdateResult(modified_count=0)
-        mock_collection.configure_mock(update_one=Mock(return_value=mock_update_one_result))
+        mock_collection.configure_mock(update_one=AsyncMock(return_value=mock_update_one_result))
 
         mark_invitation_read_or_unread = MarkInvitationReadOrUnread(
             get_organization_by_id=mock_get_organization_by_id,
@@ -1,22 +1,22 @@
-from datetime import timedelta
-from unittest.mock import AsyncMock, Mock, call
+from unittest.mock import AsyncMock, Mock
 from uuid import UUID
 
 import pytest
 
-from ....common.models.join_organization_invitation import InvitationStatus, JoinOrganizationInvitationModel
-from ....common.models.organization import OrganizationModel
+from ....common.models.join_organization_invitation import InvitationStatus
 from ....components.join_organization_invitations.create_batch_join_organization_invitations import (
     CreateBatchJoinOrganizationInvitation,
 )
-from ....components.join_organization_invitations.create_join_organization_invitation import (
-    INVITATION_EXPIRATION_DAYS,
-    CreateJoinOrganizationInvitation,
-)
 from ....exceptions import BadRequestError
-from ....utils.common import get_utc_now
 
-MockSetUp = tuple[Mock, Mock, Mock, AsyncMock, AsyncMock]
+MockSetUp = tuple[Mock, Mock, Mock, AsyncMock]
+
+MOCK_ORGANIZATION_ID = UUID("a3f5d9e2-8c67-4a01-9e45-2b70d4b4d1f3")
+MOCK_SENDER_ID = UUID("e1c8b5a6-2d9f-4fb0-86f1-3c9c5ed4a8bb")
+MOCK_RECEIVERS_ID = [
+    UUID("6b7fa9c2-3c7e-44a2-91c0-6c8e78db9e2a"),
+    UUID("0f1c61f0-e38e-11ee-89d1-0242ac120002"),
+]
 
 
 @pytest.fixture
@@ -24,145 +24,142 @@ def mock_setup() -> MockSetUp:
     mock_db = Mock()
     mock_logger = Mock()
     mock_user_context = Mock()
-    mock_create_invitation = AsyncMock()
-    mock_organization_collection = AsyncMock()
-    mock_db.configure_mock(get_collection=Mock(return_value=mock_organization_collection))
-    return mock_db, mock_logger, mock_user_context, mock_create_invitation, mock_organization_collection
+    mock_collection = AsyncMock()
+    mock_collection.configure_mock(insert_models=AsyncMock(side_effect=lambda models: models))
+    mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+    mock_user_context.configure_mock(user_id=MOCK_SENDER_ID, organization_id=MOCK_ORGANIZATION_ID)
+    return mock_db, mock_logger, mock_user_context, mock_collection
+
+
+def configure_aggregate(mock_collection: AsyncMock, organizations_data: list[dict]) -> None:
+    mock_collection.configure_mock(
+        aggregate=AsyncMock(return_value=Mock(to_list=AsyncMock(return_value=organizations_data)))
+    )
 
 
 class TestCreateBatchJoinOrganizationInvitation:
     @pytest.mark.asyncio
     async def test_aexecute_success(self, mock_setup: MockSetUp) -> None:
         # Setup mocks
-        mock_db, mock_logger, mock_user_context, mock_create_invitation, mock_organization_collection = mock_setup
-
-        # Mock request and database response
-        mock_organization_id = UUID("a3f5d9e2-8c67-4a01-9e45-2b70d4b4d1f3")
-        mock_sender_id = UUID("e1c8b5a6-2d9f-4fb0-86f1-3c9c5ed4a8bb")
-        mock_receivers_id = [
-            UUID("6b7fa9c2-3c7e-44a2-91c0-6c8e78db9e2a"),
-            UUID("0f1c61f0-e38e-11ee-89d1-0242ac120002"),
-        ]
-
-        # Mock user_context
-        mock_user_context.configure_mock(
-            user_id=mock_sender_id,
-            organization_id=mock_organization_id,
+        mock_db, mock_logger, mock_user_context, mock_collection = mock_setup
+        configure_aggregate(
+            mock_collection,
+            [
+                {
+                    "_id": MOCK_ORGANIZATION_ID,
+                    "receivers": [
+                        {"_id": receiver_id, "has_pending_invitation": False} for receiver_id in MOCK_RECEIVERS_ID
+                    ],
+                }
+            ],
         )
 
-        mock_taken_at = get_utc_now()
-        mock_invitations = [
-            JoinOrganizationInvitationModel(
-                organization_id=mock_organization_id,
-                sender_id=mock_sender_id,
-                receiver_id=mock_receiver_id,
-                status=InvitationStatus.Pending,
-                taken_action=None,
-                expires_at=mock_taken_at + timedelta(INVITATION_EXPIRATION_DAYS),
-            )
-            for mock_receiver_id in mock_receivers_id
-        ]
-
-        mock_organization = OrganizationModel(
-            name="org_test",
-            avatar_url="http://example.com/avatar.png",
-            owner_id=mock_sender_id,
+        # Initialize the component
+        create_multi_invitations = CreateBatchJoinOrganizationInvitation(
+            db=mock_db,
+            logger=mock_logger,
+            user_context=mock_user_context,
         )
 
-        mock_organization_collection.configure_mock(
-            find_one=Mock(return_value=mock_organization.model_dump(by_alias=True)),
-        )
+        # Execute the component, a repeated receiver must only be invited once
+        request = CreateBatchJoinOrganizationInvitation.Request(user_ids=[*MOCK_RECEIVERS_ID, MOCK_RECEIVERS_ID[0]])
+        response = await create_multi_invitations.aexecute(request)
+
+        # Assertions
+        assert len(response.invitations) == len(MOCK_RECEIVERS_ID)
+        for invitation, mock_receiver_id in zip(response.invitations, MOCK_RECEIVERS_ID):
+            assert invitation.organization_id == MOCK_ORGANIZATION_ID
+            assert invitation.sender_id == MOCK_SENDER_ID
+            assert invitation.receiver_id == mock_receiver_id
+            assert invitation.status == InvitationStatus.Pending
+            assert invitation.taken_action is None
 
-        response_create_invitation = [
-            CreateJoinOrganizationInvitation.Response(invitation=mock_invitation)
-            for mock_invitation in mock_invitations
-        ]
-        mock_create_invitation.configure_mock(aexecute=AsyncMock(side_effect=response_create_invitation))
+        # Verify interactions, one aggregation for every check and one bulk insert
+        mock_collection.aggregate.assert_awaited_once()
+        pipeline = mock_collection.aggregate.call_args.args[0]
+        assert pipeline[0] == {"$match": {"_id": MOCK_ORGANIZATION_ID, "owner_id": MOCK_SENDER_ID}}
+        receivers_lookup = pipeline[-1]["$lookup"]
+        assert receivers_lookup["pipeline"][0] == {"$match": {"_id": {"$in": MOCK_RECEIVERS_ID}, "is_deleted": False}}
+        mock_collection.insert_models.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_skips_receiver_with_pending_invitation(self, mock_setup: MockSetUp) -> None:
+        # Setup mocks
+        mock_db, mock_logger, mock_user_context, mock_collection = mock_setup
+        configure_aggregate(
+            mock_collection,
+            [
+                {
+                    "_id": MOCK_ORGANIZATION_ID,
+                    "receivers": [
+                        {"_id": MOCK_RECEIVERS_ID[0], "has_pending_invitation": True},
+                        {"_id": MOCK_RECEIVERS_ID[1], "has_pending_invitation": False},
+                    ],
+                }
+            ],
+        )
 
         # Initialize the component
         create_multi_invitations = CreateBatchJoinOrganizationInvitation(
             db=mock_db,
             logger=mock_logger,
             user_context=mock_user_context,
-            create_invitation=mock_create_invitation,
         )
 
         # Execute the component
-        request = CreateBatchJoinOrganizationInvitation.Request(user_ids=mock_receivers_id)
+        request = CreateBatchJoinOrganizationInvitation.Request(user_ids=MOCK_RECEIVERS_ID)
         response = await create_multi_invitations.aexecute(request)
 
         # Assertions
-        assert response.invitations is not None
-        assert response.invitations is not []
-        assert len(response.invitations) == len(mock_invitations)
-        for invitation, mock_invitation in zip(response.invitations, mock_invitations):
-            assert invitation.organization_id == mock_organization_id
-            assert invitation.sender_id == mock_sender_id
-            assert invitation.receiver_id == mock_invitation.receiver_id
-            assert invitation.status == InvitationStatus.Pending
-            assert invitation.taken_action is None
-
-        # Verify interactions
-        mock_organization_collection.find_one.call_count == 1
-        filter = {
-            "_id": mock_organization_id,
-            "owner_id": mock_sender_id,
-        }
-        expect_calls = [call(filter)]
-        assert mock_organization_collection.find_one.call_args_list == expect_calls
-
-        mock_create_invitation.aexecute.call_count == len(mock_invitations)
-        filter = {
-            "_id": mock_organization_id,
-            "owner_id": mock_sender_id,
-        }
-        expect_calls = [
-            call(CreateJoinOrganizationInvitation.Request(user_id=mock_receiver_id))
-            for mock_receiver_id in mock_receivers_id
-        ]
-        assert mock_create_invitation.aexecute.call_args_list == expect_calls
+        assert [invitation.receiver_id for invitation in response.invitations] == [MOCK_RECEIVERS_ID[1]]
 
     @pytest.mark.asyncio
-    async def test_aexecute_sender_not_own_the_organizaition(self, mock_setup: MockSetUp) -> None:
+    async def test_aexecute_receiver_not_found(self, mock_setup: MockSetUp) -> None:
         # Setup mocks
-        mock_db, mock_logger, mock_user_context, mock_create_invitation, mock_organization_collection = mock_setup
-
-        # Mock request and database response
-        mock_organization_id = UUID("a3f5d9e2-8c67-4a01-9e45-2b70d4b4d1f3")
-        mock_sender_id = UUID("e1c8b5a6-2d9f-4fb0-86f1-3c9c5ed4a8bb")
-        mock_receivers_id = [
-            UUID("6b7fa9c2-3c7e-44a2-91c0-6c8e78db9e2a"),
-            UUID("0f1c61f0-e38e-11ee-89d1-0242ac120002"),
-        ]
-
-        # Mock user_context
-        mock_user_context.configure_mock(
-            user_id=mock_sender_id,
-            organization_id=mock_organization_id,
+        mock_db, mock_logger, mock_user_context, mock_collection = mock_setup
+        configure_aggregate(
+            mock_collection,
+            [
+                {
+                    "_id": MOCK_ORGANIZATION_ID,
+                    "receivers": [{"_id": MOCK_RECEIVERS_ID[0], "has_pending_invitation": False}],
+                }
+            ],
         )
 
-        mock_organization_collection.configure_mock(
-            find_one=Mock(return_value=None),
+        # Initialize the component
+        create_multi_invitations = CreateBatchJoinOrganizationInvitation(
+            db=mock_db,
+            logger=mock_logger,
+            user_context=mock_user_context,
         )
 
+        # Execute the component
+        request = CreateBatchJoinOrganizationInvitation.Request(user_ids=MOCK_RECEIVERS_ID)
+        with pytest.raises(BadRequestError):
+            await create_multi_invitations.aexecute(request)
+
+        # Verify interactions, nothing is inserted when any receiver is invalid
+        mock_collection.insert_models.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aexecute_sender_not_own_the_organizaition(self, mock_setup: MockSetUp) -> None:
+        # Setup mocks
+        mock_db, mock_logger, mock_user_context, mock_collection = mock_setup
+        configure_aggregate(mock_collection, [])
+
         # Initialize the component
         create_multi_invitations = CreateBatchJoinOrganizationInvitation(
             db=mock_db,
             logger=mock_logger,
             user_context=mock_user_context,
-            create_invitation=mock_create_invitation,
         )
 
         # Execute the component
-        request = CreateBatchJoinOrganizationInvitation.Request(user_ids=mock_receivers_id)
+        request = CreateBatchJoinOrganizationInvitation.Request(user_ids=MOCK_RECEIVERS_ID)
         with pytest.raises(BadRequestError):
             await create_multi_invitations.aexecute(request)
 
         # Verify interactions
-        mock_organization_collection.find_one.call_count == 1
-        filter = {
-            "_id": mock_organization_id,
-            "owner_id": mock_sender_id,
-        }
-        expect_calls = [call(filter)]
-        assert mock_organization_collection.find_one.call_args_list == expect_calls
+        mock_collection.aggregate.assert_awaited_once()
+        mock_collection.insert_models.assert_not_called()
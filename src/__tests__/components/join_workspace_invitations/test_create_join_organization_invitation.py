@@ -1,5 +1,5 @@
 from datetime import timedelta
-from unittest.mock import AsyncMock, Mock, call
+from unittest.mock import AsyncMock, Mock
 from uuid import UUID
 
 import pytest
@@ -9,7 +9,7 @@ from ....components.join_organization_invitations.create_join_organization_invit
     INVITATION_EXPIRATION_DAYS,
     CreateJoinOrganizationInvitation,
 )
-from ....exceptions import BadRequestError, InternalServerError
+from ....exceptions import BadRequestError
 from ....utils.common import get_utc_now
 
 MockSetUp = tuple[Mock, Mock, Mock, AsyncMock, AsyncMock, AsyncMock]
@@ -77,19 +77,16 @@ class TestCreateJoinOrganizationInvitation:
         )
 
         # Mock invitation collection
-        mock_invitation_collection.configure_mock(
-            insert_one=Mock(return_value=Mock(inserted_id=invitation.id)),
-            find_one=Mock(return_value=invitation.model_dump(by_alias=True)),
-        )
+        mock_invitation_collection.configure_mock(insert_model=AsyncMock(side_effect=lambda model: model))
 
         # Mock organization collection
         mock_organization_collection.configure_mock(
-            find_one=Mock(return_value=True),
+            find_one=AsyncMock(return_value=True),
         )
 
         # Mock user collection
         mock_user_collection.configure_mock(
-            find_one=Mock(return_value=True),
+            find_one=AsyncMock(return_value=True),
         )
 
         # Initialize the component
@@ -110,83 +107,12 @@ class TestCreateJoinOrganizationInvitation:
         assert response.invitation.taken_action is None
 
         # Verify interactions
-        mock_invitation_collection.insert_one.assert_called_once()
-        mock_invitation_collection.find_one.call_count == 1
-        expect_calls = [call({"_id": invitation.id})]
-        assert mock_invitation_collection.find_one.call_args_list == expect_calls
-        mock_organization_collection.find_one.assert_called_once_with(
-            {"_id": mock_organization_id, "owner_id": mock_sender_id}
-        )
-        mock_user_collection.find_one.assert_called_once_with({"_id": mock_receiver_id})
-
-    @pytest.mark.asyncio
-    async def test_aexecute_no_created_invitation_found_throw_exception(self, mock_setup: MockSetUp) -> None:
-        # Setup mocks
-        (
-            mock_db,
-            mock_logger,
-            mock_user_context,
-            mock_invitation_collection,
-            mock_organization_collection,
-            mock_user_collection,
-        ) = mock_setup
-
-        # Mock request and database response
-        mock_organization_id = UUID("a3f5d9e2-8c67-4a01-9e45-2b70d4b4d1f3")
-        mock_sender_id = UUID("e1c8b5a6-2d9f-4fb0-86f1-3c9c5ed4a8bb")
-        mock_receiver_id = UUID("6b7fa9c2-3c7e-44a2-91c0-6c8e78db9e2a")
-
-        # Mock user_context
-        mock_user_context.configure_mock(
-            user_id=mock_sender_id,
-            organization_id=mock_organization_id,
-        )
-
-        mock_taken_at = get_utc_now()
-        invitation = JoinOrganizationInvitationModel(
-            organization_id=mock_organization_id,
-            sender_id=mock_sender_id,
-            receiver_id=mock_receiver_id,
-            status=InvitationStatus.Pending,
-            taken_action=None,
-            expires_at=mock_taken_at + timedelta(INVITATION_EXPIRATION_DAYS),
-        )
-
-        mock_invitation_collection.configure_mock(
-            insert_one=Mock(return_value=Mock(inserted_id=invitation.id)),
-            find_one=Mock(return_value=None),
-        )
-
-        # Mock organization collection
-        mock_organization_collection.configure_mock(
-            find_one=Mock(return_value=True),
-        )
-
-        # Mock user collection
-        mock_user_collection.configure_mock(
-            find_one=Mock(return_value=True),
-        )
-
-        # Initialize the component
-        create_invitation = CreateJoinOrganizationInvitation(
-            db=mock_db, logger=mock_logger, user_context=mock_user_context
-        )
-
-        # Execute the component
-        request = CreateJoinOrganizationInvitation.Request(user_id=mock_receiver_id)
-
-        with pytest.raises(InternalServerError):
-            await create_invitation.aexecute(request)
-
-        # Verify interactions
-        mock_invitation_collection.insert_one.assert_called_once()
-        mock_invitation_collection.find_one.call_count == 1
-        expect_calls = [call({"_id": invitation.id})]
-        assert mock_invitation_collection.find_one.call_args_list == expect_calls
+        mock_invitation_collection.insert_model.assert_called_once_with(response.invitation)
+        mock_invitation_collection.find_one.assert_not_called()
         mock_organization_collection.find_one.assert_called_once_with(
-            {"_id": mock_organization_id, "owner_id": mock_sender_id}
+            {"_id": mock_organization_id, "owner_id": mock_sender_id}, {"_id": 1}
         )
-        mock_user_collection.find_one.assert_called_once_with({"_id": mock_receiver_id})
+        mock_user_collection.find_one.assert_called_once_with({"_id": mock_receiver_id}, {"_id": 1})
 
     @pytest.mark.asyncio
     async def test_aexecute_sender_is_not_organization_owner_throw_exception(self, mock_setup: MockSetUp) -> None:
@@ -222,18 +148,17 @@ class TestCreateJoinOrganizationInvitation:
         )
 
         mock_invitation_collection.configure_mock(
-            insert_one=Mock(return_value=Mock(inserted_id=invitation.id)),
-            find_one=Mock(return_value=None),
+            insert_model=AsyncMock(side_effect=lambda model: model),
         )
 
         # Mock organization collection
         mock_organization_collection.configure_mock(
-            find_one=Mock(return_value=False),
+            find_one=AsyncMock(return_value=False),
         )
 
         # Mock user collection
         mock_user_collection.configure_mock(
-            find_one=Mock(return_value=True),
+            find_one=AsyncMock(return_value=True),
         )
 
         # Initialize the component
@@ -249,7 +174,7 @@ class TestCreateJoinOrganizationInvitation:
 
         # Verify interactions
         mock_organization_collection.find_one.assert_called_once_with(
-            {"_id": mock_organization_id, "owner_id": mock_sender_id}
+            {"_id": mock_organization_id, "owner_id": mock_sender_id}, {"_id": 1}
         )
 
     @pytest.mark.asyncio
@@ -286,18 +211,17 @@ class TestCreateJoinOrganizationInvitation:
         )
 
         mock_invitation_collection.configure_mock(
-            insert_one=Mock(return_value=Mock(inserted_id=invitation.id)),
-            find_one=Mock(return_value=None),
+            insert_model=AsyncMock(side_effect=lambda model: model),
         )
 
         # Mock organization collection
         mock_organization_collection.configure_mock(
-            find_one=Mock(return_value=True),
+            find_one=AsyncMock(return_value=True),
         )
 
         # Mock user collection
         mock_user_collection.configure_mock(
-            find_one=Mock(return_value=False),
+            find_one=AsyncMock(return_value=False),
         )
 
         # Initialize the component
@@ -312,4 +236,4 @@ class TestCreateJoinOrganizationInvitation:
             await create_invitation.aexecute(request)
 
         # Verify interactions
-        mock_user_collection.find_one.assert_called_once_with({"_id": mock_receiver_id})
+        mock_user_collection.find_one.assert_called_once_with({"_id": mock_receiver_id}, {"_id": 1})
@@ -43,8 +43,8 @@ class TestCreateDefaultOrganization:
     ) -> None:
         # Arrange
         mock_collection.configure_mock(
-            insert_one=Mock(return_value=Mock(inserted_id=mock_organization.id)),
-            find_one=Mock(return_value=None),
+            insert_one=AsyncMock(return_value=Mock(inserted_id=mock_organization.id)),
+            find_one=AsyncMock(return_value=None),
         )
 
         mock_create_organization.configure_mock(
@@ -100,7 +100,7 @@ class TestCreateDefaultOrganization:
     ) -> None:
         # Arrange
         mock_collection.configure_mock(
-            find_one=Mock(return_value=mock_organization.model_dump(by_alias=True)),
+            find_one=AsyncMock(return_value=mock_organization.model_dump(by_alias=True)),
         )
 
         create_organization = CreateUserDefaultOrganization(
@@ -52,7 +52,7 @@ class TestCreateOrganization:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_owner_id)
         mock_collection.configure_mock(
-            find_one=Mock(return_value=None),
+            find_one=AsyncMock(return_value=None),
         )
 
         mock_create_organization.configure_mock(
@@ -110,7 +110,7 @@ class TestCreateOrganization:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_owner_id)
         mock_collection.configure_mock(
-            find_one=Mock(return_value=mock_default_organization.model_dump(by_alias=True)),
+            find_one=AsyncMock(return_value=mock_default_organization.model_dump(by_alias=True)),
         )
 
         mock_create_organization.configure_mock(
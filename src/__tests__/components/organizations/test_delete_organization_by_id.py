@@ -41,7 +41,8 @@ class TestDeleteOrganizationById:
         delete_data = {"is_deleted": True}
         mock_delete_organization = organization.model_copy(update=delete_data)
         mock_collection.configure_mock(
-            update_one=Mock(return_vaulue=None), find_one=Mock(return_value=organization.model_dump(by_alias=True))
+            update_one=AsyncMock(return_vaulue=None),
+            find_one=AsyncMock(return_value=organization.model_dump(by_alias=True)),
         )
 
         # Initialize the component
@@ -79,7 +80,7 @@ class TestDeleteOrganizationById:
             name="org_test", avatar_url="http://example.com/avatar.png", owner_id=user_id, is_default=True
         )
 
-        mock_collection.configure_mock(find_one=Mock(return_value=organization.model_dump(by_alias=True)))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=organization.model_dump(by_alias=True)))
 
         # Initialize the component
         delete_organization = DeleteOrganizationById(db=mock_db, logger=mock_logger, user_context=mock_user_context)
@@ -101,7 +102,7 @@ class TestDeleteOrganizationById:
         # Mock request and database response
         organization_id = uuid4()
 
-        mock_collection.configure_mock(find_one=Mock(return_value=None))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=None))
 
         # Initialize the component
         delete_organization = DeleteOrganizationById(db=mock_db, logger=mock_logger, user_context=mock_user_context)
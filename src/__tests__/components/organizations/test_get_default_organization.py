@@ -38,7 +38,7 @@ class TestGetOrganizationByOwnerId:
             "is_default": True,
         }
 
-        mock_collection.configure_mock(find_one=Mock(return_value=organization_data))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=organization_data))
 
         # Initialize the component
         get_organization_by_id = GetUserDefaultOrganization(db=mock_db, logger=mock_logger)
@@ -66,7 +66,7 @@ class TestGetOrganizationByOwnerId:
         # # Mock user_context
         mock_user_id = UUID("b1c345d0-3e8f-4c70-b6f3-843ab6b0df59")
 
-        mock_collection.configure_mock(find_one=Mock(return_value=None))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=None))
 
         # Initialize the component
         get_organization_by_id = GetUserDefaultOrganization(db=mock_db, logger=mock_logger)
@@ -3,7 +3,8 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 
 from ....common.models import JoinedOrganization, JoinOrganizationMember, OrganizationModel, UserModel, UserRole
-from ....components.organizations import GetOrganizationById, GetOrganizationMembers
+from ....components.organizations import GetOrganizationMembers
+from ....constants.mongo import CollectionName
 from ....utils.common import generate_uuid, get_utc_now
 
 
@@ -62,6 +63,21 @@ def mock_users(mock_organization: OrganizationModel) -> list[UserModel]:
     ]
 
 
+def make_members_data(organization: OrganizationModel, users: list[UserModel]) -> list[dict]:
+    return [
+        {
+            **member.model_dump(by_alias=True),
+            "user": {"username": user.username, "email": user.email},
+        }
+        for member, user in zip(organization.members, users)
+    ]
+
+
+def configure_aggregate(mock_db: Mock, mock_collection: Mock, results: list[dict]) -> None:
+    mock_collection.configure_mock(aggregate=AsyncMock(return_value=Mock(to_list=AsyncMock(return_value=results))))
+    mock_db.configure_mock(get_collection=Mock(return_value=mock_collection))
+
+
 class TestGetOrganizationMembers:
     @pytest.mark.asyncio
     async def test_aexecute_success(
@@ -69,35 +85,22 @@ class TestGetOrganizationMembers:
         mock_db: Mock,
         mock_collection: Mock,
         mock_logger: Mock,
-        mock_get_user_by_id: Mock,
-        mock_get_organization_by_id: Mock,
         mock_organization: OrganizationModel,
         mock_users: list[UserModel],
     ) -> None:
         # Arrange
-        mock_get_organization_by_id.configure_mock(
-            aexecute=AsyncMock(return_value=GetOrganizationById.Response(organization=mock_organization))
-        )
-        mock_db.configure_mock(
-            get_collection=Mock(return_value=mock_collection),
-        )
-        mock_users_data = [mock_user.model_dump(by_alias=True) for mock_user in mock_users]
-        mock_collection.configure_mock(
-            find=Mock(return_value=mock_users_data),
-        )
+        members_data = make_members_data(mock_organization, mock_users)
+        configure_aggregate(mock_db, mock_collection, [{"total": [{"count": 2}], "members": members_data}])
 
-        get_organization_members = GetOrganizationMembers(
-            db=mock_db,
-            logger=mock_logger,
-            get_user_by_id=mock_get_user_by_id,
-            get_organization_by_id=mock_get_organization_by_id,
-        )
+        get_organization_members = GetOrganizationMembers(db=mock_db, logger=mock_logger)
         request = GetOrganizationMembers.Request(organization_id=mock_organization.id)
 
         # Act
         response = await get_organization_members.aexecute(request)
 
         # Assert
+        assert response.total == 2
+        assert response.next_cursor is None
         assert len(response.members) == len(mock_users)
         for i, member in enumerate(response.members):
             assert member.member_id == mock_users[i].id
@@ -106,41 +109,81 @@ class TestGetOrganizationMembers:
             assert member.role == mock_organization.members[i].member_role
             assert member.joined_at == mock_organization.members[i].joined_at
 
-        mock_get_organization_by_id.aexecute.assert_called_once_with(
-            GetOrganizationById.Request(id=mock_organization.id)
-        )
-        mock_collection.find.assert_called_once_with({"_id": {"$in": [user.id for user in mock_users]}})
+        mock_db.get_collection.assert_called_once_with(CollectionName.ORGANIZATIONS)
+        mock_collection.aggregate.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_aexecute_when_organization_not_found_should_return_empty(
+    async def test_aexecute_builds_filtered_keyset_pipeline(
         self,
         mock_db: Mock,
         mock_collection: Mock,
         mock_logger: Mock,
-        mock_get_user_by_id: Mock,
-        mock_get_organization_by_id: Mock,
+        mock_organization: OrganizationModel,
     ) -> None:
         # Arrange
-        mock_get_organization_by_id.configure_mock(
-            aexecute=AsyncMock(return_value=GetOrganizationById.Response(organization=None))
-        )
-        get_organization_members = GetOrganizationMembers(
-            db=mock_db,
-            logger=mock_logger,
-            get_user_by_id=mock_get_user_by_id,
-            get_organization_by_id=mock_get_organization_by_id,
+        configure_aggregate(mock_db, mock_collection, [{"total": [], "members": []}])
+        after = mock_organization.members[0]
+
+        get_organization_members = GetOrganizationMembers(db=mock_db, logger=mock_logger)
+        request = GetOrganizationMembers.Request(
+            organization_id=mock_organization.id,
+            roles=[UserRole.OrganizationAdmin],
+            order="desc",
+            limit=10,
+            after_joined_at=after.joined_at,
+            after_member_id=after.member_id,
         )
-        request = GetOrganizationMembers.Request(organization_id=generate_uuid())
+
+        # Act
+        await get_organization_members.aexecute(request)
+
+        # Assert
+        pipeline = mock_collection.aggregate.call_args.args[0]
+        assert pipeline[0] == {"$match": {"_id": mock_organization.id}}
+        assert {"$match": {"member_role": {"$in": [UserRole.OrganizationAdmin]}}} in pipeline
+
+        facet = pipeline[-1]["$facet"]
+        assert facet["total"] == [{"$count": "count"}]
+        assert facet["members"][0] == {
+            "$match": {
+                "$or": [
+                    {"joined_at": {"$lt": after.joined_at}},
+                    {"joined_at": after.joined_at, "member_id": {"$lt": after.member_id}},
+                ]
+            }
+        }
+        assert {"$sort": {"joined_at": -1, "member_id": -1}} in facet["members"]
+        assert {"$limit": 11} in facet["members"]
+
+    @pytest.mark.asyncio
+    async def test_aexecute_with_more_members_than_limit_returns_next_cursor(
+        self,
+        mock_db: Mock,
+        mock_collection: Mock,
+        mock_logger: Mock,
+        mock_organization: OrganizationModel,
+        mock_users: list[UserModel],
+    ) -> None:
+        # Arrange
+        members_data = make_members_data(mock_organization, mock_users)
+        configure_aggregate(mock_db, mock_collection, [{"total": [{"count": 2}], "members": members_data}])
+
+        get_organization_members = GetOrganizationMembers(db=mock_db, logger=mock_logger)
+        request = GetOrganizationMembers.Request(organization_id=mock_organization.id, limit=1)
 
         # Act
         response = await get_organization_members.aexecute(request)
 
         # Assert
-        assert response.members == []
-        mock_get_organization_by_id.aexecute.assert_called_once_with(
-            GetOrganizationById.Request(id=request.organization_id)
+        assert response.total == 2
+        assert len(response.members) == 1
+        assert response.next_cursor == GetOrganizationMembers.Cursor(
+            joined_at=mock_organization.members[0].joined_at, member_id=mock_organization.members[0].member_id
         )
-        mock_collection.find.assert_not_called()
+
+    def test_request_with_partial_cursor_should_fail(self) -> None:
+        with pytest.raises(ValueError):
+            GetOrganizationMembers.Request(organization_id=generate_uuid(), after_joined_at=get_utc_now())
 
     @pytest.mark.asyncio
     async def test_aexecute_when_no_members_found_should_return_empty(
@@ -148,85 +191,44 @@ class TestGetOrganizationMembers:
         mock_db: Mock,
         mock_collection: Mock,
         mock_logger: Mock,
-        mock_get_user_by_id: Mock,
-        mock_get_organization_by_id: Mock,
-        mock_organization: OrganizationModel,
     ) -> None:
         # Arrange
-        mock_get_organization_by_id.configure_mock(
-            aexecute=AsyncMock(return_value=GetOrganizationById.Response(organization=mock_organization))
-        )
-        mock_db.configure_mock(
-            get_collection=Mock(return_value=mock_collection),
-        )
-        mock_collection.configure_mock(
-            find=Mock(return_value=[]),
-        )
+        configure_aggregate(mock_db, mock_collection, [{"total": [], "members": []}])
 
-        get_organization_members = GetOrganizationMembers(
-            db=mock_db,
-            logger=mock_logger,
-            get_user_by_id=mock_get_user_by_id,
-            get_organization_by_id=mock_get_organization_by_id,
-        )
-        request = GetOrganizationMembers.Request(organization_id=mock_organization.id)
+        get_organization_members = GetOrganizationMembers(db=mock_db, logger=mock_logger)
+        request = GetOrganizationMembers.Request(organization_id=generate_uuid())
 
         # Act
         response = await get_organization_members.aexecute(request)
 
         # Assert
         assert response.members == []
-        mock_get_organization_by_id.aexecute.assert_called_once_with(
-            GetOrganizationById.Request(id=mock_organization.id)
-        )
-        mock_collection.find.assert_called_once_with(
-            {"_id": {"$in": [member.member_id for member in mock_organization.members]}}
+        assert response.total == 0
+        mock_logger.error.assert_called_once_with(
+            f"No members found for organization with id {request.organization_id}."
         )
 
     @pytest.mark.asyncio
-    async def test_aexecute_when_member_not_in_organization(
+    async def test_aexecute_when_user_of_member_not_found(
         self,
         mock_db: Mock,
         mock_collection: Mock,
         mock_logger: Mock,
-        mock_get_user_by_id: Mock,
-        mock_get_organization_by_id: Mock,
         mock_organization: OrganizationModel,
         mock_users: list[UserModel],
     ) -> None:
         # Arrange
+        members_data = make_members_data(mock_organization, mock_users)
+        del members_data[0]["user"]
+        configure_aggregate(mock_db, mock_collection, [{"total": [{"count": 2}], "members": members_data}])
 
-        mock_users[0].id = generate_uuid()  # Change the ID to one not in the organization
-        mock_get_organization_by_id.configure_mock(
-            aexecute=AsyncMock(return_value=GetOrganizationById.Response(organization=mock_organization))
-        )
-        mock_db.configure_mock(
-            get_collection=Mock(return_value=mock_collection),
-        )
-        mock_users_data = [mock_user.model_dump(by_alias=True) for mock_user in mock_users]
-        mock_collection.configure_mock(
-            find=Mock(return_value=mock_users_data),
-        )
-
-        get_organization_members = GetOrganizationMembers(
-            db=mock_db,
-            logger=mock_logger,
-            get_user_by_id=mock_get_user_by_id,
-            get_organization_by_id=mock_get_organization_by_id,
-        )
+        get_organization_members = GetOrganizationMembers(db=mock_db, logger=mock_logger)
         request = GetOrganizationMembers.Request(organization_id=mock_organization.id)
 
         # Act
         response = await get_organization_members.aexecute(request)
 
         # Assert
-        assert len(response.members) == len(mock_users) - 1  # One user is excluded
-        for member in response.members:
-            assert member.member_id != mock_users[0].id  # Ensure the excluded user is not in the response
-
-        mock_get_organization_by_id.aexecute.assert_called_once_with(
-            GetOrganizationById.Request(id=mock_organization.id)
-        )
-        mock_collection.find.assert_called_once_with(
-            {"_id": {"$in": [member.member_id for member in mock_organization.members]}}
-        )
+        assert [member.member_id for member in response.members] == [mock_users[1].id]
+        assert response.total == 2
+        mock_logger.error.assert_called_once()
@@ -96,7 +96,9 @@ class TestGetUserOrganizationMembers:
         # Arrange
         mock_user_context.configure_mock(organization_id=mock_organization.id)
         mock_get_organization_members.configure_mock(
-            aexecute=AsyncMock(return_value=GetUserOrganizationMembers.Response(members=mock_members))
+            aexecute=AsyncMock(
+                return_value=GetOrganizationMembers.Response(members=mock_members, total=len(mock_members))
+            )
         )
 
         get_user_organization_members = GetUserOrganizationMembers(
@@ -107,7 +109,7 @@ class TestGetUserOrganizationMembers:
         )
 
         # Act
-        response = await get_user_organization_members.aexecute()
+        response = await get_user_organization_members.aexecute(GetUserOrganizationMembers.Request(limit=10))
 
         # Assert
         assert len(response.members) == len(mock_members)
@@ -118,4 +120,7 @@ class TestGetUserOrganizationMembers:
             assert member.role == mock_members[i].role
             assert member.joined_at == mock_members[i].joined_at
 
-        mock_get_organization_members.aexecute.assert_called_once()
+        assert response.total == len(mock_members)
+        mock_get_organization_members.aexecute.assert_called_once_with(
+            GetOrganizationMembers.Request(organization_id=mock_organization.id, limit=10)
+        )
@@ -72,7 +72,9 @@ class TestGetOrganizationByOwnerId:
         mock_organizations_data = [
             mock_organization.model_dump(by_alias=True) for mock_organization in mock_organizations
         ]
-        mock_collection.configure_mock(find=Mock(return_value=mock_organizations_data))
+        mock_collection.configure_mock(
+            find=Mock(return_value=Mock(to_list=AsyncMock(return_value=mock_organizations_data)))
+        )
 
         get_organization_by_id = GetUserOrganizations(
             db=mock_db, logger=mock_logger, user_context=mock_user_context, get_user_by_id=mock_get_user_by_id
@@ -116,7 +118,7 @@ class TestGetOrganizationByOwnerId:
     ) -> None:
         # Arrange
         mock_user_context.configure_mock(user_id=mock_user_id)
-        mock_collection.configure_mock(find=Mock(return_value=None))
+        mock_collection.configure_mock(find=Mock(return_value=Mock(to_list=AsyncMock(return_value=[]))))
         mock_get_user_by_id.configure_mock(aexecute=AsyncMock(return_value=GetUserById.Response(user=None)))
 
         get_organization_by_id = GetUserOrganizations(
@@ -143,7 +145,7 @@ class TestGetOrganizationByOwnerId:
         mock_user_context.configure_mock(user_id=mock_user_id)
         mock_get_user_by_id.configure_mock(aexecute=AsyncMock(return_value=GetUserById.Response(user=mock_user)))
 
-        mock_collection.configure_mock(find=Mock(return_value=None))
+        mock_collection.configure_mock(find=Mock(return_value=Mock(to_list=AsyncMock(return_value=[]))))
 
         get_organization_by_id = GetUserOrganizations(
             db=mock_db, logger=mock_logger, user_context=mock_user_context, get_user_by_id=mock_get_user_by_id
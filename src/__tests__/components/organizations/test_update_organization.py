@@ -42,7 +42,8 @@ class TestUpdateOrganization:
         update_data = {"name": "update_name", "avatar_url": "http://example.com/avatar.png/update"}
         mock_update_organization = organization.model_copy(update=update_data)
         mock_collection.configure_mock(
-            update_one=Mock(return_value=None), find_one=Mock(return_value=organization.model_dump(by_alias=True))
+            update_one=AsyncMock(return_value=None),
+            find_one=AsyncMock(return_value=organization.model_dump(by_alias=True)),
         )
 
         # Initialize the component
@@ -98,7 +99,7 @@ class TestUpdateOrganization:
         organization_id = uuid4()
 
         update_data = {"name": "update_name", "avatar_url": "http://example.com/avatar.png/update"}
-        mock_collection.configure_mock(find_one=Mock(return_value=None))
+        mock_collection.configure_mock(find_one=AsyncMock(return_value=None))
 
         # Initialize the component
         update_organization = UpdateUserOrganization(db=mock_db, logger=mock_logger, user_context=mock_user_context)
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -9,25 +9,34 @@ from ....utils.common import generate_uuid
 
 class TestAddUserFromOrganization:
     @pytest.mark.asyncio
-    async def test_aexecute_success(self, mock_db: Mock, mock_logger: Mock) -> None:
+    async def test_aexecute_success(
+        self, mock_db: Mock, mock_logger: Mock, mock_user_loader: Mock, mock_organization_loader: Mock
+    ) -> None:
         # Arrange
-        mock_user_collection = Mock()
-        mock_organization_collection = Mock()
+        mock_user_collection = AsyncMock()
+        mock_organization_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(side_effect=[mock_user_collection, mock_organization_collection]))
 
-        mock_user_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=1)))
-        mock_organization_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=1)))
+        mock_user_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=1)))
+        mock_organization_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=1)))
         mock_organization_id = generate_uuid()
         mock_user_id = generate_uuid()
         request = AddUserToOrganization.Request(
             organization_id=mock_organization_id, user_id=mock_user_id, role=UserRole.OrganizationAdmin
         )
-        add_user_from_organization = AddUserToOrganization(db=mock_db, logger=mock_logger)
+        add_user_from_organization = AddUserToOrganization(
+            db=mock_db,
+            logger=mock_logger,
+            user_loader=mock_user_loader,
+            organization_loader=mock_organization_loader,
+        )
 
         # Act
         response = await add_user_from_organization.aexecute(request)
 
         # Assert
+        mock_user_loader.clear.assert_called_once_with(mock_user_id)
+        mock_organization_loader.clear.assert_called_once_with(mock_organization_id)
         assert response is not None
         assert response.joined_organization.organization_id == mock_organization_id
         assert response.joined_organization.role == UserRole.OrganizationAdmin
@@ -41,19 +50,26 @@ class TestAddUserFromOrganization:
         mock_organization_collection.update_one.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_aexecute_when_not_update_user_should_return_empty(self, mock_db: Mock, mock_logger: Mock) -> None:
+    async def test_aexecute_when_not_update_user_should_return_empty(
+        self, mock_db: Mock, mock_logger: Mock, mock_user_loader: Mock, mock_organization_loader: Mock
+    ) -> None:
         # Arrange
-        mock_user_collection = Mock()
-        mock_organization_collection = Mock()
+        mock_user_collection = AsyncMock()
+        mock_organization_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(side_effect=[mock_user_collection, mock_organization_collection]))
 
-        mock_user_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=0)))
+        mock_user_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=0)))
         mock_organization_id = generate_uuid()
         mock_user_id = generate_uuid()
         request = AddUserToOrganization.Request(
             organization_id=mock_organization_id, user_id=mock_user_id, role=UserRole.OrganizationAdmin
         )
-        add_user_from_organization = AddUserToOrganization(db=mock_db, logger=mock_logger)
+        add_user_from_organization = AddUserToOrganization(
+            db=mock_db,
+            logger=mock_logger,
+            user_loader=mock_user_loader,
+            organization_loader=mock_organization_loader,
+        )
 
         # Act
         response = await add_user_from_organization.aexecute(request)
@@ -65,21 +81,26 @@ class TestAddUserFromOrganization:
 
     @pytest.mark.asyncio
     async def test_aexecute_when_not_update_organization_should_return_empty(
-        self, mock_db: Mock, mock_logger: Mock
+        self, mock_db: Mock, mock_logger: Mock, mock_user_loader: Mock, mock_organization_loader: Mock
     ) -> None:
         # Arrange
-        mock_user_collection = Mock()
-        mock_organization_collection = Mock()
+        mock_user_collection = AsyncMock()
+        mock_organization_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(side_effect=[mock_user_collection, mock_organization_collection]))
 
-        mock_user_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=1)))
-        mock_organization_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=0)))
+        mock_user_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=1)))
+        mock_organization_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=0)))
         mock_organization_id = generate_uuid()
         mock_user_id = generate_uuid()
         request = AddUserToOrganization.Request(
             organization_id=mock_organization_id, user_id=mock_user_id, role=UserRole.OrganizationAdmin
         )
-        remove_user_from_organization = AddUserToOrganization(db=mock_db, logger=mock_logger)
+        remove_user_from_organization = AddUserToOrganization(
+            db=mock_db,
+            logger=mock_logger,
+            user_loader=mock_user_loader,
+            organization_loader=mock_organization_loader,
+        )
 
         # Act
         response = await remove_user_from_organization.aexecute(request)
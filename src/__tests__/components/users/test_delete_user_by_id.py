@@ -26,7 +26,7 @@ class TestDeleteUserById:
 
         # Mock request and database response
         user_id = uuid4()  # Use uuid4 to generate a valid UUID object
-        mock_collection.configure_mock(delete_one=Mock(return_value=Mock(deleted_count=1)))
+        mock_collection.configure_mock(delete_one=AsyncMock(return_value=Mock(deleted_count=1)))
 
         # Initialize the component
         delete_user_by_id = DeleteUserById(db=mock_db, logger=mock_logger)
@@ -47,7 +47,7 @@ class TestDeleteUserById:
 
         # Mock request and database response
         user_id = uuid4()  # Use uuid4 to generate a valid UUID object
-        mock_collection.configure_mock(delete_one=Mock(return_value=Mock(deleted_count=0)))
+        mock_collection.configure_mock(delete_one=AsyncMock(return_value=Mock(deleted_count=0)))
 
         # Initialize the component
         delete_user_by_id = DeleteUserById(db=mock_db, logger=mock_logger)
@@ -69,7 +69,7 @@ class TestDeleteUserById:
 
         # Mock request and database response
         user_id = uuid4()  # Use uuid4 to generate a valid UUID object
-        mock_collection.configure_mock(delete_one=Mock(return_value=Mock(deleted_count=2)))
+        mock_collection.configure_mock(delete_one=AsyncMock(return_value=Mock(deleted_count=2)))
 
         # Initialize the component
         delete_user_by_id = DeleteUserById(db=mock_db, logger=mock_logger)
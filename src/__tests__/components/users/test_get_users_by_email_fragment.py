@@ -4,6 +4,7 @@ import pytest
 
 from ....common.models import UserModel, UserRole
 from ....components.users.get_users_by_email_fragment import GetUserByEmailFragment
+from ....database.projection import create_projection
 from ....utils.common import generate_uuid
 
 MockSetUp = tuple[Mock, Mock, AsyncMock]
@@ -54,7 +55,7 @@ class TestGetUserByEmailFragment:
             ),
         ]
         mock_users_data = [user.model_dump(by_alias=True) for user in mock_users]
-        mock_collection.configure_mock(find=Mock(return_value=mock_users_data))
+        mock_collection.configure_mock(find=Mock(return_value=Mock(to_list=AsyncMock(return_value=mock_users_data))))
 
         # Act
         get_user_by_email_fragment = GetUserByEmailFragment(db=mock_db, logger=mock_logger)
@@ -70,13 +71,15 @@ class TestGetUserByEmailFragment:
             assert user.email == mock_user.email
 
         regex_pattern = f".*{request.email_fragment}.*"
-        mock_collection.find.assert_called_once_with({"email": {"$regex": regex_pattern, "$options": "i"}})
+        mock_collection.find.assert_called_once_with(
+            {"email": {"$regex": regex_pattern, "$options": "i"}}, create_projection(GetUserByEmailFragment.User)
+        )
 
     @pytest.mark.asyncio
     async def test_aexecute_no_user_found_return_empty_users_list(self, mock_setup: MockSetUp) -> None:
         # Assert
         mock_db, mock_logger, mock_collection = mock_setup
-        mock_collection.configure_mock(find=Mock(return_value=None))
+        mock_collection.configure_mock(find=Mock(return_value=Mock(to_list=AsyncMock(return_value=[]))))
 
         # Act
         request = GetUserByEmailFragment.Request(email_fragment="anything HERE")
@@ -88,4 +91,6 @@ class TestGetUserByEmailFragment:
         assert len(response.users) == 0
 
         regex_pattern = f".*{request.email_fragment}.*"
-        mock_collection.find.assert_called_once_with({"email": {"$regex": regex_pattern, "$options": "i"}})
+        mock_collection.find.assert_called_once_with(
+            {"email": {"$regex": regex_pattern, "$options": "i"}}, create_projection(GetUserByEmailFragment.User)
+        )
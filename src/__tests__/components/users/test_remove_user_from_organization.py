@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -8,23 +8,32 @@ from ....utils.common import generate_uuid
 
 class TestRemoveUserFromOrganization:
     @pytest.mark.asyncio
-    async def test_aexecute_success(self, mock_db: Mock, mock_logger: Mock) -> None:
+    async def test_aexecute_success(
+        self, mock_db: Mock, mock_logger: Mock, mock_user_loader: Mock, mock_organization_loader: Mock
+    ) -> None:
         # Arrange
-        mock_user_collection = Mock()
-        mock_organization_collection = Mock()
+        mock_user_collection = AsyncMock()
+        mock_organization_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(side_effect=[mock_user_collection, mock_organization_collection]))
 
-        mock_user_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=1)))
-        mock_organization_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=1)))
+        mock_user_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=1)))
+        mock_organization_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=1)))
         mock_organization_id = generate_uuid()
         mock_user_id = generate_uuid()
         request = RemoveUserFromOrganization.Request(organization_id=mock_organization_id, user_id=mock_user_id)
-        remove_user_from_organization = RemoveUserFromOrganization(db=mock_db, logger=mock_logger)
+        remove_user_from_organization = RemoveUserFromOrganization(
+            db=mock_db,
+            logger=mock_logger,
+            user_loader=mock_user_loader,
+            organization_loader=mock_organization_loader,
+        )
 
         # Act
         response = await remove_user_from_organization.aexecute(request)
 
         # Assert
+        mock_user_loader.clear.assert_called_once_with(mock_user_id)
+        mock_organization_loader.clear.assert_called_once_with(mock_organization_id)
         assert response is not None
         assert response.success is True
         mock_user_collection.update_one.assert_called_once_with(
@@ -35,17 +44,24 @@ class TestRemoveUserFromOrganization:
         )
 
     @pytest.mark.asyncio
-    async def test_aexecute_when_not_update_user_should_return_empty(self, mock_db: Mock, mock_logger: Mock) -> None:
+    async def test_aexecute_when_not_update_user_should_return_empty(
+        self, mock_db: Mock, mock_logger: Mock, mock_user_loader: Mock, mock_organization_loader: Mock
+    ) -> None:
         # Arrange
-        mock_user_collection = Mock()
-        mock_organization_collection = Mock()
+        mock_user_collection = AsyncMock()
+        mock_organization_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(side_effect=[mock_user_collection, mock_organization_collection]))
 
-        mock_user_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=0)))
+        mock_user_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=0)))
         mock_organization_id = generate_uuid()
         mock_user_id = generate_uuid()
         request = RemoveUserFromOrganization.Request(organization_id=mock_organization_id, user_id=mock_user_id)
-        remove_user_from_organization = RemoveUserFromOrganization(db=mock_db, logger=mock_logger)
+        remove_user_from_organization = RemoveUserFromOrganization(
+            db=mock_db,
+            logger=mock_logger,
+            user_loader=mock_user_loader,
+            organization_loader=mock_organization_loader,
+        )
 
         # Act
         response = await remove_user_from_organization.aexecute(request)
@@ -59,19 +75,24 @@ class TestRemoveUserFromOrganization:
 
     @pytest.mark.asyncio
     async def test_aexecute_when_not_update_organization_should_return_empty(
-        self, mock_db: Mock, mock_logger: Mock
+        self, mock_db: Mock, mock_logger: Mock, mock_user_loader: Mock, mock_organization_loader: Mock
     ) -> None:
         # Arrange
-        mock_user_collection = Mock()
-        mock_organization_collection = Mock()
+        mock_user_collection = AsyncMock()
+        mock_organization_collection = AsyncMock()
         mock_db.configure_mock(get_collection=Mock(side_effect=[mock_user_collection, mock_organization_collection]))
 
-        mock_user_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=1)))
-        mock_organization_collection.configure_mock(update_one=Mock(return_value=Mock(modified_count=0)))
+        mock_user_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=1)))
+        mock_organization_collection.configure_mock(update_one=AsyncMock(return_value=Mock(modified_count=0)))
         mock_organization_id = generate_uuid()
         mock_user_id = generate_uuid()
         request = RemoveUserFromOrganization.Request(organization_id=mock_organization_id, user_id=mock_user_id)
-        remove_user_from_organization = RemoveUserFromOrganization(db=mock_db, logger=mock_logger)
+        remove_user_from_organization = RemoveUserFromOrganization(
+            db=mock_db,
+            logger=mock_logger,
+            user_loader=mock_user_loader,
+            organization_loader=mock_organization_loader,
+        )
 
         # Act
         response = await remove_user_from_organization.aexecute(request)
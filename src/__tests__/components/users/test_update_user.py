@@ -34,6 +34,7 @@ class TestUpdateUser:
         mock_logger: Mock,
         mock_collection: Mock,
         mock_get_user_by_id: Mock,
+        mock_user_loader: Mock,
         mock_user_id: UUID,
     ) -> None:
         # Arrange
@@ -50,9 +51,11 @@ class TestUpdateUser:
         mock_http_request = UpdateUser.HttpRequest(username="newusername")
         mock_updated_user = mock_user.model_copy(update=mock_http_request.model_dump())
 
-        mock_collection.configure_mock(update_one=Mock(return_value=None))
+        mock_collection.configure_mock(update_one=AsyncMock(return_value=None))
 
-        update_user = UpdateUser(get_user_by_id=mock_get_user_by_id, db=mock_db, logger=mock_logger)
+        update_user = UpdateUser(
+            get_user_by_id=mock_get_user_by_id, user_loader=mock_user_loader, db=mock_db, logger=mock_logger
+        )
         request = UpdateUser.Request(user_id=mock_user_id, **mock_http_request.model_dump())
 
         # Act
@@ -71,13 +74,17 @@ class TestUpdateUser:
 
         # Verify interactions
         mock_collection.update_one.assert_called_once()
+        mock_user_loader.prime.assert_called_once_with(mock_user_id, mock_user_loader.prime.call_args.args[1])
+        assert mock_user_loader.prime.call_args.args[1].username == mock_updated_user.username
 
     @pytest.mark.asyncio
     async def test_aexecute_when_no_fields_to_update_should_throw_bad_request_error(
-        self, mock_db: Mock, mock_logger: Mock, mock_get_user_by_id: Mock
+        self, mock_db: Mock, mock_logger: Mock, mock_get_user_by_id: Mock, mock_user_loader: Mock
     ) -> None:
         # Arrange
-        update_user = UpdateUser(get_user_by_id=mock_get_user_by_id, db=mock_db, logger=mock_logger)
+        update_user = UpdateUser(
+            get_user_by_id=mock_get_user_by_id, user_loader=mock_user_loader, db=mock_db, logger=mock_logger
+        )
         mock_http_request = UpdateUser.HttpRequest(username=None)
 
         # Act and Assert
@@ -87,12 +94,14 @@ class TestUpdateUser:
 
     @pytest.mark.asyncio
     async def test_aexecute_when_user_not_found_should_throw_not_found_error(
-        self, mock_db: Mock, mock_logger: Mock, mock_get_user_by_id: Mock, mock_user_id: UUID
+        self, mock_db: Mock, mock_logger: Mock, mock_get_user_by_id: Mock, mock_user_loader: Mock, mock_user_id: UUID
     ) -> None:
         # Arrange
         mock_get_user_by_id.configure_mock(aexecute=AsyncMock(return_value=GetUserById.Response(user=None)))
 
-        update_user = UpdateUser(get_user_by_id=mock_get_user_by_id, db=mock_db, logger=mock_logger)
+        update_user = UpdateUser(
+            get_user_by_id=mock_get_user_by_id, user_loader=mock_user_loader, db=mock_db, logger=mock_logger
+        )
         mock_http_request = UpdateUser.HttpRequest(username="newusername")
         request = UpdateUser.Request(user_id=mock_user_id, **mock_http_request.model_dump())
 
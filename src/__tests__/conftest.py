@@ -1,9 +1,8 @@
 from logging import Logger
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
-from pymongo.collection import Collection
-from pymongo.database import Database
+from pymongo.asynchronous.database import AsyncDatabase
 
 from ..common.auth import UserContext
 from ..components.authenticate import (
@@ -20,6 +19,12 @@ from ..components.design_projects import (
     GetDesignProjectsByOrganizationId,
     UpdateDesignProject,
 )
+from ..components.design_projects.elements import (
+    BaseGetBoundaryOrderKey,
+    BaseGetElements,
+    MigrateProjectElements,
+    ResolveElementWriteMiss,
+)
 from ..components.join_organization_invitations import (
     AcceptOrRejectInvitation,
     CreateBatchJoinOrganizationInvitation,
@@ -53,6 +58,8 @@ from ..components.users import (
     RemoveUserFromOrganization,
     UpdateUser,
 )
+from ..database.loaders import OrganizationLoader, UserLoader
+from ..database.wrapped_db import AsyncSoftDeleteCollection
 from ..services.jwt_service import JwtService
 
 
@@ -113,6 +120,27 @@ def mock_get_design_project_by_id() -> Mock:
     return Mock(spec=GetDesignProjectById)
 
 
+# NOTE: mock design element-related components
+@pytest.fixture
+def mock_base_get_elements() -> Mock:
+    return Mock(spec=BaseGetElements)
+
+
+@pytest.fixture
+def mock_migrate_project_elements() -> Mock:
+    return Mock(spec=MigrateProjectElements)
+
+
+@pytest.fixture
+def mock_resolve_element_write_miss() -> Mock:
+    return Mock(spec=ResolveElementWriteMiss)
+
+
+@pytest.fixture
+def mock_base_get_boundary_order_key() -> Mock:
+    return Mock(spec=BaseGetBoundaryOrderKey)
+
+
 # NOTE: mock join organization invitation-related components
 @pytest.fixture
 def mock_create_join_organization_invitation() -> Mock:
@@ -260,17 +288,27 @@ def mock_jwt_service() -> Mock:
 
 
 @pytest.fixture
-def mock_collection() -> Mock:
-    return Mock(spec=Collection)
+def mock_collection() -> AsyncMock:
+    return AsyncMock(spec=AsyncSoftDeleteCollection)
 
 
 @pytest.fixture
-def mock_db(mock_collection: Mock) -> Mock:
-    mock = Mock(spec=Database)
+def mock_db(mock_collection: AsyncMock) -> Mock:
+    mock = Mock(spec=AsyncDatabase)
     mock.configure_mock(get_collection=Mock(return_value=mock_collection))
     return mock
 
 
+@pytest.fixture
+def mock_user_loader() -> Mock:
+    return Mock(spec=UserLoader)
+
+
+@pytest.fixture
+def mock_organization_loader() -> Mock:
+    return Mock(spec=OrganizationLoader)
+
+
 @pytest.fixture
 def mock_logger() -> Mock:
     return Mock(spec=Logger)
@@ -0,0 +1,68 @@
+import asyncio
+import typing as t
+
+import pytest
+
+from ...database.data_loader import DataLoader
+
+
+class FakeLoader(DataLoader[int, str]):
+    def __init__(self, values: dict[int, str], error: Exception | None = None) -> None:
+        super().__init__()
+        self.values = values
+        self.error = error
+        self.calls: list[list[int]] = []
+
+    async def batch_load(self, keys: list[int]) -> t.Mapping[int, str]:
+        self.calls.append(keys)
+        if self.error is not None:
+            raise self.error
+        return {key: self.values[key] for key in keys if key in self.values}
+
+
+class TestDataLoader:
+    @pytest.mark.asyncio
+    async def test_load_coalesces_concurrent_keys_into_one_batch(self) -> None:
+        loader = FakeLoader({1: "a", 2: "b"})
+
+        results = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+        assert results == ["a", "b", "a"]
+        assert loader.calls == [[1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_load_caches_results(self) -> None:
+        loader = FakeLoader({1: "a"})
+
+        assert await loader.load(1) == "a"
+        assert await loader.load(1) == "a"
+        assert loader.calls == [[1]]
+
+    @pytest.mark.asyncio
+    async def test_load_missing_key_returns_none(self) -> None:
+        loader = FakeLoader({1: "a"})
+
+        assert await loader.load_many([1, 2]) == ["a", None]
+
+    @pytest.mark.asyncio
+    async def test_load_failure_evicts_keys(self) -> None:
+        loader = FakeLoader({1: "a"}, error=RuntimeError("boom"))
+
+        with pytest.raises(RuntimeError):
+            await loader.load(1)
+
+        loader.error = None
+        assert await loader.load(1) == "a"
+        assert loader.calls == [[1], [1]]
+
+    @pytest.mark.asyncio
+    async def test_prime_and_clear(self) -> None:
+        loader = FakeLoader({1: "a"})
+
+        loader.prime(1, "primed")
+        assert await loader.load(1) == "primed"
+        assert loader.calls == []
+
+        loader.clear(1)
+        assert await loader.load(1) == "a"
+        assert loader.calls == [[1]]
@@ -0,0 +1,90 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from pymongo import ASCENDING
+
+from ...constants.mongo_index import ACTIVE_DOCUMENTS_FILTER, MongoIndex
+from ...database.indexes import ensure_indexes
+
+EMAIL_INDEX = MongoIndex(
+    name="email_active",
+    keys=(("email", ASCENDING),),
+    unique=True,
+    partial_filter_expression=ACTIVE_DOCUMENTS_FILTER,
+)
+INDEXES = {"users": (EMAIL_INDEX,)}
+
+
+class TestEnsureIndexes:
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_creates_missing_index(self, mock_db: Mock, mock_collection: AsyncMock) -> None:
+        # Arrange
+        mock_logger = Mock()
+        mock_collection.configure_mock(index_information=AsyncMock(return_value={"_id_": {"key": [("_id", 1)]}}))
+
+        # Act
+        drift = await ensure_indexes(mock_db, mock_logger, INDEXES)
+
+        # Assert
+        assert drift.missing == ["users.email_active"]
+        assert drift.mismatched == []
+        assert drift.unexpected == []
+        mock_collection.create_indexes.assert_awaited_once()
+        [index_model] = mock_collection.create_indexes.call_args.args[0]
+        assert index_model.document == {
+            "key": {"email": ASCENDING},
+            "name": "email_active",
+            "unique": True,
+            "partialFilterExpression": ACTIVE_DOCUMENTS_FILTER,
+        }
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_is_idempotent(self, mock_db: Mock, mock_collection: AsyncMock) -> None:
+        # Arrange
+        mock_logger = Mock()
+        existing_indexes = {
+            "_id_": {"key": [("_id", 1)]},
+            "email_active": {"key": [("email", 1.0)], "unique": True, "partialFilterExpression": {"is_deleted": False}},
+        }
+        mock_collection.configure_mock(index_information=AsyncMock(return_value=existing_indexes))
+
+        # Act
+        drift = await ensure_indexes(mock_db, mock_logger, INDEXES)
+
+        # Assert
+        assert not drift.has_drift
+        mock_collection.create_indexes.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_reports_drift(self, mock_db: Mock, mock_collection: AsyncMock) -> None:
+        # Arrange
+        mock_logger = Mock()
+        existing_indexes = {
+            "_id_": {"key": [("_id", 1)]},
+            "email_active": {"key": [("email", 1)]},
+            "username_1": {"key": [("username", 1)]},
+        }
+        mock_collection.configure_mock(index_information=AsyncMock(return_value=existing_indexes))
+
+        # Act
+        drift = await ensure_indexes(mock_db, mock_logger, INDEXES)
+
+        # Assert
+        assert drift.missing == []
+        assert drift.mismatched == ["users.email_active"]
+        assert drift.unexpected == ["users.username_1"]
+        mock_collection.create_indexes.assert_not_called()
+        assert mock_logger.warning.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ensure_indexes_logs_error_without_raising(self, mock_db: Mock, mock_collection: AsyncMock) -> None:
+        # Arrange
+        mock_logger = Mock()
+        mock_collection.configure_mock(index_information=AsyncMock(side_effect=Exception("unauthorized")))
+
+        # Act
+        drift = await ensure_indexes(mock_db, mock_logger, INDEXES)
+
+        # Assert
+        assert not drift.has_drift
+        mock_logger.error.assert_called_once()
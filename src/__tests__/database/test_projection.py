@@ -0,0 +1,25 @@
+import pydantic as p
+
+from ...common.models.base import BaseModelWithId
+from ...database.projection import create_projection
+
+
+class TestCreateProjection:
+    def test_projection_uses_field_aliases(self) -> None:
+        class Summary(BaseModelWithId):
+            name: str = p.Field(alias="name")
+            owner_id: str = p.Field(alias="owner_id")
+
+        assert create_projection(Summary) == {"_id": 1, "name": 1, "owner_id": 1}
+
+    def test_projection_includes_alias_choices(self) -> None:
+        class Summary(p.BaseModel):
+            id: str = p.Field(validation_alias=p.AliasChoices("id", "_id"))
+
+        assert create_projection(Summary) == {"id": 1, "_id": 1}
+
+    def test_projection_excludes_id_when_model_has_no_id(self) -> None:
+        class Summary(p.BaseModel):
+            username: str
+
+        assert create_projection(Summary) == {"username": 1, "_id": 0}
@@ -0,0 +1,181 @@
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from pymongo import AsyncMongoClient, InsertOne, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+
+from ...common.models import RefreshTokenModel
+from ...constants.mongo import CollectionName
+from ...constants.mongo_index import ACTIVE_DOCUMENTS_FILTER, MONGO_INDEXES
+from ...database.wrapped_db import (
+    NON_SOFT_DELETE_COLLECTIONS,
+    AsyncSoftDeleteCollection,
+    AsyncWrappedDatabase,
+    with_soft_delete_filter,
+    with_soft_delete_pipeline,
+)
+from ...exceptions import InternalServerError
+from ...utils.common import generate_uuid, get_utc_now
+
+
+@pytest.fixture
+def database() -> AsyncWrappedDatabase:
+    client: AsyncMongoClient = AsyncMongoClient("mongodb://localhost:27017", connect=False)
+    return AsyncWrappedDatabase(client.get_database("database"))
+
+
+class TestWithSoftDeleteFilter:
+    def test_adds_is_deleted_without_mutating_filter(self) -> None:
+        filter = {"organization_id": generate_uuid()}
+
+        scoped_filter = with_soft_delete_filter(filter)
+
+        assert scoped_filter == {**filter, "is_deleted": False}
+        assert "is_deleted" not in filter
+
+    def test_keeps_explicit_is_deleted(self) -> None:
+        assert with_soft_delete_filter({"is_deleted": True}) == {"is_deleted": True}
+
+    def test_wraps_id_value(self) -> None:
+        id = generate_uuid()
+        assert with_soft_delete_filter(id) == {"_id": id, "is_deleted": False}
+        assert with_soft_delete_filter(None) == {"is_deleted": False}
+
+    def test_prepends_match_stage_to_pipeline(self) -> None:
+        pipeline = [{"$match": {"receiver_id": generate_uuid()}}]
+
+        scoped_pipeline = with_soft_delete_pipeline(pipeline)
+
+        assert scoped_pipeline == [{"$match": {"is_deleted": False}}, *pipeline]
+        assert len(pipeline) == 1
+
+
+class TestAsyncSoftDeleteCollection:
+    def test_get_collection_wraps_soft_delete_collections(self, database: AsyncWrappedDatabase) -> None:
+        assert isinstance(database.get_collection(CollectionName.USERS), AsyncSoftDeleteCollection)
+        assert not isinstance(database.get_collection(CollectionName.REFRESH_TOKENS), AsyncSoftDeleteCollection)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method", ["count_documents", "update_one", "update_many", "delete_one", "find_one_and_update"]
+    )
+    async def test_write_and_count_paths_are_scoped(self, database: AsyncWrappedDatabase, method: str) -> None:
+        # Arrange
+        collection = database.get_collection(CollectionName.DESIGN_PROJECTS)
+        filter = {"_id": generate_uuid()}
+
+        # Act
+        with patch.object(AsyncCollection, method, new_callable=AsyncMock) as mock_method:
+            await getattr(collection, method)(filter, {"$set": {"name": "name"}})
+
+        # Assert
+        assert mock_method.call_args.args[0] == {**filter, "is_deleted": False}
+        assert "is_deleted" not in filter
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_scopes_filters_and_inserted_documents(self, database: AsyncWrappedDatabase) -> None:
+        # Arrange
+        collection = database.get_collection(CollectionName.DESIGN_PROJECTS)
+        update_request = UpdateOne({"_id": generate_uuid()}, {"$set": {"name": "name"}})
+        insert_request = InsertOne({"_id": generate_uuid()})
+
+        # Act
+        with patch.object(AsyncCollection, "bulk_write", new_callable=AsyncMock) as mock_bulk_write:
+            await collection.bulk_write([update_request, insert_request])
+
+        # Assert
+        scoped_update_request, scoped_insert_request = mock_bulk_write.call_args.args[0]
+        assert scoped_update_request._filter["is_deleted"] is False
+        assert scoped_update_request._doc == {"$set": {"name": "name"}}
+        assert scoped_insert_request._doc["is_deleted"] is False
+        assert "is_deleted" not in update_request._filter
+        assert "is_deleted" not in insert_request._doc
+
+
+class TestAsyncModelCollection:
+    @pytest.fixture
+    def refresh_token(self) -> RefreshTokenModel:
+        return RefreshTokenModel(hashed_access_token="hashed_access_token", expired_at=get_utc_now(), revoked_at=None)
+
+    @pytest.mark.asyncio
+    async def test_insert_model_returns_model_without_reading_back(
+        self, database: AsyncWrappedDatabase, refresh_token: RefreshTokenModel
+    ) -> None:
+        # Arrange
+        collection = database.get_collection(CollectionName.REFRESH_TOKENS)
+
+        # Act
+        with (
+            patch.object(AsyncCollection, "insert_one", new_callable=AsyncMock) as mock_insert_one,
+            patch.object(AsyncCollection, "find_one", new_callable=AsyncMock) as mock_find_one,
+        ):
+            inserted_refresh_token = await collection.insert_model(refresh_token)
+
+        # Assert
+        assert inserted_refresh_token is refresh_token
+        mock_insert_one.assert_awaited_once_with(refresh_token.model_dump(by_alias=True))
+        mock_find_one.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_insert_model_with_read_your_write_reads_back(
+        self, database: AsyncWrappedDatabase, refresh_token: RefreshTokenModel
+    ) -> None:
+        # Arrange
+        collection = database.get_collection(CollectionName.REFRESH_TOKENS)
+
+        # Act
+        with (
+            patch.object(AsyncCollection, "insert_one", new_callable=AsyncMock) as mock_insert_one,
+            patch.object(AsyncCollection, "find_one", new_callable=AsyncMock) as mock_find_one,
+        ):
+            mock_insert_one.return_value = Mock(inserted_id=refresh_token.id)
+            mock_find_one.return_value = refresh_token.model_dump(by_alias=True)
+            inserted_refresh_token = await collection.insert_model(refresh_token, read_your_write=True)
+
+        # Assert
+        assert inserted_refresh_token == refresh_token
+        assert inserted_refresh_token is not refresh_token
+        mock_find_one.assert_awaited_once_with({"_id": refresh_token.id})
+
+    @pytest.mark.asyncio
+    async def test_insert_model_with_read_your_write_raises_when_missing(
+        self, database: AsyncWrappedDatabase, refresh_token: RefreshTokenModel
+    ) -> None:
+        # Arrange
+        collection = database.get_collection(CollectionName.REFRESH_TOKENS)
+
+        # Act & Assert
+        with (
+            patch.object(AsyncCollection, "insert_one", new_callable=AsyncMock) as mock_insert_one,
+            patch.object(AsyncCollection, "find_one", new_callable=AsyncMock, return_value=None),
+        ):
+            mock_insert_one.return_value = Mock(inserted_id=refresh_token.id)
+            with pytest.raises(InternalServerError):
+                await collection.insert_model(refresh_token, read_your_write=True)
+
+    @pytest.mark.asyncio
+    async def test_insert_models_inserts_in_one_round_trip(
+        self, database: AsyncWrappedDatabase, refresh_token: RefreshTokenModel
+    ) -> None:
+        # Arrange
+        collection = database.get_collection(CollectionName.REFRESH_TOKENS)
+        refresh_tokens = [refresh_token, refresh_token.model_copy(update={"id": generate_uuid()})]
+
+        # Act
+        with patch.object(AsyncCollection, "insert_many", new_callable=AsyncMock) as mock_insert_many:
+            inserted_refresh_tokens = await collection.insert_models(refresh_tokens)
+            empty_inserted_refresh_tokens = await collection.insert_models([])
+
+        # Assert
+        assert inserted_refresh_tokens == refresh_tokens
+        assert empty_inserted_refresh_tokens == []
+        mock_insert_many.assert_awaited_once_with([token.model_dump(by_alias=True) for token in refresh_tokens])
+
+
+class TestSoftDeleteIndexes:
+    def test_soft_delete_collection_indexes_are_partial(self) -> None:
+        for collection_name, indexes in MONGO_INDEXES.items():
+            if collection_name in NON_SOFT_DELETE_COLLECTIONS:
+                continue
+            for index in indexes:
+                assert index.partial_filter_expression == ACTIVE_DOCUMENTS_FILTER, f"{collection_name}.{index.name}"
@@ -0,0 +1,78 @@
+import importlib
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi.websockets import WebSocket, WebSocketDisconnect
+
+from ....common.models import UserRole
+from ....common.websocket.message import WebSocketMessage
+from ....routers.websocket.router import websocket_client_endpoitn
+from ....utils.common import generate_uuid
+
+
+def create_websocket_handler(handle_event: AsyncMock) -> Mock:
+    return Mock(
+        handle_event=handle_event,
+        send_message=AsyncMock(),
+        handle_disconnected_client=AsyncMock(),
+        broadcast_message=AsyncMock(),
+    )
+
+
+@pytest.fixture(autouse=True)
+def mock_client_connection_manager(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    mock_client_connection_manager = Mock(connect=AsyncMock())
+    # NOTE: the package exports the api router under the name of the module
+    router_module = importlib.import_module("....routers.websocket.router", __package__)
+    monkeypatch.setattr(router_module, "client_connection_manager", mock_client_connection_manager)
+    return mock_client_connection_manager
+
+
+def create_websocket_user_context() -> Mock:
+    return Mock(user_id=generate_uuid(), username="user", email="user@example.com", role=UserRole.OrganizationMember)
+
+
+class TestWebsocketClientEndpoint:
+    @pytest.mark.asyncio
+    async def test_a_failing_event_is_reported_and_the_connection_goes_on(self, mock_logger: Mock) -> None:
+        # Arrange
+        design_project_id = generate_uuid()
+        websocket = Mock(
+            spec=WebSocket,
+            accept=AsyncMock(),
+            receive_json=AsyncMock(side_effect=[{"event": "CreateElement"}, {"event": "Ping"}, WebSocketDisconnect()]),
+        )
+        handle_event = AsyncMock(side_effect=[ValueError("Invalid order key"), None])
+        websocket_handler = create_websocket_handler(handle_event)
+
+        # Act
+        await websocket_client_endpoitn(
+            websocket, websocket_handler, create_websocket_user_context(), design_project_id, mock_logger
+        )
+
+        # Assert
+        assert handle_event.await_count == 2
+        websocket_handler.send_message.assert_awaited_once()
+        assert isinstance(websocket_handler.send_message.await_args.args[1], WebSocketMessage.ErrorMessage)
+        websocket_handler.handle_disconnected_client.assert_awaited_once_with(design_project_id)
+
+    @pytest.mark.asyncio
+    async def test_a_websocket_closed_by_its_outbound_queue_leaves_its_room(self, mock_logger: Mock) -> None:
+        # Arrange
+        design_project_id = generate_uuid()
+        websocket = Mock(
+            spec=WebSocket,
+            accept=AsyncMock(),
+            # NOTE: what starlette raises on receive once the writer task closed the websocket
+            receive_json=AsyncMock(side_effect=[{"event": "Ping"}, RuntimeError("WebSocket is not connected.")]),
+        )
+        websocket_handler = create_websocket_handler(AsyncMock())
+
+        # Act
+        await websocket_client_endpoitn(
+            websocket, websocket_handler, create_websocket_user_context(), design_project_id, mock_logger
+        )
+
+        # Assert
+        websocket_handler.handle_disconnected_client.assert_awaited_once_with(design_project_id)
+        assert isinstance(websocket_handler.broadcast_message.await_args.args[2], WebSocketMessage.DisconnectMessage)
@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from ...common.models import AffineTransformModel
+from ...utils.affine_transform import (
+    NodeGeometry,
+    get_linear_matrix,
+    get_node_linear_matrices,
+    transform_local_points,
+    transform_node_geometry,
+)
+
+
+def make_node_geometry(rows: list[tuple[float, ...]]) -> NodeGeometry:
+    columns = np.array(rows, dtype=np.float64).T
+    return NodeGeometry(*columns)
+
+
+def get_node_matrices(geometry: NodeGeometry) -> np.ndarray:
+    matrices = np.tile(np.eye(3), (len(geometry), 1, 1))
+    matrices[:, :2, :2] = get_node_linear_matrices(geometry)
+    matrices[:, 0, 2] = geometry.x
+    matrices[:, 1, 2] = geometry.y
+    return matrices
+
+
+def get_transform_matrix(transform: AffineTransformModel) -> np.ndarray:
+    return np.array([[transform.a, transform.c, transform.e], [transform.b, transform.d, transform.f], [0, 0, 1]])
+
+
+TRANSFORMS = [
+    AffineTransformModel(e=10, f=-5),
+    AffineTransformModel(a=2, d=0.5),
+    AffineTransformModel(a=0, b=1, c=-1, d=0, e=3, f=4),
+    AffineTransformModel(a=1, b=0.2, c=0.7, d=1.3, e=-2, f=1),
+    AffineTransformModel(a=-1, d=1),
+]
+
+GEOMETRY = make_node_geometry(
+    [
+        # x, y, rotation, scale_x, scale_y, skew_x, skew_y
+        (0, 0, 0, 1, 1, 0, 0),
+        (10, 20, 30, 2, 0.5, 0, 0),
+        (-5, 7, -120, 1, 3, 0.4, 0),
+        (1, 1, 45, 1.5, 1.5, 0.2, 0.3),
+    ]
+)
+
+
+class TestTransformNodeGeometry:
+    @pytest.mark.parametrize("transform", TRANSFORMS)
+    def test_composes_the_transform_with_every_node(self, transform: AffineTransformModel) -> None:
+        # Act
+        transformed_geometry = transform_node_geometry(transform, GEOMETRY)
+
+        # Assert
+        expected_matrices = get_transform_matrix(transform) @ get_node_matrices(GEOMETRY)
+        np.testing.assert_allclose(get_node_matrices(transformed_geometry), expected_matrices, atol=1e-9)
+        np.testing.assert_array_equal(transformed_geometry.skew_y, 0)
+
+    def test_pure_rotation_and_scale_should_not_add_skew(self) -> None:
+        # Arrange
+        transform = AffineTransformModel(a=0, b=2, c=-2, d=0)
+
+        # Act
+        transformed_geometry = transform_node_geometry(transform, make_node_geometry([(1, 2, 10, 1, 1, 0, 0)]))
+
+        # Assert
+        assert transformed_geometry.skew_x.tolist() == [0]
+        np.testing.assert_allclose(transformed_geometry.rotation, [100])
+        np.testing.assert_allclose(transformed_geometry.scale_x, [2])
+        np.testing.assert_allclose(transformed_geometry.scale_y, [2])
+        np.testing.assert_allclose([transformed_geometry.x[0], transformed_geometry.y[0]], [-4, 2])
+
+    def test_singular_nodes_should_only_move(self) -> None:
+        # Arrange
+        transform = AffineTransformModel(a=2, d=2, e=1)
+
+        # Act
+        transformed_geometry = transform_node_geometry(transform, make_node_geometry([(1, 1, 30, 0, 1, 0, 0)]))
+
+        # Assert
+        assert transformed_geometry.x.tolist() == [3]
+        assert transformed_geometry.scale_x.tolist() == [0]
+        assert transformed_geometry.rotation.tolist() == [30]
+
+
+class TestTransformLocalPoints:
+    @pytest.mark.parametrize("transform", TRANSFORMS)
+    def test_bakes_the_linear_part_into_the_points(self, transform: AffineTransformModel) -> None:
+        # Arrange
+        point_counts = np.array([1, 3, 2, 2], dtype=np.intp)
+        points = np.arange(2 * point_counts.sum(), dtype=np.float64) - 5
+
+        # Act
+        transformed_points = transform_local_points(transform, GEOMETRY, points, point_counts)
+
+        # Assert
+        node_matrices = np.repeat(get_node_linear_matrices(GEOMETRY), point_counts, axis=0)
+        expected_points = np.einsum("ij,njk,nk->ni", get_linear_matrix(transform), node_matrices, points.reshape(-1, 2))
+        np.testing.assert_allclose(np.einsum("nij,nj->ni", node_matrices, transformed_points), expected_points)
+
+    @pytest.mark.parametrize("transform", TRANSFORMS)
+    def test_keeps_the_offset_of_the_nodes(self, transform: AffineTransformModel) -> None:
+        # Arrange
+        point_counts = np.array([1, 3, 2, 2], dtype=np.intp)
+        points = np.arange(2 * point_counts.sum(), dtype=np.float64) - 5
+        offsets = np.array([[0, 0], [4, -2], [10, 10], [-3, 0.5]], dtype=np.float64)
+
+        # Act
+        transformed_points = transform_local_points(transform, GEOMETRY, points, point_counts, offsets)
+
+        # Assert
+        # NOTE: a node draws `position + node * (point - offset)`, the transform applies on top of it
+        node_matrices = np.repeat(get_node_linear_matrices(GEOMETRY), point_counts, axis=0)
+        point_offsets = np.repeat(offsets, point_counts, axis=0)
+        expected_points = np.einsum(
+            "ij,njk,nk->ni", get_linear_matrix(transform), node_matrices, points.reshape(-1, 2) - point_offsets
+        )
+        np.testing.assert_allclose(
+            np.einsum("nij,nj->ni", node_matrices, transformed_points - point_offsets), expected_points, atol=1e-9
+        )
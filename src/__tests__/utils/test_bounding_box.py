@@ -0,0 +1,75 @@
+import pydantic as p
+import pytest
+
+from ...common.models import (
+    ArrowModel,
+    BoundingBox,
+    CircleModel,
+    LineModel,
+    PyObjectBoundingBox,
+    RectangleModel,
+    ShapeType,
+    TextModel,
+)
+from ...utils.bounding_box import compute_bounding_box
+
+
+def get_bounds(bounding_box: BoundingBox | None) -> tuple[float, ...] | None:
+    if bounding_box is None:
+        return None
+    return tuple(
+        round(bound, 6) for bound in (bounding_box.min_x, bounding_box.min_y, bounding_box.max_x, bounding_box.max_y)
+    )
+
+
+class TestComputeBoundingBox:
+    @pytest.mark.parametrize(
+        "element, expected",
+        [
+            (RectangleModel(x=10, y=20, width=30, height=40), (10, 20, 40, 60)),
+            (RectangleModel(x=10, y=20, width=30, height=40, strokeWidth=2), (9, 19, 41, 61)),
+            (RectangleModel(x=0, y=0, width=10, height=20, rotation=90), (-20, 0, 0, 10)),
+            (RectangleModel(x=0, y=0, width=10, height=20, scaleX=2, scaleY=0.5), (0, 0, 20, 10)),
+            (RectangleModel(x=0, y=0, width=10, height=20, offsetX=5, offsetY=10), (-5, -10, 5, 10)),
+            (RectangleModel(x=0, y=0, width=10, height=10, skewX=1), (0, 0, 20, 10)),
+            (CircleModel(x=5, y=5, radius=5), (0, 0, 10, 10)),
+            (LineModel(x=100, y=0, points=[0, 0, 10, -5, 20, 5]), (100, -5, 120, 5)),
+            (ArrowModel(points=[0, 0, 10, 0], pointerLength=4, pointerWidth=6), (-4, -4, 14, 4)),
+            (TextModel(x=0, y=0, width=50, text="a\nb", fontSize=10), (0, 0, 50, 20)),
+        ],
+    )
+    def test_compute_bounding_box(self, element: p.BaseModel, expected: tuple[float, ...]) -> None:
+        element_data = element.model_dump(by_alias=True, exclude_none=True)
+
+        assert get_bounds(compute_bounding_box(element_data)) == expected
+
+    def test_rotation_keeps_the_element_covered(self) -> None:
+        element_data = {"shapeType": ShapeType.Rectangle, "x": 0, "y": 0, "width": 10, "height": 10, "rotation": 45}
+
+        bounds = get_bounds(compute_bounding_box(element_data))
+
+        assert bounds == (round(-(50**0.5), 6), 0, round(50**0.5, 6), round(2 * 50**0.5, 6))
+
+    @pytest.mark.parametrize(
+        "element_data",
+        [
+            {"shapeType": ShapeType.Text, "x": 0, "y": 0, "text": "auto sized"},
+            {"shapeType": ShapeType.Line, "x": 0, "y": 0},
+            {"shapeType": ShapeType.Circle, "x": 0, "y": 0},
+            {"x": 0, "y": 0, "width": 10},
+        ],
+    )
+    def test_unknown_extent_is_unbounded(self, element_data: dict) -> None:
+        assert compute_bounding_box(element_data) is None
+
+
+class TestPyObjectBoundingBox:
+    def test_parses_query_string(self) -> None:
+        bounding_box = p.TypeAdapter(PyObjectBoundingBox).validate_python("-10,0.5,10,20")
+
+        assert bounding_box == BoundingBox(min_x=-10, min_y=0.5, max_x=10, max_y=20)
+
+    @pytest.mark.parametrize("value", ["1,2,3", "a,0,1,1", "10,0,0,10", "0,0,inf,10"])
+    def test_invalid_query_string_should_raise(self, value: str) -> None:
+        with pytest.raises(p.ValidationError):
+            p.TypeAdapter(PyObjectBoundingBox).validate_python(value)
@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from ...utils.fractional_index import generate_key_between, generate_n_keys_between
+
+
+class TestGenerateKeyBetween:
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            (None, None, "a0"),
+            ("a0", None, "a1"),
+            (None, "a0", "Zz"),
+            ("a0", "a1", "a0V"),
+            ("a1", "a2", "a1V"),
+            ("a0V", "a1", "a0l"),
+            ("Zz", "a0", "ZzV"),
+            ("a0", "a0V", "a0G"),
+        ],
+    )
+    def test_generate_key_between(self, a: str | None, b: str | None, expected: str) -> None:
+        assert generate_key_between(a, b) == expected
+
+    @pytest.mark.parametrize(
+        "a, b", [("a1", "a0"), ("a0", "a0"), ("a00", None), ("a", None), ("", None), ("a0!", None), (None, "a0 ")]
+    )
+    def test_invalid_bounds_should_raise(self, a: str | None, b: str | None) -> None:
+        with pytest.raises(ValueError):
+            generate_key_between(a, b)
+
+    def test_repeated_inserts_stay_sorted(self) -> None:
+        random_generator = random.Random(0)
+        keys = [generate_key_between(None, None)]
+        for _ in range(1000):
+            index = random_generator.randint(0, len(keys))
+            lower = keys[index - 1] if index > 0 else None
+            upper = keys[index] if index < len(keys) else None
+            keys.insert(index, generate_key_between(lower, upper))
+
+        assert keys == sorted(keys)
+        assert len(set(keys)) == len(keys)
+
+    def test_appending_keeps_keys_short(self) -> None:
+        key = generate_key_between(None, None)
+        for _ in range(10_000):
+            key = generate_key_between(key, None)
+
+        assert len(key) <= 4
+
+
+class TestGenerateNKeysBetween:
+    @pytest.mark.parametrize("a, b", [(None, None), ("a0", None), (None, "a0"), ("a0", "a1")])
+    def test_keys_are_ascending_and_bounded(self, a: str | None, b: str | None) -> None:
+        keys = generate_n_keys_between(a, b, 50)
+
+        assert len(keys) == 50
+        assert keys == sorted(keys)
+        assert len(set(keys)) == len(keys)
+        assert a is None or a < keys[0]
+        assert b is None or keys[-1] < b
+
+    def test_no_keys(self) -> None:
+        assert generate_n_keys_between(None, None, 0) == []
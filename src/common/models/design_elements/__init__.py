@@ -1,16 +1,21 @@
 from .arrow import ArrowModel, BaseArrowModel
+from .bounding_box import BoundingBox, PyObjectBoundingBox
 from .circle import BaseCircleModel, CircleModel
 from .composite_type_for_model import BaseElementModel, ElementModel
 from .ellipse import BaseEllipseModel, EllipseModel
 from .image import BaseImageModel, ImageModel
 from .line import BaseLineModel, LineModel
 from .node import BaseNodeModel, NodeModel
+from .order import ElementPlacement, ElementPlacementModel
+from .patch import ELEMENT_MODEL_BY_SHAPE_TYPE, ElementPatchModel
+from .points import APPENDED_POINTS_FIELD, PackedPoints, PointsDtype, get_element_points_array, get_points_array
 from .rectangle import BaseRectangleModel, RectangleModel
 from .regular_polygon import BaseRegularPolygonModel, RegularPolygonModel
 from .ring import BaseRingModel, RingModel
 from .shape import BaseShapeModel, ShapeModel
 from .star import BaseStarModel, StarModel
 from .text import BaseTextModel, TextModel
+from .transform import AffineTransformModel
 from .type import GlobalCompositeOperationType, HTMLImageElement, ShapeType, Vector2d
 
 __all__ = [
@@ -18,6 +23,8 @@ __all__ = [
     "Vector2d",
     "HTMLImageElement",
     "ShapeType",
+    "ElementPlacement",
+    "ElementPlacementModel",
     "NodeModel",
     "BaseNodeModel",
     "ShapeModel",
@@ -44,4 +51,14 @@ __all__ = [
     "RingModel",
     "BaseStarModel",
     "StarModel",
+    "ElementPatchModel",
+    "ELEMENT_MODEL_BY_SHAPE_TYPE",
+    "BoundingBox",
+    "PyObjectBoundingBox",
+    "AffineTransformModel",
+    "PackedPoints",
+    "PointsDtype",
+    "get_points_array",
+    "get_element_points_array",
+    "APPENDED_POINTS_FIELD",
 ]
@@ -3,13 +3,14 @@ import typing as t
 import pydantic as p
 
 from .line import AbstractLineModel
+from .points import PackedPoints
 from .shape import ShapeModel, ShapeType
 
 
 class BaseArrowModel(AbstractLineModel, p.BaseModel):
     shapeType: t.Literal[ShapeType.Arrow] = p.Field(default=ShapeType.Arrow, alias="shapeType")
     # extra properties for Arrow
-    points: list[float] = p.Field(default=[], alias="points")
+    points: PackedPoints = p.Field(default_factory=lambda: PackedPoints.from_values([]), alias="points")
     tension: float | None = p.Field(default=None, alias="tension")
     closed: bool | None = p.Field(default=None, alias="closed")
     pointerLength: float | None = p.Field(default=None, alias="pointerLength")
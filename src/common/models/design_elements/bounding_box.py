@@ -0,0 +1,39 @@
+import typing as t
+
+import pydantic as p
+
+
+def parse_bounding_box(value: t.Any) -> t.Any:
+    """Accept the `minx,miny,maxx,maxy` form used by query strings."""
+    if not isinstance(value, str):
+        return value
+
+    coordinates = value.split(",")
+    if len(coordinates) != 4:
+        raise ValueError("bbox must be formatted as minx,miny,maxx,maxy")
+    min_x, min_y, max_x, max_y = coordinates
+    return {"min_x": min_x, "min_y": min_y, "max_x": max_x, "max_y": max_y}
+
+
+class BoundingBox(p.BaseModel):
+    """
+    Axis-aligned box in canvas coordinates.
+    """
+
+    min_x: float = p.Field(alias="min_x", allow_inf_nan=False)
+    min_y: float = p.Field(alias="min_y", allow_inf_nan=False)
+    max_x: float = p.Field(alias="max_x", allow_inf_nan=False)
+    max_y: float = p.Field(alias="max_y", allow_inf_nan=False)
+
+    @p.model_validator(mode="after")
+    def validate_bounds(self) -> t.Self:
+        if self.min_x > self.max_x or self.min_y > self.max_y:
+            raise ValueError("bbox minimums must not be greater than its maximums")
+        return self
+
+
+PyObjectBoundingBox = t.Annotated[
+    BoundingBox,
+    p.BeforeValidator(parse_bounding_box),
+    p.WithJsonSchema({"type": "string", "pattern": r"^[^,]+,[^,]+,[^,]+,[^,]+$", "examples": ["0,0,1920,1080"]}),
+]
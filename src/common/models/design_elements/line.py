@@ -2,12 +2,13 @@ import typing as t
 
 import pydantic as p
 
+from .points import PackedPoints
 from .shape import BaseShapeModel, ShapeModel, ShapeType
 
 
 class AbstractLineModel(BaseShapeModel, p.BaseModel):
     # extra properties for Line
-    points: list[float] | None = p.Field(default=None, alias="points")
+    points: PackedPoints | None = p.Field(default=None, alias="points")
     tension: float | None = p.Field(default=None, alias="tension")
     closed: bool | None = p.Field(default=None, alias="closed")
     bezier: bool | None = p.Field(default=None, alias="bezier")
@@ -37,7 +37,8 @@ class BaseNodeModel(p.BaseModel):
 
 
 class NodeModel(BaseNodeModel, BaseModelWithSoftDelete, BaseModelWithDateTime, BaseModelWithId):
-    pass
+    # NOTE: fractional index, elements with a higher key are drawn above the ones with a lower key
+    order_key: str | None = p.Field(default=None, alias="order_key")
 
 
 # https://github.com/konvajs/konva/blob/master/src/Node.ts#L18
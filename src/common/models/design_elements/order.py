@@ -0,0 +1,29 @@
+import typing as t
+from enum import Enum
+
+import pydantic as p
+
+from ..base import PyObjectUUID
+
+
+class ElementPlacement(str, Enum):
+    Front = "Front"
+    Back = "Back"
+    Above = "Above"
+    Below = "Below"
+
+
+class ElementPlacementModel(p.BaseModel):
+    """
+    Where to move an element in the stacking order, `Above` and `Below` are relative to `target_element_id`.
+    """
+
+    placement: ElementPlacement = p.Field(alias="placement")
+    target_element_id: PyObjectUUID | None = p.Field(default=None, alias="target_element_id")
+
+    @p.model_validator(mode="after")
+    def validate_target_element_id(self) -> t.Self:
+        is_relative_placement = self.placement in (ElementPlacement.Above, ElementPlacement.Below)
+        if is_relative_placement != (self.target_element_id is not None):
+            raise ValueError("target_element_id is required for Above and Below placements only")
+        return self
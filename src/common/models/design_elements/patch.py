@@ -0,0 +1,90 @@
+import typing as t
+from functools import cache
+
+import pydantic as p
+from bson.binary import Binary
+
+from .arrow import ArrowModel
+from .circle import CircleModel
+from .ellipse import EllipseModel
+from .image import ImageModel
+from .line import LineModel
+from .points import PackedPoints
+from .rectangle import RectangleModel
+from .regular_polygon import RegularPolygonModel
+from .ring import RingModel
+from .shape import ShapeModel
+from .star import StarModel
+from .text import TextModel
+from .type import ShapeType
+
+ELEMENT_MODEL_BY_SHAPE_TYPE: dict[ShapeType | None, type[ShapeModel]] = {
+    ShapeType.Circle: CircleModel,
+    ShapeType.Rectangle: RectangleModel,
+    ShapeType.RegularPolygon: RegularPolygonModel,
+    ShapeType.Line: LineModel,
+    ShapeType.Text: TextModel,
+    ShapeType.Image: ImageModel,
+    ShapeType.Arrow: ArrowModel,
+    ShapeType.Ellipse: EllipseModel,
+    ShapeType.Ring: RingModel,
+    ShapeType.Star: StarModel,
+    None: ShapeModel,
+}
+
+# NOTE: identity, type, order and bookkeeping fields are owned by the server and never patched by clients
+NON_PATCHABLE_FIELDS = frozenset(
+    {"id", "shapeType", "order_key", "created_at", "updated_at", "is_deleted", "deleted_at"}
+)
+
+
+@cache
+def get_element_patch_model(shape_type: ShapeType | None) -> type[p.BaseModel]:
+    """
+    Build a model accepting any subset of the patchable fields of the element model of `shape_type`.
+
+    Every field keeps its type and validators but may be omitted, so only the sent fields are validated.
+    """
+    element_model = ELEMENT_MODEL_BY_SHAPE_TYPE[shape_type]
+    fields: dict[str, t.Any] = {}
+    for name, field in element_model.model_fields.items():
+        if name in NON_PATCHABLE_FIELDS:
+            continue
+        # NOTE: required fields may be changed but not cleared
+        annotation = field.annotation if field.is_required() else field.annotation | None
+        if field.metadata:
+            annotation = t.Annotated[annotation, *field.metadata]
+        fields[name] = (annotation, p.Field(default=None, alias=field.alias))
+    return p.create_model(
+        f"{element_model.__name__}Patch",
+        __config__=p.ConfigDict(
+            extra="forbid", populate_by_name=True, arbitrary_types_allowed=True, use_enum_values=True
+        ),
+        **fields,
+    )
+
+
+class ElementPatchModel(p.BaseModel):
+    """
+    Field-level changes of one element.
+
+    `changes` is keyed by the element field aliases and validated against the concrete model of `shape_type`, a
+    `None` value clears the field.
+    """
+
+    shape_type: ShapeType | None = p.Field(default=None, alias="shape_type")
+    changes: dict[str, t.Any] = p.Field(alias="changes", min_length=1)
+
+    @p.model_validator(mode="after")
+    def validate_changes(self) -> t.Self:
+        patch_model = get_element_patch_model(self.shape_type)
+        self.changes = patch_model.model_validate(self.changes).model_dump(by_alias=True, exclude_unset=True)
+        return self
+
+    @p.field_serializer("changes", when_used="json")
+    def serialize_changes(self, changes: dict[str, t.Any]) -> dict[str, t.Any]:
+        # NOTE: changes hold the stored form of their values, packed points are sent back as plain numbers
+        return {
+            field: PackedPoints(value).to_list() if isinstance(value, Binary) else value
+            for field, value in changes.items()
+        }
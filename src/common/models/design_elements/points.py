@@ -0,0 +1,178 @@
+import base64
+import typing as t
+from enum import Enum
+
+import numpy as np
+import numpy.typing as npt
+import pydantic as p
+from bson.binary import Binary
+from pydantic_core import core_schema
+
+
+class PointsDtype(str, Enum):
+    Float32 = "float32"
+    Float64 = "float64"
+
+
+# NOTE: user defined BSON binary subtypes, the buffers are little-endian whatever the host byte order
+POINTS_BINARY_SUBTYPE_BY_DTYPE: dict[PointsDtype, int] = {PointsDtype.Float32: 0x80, PointsDtype.Float64: 0x81}
+POINTS_DTYPE_BY_BINARY_SUBTYPE = {subtype: dtype for dtype, subtype in POINTS_BINARY_SUBTYPE_BY_DTYPE.items()}
+NUMPY_DTYPE_BY_POINTS_DTYPE: dict[PointsDtype, np.dtype] = {
+    PointsDtype.Float32: np.dtype("<f4"),
+    PointsDtype.Float64: np.dtype("<f8"),
+}
+# NOTE: server-owned document field, points appended while drawing are pushed there as packed chunks until folded back
+APPENDED_POINTS_FIELD = "points_appended"
+
+
+class PackedPoints:
+    """
+    Flat `[x0, y0, x1, y1, ...]` coordinates packed into one little-endian float buffer.
+
+    Stored as a BSON binary and only decoded when the coordinates are read. Coordinates are packed as float32 whenever
+    that loses nothing, float64 otherwise.
+
+    Validates from a list of numbers, a BSON binary, or a base64 typed array `{"dtype": "float32", "data": "..."}`.
+    Dumps to a BSON binary in python mode, which is what documents store, and to a list of numbers in JSON mode.
+    """
+
+    __slots__ = ("_binary", "_array")
+
+    def __init__(self, binary: Binary) -> None:
+        dtype = POINTS_DTYPE_BY_BINARY_SUBTYPE.get(binary.subtype)
+        if dtype is None:
+            raise ValueError(f"points binary subtype {binary.subtype} is not supported")
+        if len(binary) % NUMPY_DTYPE_BY_POINTS_DTYPE[dtype].itemsize != 0:
+            raise ValueError(f"points buffer size must be a multiple of the {dtype.value} size")
+        self._binary = binary
+        self._array: npt.NDArray[np.floating] | None = None
+
+    @classmethod
+    def from_values(cls, values: npt.ArrayLike) -> "PackedPoints":
+        array = np.asarray(values, dtype=np.float64)
+        if array.ndim != 1:
+            raise ValueError("points must be a flat list of numbers")
+        packed_array = array.astype(NUMPY_DTYPE_BY_POINTS_DTYPE[PointsDtype.Float32])
+        if np.array_equal(packed_array, array, equal_nan=True):
+            return cls(Binary(packed_array.tobytes(), POINTS_BINARY_SUBTYPE_BY_DTYPE[PointsDtype.Float32]))
+        packed_array = array.astype(NUMPY_DTYPE_BY_POINTS_DTYPE[PointsDtype.Float64])
+        return cls(Binary(packed_array.tobytes(), POINTS_BINARY_SUBTYPE_BY_DTYPE[PointsDtype.Float64]))
+
+    @classmethod
+    def from_base64(cls, dtype: PointsDtype, data: str) -> "PackedPoints":
+        return cls(Binary(base64.b64decode(data, validate=True), POINTS_BINARY_SUBTYPE_BY_DTYPE[dtype]))
+
+    @property
+    def dtype(self) -> PointsDtype:
+        return POINTS_DTYPE_BY_BINARY_SUBTYPE[self._binary.subtype]
+
+    @property
+    def array(self) -> npt.NDArray[np.floating]:
+        """Read-only view over the buffer, decoded on first access."""
+        if self._array is None:
+            self._array = np.frombuffer(self._binary, dtype=NUMPY_DTYPE_BY_POINTS_DTYPE[self.dtype])
+        return self._array
+
+    def to_list(self) -> list[float]:
+        return self.array.tolist()
+
+    def to_binary(self) -> Binary:
+        return self._binary
+
+    def to_base64(self) -> dict[str, str]:
+        return {"dtype": self.dtype.value, "data": base64.b64encode(self._binary).decode()}
+
+    def __len__(self) -> int:
+        return len(self._binary) // NUMPY_DTYPE_BY_POINTS_DTYPE[self.dtype].itemsize
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PackedPoints):
+            return NotImplemented
+        return self._binary == other._binary
+
+    def __hash__(self) -> int:
+        return hash(self._binary)
+
+    def __repr__(self) -> str:
+        return f"PackedPoints(dtype={self.dtype.value}, size={len(self)})"
+
+    @classmethod
+    def _validate(cls, value: t.Any) -> "PackedPoints":
+        if isinstance(value, PackedPoints):
+            return value
+        if isinstance(value, Binary):
+            return cls(value)
+        if isinstance(value, dict):
+            dtype, data = value.get("dtype"), value.get("data")
+            if dtype not in POINTS_BINARY_SUBTYPE_BY_DTYPE or not isinstance(data, str):
+                raise ValueError("typed points must have a float32 or float64 dtype and base64 data")
+            return cls.from_base64(PointsDtype(dtype), data)
+        if isinstance(value, (list, tuple)):
+            # NOTE: one numpy conversion instead of a float validation per coordinate
+            try:
+                return cls.from_values(value)
+            except (TypeError, ValueError):
+                raise ValueError("points must be a list of numbers")
+        raise ValueError("points must be a list of numbers or a typed array")
+
+    @classmethod
+    def _serialize(cls, value: "PackedPoints", info: core_schema.SerializationInfo) -> t.Any:
+        if info.mode_is_json():
+            return value.to_list()
+        return value.to_binary()
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: t.Any, handler: p.GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(cls._serialize, info_arg=True),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: p.GetJsonSchemaHandler
+    ) -> dict[str, t.Any]:
+        return {
+            "anyOf": [
+                {"type": "array", "items": {"type": "number"}},
+                {
+                    "type": "object",
+                    "properties": {
+                        "dtype": {"enum": [dtype.value for dtype in PointsDtype]},
+                        "data": {"type": "string", "contentEncoding": "base64"},
+                    },
+                    "required": ["dtype", "data"],
+                },
+            ]
+        }
+
+
+def get_points_array(value: t.Any) -> npt.NDArray[np.floating] | None:
+    """
+    Read the coordinates of a `points` value in any of its stored forms, `None` when it holds anything else.
+    """
+    if isinstance(value, PackedPoints):
+        return value.array
+    try:
+        if isinstance(value, Binary):
+            return PackedPoints(value).array
+        if isinstance(value, list):
+            return np.asarray(value, dtype=np.float64)
+    except (TypeError, ValueError):
+        return None
+    return None
+
+
+def get_element_points_array(element_data: t.Mapping[str, t.Any]) -> npt.NDArray[np.floating] | None:
+    """
+    Read the coordinates of an element document, chunks appended after its `points` included.
+    """
+    appended_chunks = element_data.get(APPENDED_POINTS_FIELD)
+    points = element_data.get("points")
+    if not appended_chunks:
+        return get_points_array(points)
+
+    arrays = [get_points_array(chunk) for chunk in (points if points is not None else [], *appended_chunks)]
+    if any(array is None for array in arrays):
+        return None
+    return np.concatenate(t.cast(list[npt.NDArray[np.floating]], arrays), dtype=np.float64)
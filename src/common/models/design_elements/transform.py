@@ -0,0 +1,24 @@
+import typing as t
+
+import pydantic as p
+
+
+class AffineTransformModel(p.BaseModel):
+    """
+    2D affine transform in canvas coordinates, laid out like a Konva `Transform`:
+    `x' = a * x + c * y + e` and `y' = b * x + d * y + f`.
+    """
+
+    a: float = p.Field(default=1.0, alias="a", allow_inf_nan=False)
+    b: float = p.Field(default=0.0, alias="b", allow_inf_nan=False)
+    c: float = p.Field(default=0.0, alias="c", allow_inf_nan=False)
+    d: float = p.Field(default=1.0, alias="d", allow_inf_nan=False)
+    e: float = p.Field(default=0.0, alias="e", allow_inf_nan=False)
+    f: float = p.Field(default=0.0, alias="f", allow_inf_nan=False)
+
+    @p.model_validator(mode="after")
+    def validate_invertible(self) -> t.Self:
+        # NOTE: a singular transform would flatten the selection into a line or a point for good
+        if self.a * self.d - self.b * self.c == 0:
+            raise ValueError("transform must be invertible")
+        return self
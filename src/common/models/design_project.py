@@ -1,7 +1,6 @@
 import pydantic as p
 
 from .base import BaseModelWithDateTime, BaseModelWithId, BaseModelWithSoftDelete, PyObjectUUID
-from .design_elements import ElementModel
 
 
 class DesignProjectModel(BaseModelWithId, BaseModelWithDateTime, BaseModelWithSoftDelete):
@@ -9,4 +8,3 @@ class DesignProjectModel(BaseModelWithId, BaseModelWithDateTime, BaseModelWithSo
     thumbnail_url: str | None = p.Field(default=None, alias="thumbnail_url")
     organization_id: PyObjectUUID = p.Field(alias="organization_id")
     owner_id: PyObjectUUID = p.Field(alias="owner_id")
-    elements: list[ElementModel] = p.Field(default=[], alias="elements")
@@ -1,9 +1,25 @@
+import asyncio
+import typing as t
+from uuid import UUID
+
 import pydantic as p
 from fastapi.websockets import WebSocket
 
-from ...common.models import PyObjectUUID
-from ...common.websocket.message import Sender
+from ...common.models import BoundingBox, PyObjectUUID
+from ...common.websocket.message import (
+    EncodedWebSocketMessage,
+    Sender,
+    UserCursor,
+    WebSocketMessage,
+    WebSocketMessagePayload,
+)
+from ...constants.websocket import OutboundOverflowPolicy
 from ...dependencies import create_logger
+from ...utils.common import generate_uuid
+from .outbound_queue import ClientOutboundQueue
+from .room_affinity import RoomAffinity
+from .room_bus import InProcessRoomBus, RoomBus, RoomBusMessage
+from .spatial_index import ElementBoundsChange, RoomSpatialIndex
 
 DesignProjectId = PyObjectUUID
 ClientId = PyObjectUUID
@@ -12,6 +28,7 @@ ClientId = PyObjectUUID
 class WebSocketClient(p.BaseModel):
     client: Sender
     websocket: WebSocket
+    outbound_queue: ClientOutboundQueue
 
     model_config = p.ConfigDict(
         arbitrary_types_allowed=True,
@@ -22,21 +39,79 @@ WebSocketConnection = dict[ClientId, WebSocketClient]
 
 WebSocketConnections = dict[DesignProjectId, WebSocketConnection]
 
+# NOTE: clients whose viewport missed element changes are told which elements went stale at this pace
+ELEMENTS_SYNC_INTERVAL_SECONDS = 5.0
+OUTBOUND_QUEUE_SIZE = 256
+# NOTE: cursor moves are coalesced and sent to the room at 25 Hz, whatever the rate clients report them at
+CURSOR_FLUSH_INTERVAL_SECONDS = 1 / 25
+ROOM_CHANNEL_PREFIX = "design-project:"
+
 
 class ClientConnectionManager:
-    def __init__(self) -> None:
+    """
+    Rooms of the websocket clients of each design project.
+
+    Messages are sent through a bounded outbound queue per client, drained by its own writer task, so broadcasting
+    only enqueues and returns and a slow client never delays the rest of its room. Messages come encoded, the same
+    text is queued for every recipient.
+
+    Cursor moves are not broadcast one by one: the latest cursor of each user is kept and every tick the room gets
+    one frame with the cursors that moved, so a client receives one cursor frame per tick whatever the room size.
+    A client's own cursor is left out of the frame it receives.
+
+    Every room message is also published on the room bus, the managers of the other workers deliver it to their own
+    clients of the room, so a room can span workers and hosts. With `room_affinity`, the rooms this worker owns have
+    all their clients here and are not published.
+    """
+
+    def __init__(
+        self,
+        elements_sync_interval_seconds: float = ELEMENTS_SYNC_INTERVAL_SECONDS,
+        outbound_queue_size: int = OUTBOUND_QUEUE_SIZE,
+        outbound_overflow_policy: OutboundOverflowPolicy = OutboundOverflowPolicy.DropOldestCursor,
+        cursor_flush_interval_seconds: float = CURSOR_FLUSH_INTERVAL_SECONDS,
+        room_bus: RoomBus | None = None,
+        room_affinity: RoomAffinity | None = None,
+    ) -> None:
         self._connections: WebSocketConnections = {}
+        self._spatial_indexes: dict[DesignProjectId, RoomSpatialIndex] = {}
+        self._elements_sync_tasks: dict[DesignProjectId, asyncio.Task] = {}
+        self._elements_sync_interval_seconds = elements_sync_interval_seconds
+        self._outbound_queue_size = outbound_queue_size
+        self._outbound_overflow_policy = outbound_overflow_policy
+        self._user_cursors: dict[DesignProjectId, dict[ClientId, UserCursor]] = {}
+        self._cursor_flush_tasks: dict[DesignProjectId, asyncio.Task] = {}
+        self._cursor_flush_interval_seconds = cursor_flush_interval_seconds
+        self._room_bus = room_bus or InProcessRoomBus()
+        self._room_affinity = room_affinity
+        # NOTE: tells the messages of this manager apart when the bus delivers them back
+        self._origin = generate_uuid().hex
         self._logger = create_logger()
 
     async def connect(self, design_project_id: PyObjectUUID, client: Sender, websocket: WebSocket) -> None:
         client_id = client.id
-        connection = self._connections.pop(design_project_id, None) or {}
+        connection = self._connections.get(design_project_id) or {}
         if client_id in connection.keys():
             return
 
         await websocket.accept()
-        connection[client_id] = WebSocketClient(client=client, websocket=websocket)
+        await self._room_bus.start(self._receive_room_message)
+        outbound_queue = ClientOutboundQueue(
+            websocket, self._outbound_queue_size, self._outbound_overflow_policy, self._logger
+        )
+        outbound_queue.start()
+        connection[client_id] = WebSocketClient(client=client, websocket=websocket, outbound_queue=outbound_queue)
         self._connections[design_project_id] = connection
+        if design_project_id not in self._spatial_indexes:
+            self._spatial_indexes[design_project_id] = RoomSpatialIndex()
+            self._elements_sync_tasks[design_project_id] = asyncio.create_task(
+                self._sync_stale_elements(design_project_id)
+            )
+            self._user_cursors[design_project_id] = {}
+            self._cursor_flush_tasks[design_project_id] = asyncio.create_task(
+                self._flush_user_cursors(design_project_id)
+            )
+            await self._room_bus.subscribe(self._get_room_channel(design_project_id))
         self._logger.info(
             f"WebSocket connection established for client {client_id} in design project {design_project_id}."
         )
@@ -49,30 +124,222 @@ class ClientConnectionManager:
         if client_id not in self._connections[design_project_id].keys():
             return
 
-        self._connections[design_project_id].pop(client_id, None)
+        websocket_client = self._connections[design_project_id].pop(client_id, None)
+        if websocket_client is not None:
+            await websocket_client.outbound_queue.close()
+        if spatial_index := self._spatial_indexes.get(design_project_id):
+            spatial_index.remove_client(client_id)
+        if user_cursors := self._user_cursors.get(design_project_id):
+            user_cursors.pop(client_id, None)
         self._logger.info(f"WebSocket connection closed for client {client_id} from design project {design_project_id}")
 
         if not len(self._connections[design_project_id].keys()):
             self._connections.pop(design_project_id, None)
+            self._spatial_indexes.pop(design_project_id, None)
+            if elements_sync_task := self._elements_sync_tasks.pop(design_project_id, None):
+                elements_sync_task.cancel()
+            self._user_cursors.pop(design_project_id, None)
+            if cursor_flush_task := self._cursor_flush_tasks.pop(design_project_id, None):
+                cursor_flush_task.cancel()
+            await self._room_bus.unsubscribe(self._get_room_channel(design_project_id))
             self._logger.info(f"All connections closed for design project {design_project_id}")
 
-    async def broadcast(self, design_project_id: PyObjectUUID, sender_id: PyObjectUUID, message: dict) -> None:
+    async def broadcast(
+        self, design_project_id: PyObjectUUID, sender_id: PyObjectUUID, message: EncodedWebSocketMessage
+    ) -> None:
         if design_project_id not in self._connections.keys():
             return
 
         if sender_id not in self._connections[design_project_id].keys():
             return
 
-        for client_id, websocket_client in self._connections[design_project_id].items():
-            websocket = websocket_client.websocket
-            try:
-                if client_id != sender_id:
-                    await websocket.send_json(message)
-            except Exception as e:
+        client_ids = [client_id for client_id in self._connections[design_project_id].keys() if client_id != sender_id]
+        self._enqueue_to_clients(design_project_id, client_ids, message)
+        self._publish(design_project_id, message, sender_id)
+
+    async def send_to_client(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, message: EncodedWebSocketMessage
+    ) -> None:
+        """
+        Send a message to one client of the room, e.g. the reply to its own event.
+
+        It goes through the outbound queue of the client like the room messages, so that the writer task of the
+        client stays the only one writing to its websocket.
+        """
+        self._enqueue_to_clients(design_project_id, [client_id], message)
+
+    async def broadcast_element_changes(
+        self,
+        design_project_id: PyObjectUUID,
+        sender_id: PyObjectUUID,
+        message: EncodedWebSocketMessage,
+        changes: t.Sequence[ElementBoundsChange],
+    ) -> None:
+        """
+        Broadcast an element change message only to the clients whose viewport it affects.
+
+        The other clients get the changed element ids with the next elements sync of the room.
+        """
+        if design_project_id not in self._connections.keys():
+            return
+
+        if sender_id not in self._connections[design_project_id].keys():
+            return
+
+        client_ids = [client_id for client_id in self._connections[design_project_id].keys() if client_id != sender_id]
+        spatial_index = self._spatial_indexes.get(design_project_id)
+        if spatial_index is not None:
+            recipient_ids = spatial_index.route(client_ids, changes)
+            client_ids = [client_id for client_id in client_ids if client_id in recipient_ids]
+        self._enqueue_to_clients(design_project_id, client_ids, message)
+        self._publish(design_project_id, message, sender_id, changes)
+
+    async def update_viewport(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, viewport: BoundingBox | None
+    ) -> None:
+        spatial_index = self._spatial_indexes.get(design_project_id)
+        if spatial_index is None:
+            return
+
+        spatial_index.set_viewport(client_id, viewport)
+        # NOTE: a client that moves its viewport refreshes what it now shows, the missed changes are sent right away
+        await self._send_stale_elements(design_project_id, client_id)
+
+    def update_user_cursor(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, user_cursor: UserCursor
+    ) -> None:
+        """
+        Keep the latest cursor of a client, the room gets it with the next cursor frame.
+        """
+        user_cursors = self._user_cursors.get(design_project_id)
+        if user_cursors is None or client_id not in self._connections.get(design_project_id, {}):
+            return
+
+        user_cursors[client_id] = user_cursor
+
+    def flush_user_cursors(self, design_project_id: PyObjectUUID) -> None:
+        """
+        Send the cursors that moved since the last flush to the room as one frame.
+        """
+        user_cursors = self._user_cursors.get(design_project_id)
+        if not user_cursors:
+            return
+
+        self._user_cursors[design_project_id] = {}
+        encoded_message = self._encode_user_cursors(list(user_cursors.values()))
+        client_ids = list(self._connections.get(design_project_id, {}).keys())
+        # NOTE: the clients that did not move share one frame, a client never gets its own cursor echoed back
+        self._enqueue_to_clients(
+            design_project_id, [client_id for client_id in client_ids if client_id not in user_cursors], encoded_message
+        )
+        for client_id in client_ids:
+            if client_id not in user_cursors or len(user_cursors) == 1:
+                continue
+            other_user_cursors = [
+                user_cursor for cursor_client_id, user_cursor in user_cursors.items() if cursor_client_id != client_id
+            ]
+            self._enqueue_to_clients(design_project_id, [client_id], self._encode_user_cursors(other_user_cursors))
+        # NOTE: the clients of the other workers have no cursor in this frame, they all get it whole
+        self._publish(design_project_id, encoded_message)
+
+    @staticmethod
+    def _encode_user_cursors(user_cursors: list[UserCursor]) -> EncodedWebSocketMessage:
+        return EncodedWebSocketMessage.encode(
+            WebSocketMessage.ReceiveUserCursorsUpdatedMessage(
+                payload=WebSocketMessagePayload.ReceiveUserCursorsUpdatedMessagePayload(user_cursors=user_cursors)
+            )
+        )
+
+    async def _flush_user_cursors(self, design_project_id: PyObjectUUID) -> None:
+        while design_project_id in self._user_cursors:
+            await asyncio.sleep(self._cursor_flush_interval_seconds)
+            self.flush_user_cursors(design_project_id)
+
+    async def _sync_stale_elements(self, design_project_id: PyObjectUUID) -> None:
+        while True:
+            await asyncio.sleep(self._elements_sync_interval_seconds)
+            spatial_index = self._spatial_indexes.get(design_project_id)
+            if spatial_index is None:
+                return
+
+            for client_id in spatial_index.get_stale_client_ids():
+                await self._send_stale_elements(design_project_id, client_id)
+
+    async def _send_stale_elements(self, design_project_id: PyObjectUUID, client_id: PyObjectUUID) -> None:
+        spatial_index = self._spatial_indexes.get(design_project_id)
+        if spatial_index is None:
+            return
+
+        stale_element_ids = spatial_index.pop_stale_element_ids(client_id)
+        if not stale_element_ids:
+            return
+
+        elements_sync_message = WebSocketMessage.ReceiveElementsSyncMessage(
+            payload=WebSocketMessagePayload.ReceiveElementsSyncMessagePayload(stale_element_ids=list(stale_element_ids))
+        )
+        self._enqueue_to_clients(
+            design_project_id,
+            [client_id],
+            EncodedWebSocketMessage.encode(elements_sync_message),
+        )
+
+    def _enqueue_to_clients(
+        self, design_project_id: PyObjectUUID, client_ids: t.Iterable[PyObjectUUID], message: EncodedWebSocketMessage
+    ) -> None:
+        connection = self._connections.get(design_project_id, {})
+        for client_id in client_ids:
+            websocket_client = connection.get(client_id)
+            if websocket_client is None:
+                continue
+            if not websocket_client.outbound_queue.put(message) and websocket_client.outbound_queue.is_closed:
                 self._logger.info(
-                    f"Failed to send message to client {client_id} in design project {design_project_id}: {e}"
+                    f"Dropped message to disconnecting client {client_id} in design project {design_project_id}."
                 )
 
+    async def close(self) -> None:
+        await self._room_bus.close()
+
+    def _publish(
+        self,
+        design_project_id: PyObjectUUID,
+        message: EncodedWebSocketMessage,
+        sender_id: PyObjectUUID | None = None,
+        changes: t.Sequence[ElementBoundsChange] | None = None,
+    ) -> None:
+        if self._room_affinity is not None and self._room_affinity.owns_room(design_project_id):
+            return
+
+        room_bus_message = RoomBusMessage(origin=self._origin, message=message, sender_id=sender_id, changes=changes)
+        self._room_bus.publish(self._get_room_channel(design_project_id), room_bus_message.to_bytes())
+
+    def _receive_room_message(self, channel: str, data: bytes) -> None:
+        try:
+            room_bus_message = RoomBusMessage.from_bytes(data)
+            design_project_id = UUID(channel.removeprefix(ROOM_CHANNEL_PREFIX))
+        except Exception as e:
+            # NOTE: whatever a malformed message raises, it must not stop the delivery of the next ones
+            self._logger.info(f"Dropped malformed room bus message of channel {channel}: {e!r}")
+            return
+
+        if room_bus_message.origin == self._origin or design_project_id not in self._connections:
+            return
+
+        client_ids = [
+            client_id
+            for client_id in self._connections[design_project_id].keys()
+            if client_id != room_bus_message.sender_id
+        ]
+        spatial_index = self._spatial_indexes.get(design_project_id)
+        if room_bus_message.changes is not None and spatial_index is not None:
+            # NOTE: routed by the viewports of the clients of this worker, like a change made on this worker
+            recipient_ids = spatial_index.route(client_ids, room_bus_message.changes)
+            client_ids = [client_id for client_id in client_ids if client_id in recipient_ids]
+        self._enqueue_to_clients(design_project_id, client_ids, room_bus_message.message)
+
+    @staticmethod
+    def _get_room_channel(design_project_id: PyObjectUUID) -> str:
+        return f"{ROOM_CHANNEL_PREFIX}{design_project_id}"
+
     def get_clients(self, design_project_id: PyObjectUUID) -> list[Sender]:
         if design_project_id not in self._connections.keys():
             return []
@@ -1,9 +1,20 @@
 import typing as t
+from dataclasses import dataclass
 from enum import Enum
 
 import pydantic as p
 
-from ...common.models import BaseElementModel, ElementModel, PyObjectUUID, UserRole
+from ...common.models import (
+    AffineTransformModel,
+    BaseElementModel,
+    BoundingBox,
+    ElementModel,
+    ElementPatchModel,
+    ElementPlacementModel,
+    PackedPoints,
+    PyObjectUUID,
+    UserRole,
+)
 from ...constants.websocket import WebSocketEvent
 
 ElementTemporaryId = str
@@ -45,6 +56,21 @@ class IWebSocketMessage[T](p.BaseModel):
     payload: T
 
 
+@dataclass(frozen=True)
+class EncodedWebSocketMessage:
+    """
+    A message serialized once into the JSON text written as is to every recipient.
+    """
+
+    event: WebSocketEvent
+    text: str
+
+    @classmethod
+    def encode(cls, message: IWebSocketMessage) -> "EncodedWebSocketMessage":
+        # NOTE: pydantic-core writes the JSON straight from the serializer it built once for the message class
+        return cls(event=message.event, text=message.model_dump_json(by_alias=False, exclude_none=True))
+
+
 class WebSocketMessagePayload:
     # NOTE: sender message request payloads
 
@@ -59,12 +85,40 @@ class WebSocketMessagePayload:
         element_id: PyObjectUUID
         element: ElementModel
 
+    class PatchElementMessagePayload(p.BaseModel):
+        element_id: PyObjectUUID
+        patch: ElementPatchModel
+
+    class CreateBatchElementsMessagePayload(p.BaseModel):
+        elements: list["WebSocketMessagePayload.CreateElementMessagePayload"]
+
+    class UpdateBatchElementsMessagePayload(p.BaseModel):
+        elements: list[ElementModel]
+
+    class DeleteBatchElementsMessagePayload(p.BaseModel):
+        element_ids: list[PyObjectUUID]
+
+    class ReorderElementMessagePayload(ElementPlacementModel, p.BaseModel):
+        element_id: PyObjectUUID
+
+    class TransformElementsMessagePayload(p.BaseModel):
+        element_ids: list[PyObjectUUID]
+        transform: AffineTransformModel
+
+    class AppendPointsMessagePayload(p.BaseModel):
+        element_id: PyObjectUUID
+        points: PackedPoints
+
     class JoinUserCursorMessagePayload(p.BaseModel):
         user_id: PyObjectUUID
 
     class UpdateUserCursorMessagePayload(p.BaseModel):
         user_cursor: UserCursor
 
+    class UpdateViewportMessagePayload(p.BaseModel):
+        # NOTE: `None` subscribes the client to the changes of the whole canvas
+        viewport: BoundingBox | None = None
+
     # NOTE: sender message response payloads
 
     class ElementCreatedMessagePayload(p.BaseModel):
@@ -77,6 +131,33 @@ class WebSocketMessagePayload:
         updated_element_id: PyObjectUUID
         updated_element: ElementModel
 
+    class ElementPatchedMessagePayload(p.BaseModel):
+        patched_element_id: PyObjectUUID
+        patch: ElementPatchModel
+
+    class BatchElementsCreatedMessagePayload(p.BaseModel):
+        temporary_element_id_element_map: dict[ElementTemporaryId, ElementModel]
+
+    class BatchElementsUpdatedMessagePayload(p.BaseModel):
+        updated_elements: list[ElementModel]
+
+    class BatchElementsDeletedMessagePayload(p.BaseModel):
+        deleted_element_ids: list[PyObjectUUID]
+
+    class ElementReorderedMessagePayload(p.BaseModel):
+        reordered_element_id: PyObjectUUID
+        order_key: str
+
+    class ElementsTransformedMessagePayload(p.BaseModel):
+        # NOTE: receivers apply `transform` to their own copy of the elements instead of getting every new geometry
+        transformed_element_ids: list[PyObjectUUID]
+        transform: AffineTransformModel
+
+    class PointsAppendedMessagePayload(p.BaseModel):
+        # NOTE: the sender already drew the points, only their count is acknowledged
+        element_id: PyObjectUUID
+        appended_count: int
+
     class CurrentUsersMessagePayload(p.BaseModel):
         users: list[Sender]
 
@@ -91,6 +172,29 @@ class WebSocketMessagePayload:
     class ReceiveElementUpdatedMessagePayload(ReceiverMessagePayload, ElementUpdatedMessagePayload):
         pass
 
+    class ReceiveElementPatchedMessagePayload(ReceiverMessagePayload, ElementPatchedMessagePayload):
+        pass
+
+    class ReceiveBatchElementsCreatedMessagePayload(ReceiverMessagePayload, p.BaseModel):
+        elements: list[ElementModel]
+
+    class ReceiveBatchElementsUpdatedMessagePayload(ReceiverMessagePayload, BatchElementsUpdatedMessagePayload):
+        pass
+
+    class ReceiveBatchElementsDeletedMessagePayload(ReceiverMessagePayload, BatchElementsDeletedMessagePayload):
+        pass
+
+    class ReceiveElementReorderedMessagePayload(ReceiverMessagePayload, ElementReorderedMessagePayload):
+        pass
+
+    class ReceiveElementsTransformedMessagePayload(ReceiverMessagePayload, ElementsTransformedMessagePayload):
+        pass
+
+    class ReceivePointsAppendedMessagePayload(ReceiverMessagePayload, p.BaseModel):
+        # NOTE: only the new points, receivers append them to the end of their own copy of the element
+        element_id: PyObjectUUID
+        points: PackedPoints
+
     class ReceiveUserCursorJoinedMessagePayload(ReceiverMessagePayload, p.BaseModel):
         pass
 
@@ -100,6 +204,13 @@ class WebSocketMessagePayload:
     class ReceiveUserCursorLeftMessagePayload(ReceiverMessagePayload, p.BaseModel):
         pass
 
+    class ReceiveUserCursorsUpdatedMessagePayload(p.BaseModel):
+        # NOTE: the latest cursor of every user that moved since the last frame, receivers skip their own
+        user_cursors: list[UserCursor]
+
+    class ReceiveElementsSyncMessagePayload(p.BaseModel):
+        stale_element_ids: list[PyObjectUUID]
+
     # NOTE: other message payloads
 
     class PingMessagePayload(p.BaseModel):
@@ -131,12 +242,36 @@ class WebSocketMessage:
     class UpdateElementMessage(IWebSocketMessage[WebSocketMessagePayload.UpdateElementMessagePayload]):
         event: t.Literal[WebSocketEvent.UpdateElement] = WebSocketEvent.UpdateElement
 
+    class PatchElementMessage(IWebSocketMessage[WebSocketMessagePayload.PatchElementMessagePayload]):
+        event: t.Literal[WebSocketEvent.PatchElement] = WebSocketEvent.PatchElement
+
+    class CreateBatchElementsMessage(IWebSocketMessage[WebSocketMessagePayload.CreateBatchElementsMessagePayload]):
+        event: t.Literal[WebSocketEvent.CreateBatchElements] = WebSocketEvent.CreateBatchElements
+
+    class UpdateBatchElementsMessage(IWebSocketMessage[WebSocketMessagePayload.UpdateBatchElementsMessagePayload]):
+        event: t.Literal[WebSocketEvent.UpdateBatchElements] = WebSocketEvent.UpdateBatchElements
+
+    class DeleteBatchElementsMessage(IWebSocketMessage[WebSocketMessagePayload.DeleteBatchElementsMessagePayload]):
+        event: t.Literal[WebSocketEvent.DeleteBatchElements] = WebSocketEvent.DeleteBatchElements
+
+    class ReorderElementMessage(IWebSocketMessage[WebSocketMessagePayload.ReorderElementMessagePayload]):
+        event: t.Literal[WebSocketEvent.ReorderElement] = WebSocketEvent.ReorderElement
+
+    class TransformElementsMessage(IWebSocketMessage[WebSocketMessagePayload.TransformElementsMessagePayload]):
+        event: t.Literal[WebSocketEvent.TransformElements] = WebSocketEvent.TransformElements
+
+    class AppendPointsMessage(IWebSocketMessage[WebSocketMessagePayload.AppendPointsMessagePayload]):
+        event: t.Literal[WebSocketEvent.AppendPoints] = WebSocketEvent.AppendPoints
+
     class JoinUserCursorMessage(IWebSocketMessage[WebSocketMessagePayload.JoinUserCursorMessagePayload]):
         event: t.Literal[WebSocketEvent.JoinUserCursor] = WebSocketEvent.JoinUserCursor
 
     class UpdateUserCursorMessage(IWebSocketMessage[WebSocketMessagePayload.UpdateUserCursorMessagePayload]):
         event: t.Literal[WebSocketEvent.UpdateUserCursor] = WebSocketEvent.UpdateUserCursor
 
+    class UpdateViewportMessage(IWebSocketMessage[WebSocketMessagePayload.UpdateViewportMessagePayload]):
+        event: t.Literal[WebSocketEvent.UpdateViewport] = WebSocketEvent.UpdateViewport
+
     # NOTE: sender response messages
 
     class ElementCreatedMessage(IWebSocketMessage[WebSocketMessagePayload.ElementCreatedMessagePayload]):
@@ -148,6 +283,27 @@ class WebSocketMessage:
     class ElementUpdatedMessage(IWebSocketMessage[WebSocketMessagePayload.ElementUpdatedMessagePayload]):
         event: t.Literal[WebSocketEvent.ElementUpdated] = WebSocketEvent.ElementUpdated
 
+    class ElementPatchedMessage(IWebSocketMessage[WebSocketMessagePayload.ElementPatchedMessagePayload]):
+        event: t.Literal[WebSocketEvent.ElementPatched] = WebSocketEvent.ElementPatched
+
+    class BatchElementsCreatedMessage(IWebSocketMessage[WebSocketMessagePayload.BatchElementsCreatedMessagePayload]):
+        event: t.Literal[WebSocketEvent.BatchElementsCreated] = WebSocketEvent.BatchElementsCreated
+
+    class BatchElementsUpdatedMessage(IWebSocketMessage[WebSocketMessagePayload.BatchElementsUpdatedMessagePayload]):
+        event: t.Literal[WebSocketEvent.BatchElementsUpdated] = WebSocketEvent.BatchElementsUpdated
+
+    class BatchElementsDeletedMessage(IWebSocketMessage[WebSocketMessagePayload.BatchElementsDeletedMessagePayload]):
+        event: t.Literal[WebSocketEvent.BatchElementsDeleted] = WebSocketEvent.BatchElementsDeleted
+
+    class ElementReorderedMessage(IWebSocketMessage[WebSocketMessagePayload.ElementReorderedMessagePayload]):
+        event: t.Literal[WebSocketEvent.ElementReordered] = WebSocketEvent.ElementReordered
+
+    class ElementsTransformedMessage(IWebSocketMessage[WebSocketMessagePayload.ElementsTransformedMessagePayload]):
+        event: t.Literal[WebSocketEvent.ElementsTransformed] = WebSocketEvent.ElementsTransformed
+
+    class PointsAppendedMessage(IWebSocketMessage[WebSocketMessagePayload.PointsAppendedMessagePayload]):
+        event: t.Literal[WebSocketEvent.PointsAppended] = WebSocketEvent.PointsAppended
+
     class CurrentUsersMessage(IWebSocketMessage[WebSocketMessagePayload.CurrentUsersMessagePayload]):
         event: t.Literal[WebSocketEvent.CurrentUsers] = WebSocketEvent.CurrentUsers
 
@@ -162,6 +318,37 @@ class WebSocketMessage:
     class ReceiveElementUpdatedMessage(IWebSocketMessage[WebSocketMessagePayload.ReceiveElementUpdatedMessagePayload]):
         event: t.Literal[WebSocketEvent.ReceiveElementUpdated] = WebSocketEvent.ReceiveElementUpdated
 
+    class ReceiveElementPatchedMessage(IWebSocketMessage[WebSocketMessagePayload.ReceiveElementPatchedMessagePayload]):
+        event: t.Literal[WebSocketEvent.ReceiveElementPatched] = WebSocketEvent.ReceiveElementPatched
+
+    class ReceiveBatchElementsCreatedMessage(
+        IWebSocketMessage[WebSocketMessagePayload.ReceiveBatchElementsCreatedMessagePayload]
+    ):
+        event: t.Literal[WebSocketEvent.ReceiveBatchElementsCreated] = WebSocketEvent.ReceiveBatchElementsCreated
+
+    class ReceiveBatchElementsUpdatedMessage(
+        IWebSocketMessage[WebSocketMessagePayload.ReceiveBatchElementsUpdatedMessagePayload]
+    ):
+        event: t.Literal[WebSocketEvent.ReceiveBatchElementsUpdated] = WebSocketEvent.ReceiveBatchElementsUpdated
+
+    class ReceiveBatchElementsDeletedMessage(
+        IWebSocketMessage[WebSocketMessagePayload.ReceiveBatchElementsDeletedMessagePayload]
+    ):
+        event: t.Literal[WebSocketEvent.ReceiveBatchElementsDeleted] = WebSocketEvent.ReceiveBatchElementsDeleted
+
+    class ReceiveElementReorderedMessage(
+        IWebSocketMessage[WebSocketMessagePayload.ReceiveElementReorderedMessagePayload]
+    ):
+        event: t.Literal[WebSocketEvent.ReceiveElementReordered] = WebSocketEvent.ReceiveElementReordered
+
+    class ReceiveElementsTransformedMessage(
+        IWebSocketMessage[WebSocketMessagePayload.ReceiveElementsTransformedMessagePayload]
+    ):
+        event: t.Literal[WebSocketEvent.ReceiveElementsTransformed] = WebSocketEvent.ReceiveElementsTransformed
+
+    class ReceivePointsAppendedMessage(IWebSocketMessage[WebSocketMessagePayload.ReceivePointsAppendedMessagePayload]):
+        event: t.Literal[WebSocketEvent.ReceivePointsAppended] = WebSocketEvent.ReceivePointsAppended
+
     class ReceiveUserCursorJoinedMessage(
         IWebSocketMessage[WebSocketMessagePayload.ReceiveUserCursorJoinedMessagePayload]
     ):
@@ -175,6 +362,14 @@ class WebSocketMessage:
     ):
         event: t.Literal[WebSocketEvent.ReceiveUserCursorUpdated] = WebSocketEvent.ReceiveUserCursorUpdated
 
+    class ReceiveUserCursorsUpdatedMessage(
+        IWebSocketMessage[WebSocketMessagePayload.ReceiveUserCursorsUpdatedMessagePayload]
+    ):
+        event: t.Literal[WebSocketEvent.ReceiveUserCursorsUpdated] = WebSocketEvent.ReceiveUserCursorsUpdated
+
+    class ReceiveElementsSyncMessage(IWebSocketMessage[WebSocketMessagePayload.ReceiveElementsSyncMessagePayload]):
+        event: t.Literal[WebSocketEvent.ReceiveElementsSync] = WebSocketEvent.ReceiveElementsSync
+
     # NOTE: other messagemessages
 
     class PingMessage(IWebSocketMessage[WebSocketMessagePayload.PingMessagePayload]):
@@ -0,0 +1,109 @@
+import asyncio
+import collections
+import logging
+
+from fastapi import status
+from fastapi.websockets import WebSocket
+
+from ...constants.websocket import OutboundOverflowPolicy, WebSocketEvent
+from .message import EncodedWebSocketMessage
+
+# NOTE: frames that the next frame of the same kind supersedes, they are the only ones ever dropped
+DROPPABLE_EVENTS = frozenset({WebSocketEvent.ReceiveUserCursorUpdated, WebSocketEvent.ReceiveUserCursorsUpdated})
+
+
+class ClientOutboundQueue:
+    """
+    Bounded queue of the messages to send to one client, drained by its own writer task.
+
+    Enqueueing never waits on the client, so a slow or half-dead client only ever delays its own messages. When the
+    queue is full, `DropOldestCursor` makes room by dropping the oldest queued cursor frame and disconnects the client
+    only when there is none, since dropping any other message would leave it out of sync. `Disconnect` always
+    disconnects it.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        max_size: int,
+        overflow_policy: OutboundOverflowPolicy,
+        logger: logging.Logger,
+    ) -> None:
+        self._websocket = websocket
+        self._max_size = max_size
+        self._overflow_policy = overflow_policy
+        self._logger = logger
+        self._messages: collections.deque[EncodedWebSocketMessage] = collections.deque()
+        self._has_messages = asyncio.Event()
+        self._is_closed = False
+        self._writer_task: asyncio.Task | None = None
+
+    @property
+    def is_closed(self) -> bool:
+        return self._is_closed
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def start(self) -> None:
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._write_messages())
+
+    def put(self, message: EncodedWebSocketMessage) -> bool:
+        """
+        Queue `message` without waiting, returns `False` when it was dropped or the client is being disconnected.
+        """
+        if self._is_closed:
+            return False
+
+        if len(self._messages) >= self._max_size and not self._make_room(message):
+            return False
+
+        self._messages.append(message)
+        self._has_messages.set()
+        return True
+
+    async def close(self) -> None:
+        self._is_closed = True
+        self._messages.clear()
+        if self._writer_task is not None and self._writer_task is not asyncio.current_task():
+            self._writer_task.cancel()
+
+    def _make_room(self, message: EncodedWebSocketMessage) -> bool:
+        if self._overflow_policy == OutboundOverflowPolicy.DropOldestCursor:
+            for index, queued_message in enumerate(self._messages):
+                if queued_message.event in DROPPABLE_EVENTS:
+                    del self._messages[index]
+                    return True
+            if message.event in DROPPABLE_EVENTS:
+                return False
+
+        self._logger.info(f"Outbound queue of {self._max_size} messages overflowed, disconnecting the client.")
+        self._is_closed = True
+        self._messages.clear()
+        # NOTE: wake the writer up so that it closes the websocket
+        self._has_messages.set()
+        return False
+
+    async def _write_messages(self) -> None:
+        while True:
+            await self._has_messages.wait()
+            if self._is_closed:
+                await self._close_websocket()
+                return
+
+            while self._messages:
+                message = self._messages.popleft()
+                try:
+                    await self._websocket.send_text(message.text)
+                except Exception as e:
+                    self._logger.info(f"Failed to send message to client: {e}")
+            if not self._is_closed:
+                self._has_messages.clear()
+
+    async def _close_websocket(self) -> None:
+        # NOTE: the endpoint of the client then ends its receive loop and removes it from its room, even mid event
+        try:
+            await self._websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        except Exception as e:
+            self._logger.info(f"Failed to close websocket of client: {e}")
@@ -0,0 +1,146 @@
+import asyncio
+import bisect
+import contextlib
+import hashlib
+import hmac
+import logging
+import typing as t
+
+from fastapi import status
+from fastapi.websockets import WebSocket, WebSocketDisconnect
+from websockets.asyncio.client import ClientConnection, connect
+from websockets.exceptions import WebSocketException
+
+from ..models import PyObjectUUID
+
+# NOTE: points per worker on the ring, enough to spread the rooms evenly over a handful of workers
+VIRTUAL_NODES_PER_WORKER = 128
+# NOTE: set on proxied connections to the secret of the workers, the owner then serves them whatever its own ring says
+# so that they never loop
+ROOM_AFFINITY_FORWARDED_HEADER = "x-room-affinity-forwarded"
+# NOTE: how either side of a relay ends, the relay then closes the other side
+RELAY_CLOSED_ERRORS = (WebSocketException, WebSocketDisconnect, RuntimeError, OSError)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+
+class RoomAffinityRing:
+    """
+    Consistent hash ring assigning each design project to one worker.
+
+    Every worker builds the same ring from the same worker ids, so they all agree on the owner of a room without
+    talking to each other, and adding or removing a worker only moves the rooms of its share of the ring.
+    """
+
+    def __init__(self, worker_ids: t.Iterable[str], virtual_nodes: int = VIRTUAL_NODES_PER_WORKER) -> None:
+        points = sorted(
+            (_hash(f"{worker_id}#{index}"), worker_id)
+            for worker_id in set(worker_ids)
+            for index in range(virtual_nodes)
+        )
+        if not points:
+            raise ValueError("A room affinity ring needs at least one worker.")
+        self._hashes = [point_hash for point_hash, _ in points]
+        self._worker_ids = [worker_id for _, worker_id in points]
+
+    def get_worker_id(self, design_project_id: PyObjectUUID) -> str:
+        index = bisect.bisect(self._hashes, _hash(str(design_project_id))) % len(self._hashes)
+        return self._worker_ids[index]
+
+
+class RoomAffinity:
+    """
+    Keep each room in the worker owning it on the ring, so that its connections, spatial index and cursor frames live
+    in exactly one process.
+
+    A connection landing on another worker is proxied to the owner at its url in `worker_urls`: the frames are relayed
+    as they are and the owner serves the client as if it had connected directly. The relay authenticates itself with
+    the `secret` shared by the workers, a client sending the forwarded header without it is routed like any other.
+    Without `worker_id`, or when it is not in `worker_urls`, every room is served locally.
+    """
+
+    def __init__(self, worker_id: str, worker_urls: t.Mapping[str, str], secret: str, logger: logging.Logger) -> None:
+        self._worker_id = worker_id
+        self._worker_urls = dict(worker_urls)
+        self._secret = secret
+        self._logger = logger
+        self._ring = RoomAffinityRing(self._worker_urls) if worker_id in self._worker_urls else None
+        if self._ring is not None and not secret:
+            raise ValueError("Room affinity needs a secret shared by the workers to authenticate relayed connections.")
+
+    def owns_room(self, design_project_id: PyObjectUUID) -> bool:
+        """
+        Whether the rooms are pinned to workers and this worker owns the room, its clients then all connect here.
+        """
+        return self._ring is not None and self._ring.get_worker_id(design_project_id) == self._worker_id
+
+    def get_owner_url(self, design_project_id: PyObjectUUID, websocket: WebSocket) -> str | None:
+        """
+        Url to proxy the connection to, `None` when this worker serves the room.
+        """
+        if self._ring is None or self._is_forwarded(websocket):
+            return None
+
+        owner_id = self._ring.get_worker_id(design_project_id)
+        if owner_id == self._worker_id:
+            return None
+
+        url = f"{self._worker_urls[owner_id].rstrip('/')}{websocket.url.path}"
+        return f"{url}?{websocket.url.query}" if websocket.url.query else url
+
+    async def proxy(self, websocket: WebSocket, owner_url: str) -> None:
+        await websocket.accept()
+        try:
+            owner = await connect(
+                owner_url,
+                additional_headers={ROOM_AFFINITY_FORWARDED_HEADER: self._secret},
+                # NOTE: the workers share a host or a network, compressing the relayed frames only costs CPU
+                compression=None,
+                # NOTE: never through a proxy of the environment, `proxy` needs websockets 15 or later
+                proxy=None,
+            )
+        except (OSError, asyncio.TimeoutError, WebSocketException) as e:
+            self._logger.info(f"Failed to proxy websocket connection to room owner: {e}")
+            await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+            return
+
+        tasks = [
+            asyncio.create_task(self._relay_client_messages(websocket, owner)),
+            asyncio.create_task(self._relay_owner_messages(websocket, owner)),
+        ]
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await owner.close()
+            # NOTE: the client gets the close code of the owner, e.g. when its outbound queue overflowed
+            with contextlib.suppress(Exception):
+                await websocket.close(code=owner.close_code or status.WS_1000_NORMAL_CLOSURE)
+
+    def _is_forwarded(self, websocket: WebSocket) -> bool:
+        forwarded = websocket.headers.get(ROOM_AFFINITY_FORWARDED_HEADER)
+        return forwarded is not None and hmac.compare_digest(forwarded.encode(), self._secret.encode())
+
+    @staticmethod
+    async def _relay_client_messages(websocket: WebSocket, owner: ClientConnection) -> None:
+        with contextlib.suppress(*RELAY_CLOSED_ERRORS):
+            while True:
+                message = await websocket.receive()
+                if message["type"] == "websocket.disconnect":
+                    return
+                if message.get("text") is not None:
+                    await owner.send(message["text"])
+                elif message.get("bytes") is not None:
+                    await owner.send(message["bytes"])
+
+    @staticmethod
+    async def _relay_owner_messages(websocket: WebSocket, owner: ClientConnection) -> None:
+        with contextlib.suppress(*RELAY_CLOSED_ERRORS):
+            async for message in owner:
+                if isinstance(message, str):
+                    await websocket.send_text(message)
+                else:
+                    await websocket.send_bytes(message)
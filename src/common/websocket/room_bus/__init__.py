@@ -0,0 +1,17 @@
+from .base import RoomBus, RoomBusMessage, RoomMessageHandler
+from .factory import create_room_bus
+from .in_process import InProcessRoomBus, InProcessRoomHub
+from .resp import RespRoomBus
+from .unix_socket import LocalRoomBroker, UnixSocketRoomBus
+
+__all__ = [
+    "RoomBus",
+    "RoomBusMessage",
+    "RoomMessageHandler",
+    "InProcessRoomBus",
+    "InProcessRoomHub",
+    "RespRoomBus",
+    "LocalRoomBroker",
+    "UnixSocketRoomBus",
+    "create_room_bus",
+]
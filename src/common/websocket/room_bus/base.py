@@ -0,0 +1,99 @@
+import json
+import typing as t
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from uuid import UUID
+
+from ....common.models import BoundingBox, PyObjectUUID
+from ....constants.websocket import WebSocketEvent
+from ..message import EncodedWebSocketMessage
+from ..spatial_index import ElementBoundsChange, ElementBoundsChangeType
+
+RoomMessageHandler = t.Callable[[str, bytes], None]
+
+
+class RoomBus(ABC):
+    """
+    Publish/subscribe channel between the processes serving the same rooms.
+
+    Delivery is at most once and in order per publisher, like Redis pub/sub. `publish` never waits, a message that
+    cannot be buffered is dropped.
+    """
+
+    @abstractmethod
+    async def start(self, handler: RoomMessageHandler) -> None:
+        """Connect the bus, `handler` is then called with the channel and data of every message of other buses."""
+        pass
+
+    @abstractmethod
+    async def subscribe(self, channel: str) -> None:
+        pass
+
+    @abstractmethod
+    async def unsubscribe(self, channel: str) -> None:
+        pass
+
+    @abstractmethod
+    def publish(self, channel: str, data: bytes) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+
+@dataclass(frozen=True)
+class RoomBusMessage:
+    """
+    A room message as it crosses the bus: the already encoded websocket message, who sent it and the element bounds it
+    changes, so that every process routes it to its own clients.
+    """
+
+    origin: str
+    message: EncodedWebSocketMessage
+    sender_id: PyObjectUUID | None = None
+    changes: t.Sequence[ElementBoundsChange] | None = None
+
+    def to_bytes(self) -> bytes:
+        # NOTE: the message text follows the header line as is, it is never escaped into another JSON document
+        header = {
+            "origin": self.origin,
+            "event": self.message.event.value,
+            "sender_id": str(self.sender_id) if self.sender_id else None,
+            "changes": (
+                [
+                    [
+                        str(change.element_id),
+                        change.type.value,
+                        change.bounding_box.model_dump() if change.bounding_box else None,
+                    ]
+                    for change in self.changes
+                ]
+                if self.changes is not None
+                else None
+            ),
+        }
+        return f"{json.dumps(header, separators=(',', ':'))}\n{self.message.text}".encode()
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "RoomBusMessage":
+        header_line, text = data.decode().split("\n", 1)
+        header = json.loads(header_line)
+        changes = header["changes"]
+        return cls(
+            origin=header["origin"],
+            message=EncodedWebSocketMessage(event=WebSocketEvent(header["event"]), text=text),
+            sender_id=UUID(header["sender_id"]) if header["sender_id"] else None,
+            changes=(
+                [
+                    ElementBoundsChange(
+                        UUID(element_id),
+                        ElementBoundsChangeType(change_type),
+                        BoundingBox.model_construct(**bounding_box) if bounding_box else None,
+                    )
+                    for element_id, change_type, bounding_box in changes
+                ]
+                if changes is not None
+                else None
+            ),
+        )
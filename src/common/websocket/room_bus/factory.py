@@ -0,0 +1,17 @@
+import logging
+
+from ....constants.websocket import RoomBusBackend
+from .base import RoomBus
+from .in_process import InProcessRoomBus
+from .resp import RespRoomBus
+from .unix_socket import UnixSocketRoomBus
+
+
+def create_room_bus(backend: RoomBusBackend, url: str, logger: logging.Logger) -> RoomBus:
+    if backend == RoomBusBackend.UnixSocket:
+        return UnixSocketRoomBus(url, logger)
+
+    if backend == RoomBusBackend.Redis:
+        return RespRoomBus(url, logger)
+
+    return InProcessRoomBus()
@@ -0,0 +1,43 @@
+import asyncio
+
+from .base import RoomBus, RoomMessageHandler
+
+InProcessRoomHub = dict[str, set["InProcessRoomBus"]]
+
+
+class InProcessRoomBus(RoomBus):
+    """
+    Room bus of a single process. Buses sharing a hub reach each other, a bus on its own hub reaches nobody, which is
+    all a single worker needs.
+    """
+
+    def __init__(self, hub: InProcessRoomHub | None = None) -> None:
+        self._hub: InProcessRoomHub = hub if hub is not None else {}
+        self._handler: RoomMessageHandler | None = None
+
+    async def start(self, handler: RoomMessageHandler) -> None:
+        self._handler = handler
+
+    async def subscribe(self, channel: str) -> None:
+        self._hub.setdefault(channel, set()).add(self)
+
+    async def unsubscribe(self, channel: str) -> None:
+        subscribers = self._hub.get(channel)
+        if subscribers is None:
+            return
+
+        subscribers.discard(self)
+        if not subscribers:
+            self._hub.pop(channel, None)
+
+    def publish(self, channel: str, data: bytes) -> None:
+        loop = asyncio.get_running_loop()
+        for bus in self._hub.get(channel, ()):
+            if bus is not self and bus._handler is not None:
+                # NOTE: delivered on the next loop iteration, like a message coming from another process
+                loop.call_soon(bus._handler, channel, data)
+
+    async def close(self) -> None:
+        for channel in [channel for channel, subscribers in self._hub.items() if self in subscribers]:
+            await self.unsubscribe(channel)
+        self._handler = None
@@ -0,0 +1,216 @@
+import asyncio
+import logging
+import typing as t
+from urllib.parse import unquote, urlparse
+
+from .base import RoomBus, RoomMessageHandler
+
+RespValue = t.Union[bytes, int, None, "RespError", list["RespValue"]]
+
+# NOTE: past this many unsent bytes the server is not keeping up and new messages are dropped
+MAX_PENDING_PUBLISH_BYTES = 8 * 1024 * 1024
+RECONNECT_DELAY_SECONDS = 1.0
+
+
+class RespError(Exception):
+    pass
+
+
+class RespProtocolError(ConnectionError):
+    """
+    A reply that is not valid RESP, the stream is out of sync past it so the connection is dropped like a lost one.
+    """
+
+
+def encode_bulk_string(value: str | bytes) -> bytes:
+    data = value.encode() if isinstance(value, str) else value
+    return b"".join((f"${len(data)}\r\n".encode(), data, b"\r\n"))
+
+
+def encode_command(*args: str | bytes) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    return b"".join((f"*{len(args)}\r\n".encode(), *(encode_bulk_string(arg) for arg in args)))
+
+
+async def read_reply(reader: asyncio.StreamReader) -> RespValue:
+    """
+    Read one RESP2 value, errors are returned rather than raised so that a reader can go on.
+
+    A reply that can not be parsed raises `RespProtocolError`.
+    """
+    try:
+        line = await reader.readuntil(b"\r\n")
+    except asyncio.LimitOverrunError as e:
+        raise RespProtocolError(f"RESP reply line over {e.consumed} bytes") from e
+    kind, value = line[:1], line[1:-2]
+    if kind == b"+":
+        return value
+    if kind == b"-":
+        return RespError(value.decode(errors="replace"))
+    if kind == b":":
+        return _parse_int(line, value)
+    if kind == b"$":
+        length = _parse_int(line, value)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = _parse_int(line, value)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise RespProtocolError(f"Unexpected RESP reply {line!r}")
+
+
+def _parse_int(line: bytes, value: bytes) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise RespProtocolError(f"Unexpected RESP reply {line!r}") from None
+
+
+class RespRoomBus(RoomBus):
+    """
+    Room bus over any server speaking the Redis protocol, given as `redis://[:password@]host[:port]` or
+    `unix:///path/to/socket`.
+
+    Subscribing and publishing use two connections since a subscribed connection may not publish. A lost connection is
+    retried every `RECONNECT_DELAY_SECONDS` and the channels are subscribed again, messages published meanwhile are
+    lost.
+    """
+
+    def __init__(self, url: str, logger: logging.Logger) -> None:
+        self._url = urlparse(url)
+        self._logger = logger
+        self._handler: RoomMessageHandler | None = None
+        self._channels: set[str] = set()
+        self._subscriber: asyncio.StreamWriter | None = None
+        self._publisher: asyncio.StreamWriter | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._start_lock = asyncio.Lock()
+        self._is_closed = False
+
+    async def start(self, handler: RoomMessageHandler) -> None:
+        async with self._start_lock:
+            if self._handler is not None:
+                return
+
+            self._handler = handler
+            try:
+                await self._connect()
+            except (OSError, asyncio.IncompleteReadError) as e:
+                # NOTE: the rooms keep working locally until the server is back
+                self._logger.info(f"Room bus connection failed: {e}")
+                self._tasks = [asyncio.create_task(self._reconnect())]
+
+    async def subscribe(self, channel: str) -> None:
+        self._channels.add(channel)
+        if self._subscriber is not None:
+            self._subscriber.write(encode_command("SUBSCRIBE", channel))
+
+    async def unsubscribe(self, channel: str) -> None:
+        self._channels.discard(channel)
+        if self._subscriber is not None:
+            self._subscriber.write(encode_command("UNSUBSCRIBE", channel))
+
+    def publish(self, channel: str, data: bytes) -> None:
+        publisher = self._publisher
+        if publisher is None or publisher.transport.get_write_buffer_size() > MAX_PENDING_PUBLISH_BYTES:
+            self._logger.info(f"Dropped room bus message of channel {channel}, the bus is not connected or behind.")
+            return
+
+        publisher.write(encode_command("PUBLISH", channel, data))
+
+    async def close(self) -> None:
+        self._is_closed = True
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        for writer in (self._subscriber, self._publisher):
+            if writer is not None:
+                writer.close()
+        self._subscriber = None
+        self._publisher = None
+        self._handler = None
+
+    async def _open_connection(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        if self._url.scheme == "unix":
+            reader, writer = await asyncio.open_unix_connection(unquote(self._url.path))
+        else:
+            reader, writer = await asyncio.open_connection(self._url.hostname or "localhost", self._url.port or 6379)
+
+        if self._url.password:
+            auth_args = [self._url.username, self._url.password] if self._url.username else [self._url.password]
+            writer.write(encode_command("AUTH", *(unquote(auth_arg) for auth_arg in auth_args)))
+            reply = await read_reply(reader)
+            if isinstance(reply, RespError):
+                writer.close()
+                raise ConnectionError(f"Room bus authentication failed: {reply}")
+        return reader, writer
+
+    async def _connect(self) -> None:
+        subscriber_reader, subscriber = await self._open_connection()
+        try:
+            publisher_reader, publisher = await self._open_connection()
+        except OSError:
+            subscriber.close()
+            raise
+        self._subscriber, self._publisher = subscriber, publisher
+        for channel in self._channels:
+            subscriber.write(encode_command("SUBSCRIBE", channel))
+        self._tasks = [
+            asyncio.create_task(self._read_messages(subscriber_reader)),
+            asyncio.create_task(self._discard_replies(publisher_reader)),
+        ]
+
+    async def _read_messages(self, reader: asyncio.StreamReader) -> None:
+        try:
+            while True:
+                reply = await read_reply(reader)
+                if isinstance(reply, list) and len(reply) == 3 and reply[0] == b"message" and self._handler:
+                    channel, data = reply[1], reply[2]
+                    if isinstance(channel, bytes) and isinstance(data, bytes):
+                        self._handle_message(channel, data)
+                elif isinstance(reply, RespError):
+                    self._logger.info(f"Room bus server error: {reply}")
+        except (ConnectionError, asyncio.IncompleteReadError, OSError) as e:
+            self._logger.info(f"Room bus connection lost: {e}")
+            await self._reconnect()
+
+    def _handle_message(self, channel: bytes, data: bytes) -> None:
+        # NOTE: a message the handler fails on is dropped, the subscription goes on with the next one
+        try:
+            if self._handler is not None:
+                self._handler(channel.decode(), data)
+        except Exception as e:
+            self._logger.error(f"Failed to handle room bus message of channel {channel!r}: {e!r}")
+
+    async def _discard_replies(self, reader: asyncio.StreamReader) -> None:
+        # NOTE: the publish replies are only read so that they never pile up in the socket
+        try:
+            while True:
+                await read_reply(reader)
+        except (ConnectionError, asyncio.IncompleteReadError, OSError):
+            # NOTE: closing the subscriber connection makes its reader reconnect both
+            self._publisher = None
+            if self._subscriber is not None:
+                self._subscriber.close()
+
+    async def _reconnect(self) -> None:
+        for task in self._tasks:
+            if task is not asyncio.current_task():
+                task.cancel()
+        for writer in (self._subscriber, self._publisher):
+            if writer is not None:
+                writer.close()
+        self._subscriber = None
+        self._publisher = None
+
+        while not self._is_closed:
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+            try:
+                await self._connect()
+                self._logger.info("Room bus reconnected.")
+                return
+            except (OSError, asyncio.IncompleteReadError) as e:
+                self._logger.info(f"Room bus reconnection failed: {e}")
@@ -0,0 +1,161 @@
+import asyncio
+import contextlib
+import fcntl
+import logging
+import os
+from urllib.parse import quote
+
+from .resp import MAX_PENDING_PUBLISH_BYTES, RespError, RespRoomBus, encode_bulk_string, encode_command, read_reply
+
+# NOTE: a worker waits this long for another one to finish starting the broker
+BROKER_LOCK_POLL_SECONDS = 0.05
+
+
+class LocalRoomBroker:
+    """
+    Minimal pub/sub server speaking the Redis protocol on a Unix socket, for the workers of one host.
+
+    Only `SUBSCRIBE`, `UNSUBSCRIBE`, `PUBLISH`, `PING` and `AUTH` are served, which is all `RespRoomBus` sends. A
+    subscriber more than `MAX_PENDING_PUBLISH_BYTES` behind misses messages instead of slowing the publishers down.
+    """
+
+    def __init__(self, path: str, logger: logging.Logger) -> None:
+        self._path = path
+        self._logger = logger
+        self._subscribers: dict[bytes, set[asyncio.StreamWriter]] = {}
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_unix_server(self._handle_connection, self._path)
+
+    async def close(self) -> None:
+        if self._server is None:
+            return
+
+        self._server.close()
+        for subscribers in self._subscribers.values():
+            for writer in subscribers:
+                writer.close()
+        self._subscribers = {}
+        self._server = None
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path)
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        channels: set[bytes] = set()
+        try:
+            while True:
+                command = await read_reply(reader)
+                if not isinstance(command, list) or not command or not isinstance(command[0], bytes):
+                    writer.write(b"-ERR malformed command\r\n")
+                    continue
+                name, args = command[0].upper(), [arg for arg in command[1:] if isinstance(arg, bytes)]
+                if name == b"PUBLISH" and len(args) == 2:
+                    writer.write(f":{self._publish(args[0], args[1])}\r\n".encode())
+                elif name == b"SUBSCRIBE":
+                    for channel in args:
+                        channels.add(channel)
+                        self._subscribers.setdefault(channel, set()).add(writer)
+                        writer.write(self._encode_subscription_reply(b"subscribe", channel, len(channels)))
+                elif name == b"UNSUBSCRIBE":
+                    for channel in args or list(channels):
+                        channels.discard(channel)
+                        self._remove_subscriber(channel, writer)
+                        writer.write(self._encode_subscription_reply(b"unsubscribe", channel, len(channels)))
+                elif name == b"PING":
+                    writer.write(b"+PONG\r\n")
+                elif name == b"AUTH":
+                    writer.write(b"+OK\r\n")
+                else:
+                    writer.write(f"-ERR unknown command '{name.decode(errors='replace')}'\r\n".encode())
+        except (ConnectionError, asyncio.IncompleteReadError, OSError):
+            pass
+        finally:
+            for channel in channels:
+                self._remove_subscriber(channel, writer)
+            writer.close()
+
+    def _publish(self, channel: bytes, data: bytes) -> int:
+        subscribers = self._subscribers.get(channel, set())
+        message = encode_command(b"message", channel, data)
+        for subscriber in subscribers:
+            if subscriber.transport.get_write_buffer_size() > MAX_PENDING_PUBLISH_BYTES:
+                self._logger.info(f"Dropped room bus message of channel {channel!r} for a lagging subscriber.")
+                continue
+            subscriber.write(message)
+        return len(subscribers)
+
+    @staticmethod
+    def _encode_subscription_reply(kind: bytes, channel: bytes, count: int) -> bytes:
+        return b"".join((b"*3\r\n", encode_bulk_string(kind), encode_bulk_string(channel), f":{count}\r\n".encode()))
+
+    def _remove_subscriber(self, channel: bytes, writer: asyncio.StreamWriter) -> None:
+        subscribers = self._subscribers.get(channel)
+        if subscribers is None:
+            return
+
+        subscribers.discard(writer)
+        if not subscribers:
+            self._subscribers.pop(channel, None)
+
+
+class UnixSocketRoomBus(RespRoomBus):
+    """
+    Room bus between the workers of one host through a `LocalRoomBroker` on a Unix socket.
+
+    The first worker that finds no broker serving the socket starts one, under a lock file so that racing workers
+    agree on a single broker. When that worker exits, the others reconnect and one of them takes over.
+    """
+
+    def __init__(self, path: str, logger: logging.Logger) -> None:
+        super().__init__(f"unix://{quote(path)}", logger)
+        self._path = path
+        self._broker: LocalRoomBroker | None = None
+
+    async def close(self) -> None:
+        await super().close()
+        if self._broker is not None:
+            await self._broker.close()
+            self._broker = None
+
+    async def _open_connection(self) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        try:
+            return await super()._open_connection()
+        except (FileNotFoundError, ConnectionRefusedError):
+            await self._start_broker()
+            return await super()._open_connection()
+
+    async def _start_broker(self) -> None:
+        with open(f"{self._path}.lock", "w") as lock_file:
+            while True:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    break
+                except BlockingIOError:
+                    await asyncio.sleep(BROKER_LOCK_POLL_SECONDS)
+            try:
+                if await self._is_broker_serving():
+                    return
+
+                # NOTE: the socket file of a broker that exited is left behind and would make the bind fail
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(self._path)
+                self._broker = LocalRoomBroker(self._path, self._logger)
+                await self._broker.start()
+                self._logger.info(f"Room bus broker started on {self._path}.")
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    async def _is_broker_serving(self) -> bool:
+        try:
+            reader, writer = await asyncio.open_unix_connection(self._path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return False
+
+        writer.write(encode_command("PING"))
+        try:
+            return not isinstance(await read_reply(reader), RespError)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            return False
+        finally:
+            writer.close()
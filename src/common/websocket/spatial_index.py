@@ -0,0 +1,175 @@
+import math
+import typing as t
+from dataclasses import dataclass
+from enum import Enum
+
+from ...common.models import BoundingBox, PyObjectUUID
+
+TKey = t.TypeVar("TKey", bound=t.Hashable)
+
+Cell = tuple[int, int]
+
+# NOTE: about one screen of canvas at 100% zoom per cell
+DEFAULT_CELL_SIZE = 1024.0
+# NOTE: entries spanning more cells than this are kept aside and checked on every query instead of filling the grid
+MAX_CELLS_PER_ENTRY = 256
+
+
+class UniformGridIndex(t.Generic[TKey]):
+    """
+    Uniform grid over canvas coordinates, every entry is registered in the cells its bounding box overlaps.
+
+    Queries only look at the cells overlapping the queried box, so their cost follows the queried area and not the
+    number of entries.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        self._cell_size = cell_size
+        self._cells: dict[Cell, set[TKey]] = {}
+        self._bounding_boxes: dict[TKey, BoundingBox] = {}
+        self._oversized_keys: set[TKey] = set()
+
+    def __len__(self) -> int:
+        return len(self._bounding_boxes)
+
+    def __contains__(self, key: TKey) -> bool:
+        return key in self._bounding_boxes
+
+    def get(self, key: TKey) -> BoundingBox | None:
+        return self._bounding_boxes.get(key)
+
+    def insert(self, key: TKey, bounding_box: BoundingBox) -> None:
+        self.remove(key)
+        self._bounding_boxes[key] = bounding_box
+        cells = self._get_cells(bounding_box)
+        if cells is None:
+            self._oversized_keys.add(key)
+            return
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key: TKey) -> BoundingBox | None:
+        bounding_box = self._bounding_boxes.pop(key, None)
+        if bounding_box is None:
+            return None
+        if key in self._oversized_keys:
+            self._oversized_keys.discard(key)
+            return bounding_box
+        for cell in self._get_cells(bounding_box) or ():
+            keys = self._cells.get(cell)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                self._cells.pop(cell, None)
+        return bounding_box
+
+    def query(self, bounding_box: BoundingBox) -> set[TKey]:
+        """Return the keys whose bounding box intersects `bounding_box`."""
+        cells = self._get_cells(bounding_box)
+        if cells is None:
+            candidate_keys: t.Iterable[TKey] = self._bounding_boxes.keys()
+        else:
+            candidate_keys = {key for cell in cells for key in self._cells.get(cell, ())} | self._oversized_keys
+        return {key for key in candidate_keys if intersects(self._bounding_boxes[key], bounding_box)}
+
+    def _get_cells(self, bounding_box: BoundingBox) -> list[Cell] | None:
+        min_cell_x = math.floor(bounding_box.min_x / self._cell_size)
+        min_cell_y = math.floor(bounding_box.min_y / self._cell_size)
+        max_cell_x = math.floor(bounding_box.max_x / self._cell_size)
+        max_cell_y = math.floor(bounding_box.max_y / self._cell_size)
+        if (max_cell_x - min_cell_x + 1) * (max_cell_y - min_cell_y + 1) > MAX_CELLS_PER_ENTRY:
+            return None
+        return [
+            (cell_x, cell_y)
+            for cell_x in range(min_cell_x, max_cell_x + 1)
+            for cell_y in range(min_cell_y, max_cell_y + 1)
+        ]
+
+
+def intersects(a: BoundingBox, b: BoundingBox) -> bool:
+    return a.min_x <= b.max_x and b.min_x <= a.max_x and a.min_y <= b.max_y and b.min_y <= a.max_y
+
+
+class ElementBoundsChangeType(str, Enum):
+    Created = "Created"
+    Moved = "Moved"
+    Touched = "Touched"
+    Removed = "Removed"
+
+
+@dataclass(frozen=True)
+class ElementBoundsChange:
+    """
+    How a change affects the bounds of one element, `bounding_box` is only read for created and moved elements.
+    """
+
+    element_id: PyObjectUUID
+    type: ElementBoundsChangeType
+    # NOTE: `None` stands for an element whose extent is unknown, it is visible in every viewport
+    bounding_box: BoundingBox | None = None
+
+
+class RoomSpatialIndex:
+    """
+    Spatial state of one active design project room: the bounds of the elements changed while the room is active,
+    the viewports reported by its clients, and the element ids each client missed because they changed off screen.
+    """
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE) -> None:
+        self._element_bounding_boxes: dict[PyObjectUUID, BoundingBox | None] = {}
+        self._viewport_index: UniformGridIndex[PyObjectUUID] = UniformGridIndex(cell_size)
+        self._stale_element_ids: dict[PyObjectUUID, set[PyObjectUUID]] = {}
+
+    def set_viewport(self, client_id: PyObjectUUID, viewport: BoundingBox | None) -> None:
+        """Track the viewport of a client, `None` makes it receive every change."""
+        if viewport is None:
+            self._viewport_index.remove(client_id)
+            return
+        self._viewport_index.insert(client_id, viewport)
+
+    def remove_client(self, client_id: PyObjectUUID) -> None:
+        self._viewport_index.remove(client_id)
+        self._stale_element_ids.pop(client_id, None)
+
+    def route(
+        self,
+        client_ids: t.Iterable[PyObjectUUID],
+        changes: t.Sequence[ElementBoundsChange],
+    ) -> set[PyObjectUUID]:
+        """
+        Return the clients among `client_ids` that must receive `changes` and record the others as missing them.
+
+        A client receives the changes when it has not reported a viewport, or when its viewport intersects the bounds
+        an element had before or after a change. Elements with unknown bounds reach every client.
+        """
+        client_ids = set(client_ids)
+        recipient_ids = {client_id for client_id in client_ids if client_id not in self._viewport_index}
+        for bounding_box in self._apply_changes(changes):
+            if bounding_box is None:
+                return client_ids
+            recipient_ids |= self._viewport_index.query(bounding_box)
+
+        for client_id in client_ids - recipient_ids:
+            self._stale_element_ids.setdefault(client_id, set()).update(change.element_id for change in changes)
+        return recipient_ids & client_ids
+
+    def pop_stale_element_ids(self, client_id: PyObjectUUID) -> set[PyObjectUUID]:
+        return self._stale_element_ids.pop(client_id, set())
+
+    def get_stale_client_ids(self) -> list[PyObjectUUID]:
+        return list(self._stale_element_ids.keys())
+
+    def _apply_changes(self, changes: t.Sequence[ElementBoundsChange]) -> list[BoundingBox | None]:
+        bounding_boxes: list[BoundingBox | None] = []
+        for change in changes:
+            element_id = change.element_id
+            if change.type != ElementBoundsChangeType.Created:
+                # NOTE: elements untouched since the room became active have unknown previous bounds
+                bounding_boxes.append(self._element_bounding_boxes.get(element_id))
+            if change.type in (ElementBoundsChangeType.Created, ElementBoundsChangeType.Moved):
+                bounding_boxes.append(change.bounding_box)
+                self._element_bounding_boxes[element_id] = change.bounding_box
+            elif change.type == ElementBoundsChangeType.Removed:
+                self._element_bounding_boxes.pop(element_id, None)
+        return bounding_boxes
@@ -7,7 +7,6 @@ from fastapi import Depends
 from ...common.models import PyObjectUUID, RefreshTokenModel
 from ...constants.mongo import CollectionName
 from ...dependencies import LoggerDep, MongoDbDep
-from ...exceptions import InternalServerError
 from ...interfaces import IBaseComponent
 from ...services.jwt_service import JwtServiceDep
 from ...utils.common import get_utc_now
@@ -36,13 +35,7 @@ class CreateRefreshToken(ICreateRefreshToken):
         refresh_token = RefreshTokenModel(
             hashed_access_token=hashed_access_token, expired_at=expired_at, revoked_at=None
         )
-        insert_one_result = self._collection.insert_one(refresh_token.model_dump(by_alias=True))
-        find_one_result = self._collection.find_one({"_id": insert_one_result.inserted_id})
-        if not find_one_result:
-            self._logger.error("Insert refresh token but failed to retrieve it.")
-            raise InternalServerError("Failed to create refresh token.")
-
-        created_refresh_token = RefreshTokenModel(**find_one_result)
+        created_refresh_token = await self._collection.insert_model(refresh_token)
         return self.Response(refresh_token_id=created_refresh_token.id)
 
 
@@ -29,7 +29,7 @@ class RevokeRefreshToken(IRevokeRefreshToken):
 
     async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
-        find_one_result = self._collection.find_one({"_id": request.refresh_token_id})
+        find_one_result = await self._collection.find_one({"_id": request.refresh_token_id})
         if not find_one_result:
             self._logger.error("Invalid refresh token id.")
             return self.Response(success=False)
@@ -53,7 +53,7 @@ class RevokeRefreshToken(IRevokeRefreshToken):
             return self.Response(success=False)
 
         refresh_token.revoked_at = utc_now
-        self._collection.update_one(
+        await self._collection.update_one(
             {"_id": request.refresh_token_id},
             {"$set": {"revoked_at": refresh_token.revoked_at}},
         )
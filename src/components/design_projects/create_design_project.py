@@ -6,8 +6,10 @@ from fastapi import Depends
 from ...common.models import DesignProjectModel, ElementModel, PyObjectHttpUrlStr, UserRole
 from ...constants.mongo import CollectionName
 from ...dependencies import LoggerDep, MongoDbDep, UserContextDep
-from ...exceptions import BadRequestError, InternalServerError
+from ...exceptions import BadRequestError
 from ...interfaces import IBaseComponent
+from ...utils.common import generate_uuid
+from ...utils.design_element import to_element_document, with_order_keys
 from ...utils.logger import execute_service_method
 
 ICreateDesignProject = IBaseComponent["CreateDesignProject.Request", "CreateDesignProject.Response"]
@@ -20,6 +22,7 @@ DEFAULT_THUMBNAIL_URL = p.HttpUrl(
 class CreateDesignProject(ICreateDesignProject):
     def __init__(self, db: MongoDbDep, logger: LoggerDep, user_context: UserContextDep) -> None:
         self._collection = db.get_collection(CollectionName.DESIGN_PROJECTS)
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
         self._logger = logger
         self._user_context = user_context
 
@@ -46,19 +49,19 @@ class CreateDesignProject(ICreateDesignProject):
             thumbnail_url=request.thumbnail_url or str(DEFAULT_THUMBNAIL_URL),
             owner_id=user_id,
             organization_id=organization_id,
-            elements=request.elements,
         )
-        project_data = project.model_dump(by_alias=True)
-        insert_one_result = self._collection.insert_one(project_data)
-
-        created_project = self._collection.find_one({"_id": insert_one_result.inserted_id})
-        if not created_project:
-            self._logger.error(
-                f"Insert project data with id {insert_one_result.inserted_id} successfully, but unable to find the created project"
+        created_project = await self._collection.insert_model(project)
+        if request.elements:
+            # NOTE: fresh ids like a duplicate, the client ids may already be taken in the shared element collection,
+            # e.g. when an exported board is imported again
+            await self._element_collection.insert_many(
+                [
+                    to_element_document(
+                        element.model_copy(update={"id": generate_uuid()}), created_project.id, organization_id
+                    )
+                    for element in with_order_keys(request.elements)
+                ]
             )
-            raise InternalServerError("Insert project data successfully, but unable to find the created project")
-
-        created_project = DesignProjectModel(**created_project)
         return self.Response(created_project=created_project)
 
 
@@ -15,8 +15,17 @@ IDeleteDesignProjectById = IBaseComponent["DeleteDesignProjectById.Request", "De
 
 
 class DeleteDesignProjectById(IDeleteDesignProjectById):
+    """
+    Soft delete a design project together with its elements.
+
+    The elements are soft deleted too, so that element reads and the live-only element indexes drop them. Element
+    writes need no project check of their own: updates, patches and deletes filter on live elements and miss, and
+    creates read the project, which is no longer live.
+    """
+
     def __init__(self, db: MongoDbDep, logger: LoggerDep, user_context: UserContextDep) -> None:
         self._collection = db.get_collection(CollectionName.DESIGN_PROJECTS)
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
         self._logger = logger
         self._user_context = user_context
 
@@ -39,7 +48,7 @@ class DeleteDesignProjectById(IDeleteDesignProjectById):
 
         # before update condition check
         filter = {"_id": request.project_id}
-        project_data = self._collection.find_one(filter)
+        project_data = await self._collection.find_one(filter)
 
         if project_data is None:
             log_message = f"Project with id {request.project_id} not found."
@@ -73,7 +82,15 @@ class DeleteDesignProjectById(IDeleteDesignProjectById):
         deleted_project.is_deleted = True
         deleted_project.deleted_at = get_utc_now()
 
-        self._collection.update_one({"_id": deleted_project.id}, {"$set": deleted_project.model_dump(exclude={"id"})})
+        await self._collection.update_one(
+            {"_id": deleted_project.id}, {"$set": deleted_project.model_dump(exclude={"id"})}
+        )
+        # NOTE: after the project, so that creates are refused from here on and only one already past its project
+        # check can still land an element
+        await self._element_collection.update_many(
+            {"project_id": deleted_project.id},
+            {"$set": {"is_deleted": True, "deleted_at": deleted_project.deleted_at}},
+        )
 
         # process response
         return self.Response(deleted_project=deleted_project)
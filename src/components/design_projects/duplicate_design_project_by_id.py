@@ -8,8 +8,10 @@ from ...constants.mongo import CollectionName
 from ...dependencies import LoggerDep, MongoDbDep, UserContextDep
 from ...exceptions import BadRequestError
 from ...interfaces import IBaseComponent
+from ...utils.common import generate_uuid
 from ...utils.logger import execute_service_method
 from .create_design_project import CreateDesignProjectDep
+from .elements import BaseGetElements, BaseGetElementsDep
 from .get_design_project_by_id import GetDesignProjectByIdDep
 
 IDuplicateDesignProject = IBaseComponent["DuplicateDesignProject.Request", "DuplicateDesignProject.Response"]
@@ -23,12 +25,14 @@ class DuplicateDesignProject(IDuplicateDesignProject):
         user_context: UserContextDep,
         create_design_project: CreateDesignProjectDep,
         get_design_project_by_id: GetDesignProjectByIdDep,
+        base_get_elements: BaseGetElementsDep,
     ) -> None:
         self._collection = db.get_collection(CollectionName.DESIGN_PROJECTS)
         self._logger = logger
         self._user_context = user_context
         self._create_design_project = create_design_project
         self._get_design_project_by_id = get_design_project_by_id
+        self._base_get_elements = base_get_elements
 
     class Request(p.BaseModel):
         project_id: PyObjectUUID
@@ -53,10 +57,17 @@ class DuplicateDesignProject(IDuplicateDesignProject):
             self._logger.error(f"User have no permission to duplicate the project {request.project_id}.")
             raise BadRequestError(f"User have no permission to duplicate the project.")
 
+        base_get_elements_response = await self._base_get_elements.aexecute(
+            BaseGetElements.Request(organization_id=organization_id, project_id=design_project.id)
+        )
+        # NOTE: element ids are unique across projects, so the copies need their own
+        copied_elements = [
+            element.model_copy(update={"id": generate_uuid()}) for element in base_get_elements_response.elements
+        ]
         create_design_project_request = self._create_design_project.Request(
             name=self.make_copy_project_name(design_project.name),
             thumbnail_url=design_project.thumbnail_url,
-            elements=design_project.elements,
+            elements=copied_elements,
         )
         create_design_project_response = await self._create_design_project.aexecute(create_design_project_request)
         created_project = create_design_project_response.created_project
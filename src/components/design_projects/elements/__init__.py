@@ -1,11 +1,27 @@
+from .append_points import AppendPoints, AppendPointsDep
+from .base_append_points import BaseAppendPoints, BaseAppendPointsDep
+from .base_create_batch_elements import BaseCreateBatchElements, BaseCreateBatchElementsDep
 from .base_create_element import BaseCreateElement, BaseCreateElementDep
+from .base_delete_batch_elements import BaseDeleteBatchElements, BaseDeleteBatchElementsDep
 from .base_delete_element import BaseDeleteElement, BaseDeleteElementDep
+from .base_get_boundary_order_key import BaseGetBoundaryOrderKey, BaseGetBoundaryOrderKeyDep
 from .base_get_elements import BaseGetElements, BaseGetElementsDep
+from .base_patch_element import BasePatchElement, BasePatchElementDep
+from .base_reorder_element import BaseReorderElement, BaseReorderElementDep
+from .base_transform_elements import BaseTransformElements, BaseTransformElementsDep
+from .base_update_batch_elements import BaseUpdateBatchElements, BaseUpdateBatchElementsDep
 from .base_update_element import BaseUpdateElement, BaseUpdateElementDep
 from .create_batch_elements import CreateBatchElements, CreateBatchElementsDep
 from .create_element import CreateElement, CreateElementDep
+from .delete_batch_elements import DeleteBatchElements, DeleteBatchElementsDep
 from .delete_element import DeleteElement, DeleteElementDep
 from .get_elements import GetElements, GetElementsDep
+from .migrate_project_elements import MigrateProjectElements, MigrateProjectElementsDep
+from .patch_element import PatchElement, PatchElementDep
+from .reorder_element import ReorderElement, ReorderElementDep
+from .resolve_element_write_miss import ResolveElementWriteMiss, ResolveElementWriteMissDep
+from .transform_elements import TransformElements, TransformElementsDep
+from .update_batch_elements import UpdateBatchElements, UpdateBatchElementsDep
 from .update_element import UpdateElement, UpdateElementDep
 
 __all__ = [
@@ -15,6 +31,8 @@ __all__ = [
     "BaseGetElementsDep",
     "BaseDeleteElement",
     "BaseDeleteElementDep",
+    "BasePatchElement",
+    "BasePatchElementDep",
     "BaseUpdateElement",
     "BaseUpdateElementDep",
     "CreateElement",
@@ -23,8 +41,38 @@ __all__ = [
     "GetElementsDep",
     "UpdateElement",
     "UpdateElementDep",
+    "PatchElement",
+    "PatchElementDep",
     "DeleteElement",
     "DeleteElementDep",
     "CreateBatchElements",
     "CreateBatchElementsDep",
+    "BaseCreateBatchElements",
+    "BaseCreateBatchElementsDep",
+    "BaseUpdateBatchElements",
+    "BaseUpdateBatchElementsDep",
+    "UpdateBatchElements",
+    "UpdateBatchElementsDep",
+    "BaseDeleteBatchElements",
+    "BaseDeleteBatchElementsDep",
+    "DeleteBatchElements",
+    "DeleteBatchElementsDep",
+    "MigrateProjectElements",
+    "MigrateProjectElementsDep",
+    "ResolveElementWriteMiss",
+    "ResolveElementWriteMissDep",
+    "BaseGetBoundaryOrderKey",
+    "BaseGetBoundaryOrderKeyDep",
+    "BaseReorderElement",
+    "BaseReorderElementDep",
+    "ReorderElement",
+    "ReorderElementDep",
+    "BaseTransformElements",
+    "BaseTransformElementsDep",
+    "TransformElements",
+    "TransformElementsDep",
+    "BaseAppendPoints",
+    "BaseAppendPointsDep",
+    "AppendPoints",
+    "AppendPointsDep",
 ]
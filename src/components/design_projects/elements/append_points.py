@@ -0,0 +1,51 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+
+from ....common.models import PackedPoints, PyObjectUUID
+from ....dependencies import LoggerDep, UserContextDep
+from ....interfaces import IBaseComponent
+from ....utils.logger import execute_service_method
+from .base_append_points import BaseAppendPoints, BaseAppendPointsDep
+
+IAppendPoints = IBaseComponent["AppendPoints.Request", "AppendPoints.Response"]
+
+
+class AppendPoints(IAppendPoints):
+    def __init__(
+        self, logger: LoggerDep, user_context: UserContextDep, base_append_points: BaseAppendPointsDep
+    ) -> None:
+        self._logger = logger
+        self._user_context = user_context
+        self._base_append_points = base_append_points
+
+    class HttpRequest(p.BaseModel):
+        points: PackedPoints
+
+    class Request(HttpRequest, p.BaseModel):
+        project_id: PyObjectUUID
+        element_id: PyObjectUUID
+
+    class Response(BaseAppendPoints.Response):
+        pass
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        base_append_points_request = BaseAppendPoints.Request(
+            organization_id=self._user_context.organization_id,
+            project_id=request.project_id,
+            element_id=request.element_id,
+            points=request.points,
+        )
+        base_append_points_response = await self._base_append_points.aexecute(base_append_points_request)
+        return self.Response(
+            element_id=base_append_points_response.element_id,
+            points=base_append_points_response.points,
+            updated_at=base_append_points_response.updated_at,
+            bbox=base_append_points_response.bbox,
+        )
+
+
+AppendPointsDep = t.Annotated[AppendPoints, Depends()]
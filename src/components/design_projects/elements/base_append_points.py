@@ -0,0 +1,181 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+from pymongo import ReturnDocument
+
+from ....common.models import (
+    APPENDED_POINTS_FIELD,
+    BoundingBox,
+    PackedPoints,
+    PyObjectDatetime,
+    PyObjectUUID,
+    get_element_points_array,
+)
+from ....constants.mongo import CollectionName
+from ....dependencies import LoggerDep, MongoDbDep
+from ....exceptions import NotFoundError
+from ....interfaces import IBaseComponent
+from ....utils.affine_transform import POINTS_SHAPE_TYPES
+from ....utils.bounding_box import GEOMETRY_FIELDS, compute_bounding_box
+from ....utils.common import get_utc_now
+from ....utils.logger import execute_service_method
+from .resolve_element_write_miss import ResolveElementWriteMiss, ResolveElementWriteMissDep
+
+IBaseAppendPoints = IBaseComponent["BaseAppendPoints.Request", "BaseAppendPoints.Response"]
+
+# NOTE: past this many chunks the appended points are folded back into `points`, which bounds the cost of reads
+MAX_APPENDED_POINTS_CHUNKS = 64
+APPENDED_CHUNK_COUNT_FIELD = "appended_chunk_count"
+
+
+class BaseAppendPoints(IBaseAppendPoints):
+    """
+    Append points to the end of a line or an arrow while it is being drawn.
+
+    Only the new points are written, pushed as one packed chunk next to the stored `points` since MongoDB cannot
+    concatenate binaries in place, so a frame costs the size of the points it adds whatever the length of the stroke.
+    The bounding box is grown by the box of the chunk, and the chunks are folded back into `points` once there are
+    `MAX_APPENDED_POINTS_CHUNKS` of them.
+    """
+
+    def __init__(
+        self, db: MongoDbDep, logger: LoggerDep, resolve_element_write_miss: ResolveElementWriteMissDep
+    ) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
+        self._logger = logger
+        self._resolve_element_write_miss = resolve_element_write_miss
+
+    class Request(p.BaseModel):
+        organization_id: PyObjectUUID
+        project_id: PyObjectUUID
+        element_id: PyObjectUUID
+        points: PackedPoints
+
+        @p.field_validator("points")
+        @classmethod
+        def validate_points(cls, points: PackedPoints) -> PackedPoints:
+            if len(points) == 0 or len(points) % 2 != 0:
+                raise ValueError("points must hold at least one (x, y) pair")
+            return points
+
+    class Response(p.BaseModel):
+        element_id: PyObjectUUID
+        points: PackedPoints
+        updated_at: PyObjectDatetime
+        bbox: BoundingBox | None = None
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        project_id = request.project_id
+        organization_id = request.organization_id
+        element_id = request.element_id
+
+        element_filter = {
+            "_id": element_id,
+            "project_id": project_id,
+            "organization_id": organization_id,
+            "shapeType": {"$in": list(POINTS_SHAPE_TYPES)},
+        }
+        updated_at = get_utc_now()
+        update = {
+            "$push": {APPENDED_POINTS_FIELD: request.points.to_binary()},
+            "$set": {"updated_at": updated_at},
+        }
+        element_data = await self._append_points(element_filter, update)
+        if element_data is None:
+            resolve_element_write_miss_request = ResolveElementWriteMiss.Request(
+                organization_id=organization_id, project_id=project_id, element_id=element_id
+            )
+            await self._resolve_element_write_miss.aexecute(resolve_element_write_miss_request)
+            element_data = await self._append_points(element_filter, update)
+            if element_data is None:
+                raise NotFoundError(f"Element with id {element_id} not found.")
+
+        bounding_box = await self._grow_bounding_box(element_data, request.points, updated_at)
+        if element_data.get(APPENDED_CHUNK_COUNT_FIELD, 0) >= MAX_APPENDED_POINTS_CHUNKS:
+            await self._compact_points(element_id, updated_at)
+
+        return self.Response(element_id=element_id, points=request.points, updated_at=updated_at, bbox=bounding_box)
+
+    async def _append_points(self, element_filter: dict, update: dict) -> dict[str, t.Any] | None:
+        # NOTE: the stored points are left out, reading them back would make every frame as costly as the stroke
+        projection: dict[str, t.Any] = {
+            field: 1 for field in GEOMETRY_FIELDS if field not in ("points", APPENDED_POINTS_FIELD)
+        }
+        projection["bbox"] = 1
+        projection[APPENDED_CHUNK_COUNT_FIELD] = {"$size": f"${APPENDED_POINTS_FIELD}"}
+        return await self._element_collection.find_one_and_update(
+            element_filter, update, projection=projection, return_document=ReturnDocument.AFTER
+        )
+
+    async def _grow_bounding_box(
+        self, element_data: dict[str, t.Any], points: PackedPoints, updated_at: PyObjectDatetime
+    ) -> BoundingBox | None:
+        stored_bounding_box = element_data.get("bbox")
+        chunk_bounding_box = compute_bounding_box({**element_data, "points": points})
+        if stored_bounding_box is None or chunk_bounding_box is None:
+            # NOTE: the extent of the stroke is unknown, e.g. it had no points yet, so it is computed from all points
+            return await self._recompute_bounding_box(element_data["_id"], updated_at)
+
+        bounding_box = BoundingBox(
+            min_x=min(stored_bounding_box["min_x"], chunk_bounding_box.min_x),
+            min_y=min(stored_bounding_box["min_y"], chunk_bounding_box.min_y),
+            max_x=max(stored_bounding_box["max_x"], chunk_bounding_box.max_x),
+            max_y=max(stored_bounding_box["max_y"], chunk_bounding_box.max_y),
+        )
+        if bounding_box.model_dump(by_alias=True) == stored_bounding_box:
+            return bounding_box
+
+        # NOTE: guarded by `updated_at`, a full update or a transform may have replaced the points and their box since
+        update_one_result = await self._element_collection.update_one(
+            {"_id": element_data["_id"], "updated_at": updated_at},
+            {
+                "$min": {"bbox.min_x": bounding_box.min_x, "bbox.min_y": bounding_box.min_y},
+                "$max": {"bbox.max_x": bounding_box.max_x, "bbox.max_y": bounding_box.max_y},
+            },
+        )
+        if update_one_result.matched_count == 0:
+            # NOTE: the box stored by the later write may not cover these points, e.g. when it was another append
+            return await self._recompute_bounding_box(element_data["_id"])
+        return bounding_box
+
+    async def _recompute_bounding_box(
+        self, element_id: PyObjectUUID, updated_at: PyObjectDatetime | None = None
+    ) -> BoundingBox | None:
+        element_filter = {"_id": element_id} if updated_at is None else {"_id": element_id, "updated_at": updated_at}
+        element_data = await self._element_collection.find_one(
+            element_filter, {**{field: 1 for field in GEOMETRY_FIELDS}, "updated_at": 1}
+        )
+        if element_data is None:
+            # NOTE: a later write already stored a bounding box covering these points
+            return None
+
+        # NOTE: guarded by the `updated_at` read, so that the box is only stored for the points it was computed from
+        bounding_box = compute_bounding_box(element_data)
+        await self._element_collection.update_one(
+            {"_id": element_id, "updated_at": element_data.get("updated_at")},
+            {"$set": {"bbox": bounding_box.model_dump(by_alias=True) if bounding_box else None}},
+        )
+        return bounding_box
+
+    async def _compact_points(self, element_id: PyObjectUUID, updated_at: PyObjectDatetime) -> None:
+        element_data = await self._element_collection.find_one(
+            {"_id": element_id, "updated_at": updated_at}, {"points": 1, APPENDED_POINTS_FIELD: 1}
+        )
+        points = get_element_points_array(element_data) if element_data else None
+        if points is None:
+            return
+
+        # NOTE: guarded by `updated_at` so that points appended meanwhile are never dropped, the next append compacts
+        await self._element_collection.update_one(
+            {"_id": element_id, "updated_at": updated_at},
+            {
+                "$set": {"points": PackedPoints.from_values(points).to_binary()},
+                "$unset": {APPENDED_POINTS_FIELD: ""},
+            },
+        )
+
+
+BaseAppendPointsDep = t.Annotated[BaseAppendPoints, Depends()]
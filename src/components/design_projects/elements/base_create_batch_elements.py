@@ -1,24 +1,29 @@
+import asyncio
 import typing as t
 
 import pydantic as p
 from fastapi import Depends
-from pymongo import UpdateOne
 
-from ....common.models import BaseElementModel, ElementModel, PyObjectUUID
+from ....common.models import BaseElementModel, ElementModel, ElementPlacement, PyObjectUUID
 from ....constants.mongo import CollectionName
 from ....dependencies import LoggerDep, MongoDbDep
-from ....exceptions import BadRequestError
+from ....exceptions import ForbiddenError, NotFoundError
 from ....interfaces import IBaseComponent
-from ....utils.design_element import create_element
+from ....utils.design_element import create_element, to_element_document, with_order_keys
 from ....utils.logger import execute_service_method
+from .base_get_boundary_order_key import BaseGetBoundaryOrderKey, BaseGetBoundaryOrderKeyDep
 
 IBaseCreateBatchElements = IBaseComponent["BaseCreateBatchElements.Request", "BaseCreateBatchElements.Response"]
 
 
 class BaseCreateBatchElements(IBaseCreateBatchElements):
-    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
+    def __init__(
+        self, db: MongoDbDep, logger: LoggerDep, base_get_boundary_order_key: BaseGetBoundaryOrderKeyDep
+    ) -> None:
         self._collection = db.get_collection(CollectionName.DESIGN_PROJECTS)
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
         self._logger = logger
+        self._base_get_boundary_order_key = base_get_boundary_order_key
 
     class Request(p.BaseModel):
         base_elements: list[BaseElementModel]
@@ -33,45 +38,35 @@ class BaseCreateBatchElements(IBaseCreateBatchElements):
 
         project_id = request.project_id
         organization_id = request.organization_id
-        # TODO: refactor to a separate component
-        is_project_exist = self._collection.count_documents(
-            {"_id": project_id, "organization_id": organization_id}, limit=1
+        project_data, base_get_boundary_order_key_response = await asyncio.gather(
+            self._collection.find_one({"_id": project_id}, {"organization_id": 1}),
+            self._base_get_boundary_order_key.aexecute(
+                BaseGetBoundaryOrderKey.Request(project_id=project_id, placement=ElementPlacement.Front)
+            ),
         )
-        if is_project_exist < 1:
+        if not project_data:
             self._logger.error(f"Project with id {project_id} not found.")
-            raise BadRequestError(f"Project with id {project_id} not found.")
-
-        elements: list[ElementModel] = []
-        bulk_operations = []
-        for base_element in request.base_elements:
-            element = create_element(base_element)
-            element_data = element.model_dump(by_alias=True, exclude_none=True)
-            bulk_operations.append(
-                UpdateOne(
-                    {"_id": project_id},
-                    {
-                        "$push": {
-                            "elements": {
-                                "$each": [element_data],
-                                "$position": 0,
-                            }
-                        }
-                    },
-                )
-            )
-            elements.append(element)
+            raise NotFoundError(f"Project with id {project_id} not found.")
+
+        if project_data.get("organization_id") != organization_id:
+            self._logger.error(f"User have no permission to access the design project {project_id}.")
+            raise ForbiddenError("User have no permission to access the design project.")
 
-        if not len(bulk_operations):
-            self._logger.info("No update operations provided.")
+        elements: list[ElementModel] = [create_element(base_element) for base_element in request.base_elements]
+        if not len(elements):
+            self._logger.info("No elements provided.")
             return self.Response(created_elements=[])
 
-        # process bulk update operations
+        # NOTE: the batch is stacked on top, keeping its own front-to-back order
+        elements = with_order_keys(elements, base_get_boundary_order_key_response.order_key)
+
+        # process bulk insert
         try:
-            bulk_write_result = self._collection.bulk_write(bulk_operations, ordered=False)
-            # log bulk result data
-            self._logger.info(bulk_write_result.bulk_api_result)
+            await self._element_collection.insert_many(
+                [to_element_document(element, project_id, organization_id) for element in elements], ordered=False
+            )
         except Exception as e:
-            self._logger.error(f"Bulk update failed: {e}")
+            self._logger.error(f"Bulk insert failed: {e}")
             return self.Response(created_elements=[])
 
         return self.Response(created_elements=elements)
@@ -1,23 +1,29 @@
+import asyncio
 import typing as t
 
 import pydantic as p
 from fastapi import Depends
 
-from ....common.models import BaseElementModel, DesignProjectModel, ElementModel, PyObjectUUID
+from ....common.models import BaseElementModel, ElementModel, ElementPlacement, PyObjectUUID
 from ....constants.mongo import CollectionName
 from ....dependencies import LoggerDep, MongoDbDep
-from ....exceptions import BadRequestError
+from ....exceptions import ForbiddenError, NotFoundError
 from ....interfaces import IBaseComponent
-from ....utils.design_element import create_element
+from ....utils.design_element import create_element, to_element_document, with_order_keys
 from ....utils.logger import execute_service_method
+from .base_get_boundary_order_key import BaseGetBoundaryOrderKey, BaseGetBoundaryOrderKeyDep
 
 IBaseCreateElement = IBaseComponent["BaseCreateElement.Request", "BaseCreateElement.Response"]
 
 
 class BaseCreateElement(IBaseCreateElement):
-    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
+    def __init__(
+        self, db: MongoDbDep, logger: LoggerDep, base_get_boundary_order_key: BaseGetBoundaryOrderKeyDep
+    ) -> None:
         self._collection = db.get_collection(CollectionName.DESIGN_PROJECTS)
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
         self._logger = logger
+        self._base_get_boundary_order_key = base_get_boundary_order_key
 
     class Request(p.BaseModel):
         design_project_id: PyObjectUUID
@@ -32,32 +38,29 @@ class BaseCreateElement(IBaseCreateElement):
         design_project_id = request.design_project_id
         organization_id = request.organization_id
 
-        design_project_data = self._collection.find_one({"_id": design_project_id})
+        # NOTE: an insert cannot carry a filter, the projected read is the only check left on element writes and runs
+        # next to the lookup of the front-most order key
+        design_project_data, base_get_boundary_order_key_response = await asyncio.gather(
+            self._collection.find_one({"_id": design_project_id}, {"organization_id": 1}),
+            self._base_get_boundary_order_key.aexecute(
+                BaseGetBoundaryOrderKey.Request(project_id=design_project_id, placement=ElementPlacement.Front)
+            ),
+        )
         if not design_project_data:
             log_message = f"Design project with id {design_project_id} not found."
             error_message = f"Design project not found."
             self._logger.error(log_message)
-            raise BadRequestError(error_message)
+            raise NotFoundError(error_message)
 
-        design_project = DesignProjectModel(**design_project_data)
-        if design_project.organization_id != organization_id:
+        if design_project_data.get("organization_id") != organization_id:
             log_message = f"User have no permission to access the design project {design_project_id}."
             error_message = f"User have no permission to access the design project."
             self._logger.error(log_message)
-            raise BadRequestError(error_message)
+            raise ForbiddenError(error_message)
 
-        element = create_element(request.element)
-        self._collection.update_one(
-            {"_id": design_project_id},
-            {
-                "$push": {
-                    "elements": {
-                        "$each": [element.model_dump(by_alias=True, exclude_none=True)],
-                        "$position": 0,
-                    }
-                }
-            },
-        )
+        # NOTE: new elements are stacked on top
+        [element] = with_order_keys([create_element(request.element)], base_get_boundary_order_key_response.order_key)
+        await self._element_collection.insert_one(to_element_document(element, design_project_id, organization_id))
         return self.Response(created_element=element)
 
 
@@ -0,0 +1,72 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+
+from ....common.models import PyObjectUUID
+from ....constants.mongo import CollectionName
+from ....dependencies import LoggerDep, MongoDbDep
+from ....interfaces import IBaseComponent
+from ....utils.logger import execute_service_method
+from .migrate_project_elements import MigrateProjectElements, MigrateProjectElementsDep
+
+IBaseDeleteBatchElements = IBaseComponent["BaseDeleteBatchElements.Request", "BaseDeleteBatchElements.Response"]
+
+
+class BaseDeleteBatchElements(IBaseDeleteBatchElements):
+    """
+    Hard delete many elements of a project with one `delete_many`.
+
+    The ids the filter matches are read first, so the response only reports elements that were actually deleted.
+    Missing elements and elements that belong to another organization are left untouched and out of the response.
+    """
+
+    def __init__(self, db: MongoDbDep, logger: LoggerDep, migrate_project_elements: MigrateProjectElementsDep) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
+        self._logger = logger
+        self._migrate_project_elements = migrate_project_elements
+
+    class Request(p.BaseModel):
+        element_ids: list[PyObjectUUID]
+        organization_id: PyObjectUUID
+        project_id: PyObjectUUID
+
+    class Response(p.BaseModel):
+        deleted_element_ids: list[PyObjectUUID]
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        project_id = request.project_id
+        organization_id = request.organization_id
+        element_ids = list(dict.fromkeys(request.element_ids))
+        if not element_ids:
+            self._logger.info("No element ids provided.")
+            return self.Response(deleted_element_ids=[])
+
+        element_filter = {"_id": {"$in": element_ids}, "project_id": project_id, "organization_id": organization_id}
+        matched_ids = await self._find_matched_ids(element_filter)
+        if len(matched_ids) < len(element_ids):
+            # NOTE: the elements may still be embedded in a project that has not been migrated yet
+            await self._migrate_project_elements.aexecute(MigrateProjectElements.Request(project_id=project_id))
+            # NOTE: read again whatever this call migrated, a concurrent write may have migrated the project first
+            matched_ids = await self._find_matched_ids(element_filter)
+
+        deleted_element_ids = [element_id for element_id in element_ids if element_id in matched_ids]
+        if deleted_element_ids:
+            await self._element_collection.delete_many({**element_filter, "_id": {"$in": deleted_element_ids}})
+        if len(deleted_element_ids) < len(element_ids):
+            self._logger.error(
+                f"Skipped {len(element_ids) - len(deleted_element_ids)} missing or forbidden element(s) of project "
+                f"{project_id}."
+            )
+        return self.Response(deleted_element_ids=deleted_element_ids)
+
+    async def _find_matched_ids(self, element_filter: dict[str, t.Any]) -> set[PyObjectUUID]:
+        return {
+            element_data["_id"]
+            for element_data in await self._element_collection.find(element_filter, {"_id": 1}).to_list()
+        }
+
+
+BaseDeleteBatchElementsDep = t.Annotated[BaseDeleteBatchElements, Depends()]
@@ -6,16 +6,21 @@ from fastapi import Depends
 from ....common.models import PyObjectUUID
 from ....constants.mongo import CollectionName
 from ....dependencies import LoggerDep, MongoDbDep
+from ....exceptions import NotFoundError
 from ....interfaces import IBaseComponent
 from ....utils.logger import execute_service_method
+from .resolve_element_write_miss import ResolveElementWriteMiss, ResolveElementWriteMissDep
 
 IBaseDeleteElement = IBaseComponent["BaseDeleteElement.Request", "BaseDeleteElement.Response"]
 
 
 class BaseDeleteElement(IBaseDeleteElement):
-    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
-        self._collection = db.get_collection(CollectionName.DESIGN_PROJECTS)
+    def __init__(
+        self, db: MongoDbDep, logger: LoggerDep, resolve_element_write_miss: ResolveElementWriteMissDep
+    ) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
         self._logger = logger
+        self._resolve_element_write_miss = resolve_element_write_miss
 
     class Request(p.BaseModel):
         organization_id: PyObjectUUID
@@ -31,24 +36,19 @@ class BaseDeleteElement(IBaseDeleteElement):
         project_id = request.project_id
         organization_id = request.organization_id
         element_id = request.element_id
-        is_project_exist = self._collection.count_documents(
-            {"_id": project_id, "organization_id": organization_id}, limit=1
-        )
-        if is_project_exist < 1:
-            self._logger.error(f"Project with id {project_id} not found.")
-            return self.Response(success=False)
-
-        # NOTE: hard delete element
-        update_one_result = self._collection.update_one(
-            {"_id": project_id}, {"$pull": {"elements": {"_id": element_id}}}
-        )
-        if update_one_result.matched_count == 0:
-            self._logger.error(f"Element with id {element_id} not found in project {project_id}.")
-            return self.Response(success=False)
-
-        if update_one_result.modified_count == 0:
-            self._logger.error(f"Failed to modify element with id {element_id} in project {project_id}.")
-            return self.Response(success=False)
+
+        # NOTE: hard delete element, the organization is part of the write filter
+        element_filter = {"_id": element_id, "project_id": project_id, "organization_id": organization_id}
+        delete_one_result = await self._element_collection.delete_one(element_filter)
+        if delete_one_result.deleted_count == 0:
+            resolve_element_write_miss_request = ResolveElementWriteMiss.Request(
+                organization_id=organization_id, project_id=project_id, element_id=element_id
+            )
+            await self._resolve_element_write_miss.aexecute(resolve_element_write_miss_request)
+            delete_one_result = await self._element_collection.delete_one(element_filter)
+            if delete_one_result.deleted_count == 0:
+                await self._resolve_element_write_miss.aexecute(resolve_element_write_miss_request)
+                raise NotFoundError(f"Element with id {element_id} not found.")
 
         return self.Response(success=True)
 
@@ -0,0 +1,50 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+from pymongo import ASCENDING, DESCENDING
+
+from ....common.models import ElementPlacement, PyObjectUUID
+from ....constants.mongo import CollectionName
+from ....dependencies import LoggerDep, MongoDbDep
+from ....interfaces import IBaseComponent
+from ....utils.logger import execute_service_method
+
+IBaseGetBoundaryOrderKey = IBaseComponent["BaseGetBoundaryOrderKey.Request", "BaseGetBoundaryOrderKey.Response"]
+
+
+class BaseGetBoundaryOrderKey(IBaseGetBoundaryOrderKey):
+    """
+    Read the order key of the front-most or back-most element of a project with one covered index lookup.
+    """
+
+    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
+        self._logger = logger
+
+    class Request(p.BaseModel):
+        project_id: PyObjectUUID
+        placement: t.Literal[ElementPlacement.Front, ElementPlacement.Back]
+
+    class Response(p.BaseModel):
+        order_key: str | None
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        direction = DESCENDING if request.placement == ElementPlacement.Front else ASCENDING
+        elements_data = (
+            await self._element_collection.find(
+                # NOTE: elements created before order keys existed have none and never bound the stack
+                {"project_id": request.project_id, "order_key": {"$type": "string"}},
+                {"_id": 0, "order_key": 1},
+            )
+            .sort("order_key", direction)
+            .limit(1)
+            .to_list()
+        )
+        order_key = elements_data[0]["order_key"] if elements_data else None
+        return self.Response(order_key=order_key)
+
+
+BaseGetBoundaryOrderKeyDep = t.Annotated[BaseGetBoundaryOrderKey, Depends()]
@@ -3,24 +3,30 @@ import typing as t
 import pydantic as p
 from fastapi import Depends
 
-from ....common.models import DesignProjectModel, ElementModel, PyObjectUUID
+from ....common.models import BoundingBox, ElementModel, PyObjectUUID
 from ....constants.mongo import CollectionName
 from ....dependencies import LoggerDep, MongoDbDep
 from ....exceptions import BadRequestError
 from ....interfaces import IBaseComponent
+from ....utils.bounding_box import make_viewport_filter
+from ....utils.design_element import ELEMENT_ORDER_SORT, to_element
 from ....utils.logger import execute_service_method
+from .migrate_project_elements import MigrateProjectElements, MigrateProjectElementsDep
 
 IBaseGetElements = IBaseComponent["BaseGetElements.Request", "BaseGetElements.Response"]
 
 
 class BaseGetElements(IBaseGetElements):
-    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
+    def __init__(self, db: MongoDbDep, logger: LoggerDep, migrate_project_elements: MigrateProjectElementsDep) -> None:
         self._collection = db.get_collection(CollectionName.DESIGN_PROJECTS)
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
         self._logger = logger
+        self._migrate_project_elements = migrate_project_elements
 
     class Request(p.BaseModel):
         organization_id: PyObjectUUID
         project_id: PyObjectUUID
+        viewport: BoundingBox | None = None
 
     class Response(p.BaseModel):
         elements: list[ElementModel]
@@ -30,21 +36,31 @@ class BaseGetElements(IBaseGetElements):
         project_id = request.project_id
         organization_id = request.organization_id
 
-        current_project_data = self._collection.find_one({"_id": project_id})
+        # NOTE: only a flag is projected for the legacy embedded elements, never the array itself
+        current_project_data = await self._collection.find_one(
+            {"_id": project_id},
+            {"organization_id": 1, "has_embedded_elements": {"$gt": [{"$size": {"$ifNull": ["$elements", []]}}, 0]}},
+        )
         if not current_project_data:
             log_message = f"Project with id {project_id} not found."
             error_message = f"Project not found."
             self._logger.error(log_message)
             raise BadRequestError(error_message)
 
-        current_project = DesignProjectModel(**current_project_data)
-        if current_project.organization_id != organization_id:
+        if current_project_data.get("organization_id") != organization_id:
             log_message = f"User have no permission to access the project {project_id}."
             error_message = f"User have no permission to access the project."
             self._logger.error(log_message)
             raise BadRequestError(error_message)
 
-        elements = current_project.elements
+        if current_project_data.get("has_embedded_elements"):
+            await self._migrate_project_elements.aexecute(MigrateProjectElements.Request(project_id=project_id))
+
+        element_filter: dict = {"project_id": project_id}
+        if request.viewport:
+            element_filter.update(make_viewport_filter(request.viewport))
+        elements_data = await self._element_collection.find(element_filter).sort(ELEMENT_ORDER_SORT).to_list()
+        elements = [to_element(element_data) for element_data in elements_data]
         return self.Response(elements=elements)
 
 
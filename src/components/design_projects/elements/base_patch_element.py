@@ -0,0 +1,169 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+from pymongo import ReturnDocument
+
+from ....common.models import APPENDED_POINTS_FIELD, BoundingBox, ElementPatchModel, PyObjectDatetime, PyObjectUUID
+from ....constants.mongo import CollectionName
+from ....dependencies import LoggerDep, MongoDbDep
+from ....exceptions import NotFoundError
+from ....interfaces import IBaseComponent
+from ....utils.bounding_box import GEOMETRY_FIELDS, compute_bounding_box
+from ....utils.common import get_utc_now
+from ....utils.logger import execute_service_method
+from .resolve_element_write_miss import ResolveElementWriteMiss, ResolveElementWriteMissDep
+
+IBasePatchElement = IBaseComponent["BasePatchElement.Request", "BasePatchElement.Response"]
+
+# NOTE: the geometry fields that only move an element, its bounding box then moves by the same offset
+TRANSLATION_FIELDS = frozenset({"x", "y"})
+
+
+class BasePatchElement(IBasePatchElement):
+    """
+    Apply field-level changes to one element with targeted `$set`/`$unset` paths instead of replacing the document.
+
+    A patch that only moves the element, i.e. a drag, shifts the stored bounding box in the same write. Other geometry
+    changes clear it in the same write, which keeps the element in every viewport, and store the recomputed one next.
+    """
+
+    def __init__(
+        self, db: MongoDbDep, logger: LoggerDep, resolve_element_write_miss: ResolveElementWriteMissDep
+    ) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
+        self._logger = logger
+        self._resolve_element_write_miss = resolve_element_write_miss
+
+    class Request(p.BaseModel):
+        patch: ElementPatchModel
+        organization_id: PyObjectUUID
+        project_id: PyObjectUUID
+        element_id: PyObjectUUID
+
+    class Response(p.BaseModel):
+        patched_element_id: PyObjectUUID
+        patch: ElementPatchModel
+        updated_at: PyObjectDatetime
+        # NOTE: only set when the patch moved or resized an element whose extent is known
+        bbox: BoundingBox | None = None
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        patch = request.patch
+        project_id = request.project_id
+        organization_id = request.organization_id
+        element_id = request.element_id
+
+        # NOTE: the changes were validated against the model of `shape_type`, so the element must still be of that type
+        element_filter = {
+            "_id": element_id,
+            "project_id": project_id,
+            "organization_id": organization_id,
+            "shapeType": patch.shape_type,
+        }
+        updated_at = get_utc_now()
+        is_matched, bounding_box = await self._patch_element(element_filter, patch, updated_at)
+        if not is_matched:
+            resolve_element_write_miss_request = ResolveElementWriteMiss.Request(
+                organization_id=organization_id, project_id=project_id, element_id=element_id
+            )
+            await self._resolve_element_write_miss.aexecute(resolve_element_write_miss_request)
+            is_matched, bounding_box = await self._patch_element(element_filter, patch, updated_at)
+            if not is_matched:
+                await self._resolve_element_write_miss.aexecute(resolve_element_write_miss_request)
+                raise NotFoundError(f"Element with id {element_id} not found.")
+
+        return self.Response(patched_element_id=element_id, patch=patch, updated_at=updated_at, bbox=bounding_box)
+
+    async def _patch_element(
+        self, element_filter: dict, patch: ElementPatchModel, updated_at: PyObjectDatetime
+    ) -> tuple[bool, BoundingBox | None]:
+        geometry_fields = GEOMETRY_FIELDS.intersection(patch.changes)
+        if not geometry_fields:
+            update_one_result = await self._element_collection.update_one(
+                element_filter, self._make_update(patch, updated_at)
+            )
+            # NOTE: matched rather than modified, a patch repeating the stored values is no miss
+            return update_one_result.matched_count > 0, None
+
+        if geometry_fields <= TRANSLATION_FIELDS:
+            element_data = await self._element_collection.find_one_and_update(
+                element_filter,
+                self._make_translation_update(patch, updated_at),
+                projection={"bbox": 1},
+                return_document=ReturnDocument.AFTER,
+            )
+            if element_data is None:
+                return False, None
+            return True, BoundingBox.model_validate(element_data["bbox"]) if element_data.get("bbox") else None
+
+        # NOTE: the bounding box depends on fields the patch may not carry, so it is computed from the patched document
+        update = self._make_update(patch, updated_at)
+        update["$set"]["bbox"] = None
+        element_data = await self._element_collection.find_one_and_update(
+            element_filter,
+            update,
+            projection={field: 1 for field in GEOMETRY_FIELDS},
+            return_document=ReturnDocument.AFTER,
+        )
+        if element_data is None:
+            return False, None
+
+        # NOTE: guarded by `updated_at` so that a concurrent write, which stores its own bounding box, always wins
+        bounding_box = compute_bounding_box(element_data)
+        if bounding_box is not None:
+            await self._element_collection.update_one(
+                {"_id": element_data["_id"], "updated_at": updated_at},
+                {"$set": {"bbox": bounding_box.model_dump(by_alias=True)}},
+            )
+        return True, bounding_box
+
+    def _make_update(self, patch: ElementPatchModel, updated_at: PyObjectDatetime) -> dict[str, t.Any]:
+        # NOTE: cleared fields are unset to keep the documents free of nulls, like `to_element_document` does
+        set_fields = {field: value for field, value in patch.changes.items() if value is not None}
+        unset_fields = {field: "" for field, value in patch.changes.items() if value is None}
+        if "points" in patch.changes:
+            # NOTE: new points replace the ones appended while drawing too
+            unset_fields[APPENDED_POINTS_FIELD] = ""
+        update: dict[str, t.Any] = {"$set": {**set_fields, "updated_at": updated_at}}
+        if unset_fields:
+            update["$unset"] = unset_fields
+        return update
+
+    def _make_translation_update(
+        self, patch: ElementPatchModel, updated_at: PyObjectDatetime
+    ) -> list[dict[str, t.Any]]:
+        # NOTE: a pipeline update reads the stored position, the values are literals so that no string is a field path
+        offsets = {
+            axis: (
+                {"$subtract": [patch.changes[axis] or 0.0, {"$ifNull": [f"${axis}", 0.0]}]}
+                if axis in patch.changes
+                else 0.0
+            )
+            for axis in ("x", "y")
+        }
+        shifted_bounding_box = {
+            f"{bound}_{axis}": {"$add": [f"$bbox.{bound}_{axis}", offsets[axis]]}
+            for bound in ("min", "max")
+            for axis in ("x", "y")
+        }
+        set_fields = {field: {"$literal": value} for field, value in patch.changes.items() if value is not None}
+        unset_fields = [field for field, value in patch.changes.items() if value is None]
+        pipeline: list[dict[str, t.Any]] = [
+            {
+                "$set": {
+                    **set_fields,
+                    "updated_at": updated_at,
+                    # NOTE: a stage reads the document as it was before the stage, so the offsets use the old position
+                    "bbox": {"$cond": [{"$eq": [{"$ifNull": ["$bbox", None]}, None]}, None, shifted_bounding_box]},
+                }
+            }
+        ]
+        if unset_fields:
+            pipeline.append({"$unset": unset_fields})
+        return pipeline
+
+
+BasePatchElementDep = t.Annotated[BasePatchElement, Depends()]
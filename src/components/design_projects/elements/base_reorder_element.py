@@ -0,0 +1,122 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+from pymongo import ASCENDING, DESCENDING
+
+from ....common.models import ElementPlacement, ElementPlacementModel, PyObjectUUID
+from ....constants.mongo import CollectionName
+from ....dependencies import LoggerDep, MongoDbDep
+from ....exceptions import BadRequestError, NotFoundError
+from ....interfaces import IBaseComponent
+from ....utils.common import get_utc_now
+from ....utils.fractional_index import generate_key_between
+from ....utils.logger import execute_service_method
+from .base_get_boundary_order_key import BaseGetBoundaryOrderKey, BaseGetBoundaryOrderKeyDep
+from .resolve_element_write_miss import ResolveElementWriteMiss, ResolveElementWriteMissDep
+
+IBaseReorderElement = IBaseComponent["BaseReorderElement.Request", "BaseReorderElement.Response"]
+
+
+class BaseReorderElement(IBaseReorderElement):
+    """
+    Move one element in the stacking order by writing a new order key for it, the other elements are never touched.
+    """
+
+    def __init__(
+        self,
+        db: MongoDbDep,
+        logger: LoggerDep,
+        base_get_boundary_order_key: BaseGetBoundaryOrderKeyDep,
+        resolve_element_write_miss: ResolveElementWriteMissDep,
+    ) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
+        self._logger = logger
+        self._base_get_boundary_order_key = base_get_boundary_order_key
+        self._resolve_element_write_miss = resolve_element_write_miss
+
+    class Request(p.BaseModel):
+        organization_id: PyObjectUUID
+        project_id: PyObjectUUID
+        element_id: PyObjectUUID
+        placement: ElementPlacementModel
+
+    class Response(p.BaseModel):
+        reordered_element_id: PyObjectUUID
+        order_key: str
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        project_id = request.project_id
+        organization_id = request.organization_id
+        element_id = request.element_id
+        if request.placement.target_element_id == element_id:
+            self._logger.error(f"Element with id {element_id} cannot be placed relative to itself.")
+            raise BadRequestError("An element cannot be placed relative to itself.")
+
+        order_key = await self._make_order_key(request)
+        element_filter = {"_id": element_id, "project_id": project_id, "organization_id": organization_id}
+        update = {"$set": {"order_key": order_key, "updated_at": get_utc_now()}}
+        update_one_result = await self._element_collection.update_one(element_filter, update)
+        if update_one_result.matched_count == 0:
+            resolve_element_write_miss_request = ResolveElementWriteMiss.Request(
+                organization_id=organization_id, project_id=project_id, element_id=element_id
+            )
+            await self._resolve_element_write_miss.aexecute(resolve_element_write_miss_request)
+            # NOTE: migrated elements got fresh order keys, the new key has to be computed against them
+            order_key = await self._make_order_key(request)
+            update = {"$set": {"order_key": order_key, "updated_at": get_utc_now()}}
+            update_one_result = await self._element_collection.update_one(element_filter, update)
+            if update_one_result.matched_count == 0:
+                await self._resolve_element_write_miss.aexecute(resolve_element_write_miss_request)
+                raise NotFoundError(f"Element with id {element_id} not found.")
+
+        return self.Response(reordered_element_id=element_id, order_key=order_key)
+
+    async def _make_order_key(self, request: "Request") -> str:
+        placement = request.placement.placement
+        target_element_id = request.placement.target_element_id
+        if placement == ElementPlacement.Front or placement == ElementPlacement.Back:
+            base_get_boundary_order_key_response = await self._base_get_boundary_order_key.aexecute(
+                BaseGetBoundaryOrderKey.Request(project_id=request.project_id, placement=placement)
+            )
+            boundary_order_key = base_get_boundary_order_key_response.order_key
+            if placement == ElementPlacement.Front:
+                return generate_key_between(boundary_order_key, None)
+            return generate_key_between(None, boundary_order_key)
+
+        target_element_data = await self._element_collection.find_one(
+            {"_id": target_element_id, "project_id": request.project_id}, {"_id": 0, "order_key": 1}
+        )
+        if not target_element_data:
+            self._logger.error(f"Element with id {target_element_id} not found in project {request.project_id}.")
+            raise NotFoundError(f"Element with id {target_element_id} not found.")
+
+        target_order_key = target_element_data.get("order_key")
+        if target_order_key is None:
+            self._logger.error(f"Element with id {target_element_id} has no order key.")
+            raise BadRequestError(f"Element with id {target_element_id} cannot be used as a placement target.")
+
+        # NOTE: the moved element is skipped so that it never bounds its own new position
+        is_above = placement == ElementPlacement.Above
+        neighbor_elements_data = (
+            await self._element_collection.find(
+                {
+                    "project_id": request.project_id,
+                    "_id": {"$ne": request.element_id},
+                    "order_key": {"$gt" if is_above else "$lt": target_order_key},
+                },
+                {"_id": 0, "order_key": 1},
+            )
+            .sort("order_key", ASCENDING if is_above else DESCENDING)
+            .limit(1)
+            .to_list()
+        )
+        neighbor_order_key = neighbor_elements_data[0]["order_key"] if neighbor_elements_data else None
+        if is_above:
+            return generate_key_between(target_order_key, neighbor_order_key)
+        return generate_key_between(neighbor_order_key, target_order_key)
+
+
+BaseReorderElementDep = t.Annotated[BaseReorderElement, Depends()]
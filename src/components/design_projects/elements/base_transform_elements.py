@@ -0,0 +1,98 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+from pymongo import UpdateOne
+
+from ....common.models import AffineTransformModel, BoundingBox, PyObjectDatetime, PyObjectUUID
+from ....constants.mongo import CollectionName
+from ....dependencies import LoggerDep, MongoDbDep
+from ....interfaces import IBaseComponent
+from ....utils.affine_transform import make_transform_updates
+from ....utils.bounding_box import GEOMETRY_FIELDS
+from ....utils.common import get_utc_now
+from ....utils.logger import execute_service_method
+from .migrate_project_elements import MigrateProjectElements, MigrateProjectElementsDep
+
+IBaseTransformElements = IBaseComponent["BaseTransformElements.Request", "BaseTransformElements.Response"]
+
+
+class BaseTransformElements(IBaseTransformElements):
+    """
+    Apply one affine transform to a selection of elements of a project.
+
+    The geometry of the whole selection is transformed as NumPy columns and written back with one unordered
+    `bulk_write`. Elements that are missing or belong to another organization are skipped and left out of the
+    response.
+    """
+
+    def __init__(self, db: MongoDbDep, logger: LoggerDep, migrate_project_elements: MigrateProjectElementsDep) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
+        self._logger = logger
+        self._migrate_project_elements = migrate_project_elements
+
+    class Request(p.BaseModel):
+        organization_id: PyObjectUUID
+        project_id: PyObjectUUID
+        element_ids: list[PyObjectUUID]
+        transform: AffineTransformModel
+
+    class Response(p.BaseModel):
+        transformed_element_ids: list[PyObjectUUID]
+        transform: AffineTransformModel
+        updated_at: PyObjectDatetime | None = None
+        # NOTE: only used to route the broadcast of the transform, clients derive the bounds themselves
+        bounding_boxes: list[BoundingBox | None] = p.Field(default_factory=list, exclude=True)
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        project_id = request.project_id
+        element_ids = list(dict.fromkeys(request.element_ids))
+        if not element_ids:
+            self._logger.info("No elements provided.")
+            return self.Response(transformed_element_ids=[], transform=request.transform)
+
+        elements_data = await self._find_elements_data(request, element_ids)
+        if len(elements_data) < len(element_ids):
+            # NOTE: the elements may still be embedded in a project that has not been migrated yet
+            await self._migrate_project_elements.aexecute(MigrateProjectElements.Request(project_id=project_id))
+            # NOTE: read again whatever this call migrated, a concurrent write may have migrated the project first
+            elements_data = await self._find_elements_data(request, element_ids)
+        if len(elements_data) < len(element_ids):
+            self._logger.error(
+                f"Skipped {len(element_ids) - len(elements_data)} missing or forbidden element(s) of project {project_id}."
+            )
+        if not elements_data:
+            return self.Response(transformed_element_ids=[], transform=request.transform)
+
+        updated_at = get_utc_now()
+        updates, bounding_boxes = make_transform_updates(elements_data, request.transform, updated_at)
+        update_requests = [
+            UpdateOne(
+                {"_id": element_data["_id"], "project_id": project_id, "organization_id": request.organization_id},
+                update,
+            )
+            for element_data, update in zip(elements_data, updates)
+        ]
+        await self._element_collection.bulk_write(update_requests, ordered=False)
+
+        return self.Response(
+            transformed_element_ids=[element_data["_id"] for element_data in elements_data],
+            transform=request.transform,
+            updated_at=updated_at,
+            bounding_boxes=bounding_boxes,
+        )
+
+    async def _find_elements_data(self, request: "Request", element_ids: list[PyObjectUUID]) -> list[dict[str, t.Any]]:
+        return await self._element_collection.find(
+            {
+                "_id": {"$in": element_ids},
+                "project_id": request.project_id,
+                "organization_id": request.organization_id,
+            },
+            {field: 1 for field in GEOMETRY_FIELDS},
+        ).to_list()
+
+
+BaseTransformElementsDep = t.Annotated[BaseTransformElements, Depends()]
@@ -0,0 +1,98 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+from pymongo import UpdateOne
+
+from ....common.models import ElementModel, PyObjectUUID
+from ....constants.mongo import CollectionName
+from ....dependencies import LoggerDep, MongoDbDep
+from ....interfaces import IBaseComponent
+from ....utils.common import get_utc_now
+from ....utils.design_element import to_element_update
+from ....utils.logger import execute_service_method
+from .migrate_project_elements import MigrateProjectElements, MigrateProjectElementsDep
+
+IBaseUpdateBatchElements = IBaseComponent["BaseUpdateBatchElements.Request", "BaseUpdateBatchElements.Response"]
+
+
+class BaseUpdateBatchElements(IBaseUpdateBatchElements):
+    """
+    Update many elements of a project with one unordered `bulk_write`.
+
+    Elements that are missing or belong to another organization are skipped and left out of the response.
+    """
+
+    def __init__(self, db: MongoDbDep, logger: LoggerDep, migrate_project_elements: MigrateProjectElementsDep) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
+        self._logger = logger
+        self._migrate_project_elements = migrate_project_elements
+
+    class Request(p.BaseModel):
+        elements: list[ElementModel]
+        organization_id: PyObjectUUID
+        project_id: PyObjectUUID
+
+    class Response(p.BaseModel):
+        updated_elements: list[ElementModel]
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        project_id = request.project_id
+        organization_id = request.organization_id
+        if not request.elements:
+            self._logger.info("No elements provided.")
+            return self.Response(updated_elements=[])
+
+        updated_at = get_utc_now()
+        updated_elements = [element.model_copy(update={"updated_at": updated_at}) for element in request.elements]
+        # NOTE: order keys and creation dates are kept, stacking only changes through reorders
+        update_requests = [
+            UpdateOne(
+                {"_id": element.id, "project_id": project_id, "organization_id": organization_id},
+                to_element_update(element, project_id, organization_id),
+            )
+            for element in updated_elements
+        ]
+        bulk_write_result = await self._element_collection.bulk_write(update_requests, ordered=False)
+        if bulk_write_result.matched_count < len(update_requests):
+            # NOTE: the elements may still be embedded in a project that has not been migrated yet
+            await self._migrate_project_elements.aexecute(MigrateProjectElements.Request(project_id=project_id))
+            # NOTE: retried whatever this call migrated, a concurrent write may have migrated the project first, the
+            # writes that already matched only set the same values again
+            await self._element_collection.bulk_write(update_requests, ordered=False)
+
+        # NOTE: the order keys and creation dates are kept by the update, the response reports the stored ones, which
+        # also tells which elements were actually updated
+        preserved_elements_data = {
+            element_data["_id"]: element_data
+            for element_data in await self._element_collection.find(
+                {
+                    "_id": {"$in": [element.id for element in updated_elements]},
+                    "project_id": project_id,
+                    "organization_id": organization_id,
+                },
+                {"order_key": 1, "created_at": 1},
+            ).to_list()
+        }
+        if len(preserved_elements_data) < len(updated_elements):
+            self._logger.error(
+                f"Skipped {len(updated_elements) - len(preserved_elements_data)} missing or forbidden element(s) of "
+                f"project {project_id}."
+            )
+        return self.Response(
+            updated_elements=[
+                element.model_copy(
+                    update={
+                        "order_key": preserved_elements_data[element.id].get("order_key"),
+                        "created_at": preserved_elements_data[element.id].get("created_at", element.created_at),
+                    }
+                )
+                for element in updated_elements
+                if element.id in preserved_elements_data
+            ]
+        )
+
+
+BaseUpdateBatchElementsDep = t.Annotated[BaseUpdateBatchElements, Depends()]
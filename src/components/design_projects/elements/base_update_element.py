@@ -2,22 +2,28 @@ import typing as t
 
 import pydantic as p
 from fastapi import Depends
+from pymongo import ReturnDocument
 
 from ....common.models import ElementModel, PyObjectUUID
 from ....constants.mongo import CollectionName
 from ....dependencies import LoggerDep, MongoDbDep
-from ....exceptions import BadRequestError
+from ....exceptions import NotFoundError
 from ....interfaces import IBaseComponent
 from ....utils.common import get_utc_now
+from ....utils.design_element import to_element_update
 from ....utils.logger import execute_service_method
+from .resolve_element_write_miss import ResolveElementWriteMiss, ResolveElementWriteMissDep
 
-IBaseUpdateElement = IBaseComponent["BaseUpdateElement.Request", "BaseUpdateElement.Response | None"]
+IBaseUpdateElement = IBaseComponent["BaseUpdateElement.Request", "BaseUpdateElement.Response"]
 
 
 class BaseUpdateElement(IBaseUpdateElement):
-    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
-        self._collection = db.get_collection(CollectionName.DESIGN_PROJECTS)
+    def __init__(
+        self, db: MongoDbDep, logger: LoggerDep, resolve_element_write_miss: ResolveElementWriteMissDep
+    ) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
         self._logger = logger
+        self._resolve_element_write_miss = resolve_element_write_miss
 
     class Request(p.BaseModel):
         element: ElementModel
@@ -28,7 +34,7 @@ class BaseUpdateElement(IBaseUpdateElement):
     class Response(p.BaseModel):
         updated_element: ElementModel
 
-    async def aexecute(self, request: "Request") -> "Response | None":
+    async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
 
         element = request.element
@@ -36,32 +42,36 @@ class BaseUpdateElement(IBaseUpdateElement):
         organization_id = request.organization_id
         element_id = request.element_id
 
-        is_project_exist = self._collection.count_documents(
-            {"_id": project_id, "organization_id": organization_id}, limit=1
-        )
-        if is_project_exist < 1:
-            self._logger.error(f"Project with id {project_id} not found.")
-            raise BadRequestError(f"Project with id {project_id} not found.")
-
         updated_element = element.model_copy()
         updated_element.id = element_id
         updated_element.updated_at = get_utc_now()
-        updated_element_data = updated_element.model_dump(exclude={"id"}, exclude_none=True)
-        # TODO: find the matched element, update it and return the updated element
-        update_one_result = self._collection.update_one(
-            {"_id": project_id, "elements._id": element_id},
-            {"$set": {"elements.$": {"_id": element_id, **updated_element_data}}},
-        )
-
-        if update_one_result.matched_count == 0:
-            self._logger.error(f"Element with id {element_id} not found in project {project_id}.")
-            return None
-
-        if update_one_result.modified_count == 0:
-            self._logger.error(f"Failed to modify element with id {element_id} in project {project_id}.")
-            return None
-
+        # NOTE: the organization is part of the write filter, a miss is only explained after the fact
+        element_filter = {"_id": element_id, "project_id": project_id, "organization_id": organization_id}
+        element_update = to_element_update(updated_element, project_id, organization_id)
+        preserved_element_data = await self._update_element(element_filter, element_update)
+        if preserved_element_data is None:
+            resolve_element_write_miss_request = ResolveElementWriteMiss.Request(
+                organization_id=organization_id, project_id=project_id, element_id=element_id
+            )
+            await self._resolve_element_write_miss.aexecute(resolve_element_write_miss_request)
+            preserved_element_data = await self._update_element(element_filter, element_update)
+            if preserved_element_data is None:
+                await self._resolve_element_write_miss.aexecute(resolve_element_write_miss_request)
+                raise NotFoundError(f"Element with id {element_id} not found.")
+
+        # NOTE: the order key and creation date are kept by the update, the response reports the stored ones
+        updated_element.order_key = preserved_element_data.get("order_key")
+        updated_element.created_at = preserved_element_data.get("created_at", updated_element.created_at)
         return self.Response(updated_element=updated_element)
 
+    async def _update_element(self, element_filter: dict[str, t.Any], element_update: dict[str, t.Any]) -> dict | None:
+        # NOTE: the document comes back whenever the filter matched, so a write that changes nothing is no miss
+        return await self._element_collection.find_one_and_update(
+            element_filter,
+            element_update,
+            projection={"order_key": 1, "created_at": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+
 
 BaseUpdateElementDep = t.Annotated[BaseUpdateElement, Depends()]
@@ -0,0 +1,49 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+
+from ....common.models import PyObjectUUID
+from ....dependencies import LoggerDep, UserContextDep
+from ....interfaces import IBaseComponent
+from ....utils.logger import execute_service_method
+from .base_delete_batch_elements import BaseDeleteBatchElements, BaseDeleteBatchElementsDep
+
+IDeleteBatchElements = IBaseComponent["DeleteBatchElements.Request", "DeleteBatchElements.Response"]
+
+
+class DeleteBatchElements(IDeleteBatchElements):
+    def __init__(
+        self,
+        logger: LoggerDep,
+        user_context: UserContextDep,
+        base_delete_batch_elements: BaseDeleteBatchElementsDep,
+    ) -> None:
+        self._logger = logger
+        self._user_context = user_context
+        self._base_delete_batch_elements = base_delete_batch_elements
+
+    class HttpRequest(p.BaseModel):
+        element_ids: list[PyObjectUUID]
+
+    class Request(HttpRequest, p.BaseModel):
+        project_id: PyObjectUUID
+
+    class Response(BaseDeleteBatchElements.Response):
+        pass
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        base_delete_batch_elements_request = BaseDeleteBatchElements.Request(
+            element_ids=request.element_ids,
+            organization_id=self._user_context.organization_id,
+            project_id=request.project_id,
+        )
+        base_delete_batch_elements_response = await self._base_delete_batch_elements.aexecute(
+            base_delete_batch_elements_request
+        )
+        return self.Response(deleted_element_ids=base_delete_batch_elements_response.deleted_element_ids)
+
+
+DeleteBatchElementsDep = t.Annotated[DeleteBatchElements, Depends()]
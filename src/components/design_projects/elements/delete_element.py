@@ -40,11 +40,7 @@ class DeleteElement(IDeleteElement):
             organization_id=organization_id, project_id=project_id, element_id=element_id
         )
         base_delete_element_response = await self._base_delete_element.aexecute(base_delete_element_request)
-        if base_delete_element_response.success == False:
-            self._logger.error(f"Failed to delete element with id {element_id} in project {project_id}.")
-            return self.Response(success=False)
-
-        return self.Response(success=True)
+        return self.Response(success=base_delete_element_response.success)
 
 
 DeleteElementDep = t.Annotated[DeleteElement, Depends()]
@@ -3,7 +3,7 @@ import typing as t
 import pydantic as p
 from fastapi import Depends
 
-from ....common.models import PyObjectUUID
+from ....common.models import PyObjectBoundingBox, PyObjectUUID
 from ....constants.mongo import CollectionName
 from ....dependencies import LoggerDep, MongoDbDep, UserContextDep
 from ....interfaces import IBaseComponent
@@ -22,7 +22,12 @@ class GetElements(IGetElements):
         self._user_context = user_context
         self._base_get_elements = base_get_elements
 
-    class Request(p.BaseModel):
+    class HttpRequest(p.BaseModel):
+        bbox: PyObjectBoundingBox | None = p.Field(
+            default=None, description="Only return the elements visible in the `minx,miny,maxx,maxy` viewport"
+        )
+
+    class Request(HttpRequest, p.BaseModel):
         project_id: PyObjectUUID
 
     class Response(BaseGetElements.Response, p.BaseModel):
@@ -33,7 +38,9 @@ class GetElements(IGetElements):
 
         project_id = request.project_id
         organization_id = self._user_context.organization_id
-        base_get_elements_request = BaseGetElements.Request(organization_id=organization_id, project_id=project_id)
+        base_get_elements_request = BaseGetElements.Request(
+            organization_id=organization_id, project_id=project_id, viewport=request.bbox
+        )
         base_get_elements_response = await self._base_get_elements.aexecute(base_get_elements_request)
         return self.Response(**base_get_elements_response.model_dump())
 
@@ -0,0 +1,98 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+from pymongo.errors import BulkWriteError
+
+from ....common.models import PyObjectUUID
+from ....constants.mongo import CollectionName
+from ....dependencies import LoggerDep, MongoDbDep
+from ....interfaces import IBaseComponent
+from ....utils.bounding_box import to_bounding_box_document
+from ....utils.common import generate_uuid
+from ....utils.fractional_index import generate_n_keys_between
+from ....utils.logger import execute_service_method
+
+IMigrateProjectElements = IBaseComponent["MigrateProjectElements.Request", "MigrateProjectElements.Response"]
+
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+
+class MigrateProjectElements(IMigrateProjectElements):
+    """
+    Move the elements still embedded in a design project document into the `design_elements` collection.
+
+    Safe to run concurrently: elements that another run already moved are skipped, and the embedded array is only
+    unset once every element exists in the collection.
+    """
+
+    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
+        self._project_collection = db.get_collection(CollectionName.DESIGN_PROJECTS)
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
+        self._logger = logger
+
+    class Request(p.BaseModel):
+        project_id: PyObjectUUID
+
+    class Response(p.BaseModel):
+        migrated_count: int
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+        project_id = request.project_id
+
+        project_data = await self._project_collection.find_one(
+            {"_id": project_id, "elements.0": {"$exists": True}}, {"organization_id": 1, "elements": 1}
+        )
+        if not project_data:
+            return self.Response(migrated_count=0)
+
+        # NOTE: the raw documents are moved as they are so that no legacy field is lost to validation
+        # NOTE: the embedded array was kept front-most first, the order keys preserve that stacking
+        order_keys = generate_n_keys_between(None, None, len(project_data["elements"]))
+        element_documents = [
+            {
+                **element_data,
+                "project_id": project_id,
+                "organization_id": project_data["organization_id"],
+                "order_key": order_key,
+                "bbox": to_bounding_box_document(element_data),
+            }
+            for element_data, order_key in zip(project_data["elements"], reversed(order_keys))
+        ]
+        migrated_count = await self._insert_element_documents(project_id, element_documents)
+        await self._project_collection.update_one({"_id": project_id}, {"$unset": {"elements": ""}})
+
+        self._logger.info(f"Migrated {migrated_count} element(s) of project {project_id} to their own collection.")
+        return self.Response(migrated_count=migrated_count)
+
+    async def _insert_element_documents(self, project_id: PyObjectUUID, element_documents: list[dict]) -> int:
+        try:
+            await self._element_collection.insert_many(element_documents, ordered=False)
+            return len(element_documents)
+        except BulkWriteError as e:
+            write_errors = e.details.get("writeErrors", [])
+            if any(write_error["code"] != DUPLICATE_KEY_ERROR_CODE for write_error in write_errors):
+                raise
+
+        duplicated_documents = [element_documents[write_error["index"]] for write_error in write_errors]
+        migrated_ids = {
+            element_data["_id"]
+            for element_data in await self._element_collection.find(
+                {"_id": {"$in": [document["_id"] for document in duplicated_documents]}, "project_id": project_id},
+                {"_id": 1},
+            ).to_list()
+        }
+        # NOTE: duplicated projects used to share element ids, the copies get fresh ids once they own a document
+        conflicting_documents = [
+            {**document, "_id": generate_uuid()}
+            for document in duplicated_documents
+            if document["_id"] not in migrated_ids
+        ]
+        if conflicting_documents:
+            await self._element_collection.insert_many(conflicting_documents)
+
+        return len(element_documents) - len(migrated_ids)
+
+
+MigrateProjectElementsDep = t.Annotated[MigrateProjectElements, Depends()]
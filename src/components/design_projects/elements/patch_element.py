@@ -0,0 +1,52 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+
+from ....common.models import ElementPatchModel, PyObjectUUID
+from ....dependencies import LoggerDep, UserContextDep
+from ....interfaces import IBaseComponent
+from ....utils.logger import execute_service_method
+from .base_patch_element import BasePatchElement, BasePatchElementDep
+
+IPatchElement = IBaseComponent["PatchElement.Request", "PatchElement.Response"]
+
+
+class PatchElement(IPatchElement):
+    def __init__(
+        self, logger: LoggerDep, user_context: UserContextDep, base_patch_element: BasePatchElementDep
+    ) -> None:
+        self._logger = logger
+        self._user_context = user_context
+        self._base_patch_element = base_patch_element
+
+    class HttpRequest(p.BaseModel):
+        patch: ElementPatchModel
+
+    class Request(HttpRequest, p.BaseModel):
+        project_id: PyObjectUUID
+        element_id: PyObjectUUID
+
+    class Response(BasePatchElement.Response):
+        pass
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        element_id = request.element_id
+        base_patch_element_request = BasePatchElement.Request(
+            patch=request.patch,
+            organization_id=self._user_context.organization_id,
+            project_id=request.project_id,
+            element_id=element_id,
+        )
+        base_patch_element_response = await self._base_patch_element.aexecute(base_patch_element_request)
+
+        return self.Response(
+            patched_element_id=base_patch_element_response.patched_element_id,
+            patch=base_patch_element_response.patch,
+            updated_at=base_patch_element_response.updated_at,
+        )
+
+
+PatchElementDep = t.Annotated[PatchElement, Depends()]
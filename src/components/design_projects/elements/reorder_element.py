@@ -0,0 +1,50 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+
+from ....common.models import ElementPlacementModel, PyObjectUUID
+from ....dependencies import LoggerDep, UserContextDep
+from ....interfaces import IBaseComponent
+from ....utils.logger import execute_service_method
+from .base_reorder_element import BaseReorderElement, BaseReorderElementDep
+
+IReorderElement = IBaseComponent["ReorderElement.Request", "ReorderElement.Response"]
+
+
+class ReorderElement(IReorderElement):
+    def __init__(
+        self, logger: LoggerDep, user_context: UserContextDep, base_reorder_element: BaseReorderElementDep
+    ) -> None:
+        self._logger = logger
+        self._user_context = user_context
+        self._base_reorder_element = base_reorder_element
+
+    class HttpRequest(ElementPlacementModel, p.BaseModel):
+        pass
+
+    class Request(HttpRequest, p.BaseModel):
+        project_id: PyObjectUUID
+        element_id: PyObjectUUID
+
+    class Response(BaseReorderElement.Response):
+        pass
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        base_reorder_element_request = BaseReorderElement.Request(
+            organization_id=self._user_context.organization_id,
+            project_id=request.project_id,
+            element_id=request.element_id,
+            placement=ElementPlacementModel(placement=request.placement, target_element_id=request.target_element_id),
+        )
+        base_reorder_element_response = await self._base_reorder_element.aexecute(base_reorder_element_request)
+
+        return self.Response(
+            reordered_element_id=base_reorder_element_response.reordered_element_id,
+            order_key=base_reorder_element_response.order_key,
+        )
+
+
+ReorderElementDep = t.Annotated[ReorderElement, Depends()]
@@ -0,0 +1,84 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+
+from ....common.models import PyObjectUUID
+from ....constants.mongo import CollectionName
+from ....dependencies import LoggerDep, MongoDbDep
+from ....exceptions import BadRequestError, ForbiddenError, NotFoundError
+from ....interfaces import IBaseComponent
+from ....utils.logger import execute_service_method
+from .migrate_project_elements import MigrateProjectElements, MigrateProjectElementsDep
+
+IResolveElementWriteMiss = IBaseComponent["ResolveElementWriteMiss.Request", "ResolveElementWriteMiss.Response"]
+
+
+class ResolveElementWriteMiss(IResolveElementWriteMiss):
+    """
+    Explain why an element write filtered by `_id`, `project_id` and `organization_id` matched nothing.
+
+    Element writes carry the organization check in their own filter, so this only runs on the failure path. It raises
+    `ForbiddenError` when the element belongs to another organization, `NotFoundError` when it does not exist and
+    `BadRequestError` when it exists but the rest of the write filter did not match. It returns only when the element
+    was still embedded in the project and exists once the project is migrated, whether by this call or by a concurrent
+    write, in which case the write should be retried.
+    """
+
+    def __init__(self, db: MongoDbDep, logger: LoggerDep, migrate_project_elements: MigrateProjectElementsDep) -> None:
+        self._element_collection = db.get_collection(CollectionName.DESIGN_ELEMENTS)
+        self._logger = logger
+        self._migrate_project_elements = migrate_project_elements
+
+    class Request(p.BaseModel):
+        organization_id: PyObjectUUID
+        project_id: PyObjectUUID
+        element_id: PyObjectUUID
+
+    class Response(p.BaseModel):
+        migrated_count: int
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        organization_id = request.organization_id
+        project_id = request.project_id
+        element_id = request.element_id
+
+        element_data = await self._find_element_data(project_id, element_id)
+        if element_data:
+            self._check_organization(element_data, organization_id, project_id, element_id)
+            self._logger.error(f"Element with id {element_id} in project {project_id} does not match the write.")
+            raise BadRequestError(f"Element with id {element_id} does not match the requested change.")
+
+        # NOTE: the element may still be embedded in a project that has not been migrated yet
+        migrate_project_elements_response = await self._migrate_project_elements.aexecute(
+            MigrateProjectElements.Request(project_id=project_id)
+        )
+        # NOTE: read again rather than trusting the migrated count, a concurrent write may have migrated it first
+        element_data = await self._find_element_data(project_id, element_id)
+        if element_data is None:
+            self._logger.error(f"Element with id {element_id} not found in project {project_id}.")
+            raise NotFoundError(f"Element with id {element_id} not found.")
+
+        self._check_organization(element_data, organization_id, project_id, element_id)
+        return self.Response(migrated_count=migrate_project_elements_response.migrated_count)
+
+    async def _find_element_data(self, project_id: PyObjectUUID, element_id: PyObjectUUID) -> dict[str, t.Any] | None:
+        return await self._element_collection.find_one(
+            {"_id": element_id, "project_id": project_id}, {"organization_id": 1}
+        )
+
+    def _check_organization(
+        self,
+        element_data: dict[str, t.Any],
+        organization_id: PyObjectUUID,
+        project_id: PyObjectUUID,
+        element_id: PyObjectUUID,
+    ) -> None:
+        if element_data.get("organization_id") != organization_id:
+            self._logger.error(f"User have no permission to modify element {element_id} of project {project_id}.")
+            raise ForbiddenError("User have no permission to modify the element.")
+
+
+ResolveElementWriteMissDep = t.Annotated[ResolveElementWriteMiss, Depends()]
@@ -0,0 +1,53 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+
+from ....common.models import AffineTransformModel, PyObjectUUID
+from ....dependencies import LoggerDep, UserContextDep
+from ....interfaces import IBaseComponent
+from ....utils.logger import execute_service_method
+from .base_transform_elements import BaseTransformElements, BaseTransformElementsDep
+
+ITransformElements = IBaseComponent["TransformElements.Request", "TransformElements.Response"]
+
+
+class TransformElements(ITransformElements):
+    def __init__(
+        self,
+        logger: LoggerDep,
+        user_context: UserContextDep,
+        base_transform_elements: BaseTransformElementsDep,
+    ) -> None:
+        self._logger = logger
+        self._user_context = user_context
+        self._base_transform_elements = base_transform_elements
+
+    class HttpRequest(p.BaseModel):
+        element_ids: list[PyObjectUUID]
+        transform: AffineTransformModel
+
+    class Request(HttpRequest, p.BaseModel):
+        project_id: PyObjectUUID
+
+    class Response(BaseTransformElements.Response):
+        pass
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        base_transform_elements_request = BaseTransformElements.Request(
+            organization_id=self._user_context.organization_id,
+            project_id=request.project_id,
+            element_ids=request.element_ids,
+            transform=request.transform,
+        )
+        base_transform_elements_response = await self._base_transform_elements.aexecute(base_transform_elements_request)
+        return self.Response(
+            transformed_element_ids=base_transform_elements_response.transformed_element_ids,
+            transform=base_transform_elements_response.transform,
+            updated_at=base_transform_elements_response.updated_at,
+        )
+
+
+TransformElementsDep = t.Annotated[TransformElements, Depends()]
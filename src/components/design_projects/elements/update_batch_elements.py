@@ -0,0 +1,49 @@
+import typing as t
+
+import pydantic as p
+from fastapi import Depends
+
+from ....common.models import ElementModel, PyObjectUUID
+from ....dependencies import LoggerDep, UserContextDep
+from ....interfaces import IBaseComponent
+from ....utils.logger import execute_service_method
+from .base_update_batch_elements import BaseUpdateBatchElements, BaseUpdateBatchElementsDep
+
+IUpdateBatchElements = IBaseComponent["UpdateBatchElements.Request", "UpdateBatchElements.Response"]
+
+
+class UpdateBatchElements(IUpdateBatchElements):
+    def __init__(
+        self,
+        logger: LoggerDep,
+        user_context: UserContextDep,
+        base_update_batch_elements: BaseUpdateBatchElementsDep,
+    ) -> None:
+        self._logger = logger
+        self._user_context = user_context
+        self._base_update_batch_elements = base_update_batch_elements
+
+    class HttpRequest(p.BaseModel):
+        elements: list[ElementModel]
+
+    class Request(HttpRequest, p.BaseModel):
+        project_id: PyObjectUUID
+
+    class Response(BaseUpdateBatchElements.Response):
+        pass
+
+    async def aexecute(self, request: "Request") -> "Response":
+        self._logger.info(execute_service_method(self))
+
+        base_update_batch_elements_request = BaseUpdateBatchElements.Request(
+            elements=request.elements,
+            organization_id=self._user_context.organization_id,
+            project_id=request.project_id,
+        )
+        base_update_batch_elements_response = await self._base_update_batch_elements.aexecute(
+            base_update_batch_elements_request
+        )
+        return self.Response(updated_elements=base_update_batch_elements_response.updated_elements)
+
+
+UpdateBatchElementsDep = t.Annotated[UpdateBatchElements, Depends()]
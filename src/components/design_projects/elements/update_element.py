@@ -6,7 +6,6 @@ from fastapi import Depends
 from ....common.models import ElementModel, PyObjectUUID
 from ....constants.mongo import CollectionName
 from ....dependencies import LoggerDep, MongoDbDep, UserContextDep
-from ....exceptions import BadRequestError
 from ....interfaces import IBaseComponent
 from ....utils.logger import execute_service_method
 from .base_update_element import BaseUpdateElementDep
@@ -44,9 +43,6 @@ class UpdateElement(IUpdateElement):
             element_id=element_id,
         )
         base_update_element_response = await self._base_update_element.aexecute(base_update_element_request)
-        if not base_update_element_response:
-            self._logger.error(f"Failed to update element with id {element_id}.")
-            raise BadRequestError(f"Failed to update element with id {element_id}.")
 
         updated_element = base_update_element_response.updated_element
         return self.Response(updated_element=updated_element)
@@ -27,7 +27,7 @@ class GetDesignProjectById(IGetDesignProjectById):
     async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
         filter = {"_id": request.project_id}
-        project_data = self._collection.find_one(filter)
+        project_data = await self._collection.find_one(filter)
         if not project_data:
             self._logger.info(f"Project with id {request.project_id} not found.")
             raise NotFoundError(f"Project with id {request.project_id} not found.")
@@ -3,8 +3,10 @@ import typing as t
 import pydantic as p
 from fastapi import Depends
 
-from ...common.models import DesignProjectModel
+from ...common.models import PyObjectUUID
+from ...common.models.base import BaseModelWithDateTime, BaseModelWithId
 from ...constants.mongo import CollectionName
+from ...database.projection import create_projection
 from ...dependencies import LoggerDep, MongoDbDep, UserContextDep
 from ...interfaces import IBaseComponentWithoutRequest
 from ...utils.logger import execute_service_method
@@ -18,15 +20,22 @@ class GetDesignProjectsByOrganizationId(IGetDesignProjectsByOrganizationId):
         self._logger = logger
         self._user_context = user_context
 
+    class DesignProjectSummary(BaseModelWithId, BaseModelWithDateTime):
+        name: str = p.Field(alias="name")
+        thumbnail_url: str | None = p.Field(default=None, alias="thumbnail_url")
+        organization_id: PyObjectUUID = p.Field(alias="organization_id")
+        owner_id: PyObjectUUID = p.Field(alias="owner_id")
+
     class Response(p.BaseModel):
-        projects: t.List[DesignProjectModel]
+        projects: t.List["GetDesignProjectsByOrganizationId.DesignProjectSummary"]
 
     async def aexecute(self) -> "Response":
         self._logger.info(execute_service_method(self))
         filter = {"organization_id": self._user_context.organization_id}
-        projects_data = self._collection.find(filter)
+        projection = create_projection(self.DesignProjectSummary)
+        projects_data = await self._collection.find(filter, projection).to_list()
 
-        projects = [DesignProjectModel(**project) for project in projects_data]
+        projects = [self.DesignProjectSummary(**project) for project in projects_data]
         return self.Response(projects=projects)
 
 
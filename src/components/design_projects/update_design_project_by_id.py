@@ -48,7 +48,7 @@ class UpdateDesignProject(IUpdateDesignProject):
             raise BadRequestError(error_message)
 
         filter = {"_id": request.project_id}
-        project_data = self._collection.find_one(filter)
+        project_data = await self._collection.find_one(filter)
 
         if project_data is None:
             log_message = f"Project with id {request.project_id} not found."
@@ -82,7 +82,9 @@ class UpdateDesignProject(IUpdateDesignProject):
             updated_project.thumbnail_url = str(request.thumbnail_url)
         updated_project.updated_at = get_utc_now()
 
-        self._collection.update_one({"_id": updated_project.id}, {"$set": updated_project.model_dump(exclude={"id"})})
+        await self._collection.update_one(
+            {"_id": updated_project.id}, {"$set": updated_project.model_dump(exclude={"id"})}
+        )
 
         return self.Response(updated_project=updated_project)
 
@@ -49,7 +49,7 @@ class AcceptOrRejectInvitation(IAcceptOrRejectInvitation):
 
     async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
-        invitation_data = self._invitation_collection.find_one({"_id": request.invitation_id})
+        invitation_data = await self._invitation_collection.find_one({"_id": request.invitation_id})
         if not invitation_data:
             self._logger.error(f"Invitation with ID {request.invitation_id} not found.")
             return self.Response(success=False)
@@ -110,7 +110,9 @@ class AcceptOrRejectInvitation(IAcceptOrRejectInvitation):
         invitation.taken_action = TakenAction(action=invitee_action, taken_at=now)
         invitation.status = InvitationStatus.Completed
         invitation.updated_at = now
-        self._invitation_collection.update_one({"_id": invitation.id}, {"$set": invitation.model_dump(exclude={"id"})})
+        await self._invitation_collection.update_one(
+            {"_id": invitation.id}, {"$set": invitation.model_dump(exclude={"id"})}
+        )
         return self.Response(success=True)
 
 
@@ -1,17 +1,18 @@
 import typing as t
+from datetime import timedelta
 from uuid import UUID
 
 import pydantic as p
 from fastapi import Depends
-from pymongo.cursor import Cursor
 
-from ...common.models import JoinOrganizationInvitationModel, OrganizationModel
+from ...common.models import JoinOrganizationInvitationModel, PyObjectUUID
 from ...constants.mongo import CollectionName
 from ...dependencies import LoggerDep, MongoDbDep, UserContextDep
-from ...exceptions import BadRequestError, InternalServerError
+from ...exceptions import BadRequestError
 from ...interfaces import IBaseComponent
+from ...utils.common import get_utc_now
 from ...utils.logger import execute_service_method
-from .create_join_organization_invitation import CreateJoinOrganizationInvitationDep
+from .create_join_organization_invitation import INVITATION_EXPIRATION_DAYS
 
 ICreateBatchJoinOrganizationInvitation = IBaseComponent[
     "CreateBatchJoinOrganizationInvitation.Request", "CreateBatchJoinOrganizationInvitation.Response"
@@ -24,12 +25,15 @@ class CreateBatchJoinOrganizationInvitation(ICreateBatchJoinOrganizationInvitati
         db: MongoDbDep,
         logger: LoggerDep,
         user_context: UserContextDep,
-        create_invitation: CreateJoinOrganizationInvitationDep,
     ) -> None:
         self._organization_collection = db.get_collection(CollectionName.ORGANIZATIONS)
+        self._invitation_collection = db.get_collection(CollectionName.JOIN_ORGANIZATION_INVITATIONS)
         self._logger = logger
         self._user_context = user_context
-        self._create_invitation = create_invitation
+
+    class Receiver(p.BaseModel):
+        id: PyObjectUUID = p.Field(alias="_id")
+        has_pending_invitation: bool = p.Field(alias="has_pending_invitation")
 
     class Request(p.BaseModel):
         user_ids: t.List["UUID"]
@@ -37,31 +41,93 @@ class CreateBatchJoinOrganizationInvitation(ICreateBatchJoinOrganizationInvitati
     class Response(p.BaseModel):
         invitations: t.List["JoinOrganizationInvitationModel"]
 
+    def _make_pipeline(self, organization_id: UUID, sender_id: UUID, receiver_ids: list[UUID]) -> list[dict]:
+        pending_invitation_filter = {
+            "$expr": {"$eq": ["$receiver_id", "$$receiver_id"]},
+            "organization_id": organization_id,
+            "taken_action": None,
+            "expires_at": {"$gt": get_utc_now()},
+            "is_deleted": False,
+        }
+        return [
+            # NOTE: no document comes back when the sender is not the owner of the organization
+            {"$match": {"_id": organization_id, "owner_id": sender_id}},
+            {"$project": {"_id": 1}},
+            {
+                "$lookup": {
+                    "from": CollectionName.USERS,
+                    "pipeline": [
+                        {"$match": {"_id": {"$in": receiver_ids}, "is_deleted": False}},
+                        {
+                            "$lookup": {
+                                "from": CollectionName.JOIN_ORGANIZATION_INVITATIONS,
+                                "let": {"receiver_id": "$_id"},
+                                "pipeline": [
+                                    {"$match": pending_invitation_filter},
+                                    {"$limit": 1},
+                                    {"$project": {"_id": 1}},
+                                ],
+                                "as": "pending_invitations",
+                            }
+                        },
+                        {
+                            "$project": {
+                                "_id": 1,
+                                "has_pending_invitation": {"$gt": [{"$size": "$pending_invitations"}, 0]},
+                            }
+                        },
+                    ],
+                    "as": "receivers",
+                }
+            },
+        ]
+
     async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
-        receiver_ids = request.user_ids
+        # NOTE: keep the first occurrence of every receiver so a repeated id never creates two invitations
+        receiver_ids = list(dict.fromkeys(request.user_ids))
         organization_id = self._user_context.organization_id
         sender_id = self._user_context.user_id
 
-        # check if the invitation sender is the owner of the organization
-        filter = {
-            "_id": organization_id,
-            "owner_id": sender_id,
-        }
-        organization_data = self._organization_collection.find_one(filter)
-
-        if organization_data is None:
+        # check ownership, receivers and pending invitations in a single round trip
+        cursor = await self._organization_collection.aggregate(
+            self._make_pipeline(organization_id, sender_id, receiver_ids)
+        )
+        organizations_data = await cursor.to_list()
+        if not organizations_data:
             log_message = f"Can not create workspace invitation(s). user with id={sender_id} is not the owner of the organizaton with id={organization_id}"
             error_message = f"Can not create workspace invitation(s). user is not the owner of the organizaton with id"
             self._logger.error(log_message)
             raise BadRequestError(error_message)
 
-        # process create multi invitations
-        invitation_responses = [
-            await self._create_invitation.aexecute(CreateJoinOrganizationInvitationDep.Request(user_id=user_id))
-            for user_id in receiver_ids
-        ]
-        return self.Response(invitations=list(map(lambda response: response.invitation, invitation_responses)))
+        receivers = {
+            receiver.id: receiver
+            for receiver in (self.Receiver(**receiver_data) for receiver_data in organizations_data[0]["receivers"])
+        }
+        missing_receiver_ids = [receiver_id for receiver_id in receiver_ids if receiver_id not in receivers]
+        if missing_receiver_ids:
+            self._logger.error(f"Users with ids {missing_receiver_ids} are not found.")
+            raise BadRequestError("User is not found.")
+
+        expires_at = get_utc_now() + timedelta(days=INVITATION_EXPIRATION_DAYS)
+        invitations: list[JoinOrganizationInvitationModel] = []
+        for receiver_id in receiver_ids:
+            if receivers[receiver_id].has_pending_invitation:
+                self._logger.info(f"User with id {receiver_id} already has a pending invitation, skipping.")
+                continue
+
+            invitations.append(
+                JoinOrganizationInvitationModel(
+                    organization_id=organization_id,
+                    sender_id=sender_id,
+                    receiver_id=receiver_id,
+                    taken_action=None,
+                    expires_at=expires_at,
+                )
+            )
+
+        created_invitations = await self._invitation_collection.insert_models(invitations)
+        return self.Response(invitations=created_invitations)
 
 
 CreateBatchJoinOrganizationInvitationDep = t.Annotated[CreateBatchJoinOrganizationInvitation, Depends()]
@@ -7,7 +7,7 @@ from fastapi import Depends
 from ...common.models import JoinOrganizationInvitationModel, PyObjectUUID
 from ...constants.mongo import CollectionName
 from ...dependencies import LoggerDep, MongoDbDep, UserContextDep
-from ...exceptions import BadRequestError, InternalServerError
+from ...exceptions import BadRequestError
 from ...interfaces import IBaseComponent
 from ...utils.common import get_utc_now
 from ...utils.logger import execute_service_method
@@ -46,13 +46,15 @@ class CreateJoinOrganizationInvitation(ICreateJoinOrganizationInvitation):
         sender_id = self._user_context.user_id
 
         # check if the invitation sender is the owner of the organization
-        organization_data = self._organization_collection.find_one({"_id": organization_id, "owner_id": sender_id})
+        organization_data = await self._organization_collection.find_one(
+            {"_id": organization_id, "owner_id": sender_id}, {"_id": 1}
+        )
         if not organization_data:
             self._logger.error(f"User with id {sender_id}) has no permission to send invitation.")
             raise BadRequestError("User has no permission to send invitation.")
 
         # check if receiver is a valid user in database
-        user_data = self._user_collection.find_one({"_id": receiver_id})
+        user_data = await self._user_collection.find_one({"_id": receiver_id}, {"_id": 1})
         if not user_data:
             self._logger.error(f"User with id {receiver_id} is not found.")
             raise BadRequestError("User is not found.")
@@ -67,18 +69,7 @@ class CreateJoinOrganizationInvitation(ICreateJoinOrganizationInvitation):
             taken_action=None,
             expires_at=expires_at,
         )
-        invitation_data = invitation.model_dump(by_alias=True)
-        inserted_invitation = self._invitation_collection.insert_one(invitation_data)
-        created_invitation = self._invitation_collection.find_one({"_id": inserted_invitation.inserted_id})
-        if not created_invitation:
-            self._logger.error(
-                f"Insert join_organization_invitation data with id {inserted_invitation.inserted_id} successfully, but unable to find the created join organization_invitation"
-            )
-            raise InternalServerError(
-                "Insert join_rganization_invitation data successfully, but unable to find the created join organization_invitation"
-            )
-
-        created_invitation = JoinOrganizationInvitationModel(**created_invitation)
+        created_invitation = await self._invitation_collection.insert_model(invitation)
         return self.Response(invitation=created_invitation)
 
 
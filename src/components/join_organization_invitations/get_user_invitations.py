@@ -3,31 +3,27 @@ import typing as t
 import pydantic as p
 from fastapi import Depends
 
-from ...common.models import InvitationStatus, JoinOrganizationInvitationModel, PyObjectDatetime, PyObjectUUID
+from ...common.models import InvitationStatus, PyObjectDatetime, PyObjectUUID
 from ...constants.mongo import CollectionName
 from ...dependencies import LoggerDep, MongoDbDep, UserContextDep
-from ...interfaces import IBaseComponentWithoutRequest
+from ...interfaces import IBaseComponent
 from ...utils.common import get_utc_now
 from ...utils.logger import execute_service_method
-from ..organizations import GetOrganizationById, GetOrganizationByIdDep
-from ..users import GetUserById, GetUserByIdDep
 
-IGetUserInvitations = IBaseComponentWithoutRequest["GetUserInvitations.Response"]
+IGetUserInvitations = IBaseComponent["GetUserInvitations.Request", "GetUserInvitations.Response"]
 
 INVITATION_EXPIRATION_DAYS = 3
+DEFAULT_INVITATIONS_PAGE_SIZE = 50
+MAX_INVITATIONS_PAGE_SIZE = 200
 
 
 class GetUserInvitations(IGetUserInvitations):
     def __init__(
         self,
-        get_organization_by_id: GetOrganizationByIdDep,
-        get_user_by_id: GetUserByIdDep,
         db: MongoDbDep,
         logger: LoggerDep,
         user_context: UserContextDep,
     ) -> None:
-        self._get_organization_by_id = get_organization_by_id
-        self._get_user_by_id = get_user_by_id
         self._collection = db.get_collection(CollectionName.JOIN_ORGANIZATION_INVITATIONS)
         self._logger = logger
         self._user_context = user_context
@@ -47,8 +43,13 @@ class GetUserInvitations(IGetUserInvitations):
         created_at: PyObjectDatetime = p.Field(alias="created_at")
         is_read: bool = p.Field(alias="is_read")
 
+    class Request(p.BaseModel):
+        skip: int = p.Field(default=0, ge=0)
+        limit: int = p.Field(default=DEFAULT_INVITATIONS_PAGE_SIZE, ge=1, le=MAX_INVITATIONS_PAGE_SIZE)
+
     class Response(p.BaseModel):
         invitations: list["GetUserInvitations.UserInvitation"]
+        has_more: bool = p.Field(default=False)
 
     def _make_query(self, receiver_id: PyObjectUUID) -> dict:
         return {
@@ -57,42 +58,70 @@ class GetUserInvitations(IGetUserInvitations):
             "expires_at": {"$gt": get_utc_now()},
         }
 
-    async def aexecute(self) -> "Response":
+    def _make_lookup(self, from_collection: str, local_field: str, as_field: str, projection: dict) -> dict:
+        return {
+            "$lookup": {
+                "from": from_collection,
+                "let": {"id": f"${local_field}"},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$_id", "$$id"]}, "is_deleted": False}},
+                    {"$project": projection},
+                ],
+                "as": as_field,
+            }
+        }
+
+    def _make_pipeline(self, receiver_id: PyObjectUUID, skip: int, limit: int) -> list[dict]:
+        return [
+            {"$match": self._make_query(receiver_id)},
+            # NOTE: equality on `receiver_id` + `taken_action` lets the compound index return documents already
+            # sorted on `expires_at`, which is `created_at` plus a fixed expiration, so this is newest first
+            {"$sort": {"expires_at": -1}},
+            {"$skip": skip},
+            # NOTE: one extra document tells whether another page exists without a separate count
+            {"$limit": limit + 1},
+            self._make_lookup(CollectionName.ORGANIZATIONS, "organization_id", "organization", {"_id": 0, "name": 1}),
+            self._make_lookup(CollectionName.USERS, "sender_id", "sender", {"_id": 0, "username": 1}),
+            # NOTE: dangling references are kept so that paging stays stable, they are skipped after the query
+            {"$unwind": {"path": "$organization", "preserveNullAndEmptyArrays": True}},
+            {"$unwind": {"path": "$sender", "preserveNullAndEmptyArrays": True}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "id": "$_id",
+                    "organization": 1,
+                    "sender": 1,
+                    "status": 1,
+                    "expires_at": 1,
+                    "created_at": 1,
+                    "is_read": 1,
+                }
+            },
+        ]
+
+    async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
         receiver_id = self._user_context.user_id
-        query_filter = self._make_query(receiver_id)
+        pipeline = self._make_pipeline(receiver_id, request.skip, request.limit)
 
-        invitations_data = self._collection.find(query_filter)
-        invitations = [JoinOrganizationInvitationModel(**invitation_data) for invitation_data in invitations_data]
+        cursor = await self._collection.aggregate(pipeline)
+        invitations_data = await cursor.to_list()
 
+        has_more = len(invitations_data) > request.limit
         user_invitations = []
-        for invitation in invitations:
-            organization_id = invitation.organization_id
-            get_organization_by_id_response = await self._get_organization_by_id.aexecute(
-                GetOrganizationById.Request(id=organization_id)
-            )
-            if not get_organization_by_id_response.organization:
-                self._logger.error(f"Organization with id {organization_id} not found.")
+        for invitation_data in invitations_data[: request.limit]:
+            invitation_id = invitation_data["id"]
+            if "organization" not in invitation_data:
+                self._logger.error(f"Organization of invitation with id {invitation_id} not found.")
                 continue
 
-            sender_id = invitation.sender_id
-            get_user_by_id_response = await self._get_user_by_id.aexecute(GetUserById.Request(user_id=sender_id))
-            if not get_user_by_id_response.user:
-                self._logger.error(f"User with id {sender_id} not found.")
+            if "sender" not in invitation_data:
+                self._logger.error(f"Sender of invitation with id {invitation_id} not found.")
                 continue
 
-            user_invitation = self.UserInvitation(
-                id=invitation.id,
-                organization=self.Organization(name=get_organization_by_id_response.organization.name),
-                sender=self.Sender(username=get_user_by_id_response.user.username),
-                status=invitation.status,
-                expires_at=invitation.expires_at,
-                created_at=invitation.created_at,
-                is_read=invitation.is_read,
-            )
-            user_invitations.append(user_invitation)
-
-        return self.Response(invitations=user_invitations)
+            user_invitations.append(self.UserInvitation(**invitation_data))
+
+        return self.Response(invitations=user_invitations, has_more=has_more)
 
 
 GetUserInvitationsDep = t.Annotated[GetUserInvitations, Depends()]
@@ -50,7 +50,7 @@ class MarkInvitationReadOrUnread(IMarkInvitationReadOrUnread):
         query = {
             "_id": invitation_id,
         }
-        invitation_data = self._collection.find_one(query)
+        invitation_data = await self._collection.find_one(query)
         if not invitation_data:
             self._logger.error(f"Invitation with id {invitation_id} not found.")
             return self.Response(success=False)
@@ -62,7 +62,7 @@ class MarkInvitationReadOrUnread(IMarkInvitationReadOrUnread):
 
         invitation.is_read = is_read
         invitation.updated_at = get_utc_now()
-        update_result = self._collection.update_one(query, {"$set": invitation.model_dump(exclude={"id"})})
+        update_result = await self._collection.update_one(query, {"$set": invitation.model_dump(exclude={"id"})})
         if not update_result.modified_count:
             self._logger.error(f"Failed to mark invitation is_read {is_read} with id {invitation_id}.")
             return self.Response(success=False)
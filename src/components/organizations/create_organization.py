@@ -40,15 +40,7 @@ class CreateOrganization(ICreateOrganization):
             owner_id=owner_id,
             is_default=request.is_default,
         )
-        inserted_organization = self._collection.insert_one(organization.model_dump(by_alias=True))
-        created_organization = self._collection.find_one({"_id": inserted_organization.inserted_id})
-        if not created_organization:
-            self._logger.error(
-                f"Insert organization data with id {inserted_organization.inserted_id} successfully, but unable to find the created organization"
-            )
-            raise InternalServerError(
-                "Insert organization data successfully, but unable to find the created organization"
-            )
+        await self._collection.insert_model(organization)
 
         add_user_to_organization_request = AddUserToOrganization.Request(
             organization_id=organization.id,
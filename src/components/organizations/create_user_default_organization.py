@@ -40,7 +40,7 @@ class CreateUserDefaultOrganization(ICreateUserDefaultOrganization):
             "owner_id": owner_id,
             "is_default": True,
         }
-        organization_data = self._collection.find_one(filter)
+        organization_data = await self._collection.find_one(filter)
         if organization_data:
             log_message = (
                 f"the user {owner_id} has already owned a default organization. Can not create another default."
@@ -42,7 +42,7 @@ class CreateUserOrganization(ICreateUserOrganization):
             "owner_id": self._user_context.user_id,
             "is_default": True,
         }
-        organization_data = self._collection.find_one(filter)
+        organization_data = await self._collection.find_one(filter)
         create_organization_request = CreateOrganization.Request(
             name=request.name,
             avatar_url=request.avatar_url,
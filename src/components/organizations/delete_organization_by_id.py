@@ -36,7 +36,7 @@ class DeleteOrganizationById(IDeleteOrganizationById):
             "_id": organization_id,
             "owner_id": self._user_context.user_id,
         }
-        organization_data = self._collection.find_one(filter)
+        organization_data = await self._collection.find_one(filter)
 
         if organization_data is None:
             error_message = f"Organization with id {organization_id} not found."
@@ -55,7 +55,7 @@ class DeleteOrganizationById(IDeleteOrganizationById):
         organization.is_deleted = True
         organization.deleted_at = get_utc_now()
 
-        self._collection.update_one(
+        await self._collection.update_one(
             {"_id": organization.id}, {"$set": organization.model_dump(exclude={"id", "is_default"})}
         )
         return self.Response(deleted_organization=organization)
@@ -4,8 +4,7 @@ import pydantic as p
 from fastapi import Depends
 
 from ...common.models import OrganizationModel, PyObjectUUID
-from ...constants.mongo import CollectionName
-from ...dependencies import LoggerDep, MongoDbDep
+from ...dependencies import LoggerDep, OrganizationLoaderDep
 from ...interfaces import IBaseComponent
 from ...utils.logger import execute_service_method
 
@@ -13,8 +12,8 @@ IGetOrganizationById = IBaseComponent["GetOrganizationById.Request", "GetOrganiz
 
 
 class GetOrganizationById(IGetOrganizationById):
-    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
-        self._collection = db.get_collection(CollectionName.ORGANIZATIONS)
+    def __init__(self, organization_loader: OrganizationLoaderDep, logger: LoggerDep) -> None:
+        self._organization_loader = organization_loader
         self._logger = logger
 
     class Request(p.BaseModel):
@@ -25,13 +24,7 @@ class GetOrganizationById(IGetOrganizationById):
 
     async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
-        organization_id = request.id
-        filter = {"_id": organization_id}
-        organization_data = self._collection.find_one(filter)
-        if not organization_data:
-            return self.Response(organization=None)
-
-        organization = OrganizationModel(**organization_data)
+        organization = await self._organization_loader.load(request.id)
         return self.Response(organization=organization)
 
 
@@ -2,31 +2,29 @@ import typing as t
 
 import pydantic as p
 from fastapi import Depends
+from pymongo import ASCENDING, DESCENDING
 
-from ...common.models import PyObjectDatetime, PyObjectUUID, UserModel, UserRole
+from ...common.models import PyObjectDatetime, PyObjectUUID, UserRole
 from ...constants.mongo import CollectionName
+from ...database.projection import create_projection
 from ...dependencies import LoggerDep, MongoDbDep
 from ...interfaces import IBaseComponent
-from ...utils.common import find
 from ...utils.logger import execute_service_method
-from ..users import GetUserByIdDep
-from .get_organization_by_id import GetOrganizationById, GetOrganizationByIdDep
 
 IGetOrganizationMembers = IBaseComponent["GetOrganizationMembers.Request", "GetOrganizationMembers.Response"]
 
+DEFAULT_MEMBERS_PAGE_SIZE = 50
+MAX_MEMBERS_PAGE_SIZE = 200
+
 
 class GetOrganizationMembers(IGetOrganizationMembers):
-    def __init__(
-        self,
-        db: MongoDbDep,
-        logger: LoggerDep,
-        get_user_by_id: GetUserByIdDep,
-        get_organization_by_id: GetOrganizationByIdDep,
-    ) -> None:
-        self._collection = db.get_collection(CollectionName.USERS)
+    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
+        self._collection = db.get_collection(CollectionName.ORGANIZATIONS)
         self._logger = logger
-        self._get_user_by_id = get_user_by_id
-        self._get_organization_by_id = get_organization_by_id
+
+    class User(p.BaseModel):
+        username: str = p.Field(alias="username")
+        email: str = p.Field(alias="email")
 
     class Member(p.BaseModel):
         member_id: PyObjectUUID
@@ -35,49 +33,115 @@ class GetOrganizationMembers(IGetOrganizationMembers):
         role: UserRole
         joined_at: PyObjectDatetime
 
-    class Request(p.BaseModel):
+    class Cursor(p.BaseModel):
+        joined_at: PyObjectDatetime
+        member_id: PyObjectUUID
+
+    class PageRequest(p.BaseModel):
+        roles: list[UserRole] | None = p.Field(default=None)
+        order: t.Literal["asc", "desc"] = p.Field(default="asc")
+        limit: int = p.Field(default=DEFAULT_MEMBERS_PAGE_SIZE, ge=1, le=MAX_MEMBERS_PAGE_SIZE)
+        after_joined_at: PyObjectDatetime | None = p.Field(default=None)
+        after_member_id: PyObjectUUID | None = p.Field(default=None)
+
+        @p.model_validator(mode="after")
+        def validate_cursor(self) -> t.Self:
+            if (self.after_joined_at is None) != (self.after_member_id is None):
+                raise ValueError("after_joined_at and after_member_id must be provided together")
+            return self
+
+    class Request(PageRequest):
         organization_id: PyObjectUUID
 
     class Response(p.BaseModel):
         members: list["GetOrganizationMembers.Member"] = p.Field(default=[])
+        total: int = p.Field(default=0)
+        next_cursor: "GetOrganizationMembers.Cursor | None" = p.Field(default=None)
+
+    def _make_keyset_filter(self, request: "Request") -> dict:
+        # NOTE: `member_id` breaks ties between members who joined at the same instant
+        operator = "$gt" if request.order == "asc" else "$lt"
+        return {
+            "$or": [
+                {"joined_at": {operator: request.after_joined_at}},
+                {"joined_at": request.after_joined_at, "member_id": {operator: request.after_member_id}},
+            ]
+        }
+
+    def _make_pipeline(self, request: "Request") -> list[dict]:
+        direction = ASCENDING if request.order == "asc" else DESCENDING
+        page_stages: list[dict] = []
+        if request.after_joined_at is not None:
+            page_stages.append({"$match": self._make_keyset_filter(request)})
+        page_stages.extend(
+            [
+                {"$sort": {"joined_at": direction, "member_id": direction}},
+                # NOTE: one extra member tells whether another page exists
+                {"$limit": request.limit + 1},
+                {
+                    "$lookup": {
+                        "from": CollectionName.USERS,
+                        "localField": "member_id",
+                        "foreignField": "_id",
+                        "pipeline": [
+                            {"$match": {"is_deleted": False}},
+                            {"$project": create_projection(self.User)},
+                        ],
+                        "as": "user",
+                    }
+                },
+                {"$unwind": {"path": "$user", "preserveNullAndEmptyArrays": True}},
+            ]
+        )
+
+        pipeline: list[dict] = [
+            {"$match": {"_id": request.organization_id}},
+            {"$unwind": "$members"},
+            {"$replaceWith": "$members"},
+        ]
+        if request.roles is not None:
+            pipeline.append({"$match": {"member_role": {"$in": request.roles}}})
+        # NOTE: both facets share the filtered members, so the total never reaches the application as a list
+        pipeline.append({"$facet": {"total": [{"$count": "count"}], "members": page_stages}})
+        return pipeline
 
     async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
         organization_id = request.organization_id
-        get_organization_by_id_request = GetOrganizationById.Request(
-            id=organization_id,
-        )
-        get_organization_by_id_response = await self._get_organization_by_id.aexecute(get_organization_by_id_request)
-        organization = get_organization_by_id_response.organization
-        if not organization:
-            self._logger.error(f"Organization with id {organization_id} is not found.")
-            return self.Response(members=[])
-
-        member_ids = [member.member_id for member in organization.members]
-        query = {"_id": {"$in": member_ids}}
-        users_data = self._collection.find(query)
-        if not users_data:
+        cursor = await self._collection.aggregate(self._make_pipeline(request))
+        results = await cursor.to_list()
+        if not results or not results[0]["total"]:
             self._logger.error(f"No members found for organization with id {organization_id}.")
             return self.Response(members=[])
 
-        users = [UserModel(**user_data) for user_data in users_data]
+        total = results[0]["total"][0]["count"]
+        members_data = results[0]["members"]
+        page_data = members_data[: request.limit]
+
         members: list["GetOrganizationMembers.Member"] = []
-        for user in users:
-            member = find(organization.members, lambda x: x.member_id == user.id)
-            if not member:
-                self._logger.error(f"Member with id {user.id} is not found in organization {organization_id}.")
+        for member_data in page_data:
+            if "user" not in member_data:
+                self._logger.error(
+                    f"User of member with id {member_data['member_id']} in organization {organization_id} is not found."
+                )
                 continue
 
+            user = self.User(**member_data["user"])
             members.append(
                 self.Member(
-                    member_id=user.id,
+                    member_id=member_data["member_id"],
                     username=user.username,
                     email=user.email,
-                    role=member.member_role,
-                    joined_at=member.joined_at,
+                    role=member_data["member_role"],
+                    joined_at=member_data["joined_at"],
                 )
             )
-        return self.Response(members=members)
+
+        next_cursor = None
+        if len(members_data) > request.limit:
+            last_member_data = page_data[-1]
+            next_cursor = self.Cursor(joined_at=last_member_data["joined_at"], member_id=last_member_data["member_id"])
+        return self.Response(members=members, total=total, next_cursor=next_cursor)
 
 
 GetOrganizationMembersDep = t.Annotated[GetOrganizationMembers, Depends()]
@@ -30,7 +30,7 @@ class GetUserDefaultOrganization(IGetUserDefaultOrganization):
     async def aexecute(self, request: Request) -> "Response":
         self._logger.info(execute_service_method(self))
         filter = {"owner_id": request.owner_id, "is_default": True}
-        organization_data = self._collection.find_one(filter)
+        organization_data = await self._collection.find_one(filter)
         if not organization_data:
             self._logger.error(f"No default organization with owner_id {request.owner_id} is found.")
             raise NotFoundError(f"No default organization with owner_id {request.owner_id} is found.")
@@ -4,11 +4,13 @@ from fastapi import Depends
 
 from ...constants.mongo import CollectionName
 from ...dependencies import LoggerDep, MongoDbDep, UserContextDep
-from ...interfaces import IBaseComponentWithoutRequest
+from ...interfaces import IBaseComponent
 from ...utils.logger import execute_service_method
 from .get_organization_members import GetOrganizationMembers, GetOrganizationMembersDep
 
-IGetUserOrganizationMembers = IBaseComponentWithoutRequest["GetUserOrganizationMembers.Response"]
+IGetUserOrganizationMembers = IBaseComponent[
+    "GetUserOrganizationMembers.Request", "GetUserOrganizationMembers.Response"
+]
 
 
 class GetUserOrganizationMembers(IGetUserOrganizationMembers):
@@ -24,18 +26,23 @@ class GetUserOrganizationMembers(IGetUserOrganizationMembers):
         self._user_context = user_context
         self._get_organization_members = get_organization_members
 
+    class Request(GetOrganizationMembers.PageRequest):
+        pass
+
     class Response(GetOrganizationMembers.Response):
         pass
 
-    async def aexecute(self) -> "Response":
+    async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
         organization_id = self._user_context.organization_id
         get_organization_members_request = GetOrganizationMembers.Request(
+            **request.model_dump(),
             organization_id=organization_id,
         )
-        return self.Response(
-            members=(await self._get_organization_members.aexecute(get_organization_members_request)).members
+        get_organization_members_response = await self._get_organization_members.aexecute(
+            get_organization_members_request
         )
+        return self.Response(**get_organization_members_response.model_dump())
 
 
 GetUserOrganizationMembersDep = t.Annotated[GetUserOrganizationMembers, Depends()]
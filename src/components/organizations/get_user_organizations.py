@@ -39,7 +39,7 @@ class GetUserOrganizations(IGetUserOrganizations):
         joined_organizations = user.joined_organizations
         joined_organization_ids = [item.organization_id for item in joined_organizations]
         filter = {"_id": {"$in": joined_organization_ids}}
-        organizations_data = self._collection.find(filter)
+        organizations_data = await self._collection.find(filter).to_list()
         if not organizations_data:
             self._logger.error(f"No organization that owner_id {self._user_context.user_id} joined is found.")
             raise NotFoundError(f"No organization that owner_id {self._user_context.user_id} joined is found.")
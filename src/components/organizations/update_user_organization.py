@@ -44,7 +44,7 @@ class UpdateUserOrganization(IUpdateUserOrganization):
             "_id": request.organization_id,
             "owner_id": self._user_context.user_id,
         }
-        organization_data = self._collection.find_one(filter)
+        organization_data = await self._collection.find_one(filter)
         if organization_data is None:
             error_message = f"Organization with id {request.organization_id} not found."
             self._logger.error(error_message)
@@ -53,7 +53,7 @@ class UpdateUserOrganization(IUpdateUserOrganization):
         organization = OrganizationModel(**organization_data)
         updated_organization = organization.model_copy(update=update_data)
         updated_organization.updated_at = get_utc_now()
-        self._collection.update_one(
+        await self._collection.update_one(
             {"_id": updated_organization.id}, {"$set": updated_organization.model_dump(exclude={"id"})}
         )
         return self.Response(updated_organization=updated_organization)
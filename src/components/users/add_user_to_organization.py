@@ -5,7 +5,7 @@ from fastapi import Depends
 
 from ...common.models import JoinedOrganization, JoinOrganizationMember, PyObjectUUID, UserRole
 from ...constants.mongo import CollectionName
-from ...dependencies import LoggerDep, MongoDbDep
+from ...dependencies import LoggerDep, MongoDbDep, OrganizationLoaderDep, UserLoaderDep
 from ...interfaces import IBaseComponent
 from ...utils.common import get_utc_now
 from ...utils.logger import execute_service_method
@@ -16,10 +16,18 @@ IAddUserToOrganization = IBaseComponent["AddUserToOrganization.Request", "AddUse
 # TODO: handle add relationship with transaction
 # Assume two operations will be done successfully
 class AddUserToOrganization(IAddUserToOrganization):
-    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
+    def __init__(
+        self,
+        db: MongoDbDep,
+        logger: LoggerDep,
+        user_loader: UserLoaderDep,
+        organization_loader: OrganizationLoaderDep,
+    ) -> None:
         self._user_collection = db.get_collection(CollectionName.USERS)
         self._organization_collection = db.get_collection(CollectionName.ORGANIZATIONS)
         self._logger = logger
+        self._user_loader = user_loader
+        self._organization_loader = organization_loader
 
     class Request(p.BaseModel):
         organization_id: PyObjectUUID
@@ -38,7 +46,10 @@ class AddUserToOrganization(IAddUserToOrganization):
         role = request.role
 
         joined_organization = JoinedOrganization(organization_id=organization_id, role=role, joined_at=now)
-        update_user_result = self._user_collection.update_one(
+        # NOTE: both documents change below, drop them from the request-scoped cache
+        self._user_loader.clear(user_id)
+        self._organization_loader.clear(organization_id)
+        update_user_result = await self._user_collection.update_one(
             {"_id": user_id},
             {
                 "$push": {"joined_organizations": joined_organization.model_dump()},
@@ -53,7 +64,7 @@ class AddUserToOrganization(IAddUserToOrganization):
             member_role=role,
             joined_at=now,
         )
-        update_organization_result = self._organization_collection.update_one(
+        update_organization_result = await self._organization_collection.update_one(
             {"_id": organization_id},
             {
                 "$push": {"members": join_organization_member.model_dump()},
@@ -6,7 +6,6 @@ from fastapi import Depends
 from ...common.models import JoinedOrganization, UserModel, UserRole
 from ...constants.mongo import CollectionName
 from ...dependencies import LoggerDep, MongoDbDep
-from ...exceptions import InternalServerError
 from ...interfaces import IBaseComponent
 from ...utils.logger import execute_service_method
 
@@ -37,16 +36,7 @@ class CreateUser(ICreateUser):
             role=request.role,
             joined_organizations=request.joined_organizations,
         )
-        user_data = user.model_dump(by_alias=True)
-        inserted_user = self._collection.insert_one(user_data)
-        created_user = self._collection.find_one({"_id": inserted_user.inserted_id})
-        if not created_user:
-            self._logger.error(
-                f"Insert user data with id {inserted_user.inserted_id} successfully, but unable to find the created user"
-            )
-            raise InternalServerError("Insert user data successfully, but unable to find the created user")
-
-        created_user = UserModel(**created_user)
+        created_user = await self._collection.insert_model(user)
         return self.Response(created_user=created_user)
 
 
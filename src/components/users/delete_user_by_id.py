@@ -27,7 +27,7 @@ class DeleteUserById(IDeleteUserById):
 
     async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
-        result = self._collection.delete_one({"_id": request.user_id})
+        result = await self._collection.delete_one({"_id": request.user_id})
         if result.deleted_count == 0:
             self._logger.info(f"User with id {request.user_id} not found")
             raise NotFoundError(f"User with id {request.user_id} not found")
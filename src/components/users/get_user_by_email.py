@@ -26,7 +26,7 @@ class GetUserByEmail(IGetUserByEmail):
 
     async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
-        result = self._collection.find_one({"email": request.email})
+        result = await self._collection.find_one({"email": request.email})
         if not result:
             return self.Response(user=None)
 
@@ -4,8 +4,7 @@ import pydantic as p
 from fastapi import Depends
 
 from ...common.models import PyObjectUUID, UserModel
-from ...constants.mongo import CollectionName
-from ...dependencies import LoggerDep, MongoDbDep
+from ...dependencies import LoggerDep, UserLoaderDep
 from ...interfaces import IBaseComponent
 from ...utils.logger import execute_service_method
 
@@ -13,8 +12,8 @@ IGetUserById = IBaseComponent["GetUserById.Request", "GetUserById.Response"]
 
 
 class GetUserById(IGetUserById):
-    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
-        self._collection = db.get_collection(CollectionName.USERS)
+    def __init__(self, user_loader: UserLoaderDep, logger: LoggerDep) -> None:
+        self._user_loader = user_loader
         self._logger = logger
 
     class Request(p.BaseModel):
@@ -25,11 +24,7 @@ class GetUserById(IGetUserById):
 
     async def aexecute(self, request: "Request") -> "Response":
         self._logger.info(execute_service_method(self))
-        user_data = self._collection.find_one({"_id": request.user_id})
-        if not user_data:
-            return self.Response(user=None)
-
-        user = UserModel(**user_data)
+        user = await self._user_loader.load(request.user_id)
         return self.Response(user=user)
 
 
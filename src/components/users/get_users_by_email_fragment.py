@@ -2,11 +2,10 @@ import typing as t
 
 import pydantic as p
 from fastapi import Depends
-from pymongo.cursor import Cursor
 
-from ...common.models import UserModel
 from ...common.models.base import PyObjectUUID
 from ...constants.mongo import CollectionName
+from ...database.projection import create_projection
 from ...dependencies import LoggerDep, MongoDbDep
 from ...interfaces import IBaseComponent
 from ...utils.logger import execute_service_method
@@ -21,7 +20,7 @@ class GetUserByEmailFragment(IGetUserByEmailFragment):
         self._collection = self._db.get_collection(CollectionName.USERS)
 
     class User(p.BaseModel):
-        id: PyObjectUUID
+        id: PyObjectUUID = p.Field(validation_alias=p.AliasChoices("id", "_id"))
         username: str
         email: str
 
@@ -35,14 +34,13 @@ class GetUserByEmailFragment(IGetUserByEmailFragment):
         self._logger.info(execute_service_method(self))
         email_fragment = request.email_fragment
         regex_pattern = f".*{email_fragment}.*"
-        users_data: Cursor = self._collection.find(
-            {"email": {"$regex": regex_pattern, "$options": "i"}}
-        )  # "$options": "i" ~ case ignore
+        users_data = await self._collection.find(
+            {"email": {"$regex": regex_pattern, "$options": "i"}}, create_projection(self.User)
+        ).to_list()  # "$options": "i" ~ case ignore
         if not users_data:
             return self.Response(users=[])
 
-        matched_users = [UserModel(**user_data) for user_data in users_data]
-        users = [self.User(id=user.id, username=user.username, email=user.email) for user in matched_users]
+        users = [self.User(**user_data) for user_data in users_data]
         return self.Response(users=users)
 
 
@@ -5,7 +5,7 @@ from fastapi import Depends
 
 from ...common.models import PyObjectUUID
 from ...constants.mongo import CollectionName
-from ...dependencies import LoggerDep, MongoDbDep
+from ...dependencies import LoggerDep, MongoDbDep, OrganizationLoaderDep, UserLoaderDep
 from ...interfaces import IBaseComponent
 from ...utils.logger import execute_service_method
 
@@ -17,10 +17,18 @@ IRemoveUserFromOrganization = IBaseComponent[
 # TODO: handle add relationship with transaction
 # Assume two operations will be done successfully
 class RemoveUserFromOrganization(IRemoveUserFromOrganization):
-    def __init__(self, db: MongoDbDep, logger: LoggerDep) -> None:
+    def __init__(
+        self,
+        db: MongoDbDep,
+        logger: LoggerDep,
+        user_loader: UserLoaderDep,
+        organization_loader: OrganizationLoaderDep,
+    ) -> None:
         self._user_collection = db.get_collection(CollectionName.USERS)
         self._organization_collection = db.get_collection(CollectionName.ORGANIZATIONS)
         self._logger = logger
+        self._user_loader = user_loader
+        self._organization_loader = organization_loader
 
     class Request(p.BaseModel):
         organization_id: PyObjectUUID
@@ -34,7 +42,10 @@ class RemoveUserFromOrganization(IRemoveUserFromOrganization):
         organization_id = request.organization_id
         user_id = request.user_id
 
-        update_user_result = self._user_collection.update_one(
+        # NOTE: both documents change below, drop them from the request-scoped cache
+        self._user_loader.clear(user_id)
+        self._organization_loader.clear(organization_id)
+        update_user_result = await self._user_collection.update_one(
             {"_id": user_id},
             {
                 "$pull": {"joined_organizations": {"organization_id": organization_id}},
@@ -44,7 +55,7 @@ class RemoveUserFromOrganization(IRemoveUserFromOrganization):
             self._logger.error(f"Failed to update user {user_id}")
             return None
 
-        update_organization_result = self._organization_collection.update_one(
+        update_organization_result = await self._organization_collection.update_one(
             {"_id": organization_id},
             {
                 "$pull": {"members": {"member_id": user_id}},
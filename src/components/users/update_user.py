@@ -5,7 +5,7 @@ from fastapi import Depends
 
 from ...common.models import PyObjectUUID
 from ...constants.mongo import CollectionName
-from ...dependencies import LoggerDep, MongoDbDep
+from ...dependencies import LoggerDep, MongoDbDep, UserLoaderDep
 from ...exceptions import BadRequestError
 from ...interfaces import IBaseComponent
 from ...utils.common import get_utc_now
@@ -17,8 +17,11 @@ IUpdateUser = IBaseComponent["UpdateUser.Request", "UpdateUser.Response"]
 
 
 class UpdateUser(IUpdateUser):
-    def __init__(self, get_user_by_id: GetUserByIdDep, db: MongoDbDep, logger: LoggerDep) -> None:
+    def __init__(
+        self, get_user_by_id: GetUserByIdDep, user_loader: UserLoaderDep, db: MongoDbDep, logger: LoggerDep
+    ) -> None:
         self._get_user_by_id = get_user_by_id
+        self._user_loader = user_loader
         self._collection = db.get_collection(CollectionName.USERS)
         self._logger = logger
 
@@ -47,7 +50,8 @@ class UpdateUser(IUpdateUser):
 
         updated_user = user.model_copy(update=update_data)
         updated_user.updated_at = get_utc_now()
-        self._collection.update_one({"_id": updated_user.id}, {"$set": updated_user.model_dump(exclude={"id"})})
+        await self._collection.update_one({"_id": updated_user.id}, {"$set": updated_user.model_dump(exclude={"id"})})
+        self._user_loader.prime(updated_user.id, updated_user)
         return self.Response(updated_user=GetMe.User(**updated_user.model_dump()))
 
 
@@ -4,12 +4,28 @@ from functools import lru_cache
 from fastapi import Depends
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from .constants.websocket import OutboundOverflowPolicy, RoomBusBackend
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
     JWT_SECRET_KEY: str
     MONGO_URI: str
+    MONGO_MIN_POOL_SIZE: int = 10
+    MONGO_MAX_POOL_SIZE: int = 100
+    WEBSOCKET_OUTBOUND_QUEUE_SIZE: int = 256
+    WEBSOCKET_OUTBOUND_OVERFLOW_POLICY: OutboundOverflowPolicy = OutboundOverflowPolicy.DropOldestCursor
+    WEBSOCKET_CURSOR_TICK_RATE: float = 25.0
+    # NOTE: a socket path for `UnixSocket`, a `redis://` or `unix://` url for `Redis`
+    WEBSOCKET_ROOM_BUS: RoomBusBackend = RoomBusBackend.InProcess
+    WEBSOCKET_ROOM_BUS_URL: str = "/tmp/design-project-rooms.sock"
+    # NOTE: the id of this worker and the websocket base url of every worker, e.g. {"worker-0": "ws://127.0.0.1:8001"},
+    # each worker is its own process with its own id and port
+    WEBSOCKET_WORKER_ID: str = ""
+    WEBSOCKET_WORKER_URLS: dict[str, str] = {}
+    # NOTE: shared by the workers, authenticates the connections they relay to each other
+    WEBSOCKET_WORKER_SECRET: str = ""
 
 
 settings = Settings()
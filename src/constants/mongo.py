@@ -9,3 +9,4 @@ class CollectionName:
     ORGANIZATIONS: str = "organizations"
     JOIN_ORGANIZATION_INVITATIONS: str = "join_organization_invitations"
     DESIGN_PROJECTS: str = "design_projects"
+    DESIGN_ELEMENTS: str = "design_elements"
@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from pymongo import ASCENDING, DESCENDING
+
+from .mongo import CollectionName
+
+# NOTE: soft-delete collections always query with `is_deleted: False`, so their indexes only need to cover live documents
+ACTIVE_DOCUMENTS_FILTER = {"is_deleted": False}
+
+
+@dataclass(frozen=True)
+class MongoIndex:
+    name: str
+    keys: tuple[tuple[str, int], ...]
+    unique: bool = False
+    partial_filter_expression: dict[str, Any] | None = field(default=None, hash=False)
+
+
+MONGO_INDEXES: dict[str, tuple[MongoIndex, ...]] = {
+    CollectionName.STUDENTS: (),
+    CollectionName.USERS: (
+        # NOTE: serves the lookups by email, not unique since existing users may already share an email
+        MongoIndex(
+            name="email_active",
+            keys=(("email", ASCENDING),),
+            partial_filter_expression=ACTIVE_DOCUMENTS_FILTER,
+        ),
+    ),
+    CollectionName.ORGANIZATIONS: (
+        MongoIndex(
+            name="owner_id_is_default_active",
+            keys=(("owner_id", ASCENDING), ("is_default", ASCENDING)),
+            partial_filter_expression=ACTIVE_DOCUMENTS_FILTER,
+        ),
+    ),
+    CollectionName.JOIN_ORGANIZATION_INVITATIONS: (
+        # NOTE: equality fields first, then the `expires_at` range
+        MongoIndex(
+            name="receiver_id_taken_action_expires_at_active",
+            keys=(("receiver_id", ASCENDING), ("taken_action", ASCENDING), ("expires_at", ASCENDING)),
+            partial_filter_expression=ACTIVE_DOCUMENTS_FILTER,
+        ),
+    ),
+    CollectionName.DESIGN_PROJECTS: (
+        MongoIndex(
+            name="organization_id_active",
+            keys=(("organization_id", ASCENDING),),
+            partial_filter_expression=ACTIVE_DOCUMENTS_FILTER,
+        ),
+    ),
+    CollectionName.DESIGN_ELEMENTS: (
+        # NOTE: serves the per-project listing front-most first, and the front/back order key lookups
+        MongoIndex(
+            name="project_id_order_key_created_at_active",
+            keys=(("project_id", ASCENDING), ("order_key", DESCENDING), ("created_at", DESCENDING)),
+            partial_filter_expression=ACTIVE_DOCUMENTS_FILTER,
+        ),
+        # NOTE: serves viewport reads, the scan is bounded by the viewport on x and the y bounds filter index keys
+        MongoIndex(
+            name="project_id_bbox_active",
+            keys=(
+                ("project_id", ASCENDING),
+                ("bbox.min_x", ASCENDING),
+                ("bbox.max_x", ASCENDING),
+                ("bbox.min_y", ASCENDING),
+                ("bbox.max_y", ASCENDING),
+            ),
+            partial_filter_expression=ACTIVE_DOCUMENTS_FILTER,
+        ),
+    ),
+    CollectionName.REFRESH_TOKENS: (),
+}
@@ -11,17 +11,53 @@ class WebSocketEvent(str, Enum):
     CreateElement = "CreateElement"
     DeleteElement = "DeleteElement"
     UpdateElement = "UpdateElement"
+    PatchElement = "PatchElement"
+    CreateBatchElements = "CreateBatchElements"
+    UpdateBatchElements = "UpdateBatchElements"
+    DeleteBatchElements = "DeleteBatchElements"
+    ReorderElement = "ReorderElement"
+    TransformElements = "TransformElements"
+    AppendPoints = "AppendPoints"
     JoinUserCursor = "JoinUserCursor"
     UpdateUserCursor = "UpdateUserCursor"
+    UpdateViewport = "UpdateViewport"
     # NOTE: sender response events
     ElementCreated = "ElementCreated"
     ElementDeleted = "ElementDeleted"
     ElementUpdated = "ElementUpdated"
+    ElementPatched = "ElementPatched"
+    BatchElementsCreated = "BatchElementsCreated"
+    BatchElementsUpdated = "BatchElementsUpdated"
+    BatchElementsDeleted = "BatchElementsDeleted"
+    ElementReordered = "ElementReordered"
+    ElementsTransformed = "ElementsTransformed"
+    PointsAppended = "PointsAppended"
     CurrentUsers = "CurrentUsers"
     # NOTE: receiver events
     ReceiveElementCreated = "ReceiveElementCreated"
     ReceiveElementDeleted = "ReceiveElementDeleted"
     ReceiveElementUpdated = "ReceiveElementUpdated"
+    ReceiveElementPatched = "ReceiveElementPatched"
+    ReceiveBatchElementsCreated = "ReceiveBatchElementsCreated"
+    ReceiveBatchElementsUpdated = "ReceiveBatchElementsUpdated"
+    ReceiveBatchElementsDeleted = "ReceiveBatchElementsDeleted"
+    ReceiveElementReordered = "ReceiveElementReordered"
+    ReceiveElementsTransformed = "ReceiveElementsTransformed"
+    ReceivePointsAppended = "ReceivePointsAppended"
     ReceiveUserCursorJoined = "ReceiveUserCursorJoined"
     ReceiveUserCursorLeft = "ReceiveUserCursorLeft"
     ReceiveUserCursorUpdated = "ReceiveUserCursorUpdated"
+    ReceiveUserCursorsUpdated = "ReceiveUserCursorsUpdated"
+    ReceiveElementsSync = "ReceiveElementsSync"
+
+
+class OutboundOverflowPolicy(str, Enum):
+    # NOTE: cursor frames are superseded by the next ones, other messages are never dropped
+    DropOldestCursor = "DropOldestCursor"
+    Disconnect = "Disconnect"
+
+
+class RoomBusBackend(str, Enum):
+    InProcess = "InProcess"
+    UnixSocket = "UnixSocket"
+    Redis = "Redis"
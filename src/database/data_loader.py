@@ -0,0 +1,81 @@
+import asyncio
+import typing as t
+from abc import ABC, abstractmethod
+from collections.abc import Hashable, Iterable
+
+
+class DataLoader[K: Hashable, V](ABC):
+    """
+    Request-scoped batching loader.
+
+    Every `load` issued during the same event-loop tick is coalesced into a single `batch_load` call and each
+    result is cached for the lifetime of the loader, so one request never fetches the same entity twice.
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[K, asyncio.Future[V | None]] = {}
+        self._pending_keys: list[K] = []
+        self._dispatch_task: asyncio.Task[None] | None = None
+
+    @abstractmethod
+    async def batch_load(self, keys: list[K]) -> t.Mapping[K, V]:
+        """Load every key in one round trip, keys without a value are simply left out of the mapping."""
+
+    async def load(self, key: K) -> V | None:
+        future = self._cache.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._cache[key] = future
+            self._pending_keys.append(key)
+            self._schedule_dispatch()
+
+        return await future
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        future = self._cache.get(key)
+        if future is not None and not future.done():
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._cache[key] = future
+
+    def clear(self, key: K) -> None:
+        future = self._cache.get(key)
+        if future is not None and future.done():
+            del self._cache[key]
+
+    def clear_all(self) -> None:
+        self._cache = {key: future for key, future in self._cache.items() if not future.done()}
+
+    def _schedule_dispatch(self) -> None:
+        if self._dispatch_task is not None and not self._dispatch_task.done():
+            return
+
+        # NOTE: the task only starts on the next loop iteration, after every coroutine scheduled in this tick
+        # (e.g. by asyncio.gather) has had the chance to enqueue its key
+        self._dispatch_task = asyncio.ensure_future(self._dispatch())
+
+    async def _dispatch(self) -> None:
+        keys, self._pending_keys = self._pending_keys, []
+        futures = [(key, self._cache[key]) for key in keys]
+        try:
+            values = await self.batch_load(keys)
+        except Exception as e:
+            for key, future in futures:
+                # NOTE: failed keys are evicted so a later load can retry them
+                if self._cache.get(key) is future:
+                    del self._cache[key]
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key, future in futures:
+            if not future.done():
+                future.set_result(values.get(key))
+
+        if self._pending_keys:
+            self._dispatch_task = asyncio.ensure_future(self._dispatch())
@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from logging import Logger
+from typing import Any
+
+from pymongo import IndexModel
+from pymongo.asynchronous.database import AsyncDatabase
+
+from ..constants.mongo_index import MONGO_INDEXES, MongoIndex
+
+DEFAULT_INDEX_NAME = "_id_"
+
+
+@dataclass
+class IndexDrift:
+    missing: list[str] = field(default_factory=list)
+    mismatched: list[str] = field(default_factory=list)
+    unexpected: list[str] = field(default_factory=list)
+
+    @property
+    def has_drift(self) -> bool:
+        return bool(self.missing or self.mismatched or self.unexpected)
+
+
+def to_index_model(index: MongoIndex) -> IndexModel:
+    options: dict[str, Any] = {"name": index.name, "unique": index.unique}
+    if index.partial_filter_expression is not None:
+        options["partialFilterExpression"] = index.partial_filter_expression
+    return IndexModel(list(index.keys), **options)
+
+
+def is_matching_index(index: MongoIndex, index_info: dict[str, Any]) -> bool:
+    # NOTE: some servers report directions as floats (e.g. 1.0)
+    keys = tuple(
+        (key, int(direction) if isinstance(direction, float) else direction)
+        for key, direction in index_info.get("key", [])
+    )
+    return (
+        keys == index.keys
+        and bool(index_info.get("unique", False)) == index.unique
+        and index_info.get("partialFilterExpression") == index.partial_filter_expression
+    )
+
+
+async def ensure_indexes(
+    db: AsyncDatabase, logger: Logger, indexes: dict[str, tuple[MongoIndex, ...]] = MONGO_INDEXES
+) -> IndexDrift:
+    """
+    Create the declared indexes that do not exist yet and report drift against the declared registry.
+
+    Mismatched and undeclared indexes are only reported, never dropped, so a bad declaration cannot take
+    down an index that production traffic relies on.
+    """
+    drift = IndexDrift()
+    for collection_name, declared_indexes in indexes.items():
+        collection = db.get_collection(collection_name)
+        try:
+            existing_indexes: dict[str, dict[str, Any]] = await collection.index_information()
+            missing_indexes: list[MongoIndex] = []
+            for index in declared_indexes:
+                index_info = existing_indexes.get(index.name)
+                if index_info is None:
+                    missing_indexes.append(index)
+                elif not is_matching_index(index, index_info):
+                    drift.mismatched.append(f"{collection_name}.{index.name}")
+
+            declared_names = {index.name for index in declared_indexes}
+            drift.unexpected.extend(
+                f"{collection_name}.{name}"
+                for name in existing_indexes
+                if name != DEFAULT_INDEX_NAME and name not in declared_names
+            )
+
+            if missing_indexes:
+                await collection.create_indexes([to_index_model(index) for index in missing_indexes])
+                drift.missing.extend(f"{collection_name}.{index.name}" for index in missing_indexes)
+        except Exception as e:
+            logger.error(f"Failed to ensure indexes of collection {collection_name}: {e}", exc_info=True)
+
+    if drift.missing:
+        logger.info(f"Created missing MongoDB indexes: {', '.join(drift.missing)}")
+    if drift.mismatched:
+        logger.warning(f"MongoDB indexes differ from their declaration: {', '.join(drift.mismatched)}")
+    if drift.unexpected:
+        logger.warning(f"MongoDB indexes are not declared in the registry: {', '.join(drift.unexpected)}")
+    return drift
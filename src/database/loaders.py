@@ -0,0 +1,36 @@
+import typing as t
+from uuid import UUID
+
+from fastapi import Depends
+
+from ..common.models import OrganizationModel, UserModel
+from ..constants.mongo import CollectionName
+from .data_loader import DataLoader
+from .mongodb import MongoDbDep
+
+
+class UserLoader(DataLoader[UUID, UserModel]):
+    def __init__(self, db: MongoDbDep) -> None:
+        super().__init__()
+        self._collection = db.get_collection(CollectionName.USERS)
+
+    async def batch_load(self, keys: list[UUID]) -> dict[UUID, UserModel]:
+        users_data = await self._collection.find({"_id": {"$in": keys}}).to_list()
+        users = [UserModel(**user_data) for user_data in users_data]
+        return {user.id: user for user in users}
+
+
+class OrganizationLoader(DataLoader[UUID, OrganizationModel]):
+    def __init__(self, db: MongoDbDep) -> None:
+        super().__init__()
+        self._collection = db.get_collection(CollectionName.ORGANIZATIONS)
+
+    async def batch_load(self, keys: list[UUID]) -> dict[UUID, OrganizationModel]:
+        organizations_data = await self._collection.find({"_id": {"$in": keys}}).to_list()
+        organizations = [OrganizationModel(**organization_data) for organization_data in organizations_data]
+        return {organization.id: organization for organization in organizations}
+
+
+# NOTE: FastAPI caches dependencies per request, so every component resolved for one request shares these loaders
+UserLoaderDep = t.Annotated[UserLoader, Depends()]
+OrganizationLoaderDep = t.Annotated[OrganizationLoader, Depends()]
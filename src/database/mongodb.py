@@ -1,34 +1,86 @@
 import typing as t
+from logging import Logger
 
 from bson.binary import UuidRepresentation
 from bson.codec_options import CodecOptions
 from fastapi import Depends
-from pymongo.database import Database
-from pymongo.mongo_client import MongoClient
+from pymongo import AsyncMongoClient
 from pymongo.server_api import ServerApi
 
-from ..config import settings
+from ..config import Settings
 from ..exceptions import InternalServerError
 from ..logger import LoggerDep
-from .wrapped_db import WrappedDatabase
+from .wrapped_db import AsyncWrappedDatabase
 
 DATABASE_NAME = "database"
 
 
-def create_mongodb_database(logger: LoggerDep) -> WrappedDatabase:
-    try:
-        codec_options: CodecOptions = CodecOptions(
-            uuid_representation=UuidRepresentation.STANDARD,  # use standard UUID representation
-            tz_aware=True,  # configure timezone-aware datetime objects
-        )
-        client: MongoClient = MongoClient(settings.MONGO_URI, server_api=ServerApi("1"))
-        client.admin.command("ping")
-        logger.info("Connected successfully to MongoDB")
-        database = client.get_database(DATABASE_NAME, codec_options=codec_options)
-        return WrappedDatabase(database)
-    except Exception as e:
-        logger.error(f"Failed to connect to MongoDB: {e}", exc_info=True, stack_info=True)
-        raise InternalServerError("Failed to connect to MongoDB") from e
+class MongoDbConnection:
+    """
+    Holds the process-wide pooled asyncio MongoDB client.
 
+    The client is created once per worker in the application lifespan and shared by every
+    HTTP request and WebSocket connection, so requests only borrow a pooled socket instead of
+    paying for connection setup, server selection and a ping.
+    """
 
-MongoDbDep = t.Annotated[WrappedDatabase, Depends(create_mongodb_database)]
+    def __init__(self) -> None:
+        self._client: AsyncMongoClient | None = None
+        self._database: AsyncWrappedDatabase | None = None
+
+    @property
+    def database(self) -> AsyncWrappedDatabase | None:
+        return self._database
+
+    async def connect(self, settings: Settings, logger: Logger) -> AsyncWrappedDatabase:
+        if self._database is not None:
+            return self._database
+
+        try:
+            codec_options: CodecOptions = CodecOptions(
+                uuid_representation=UuidRepresentation.STANDARD,  # use standard UUID representation
+                tz_aware=True,  # configure timezone-aware datetime objects
+            )
+            client: AsyncMongoClient = AsyncMongoClient(
+                settings.MONGO_URI,
+                server_api=ServerApi("1"),
+                minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+                maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            )
+            # NOTE: ping once at startup, the pool is then filled up to minPoolSize in the background
+            await client.admin.command("ping")
+            logger.info(
+                f"Connected successfully to MongoDB with pool size "
+                f"{settings.MONGO_MIN_POOL_SIZE}-{settings.MONGO_MAX_POOL_SIZE}"
+            )
+        except Exception as e:
+            logger.error(f"Failed to connect to MongoDB: {e}", exc_info=True, stack_info=True)
+            raise InternalServerError("Failed to connect to MongoDB") from e
+
+        self._client = client
+        self._database = AsyncWrappedDatabase(client.get_database(DATABASE_NAME, codec_options=codec_options))
+        return self._database
+
+    async def close(self, logger: Logger) -> None:
+        if self._client is None:
+            return
+
+        await self._client.close()
+        self._client = None
+        self._database = None
+        logger.info("Closed MongoDB connection")
+
+
+mongodb_connection = MongoDbConnection()
+
+
+def create_mongodb_database(logger: LoggerDep) -> AsyncWrappedDatabase:
+    database = mongodb_connection.database
+    if database is None:
+        logger.error("MongoDB client is not connected, make sure the application lifespan has started.")
+        raise InternalServerError("Failed to connect to MongoDB")
+
+    return database
+
+
+MongoDbDep = t.Annotated[AsyncWrappedDatabase, Depends(create_mongodb_database)]
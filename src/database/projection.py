@@ -0,0 +1,24 @@
+from typing import Any
+
+import pydantic as p
+
+ID_FIELD = "_id"
+
+
+def create_projection(model_type: type[p.BaseModel]) -> dict[str, Any]:
+    """
+    Build a MongoDB projection that only fetches the fields `model_type` can be validated from.
+    """
+    projection: dict[str, Any] = {}
+    for name, field in model_type.model_fields.items():
+        if isinstance(field.validation_alias, p.AliasChoices):
+            keys = [choice for choice in field.validation_alias.choices if isinstance(choice, str)]
+        else:
+            keys = [field.validation_alias or field.alias or name]
+
+        for key in keys:
+            projection[key] = 1
+
+    if ID_FIELD not in projection:
+        projection[ID_FIELD] = 0
+    return projection
@@ -1,34 +1,170 @@
+import copy
+from collections.abc import Mapping, Sequence
 from typing import Any, override
 
-from pymongo.collection import Collection
-from pymongo.cursor import Cursor
-from pymongo.database import Database
+import pydantic as p
+from pymongo import InsertOne, ReplaceOne
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.command_cursor import AsyncCommandCursor
+from pymongo.asynchronous.cursor import AsyncCursor
+from pymongo.asynchronous.database import AsyncDatabase
 
 from ..constants.mongo import CollectionName
+from ..exceptions import InternalServerError
 
 IS_DELETED = "is_deleted"
 NON_SOFT_DELETE_COLLECTIONS = {CollectionName.REFRESH_TOKENS}
 
 
-class SoftDeleteCollection(Collection):
-    def __init__(self, collection: Collection):
+def with_soft_delete_filter(filter: Any | None = None) -> dict[str, Any]:
+    """
+    Return a copy of `filter` restricted to documents that are not soft-deleted.
+
+    Filters that already mention `is_deleted` are kept as they are so callers can still reach deleted documents.
+    """
+    if filter is None:
+        return {IS_DELETED: False}
+    if not isinstance(filter, Mapping):
+        # NOTE: pymongo treats a non-mapping filter as an `_id` value
+        return {"_id": filter, IS_DELETED: False}
+    if IS_DELETED in filter:
+        return dict(filter)
+    return {**filter, IS_DELETED: False}
+
+
+def with_soft_delete_pipeline(pipeline: Sequence[Mapping[str, Any]]) -> list[Mapping[str, Any]]:
+    if pipeline and IS_DELETED in pipeline[0].get("$match", {}):
+        return list(pipeline)
+    return [{"$match": {IS_DELETED: False}}, *pipeline]
+
+
+def with_soft_delete_document(document: Mapping[str, Any]) -> dict[str, Any]:
+    # NOTE: documents without the field would be invisible to every read and to the partial indexes
+    return {IS_DELETED: False, **document}
+
+
+class AsyncModelCollection(AsyncCollection):
+    def __init__(self, collection: AsyncCollection):
         super().__init__(database=collection._database, name=collection._name, codec_options=collection._codec_options)
 
-    def find_one(self, filter: Any | None = None, *args, **kwargs):
-        filter = filter or {}
-        if IS_DELETED not in filter:
-            filter[IS_DELETED] = False
-        return super().find_one(filter, *args, **kwargs)
+    async def insert_model[T: p.BaseModel](self, model: T, *args, read_your_write: bool = False, **kwargs) -> T:
+        """
+        Insert `model` and return it without reading the document back.
+
+        The model is already validated, so only `read_your_write=True` pays a second round trip to return the
+        document as stored by the server.
+        """
+        insert_one_result = await self.insert_one(model.model_dump(by_alias=True), *args, **kwargs)
+        if not read_your_write:
+            return model
+
+        document = await self.find_one({"_id": insert_one_result.inserted_id})
+        if document is None:
+            raise InternalServerError(
+                f"Inserted document {insert_one_result.inserted_id} into {self.name} but unable to read it back"
+            )
+        return type(model).model_validate(document)
+
+    async def insert_models[T: p.BaseModel](self, models: Sequence[T], *args, **kwargs) -> list[T]:
+        """Insert every model with a single `insert_many` round trip and return them as they are."""
+        if not models:
+            return []
+
+        await self.insert_many([model.model_dump(by_alias=True) for model in models], *args, **kwargs)
+        return list(models)
+
+
+class AsyncSoftDeleteCollection(AsyncModelCollection):
+    """
+    Collection that scopes every read and write to documents that are not soft-deleted.
+
+    Caller filters, pipelines and documents are never mutated, the rewritten copies are sent to the server.
+    """
+
+    @override
+    def find(self, filter: Any | None = None, *args, **kwargs) -> AsyncCursor:
+        return super().find(with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def find_one(self, filter: Any | None = None, *args, **kwargs):
+        return await super().find_one(with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def count_documents(self, filter: Mapping[str, Any], *args, **kwargs) -> int:
+        return await super().count_documents(with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def distinct(self, key: str, filter: Mapping[str, Any] | None = None, *args, **kwargs) -> list:
+        return await super().distinct(key, with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def aggregate(self, pipeline: Sequence[Mapping[str, Any]], *args, **kwargs) -> AsyncCommandCursor:
+        return await super().aggregate(with_soft_delete_pipeline(pipeline), *args, **kwargs)
+
+    @override
+    async def insert_one(self, document: Mapping[str, Any], *args, **kwargs):
+        return await super().insert_one(with_soft_delete_document(document), *args, **kwargs)
+
+    @override
+    async def insert_many(self, documents, *args, **kwargs):
+        return await super().insert_many(
+            [with_soft_delete_document(document) for document in documents], *args, **kwargs
+        )
+
+    @override
+    async def update_one(self, filter: Mapping[str, Any], *args, **kwargs):
+        return await super().update_one(with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def update_many(self, filter: Mapping[str, Any], *args, **kwargs):
+        return await super().update_many(with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def replace_one(self, filter: Mapping[str, Any], replacement: Mapping[str, Any], *args, **kwargs):
+        return await super().replace_one(
+            with_soft_delete_filter(filter), with_soft_delete_document(replacement), *args, **kwargs
+        )
+
+    @override
+    async def delete_one(self, filter: Mapping[str, Any], *args, **kwargs):
+        return await super().delete_one(with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def delete_many(self, filter: Mapping[str, Any], *args, **kwargs):
+        return await super().delete_many(with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def find_one_and_update(self, filter: Mapping[str, Any], *args, **kwargs):
+        return await super().find_one_and_update(with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def find_one_and_replace(self, filter: Mapping[str, Any], replacement: Mapping[str, Any], *args, **kwargs):
+        return await super().find_one_and_replace(
+            with_soft_delete_filter(filter), with_soft_delete_document(replacement), *args, **kwargs
+        )
+
+    @override
+    async def find_one_and_delete(self, filter: Mapping[str, Any], *args, **kwargs):
+        return await super().find_one_and_delete(with_soft_delete_filter(filter), *args, **kwargs)
+
+    @override
+    async def bulk_write(self, requests: Sequence[Any], *args, **kwargs):
+        return await super().bulk_write(
+            [self._with_soft_delete_request(request) for request in requests], *args, **kwargs
+        )
 
-    def find(self, filter: Any | None = None, *args, **kwargs) -> Cursor:
-        filter = filter or {}
-        if IS_DELETED not in filter:
-            filter[IS_DELETED] = False
-        return super().find(filter, *args, **kwargs)
+    def _with_soft_delete_request(self, request: Any) -> Any:
+        # NOTE: pymongo write models keep their filter/document in private attributes, copy before rewriting them
+        scoped_request = copy.copy(request)
+        if hasattr(scoped_request, "_filter"):
+            scoped_request._filter = with_soft_delete_filter(scoped_request._filter)
+        if isinstance(scoped_request, (InsertOne, ReplaceOne)):
+            scoped_request._doc = with_soft_delete_document(scoped_request._doc)
+        return scoped_request
 
 
-class WrappedDatabase(Database):
-    def __init__(self, db: Database):
+class AsyncWrappedDatabase(AsyncDatabase):
+    def __init__(self, db: AsyncDatabase):
         super().__init__(client=db._client, name=db._name, codec_options=db._codec_options)
 
     @override
@@ -39,7 +175,7 @@ class WrappedDatabase(Database):
         read_preference=None,
         write_concern=None,
         read_concern=None,
-    ) -> SoftDeleteCollection | Collection:
+    ) -> AsyncSoftDeleteCollection | AsyncModelCollection:
 
         raw_collection = super().get_collection(
             name,
@@ -49,6 +185,6 @@ class WrappedDatabase(Database):
             read_concern=read_concern,
         )
         if name in NON_SOFT_DELETE_COLLECTIONS:
-            return raw_collection
+            return AsyncModelCollection(raw_collection)
 
-        return SoftDeleteCollection(raw_collection)
+        return AsyncSoftDeleteCollection(raw_collection)
@@ -1,10 +1,13 @@
 from .common.auth import UserContextDep
 from .config import SettingsDep, create_settings
+from .database.loaders import OrganizationLoaderDep, UserLoaderDep
 from .database.mongodb import MongoDbDep
 from .logger import LoggerDep, create_logger
 
 __all__ = [
     "MongoDbDep",
+    "UserLoaderDep",
+    "OrganizationLoaderDep",
     "LoggerDep",
     "SettingsDep",
     "UserContextDep",
@@ -1,14 +1,31 @@
+from contextlib import asynccontextmanager
+
 from fastapi import Depends, FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from .config import settings
+from .database.indexes import ensure_indexes
+from .database.mongodb import mongodb_connection
 from .exceptions import AppException, ErrorContent, ErrorJSONResponse, ErrorType
+from .logger import logger
 from .middlewares.authenticate_middleware import AuthenticateMiddleware
 from .routers import authenticate, design_projects, join_organization_invitations, organizations, users, websocket
+from .routers.websocket.router import client_connection_manager
 from .services.jwt_service import JwtService
 
-app = FastAPI(dependencies=[Depends(JwtService)])
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    database = await mongodb_connection.connect(settings, logger)
+    await ensure_indexes(database, logger)
+    yield
+    await client_connection_manager.close()
+    await mongodb_connection.close(logger)
+
+
+app = FastAPI(dependencies=[Depends(JwtService)], lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
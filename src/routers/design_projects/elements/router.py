@@ -1,15 +1,29 @@
-from fastapi import APIRouter, status
+import typing as t
+
+from fastapi import APIRouter, Query, status
 
 from ....common.models import PyObjectUUID
 from ....components.design_projects.elements import (
+    AppendPoints,
+    AppendPointsDep,
     CreateBatchElements,
     CreateBatchElementsDep,
     CreateElement,
     CreateElementDep,
+    DeleteBatchElements,
+    DeleteBatchElementsDep,
     DeleteElement,
     DeleteElementDep,
     GetElements,
     GetElementsDep,
+    PatchElement,
+    PatchElementDep,
+    ReorderElement,
+    ReorderElementDep,
+    TransformElements,
+    TransformElementsDep,
+    UpdateBatchElements,
+    UpdateBatchElementsDep,
     UpdateElement,
     UpdateElementDep,
 )
@@ -58,6 +72,72 @@ async def create_batch_elements(
     )
 
 
+# NOTE: the batch routes are registered before `/{element_id}` so that "batch" is never parsed as an element id
+@router.put(
+    f"{ApiPath.ELEMENTS}/batch",
+    response_model=UpdateBatchElements.Response,
+    response_model_exclude_none=True,
+    response_description="Elements batch updated in design project",
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+)
+async def update_batch_elements(
+    design_project_id: PyObjectUUID,
+    request: UpdateBatchElements.HttpRequest,
+    update_batch_elements: UpdateBatchElementsDep,
+):
+    return await update_batch_elements.aexecute(
+        UpdateBatchElements.Request(
+            project_id=design_project_id,
+            elements=request.elements,
+        )
+    )
+
+
+# NOTE: a POST rather than a DELETE with a body, which many clients and proxies drop
+@router.post(
+    f"{ApiPath.ELEMENTS}/batch/delete",
+    response_model=DeleteBatchElements.Response,
+    response_model_exclude_none=True,
+    response_description="Elements batch deleted in design project",
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+)
+async def delete_batch_elements(
+    design_project_id: PyObjectUUID,
+    request: DeleteBatchElements.HttpRequest,
+    delete_batch_elements: DeleteBatchElementsDep,
+):
+    return await delete_batch_elements.aexecute(
+        DeleteBatchElements.Request(
+            project_id=design_project_id,
+            element_ids=request.element_ids,
+        )
+    )
+
+
+@router.post(
+    f"{ApiPath.ELEMENTS}/transform",
+    response_model=TransformElements.Response,
+    response_model_exclude_none=True,
+    response_description="Elements transformed in design project",
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+)
+async def transform_elements(
+    design_project_id: PyObjectUUID,
+    request: TransformElements.HttpRequest,
+    transform_elements: TransformElementsDep,
+):
+    return await transform_elements.aexecute(
+        TransformElements.Request(
+            project_id=design_project_id,
+            element_ids=request.element_ids,
+            transform=request.transform,
+        )
+    )
+
+
 @router.get(
     ApiPath.ELEMENTS,
     response_model=GetElements.Response,
@@ -66,8 +146,12 @@ async def create_batch_elements(
     response_model_by_alias=False,
     status_code=status.HTTP_200_OK,
 )
-async def get_elements(design_project_id: PyObjectUUID, get_elements: GetElementsDep):
-    return await get_elements.aexecute(GetElements.Request(project_id=design_project_id))
+async def get_elements(
+    design_project_id: PyObjectUUID,
+    get_elements: GetElementsDep,
+    request: t.Annotated[GetElements.HttpRequest, Query()],
+):
+    return await get_elements.aexecute(GetElements.Request(project_id=design_project_id, bbox=request.bbox))
 
 
 @router.put(
@@ -93,6 +177,76 @@ async def update_element(
     )
 
 
+@router.patch(
+    f"{ApiPath.ELEMENTS}/{{element_id}}",
+    response_model=PatchElement.Response,
+    response_model_exclude_none=True,
+    response_description="Element patched in design project",
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+)
+async def patch_element(
+    design_project_id: PyObjectUUID,
+    element_id: PyObjectUUID,
+    patch_element: PatchElementDep,
+    request: PatchElement.HttpRequest,
+):
+    return await patch_element.aexecute(
+        PatchElement.Request(
+            project_id=design_project_id,
+            element_id=element_id,
+            patch=request.patch,
+        )
+    )
+
+
+@router.put(
+    f"{ApiPath.ELEMENTS}/{{element_id}}/order",
+    response_model=ReorderElement.Response,
+    response_model_exclude_none=True,
+    response_description="Element reordered in design project",
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+)
+async def reorder_element(
+    design_project_id: PyObjectUUID,
+    element_id: PyObjectUUID,
+    reorder_element: ReorderElementDep,
+    request: ReorderElement.HttpRequest,
+):
+    return await reorder_element.aexecute(
+        ReorderElement.Request(
+            project_id=design_project_id,
+            element_id=element_id,
+            placement=request.placement,
+            target_element_id=request.target_element_id,
+        )
+    )
+
+
+@router.post(
+    f"{ApiPath.ELEMENTS}/{{element_id}}/points",
+    response_model=AppendPoints.Response,
+    response_model_exclude_none=True,
+    response_description="Points appended to element in design project",
+    response_model_by_alias=False,
+    status_code=status.HTTP_200_OK,
+)
+async def append_points(
+    design_project_id: PyObjectUUID,
+    element_id: PyObjectUUID,
+    append_points: AppendPointsDep,
+    request: AppendPoints.HttpRequest,
+):
+    return await append_points.aexecute(
+        AppendPoints.Request(
+            project_id=design_project_id,
+            element_id=element_id,
+            points=request.points,
+        )
+    )
+
+
 @router.delete(
     f"{ApiPath.ELEMENTS}/{{element_id}}",
     response_model=DeleteElement.Response,
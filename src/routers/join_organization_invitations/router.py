@@ -1,10 +1,13 @@
-from fastapi import APIRouter, status
+import typing as t
+
+from fastapi import APIRouter, Query, status
 
 from ...common.models import PyObjectUUID
 from ...components.join_organization_invitations import (
     AcceptOrRejectInvitation,
     AcceptOrRejectInvitationDep,
     CreateBatchJoinOrganizationInvitationDep,
+    GetUserInvitations,
     GetUserInvitationsDep,
     MarkInvitationReadOrUnread,
     MarkInvitationReadOrUnreadDep,
@@ -84,5 +87,8 @@ async def mark_invitation_unread(
     response_model_by_alias=False,
     status_code=status.HTTP_201_CREATED,
 )
-async def get_invitations_for_receiver(create_organization: GetUserInvitationsDep):
-    return await create_organization.aexecute()
+async def get_invitations_for_receiver(
+    create_organization: GetUserInvitationsDep,
+    request: t.Annotated[GetUserInvitations.Request, Query()],
+):
+    return await create_organization.aexecute(request)
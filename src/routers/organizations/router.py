@@ -1,4 +1,6 @@
-from fastapi import APIRouter, status
+import typing as t
+
+from fastapi import APIRouter, Query, status
 
 from ...common.models import PyObjectUUID
 from ...components.organizations import (
@@ -44,8 +46,11 @@ async def get_organizations_by_owner_id(get_organizations_by_owner_id: GetUserOr
     response_model_by_alias=False,
     status_code=status.HTTP_200_OK,
 )
-async def get_user_organization_members(get_user_organization_members: GetUserOrganizationMembersDep):
-    return await get_user_organization_members.aexecute()
+async def get_user_organization_members(
+    get_user_organization_members: GetUserOrganizationMembersDep,
+    request: t.Annotated[GetUserOrganizationMembers.Request, Query()],
+):
+    return await get_user_organization_members.aexecute(request)
 
 
 @router.get(
@@ -55,8 +60,14 @@ async def get_user_organization_members(get_user_organization_members: GetUserOr
     response_model_by_alias=False,
     status_code=status.HTTP_200_OK,
 )
-async def get_organization_members(get_organization_members: GetOrganizationMembersDep, organization_id: PyObjectUUID):
-    return await get_organization_members.aexecute(GetOrganizationMembers.Request(organization_id=organization_id))
+async def get_organization_members(
+    get_organization_members: GetOrganizationMembersDep,
+    organization_id: PyObjectUUID,
+    page: t.Annotated[GetOrganizationMembers.PageRequest, Query()],
+):
+    return await get_organization_members.aexecute(
+        GetOrganizationMembers.Request(**page.model_dump(), organization_id=organization_id)
+    )
 
 
 @router.get(
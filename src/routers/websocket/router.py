@@ -6,23 +6,58 @@ from fastapi import APIRouter, Depends
 from fastapi.websockets import WebSocket, WebSocketDisconnect
 
 from ...common.auth.websocket_user_context import WebsocketUserContextDep
-from ...common.models import BaseCircleModel, BaseElementModel, BaseRectangleModel, PyObjectUUID
+from ...common.models import BaseCircleModel, BaseElementModel, BaseRectangleModel, ElementPlacementModel, PyObjectUUID
 from ...common.websocket.connection_manager import ClientConnectionManager, Sender
-from ...common.websocket.message import IWebSocketMessage, Sender, WebSocketMessage, WebSocketMessagePayload
+from ...common.websocket.message import (
+    EncodedWebSocketMessage,
+    IWebSocketMessage,
+    Sender,
+    WebSocketMessage,
+    WebSocketMessagePayload,
+)
+from ...common.websocket.room_affinity import RoomAffinity
+from ...common.websocket.room_bus import create_room_bus
+from ...common.websocket.spatial_index import ElementBoundsChange, ElementBoundsChangeType
 from ...components.design_projects.elements import (
+    BaseAppendPoints,
+    BaseAppendPointsDep,
+    BaseCreateBatchElements,
+    BaseCreateBatchElementsDep,
     BaseCreateElement,
     BaseCreateElementDep,
+    BaseDeleteBatchElements,
+    BaseDeleteBatchElementsDep,
     BaseDeleteElement,
     BaseDeleteElementDep,
+    BasePatchElement,
+    BasePatchElementDep,
+    BaseReorderElement,
+    BaseReorderElementDep,
+    BaseTransformElements,
+    BaseTransformElementsDep,
+    BaseUpdateBatchElements,
+    BaseUpdateBatchElementsDep,
     BaseUpdateElement,
     BaseUpdateElementDep,
 )
 from ...constants.websocket import WebSocketEvent
-from ...dependencies import LoggerDep
+from ...dependencies import LoggerDep, create_logger, create_settings
+from ...exceptions import AppException
+from ...utils.bounding_box import GEOMETRY_FIELDS, compute_element_bounding_box
 from ...utils.design_element import BaseElementTypeChecker, create_element
 from ...utils.logger import execute_service_method
 
-client_connection_manager = ClientConnectionManager()
+settings = create_settings()
+room_affinity = RoomAffinity(
+    settings.WEBSOCKET_WORKER_ID, settings.WEBSOCKET_WORKER_URLS, settings.WEBSOCKET_WORKER_SECRET, create_logger()
+)
+client_connection_manager = ClientConnectionManager(
+    outbound_queue_size=settings.WEBSOCKET_OUTBOUND_QUEUE_SIZE,
+    outbound_overflow_policy=settings.WEBSOCKET_OUTBOUND_OVERFLOW_POLICY,
+    cursor_flush_interval_seconds=1 / settings.WEBSOCKET_CURSOR_TICK_RATE,
+    room_bus=create_room_bus(settings.WEBSOCKET_ROOM_BUS, settings.WEBSOCKET_ROOM_BUS_URL, create_logger()),
+    room_affinity=room_affinity,
+)
 
 TBaseModel = t.TypeVar("TBaseModel", bound=p.BaseModel)
 
@@ -30,30 +65,55 @@ TBaseModel = t.TypeVar("TBaseModel", bound=p.BaseModel)
 class WebsocketHandler:
     def __init__(
         self,
-        websocket: WebSocket,
         websocket_user_context: WebsocketUserContextDep,
         base_create_element: BaseCreateElementDep,
         logger: LoggerDep,
         base_delete_element: BaseDeleteElementDep,
         base_update_element: BaseUpdateElementDep,
+        base_patch_element: BasePatchElementDep,
+        base_create_batch_elements: BaseCreateBatchElementsDep,
+        base_update_batch_elements: BaseUpdateBatchElementsDep,
+        base_delete_batch_elements: BaseDeleteBatchElementsDep,
+        base_reorder_element: BaseReorderElementDep,
+        base_transform_elements: BaseTransformElementsDep,
+        base_append_points: BaseAppendPointsDep,
     ) -> None:
-        self._websocket = websocket
         self._user_context = websocket_user_context
         self._base_create_element = base_create_element
         self._logger = logger
         self._base_delete_element = base_delete_element
         self._base_update_element = base_update_element
-
-    async def send_message(self, message: IWebSocketMessage) -> None:
-        await self._websocket.send_json(message.model_dump(mode="json", by_alias=False, exclude_none=True))
+        self._base_patch_element = base_patch_element
+        self._base_create_batch_elements = base_create_batch_elements
+        self._base_update_batch_elements = base_update_batch_elements
+        self._base_delete_batch_elements = base_delete_batch_elements
+        self._base_reorder_element = base_reorder_element
+        self._base_transform_elements = base_transform_elements
+        self._base_append_points = base_append_points
+
+    async def send_message(self, design_project_id: PyObjectUUID, message: IWebSocketMessage) -> None:
+        # NOTE: through the outbound queue of the client, its writer task is the only one writing to the websocket
+        await client_connection_manager.send_to_client(
+            design_project_id, self._user_context.user_id, EncodedWebSocketMessage.encode(message)
+        )
 
     async def broadcast_message(
         self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, message: IWebSocketMessage
     ) -> None:
-        await client_connection_manager.broadcast(
+        await client_connection_manager.broadcast(design_project_id, client_id, EncodedWebSocketMessage.encode(message))
+
+    async def broadcast_element_message(
+        self,
+        design_project_id: PyObjectUUID,
+        client_id: PyObjectUUID,
+        message: IWebSocketMessage,
+        changes: list[ElementBoundsChange],
+    ) -> None:
+        await client_connection_manager.broadcast_element_changes(
             design_project_id,
             client_id,
-            message.model_dump(mode="json", by_alias=False, exclude_none=True),
+            EncodedWebSocketMessage.encode(message),
+            changes,
         )
 
     def _create_sender(self) -> Sender:
@@ -64,7 +124,9 @@ class WebsocketHandler:
             role=self._user_context.role,
         )
 
-    async def _validate_payload(self, payload: dict, cls: type[TBaseModel]) -> TBaseModel | None:
+    async def _validate_payload(
+        self, design_project_id: PyObjectUUID, payload: dict, cls: type[TBaseModel]
+    ) -> TBaseModel | None:
         try:
             return cls.model_validate(payload)
         except p.ValidationError as e:
@@ -72,15 +134,15 @@ class WebsocketHandler:
             error_message = WebSocketMessage.ErrorMessage(
                 payload=WebSocketMessagePayload.ErrorMessagePayload(message=f"Failed to validate payload: {e}")
             )
-            await self.send_message(error_message)
+            await self.send_message(design_project_id, error_message)
             return None
 
-    async def _handle_ping_message(self) -> None:
+    async def _handle_ping_message(self, design_project_id: PyObjectUUID) -> None:
         self._logger.info(execute_service_method(self))
         pong_message = WebSocketMessage.PongMessage(
             payload=WebSocketMessagePayload.PongMessagePayload(message="I received your ping!")
         )
-        await self.send_message(pong_message)
+        await self.send_message(design_project_id, pong_message)
 
     async def _handle_broadcast_message(self, design_project_id: PyObjectUUID, client_id: PyObjectUUID) -> None:
         self._logger.info(execute_service_method(self))
@@ -97,7 +159,7 @@ class WebsocketHandler:
     ) -> None:
         self._logger.info(execute_service_method(self))
         create_element_message_payload = await self._validate_payload(
-            payload, WebSocketMessagePayload.CreateElementMessagePayload
+            design_project_id, payload, WebSocketMessagePayload.CreateElementMessagePayload
         )
         if not create_element_message_payload:
             return
@@ -117,7 +179,7 @@ class WebsocketHandler:
                 temporary_element_id_element_map={temporary_element_id: created_element},
             )
         )
-        await self.send_message(element_created_message)
+        await self.send_message(design_project_id, element_created_message)
 
         retrieve_element_created_message = WebSocketMessage.ReceiveElementCreatedMessage(
             payload=WebSocketMessagePayload.ReceiveElementCreatedMessagePayload(
@@ -125,10 +187,15 @@ class WebsocketHandler:
                 element=created_element,
             )
         )
-        await self.broadcast_message(
+        await self.broadcast_element_message(
             design_project_id,
             client_id,
             retrieve_element_created_message,
+            [
+                ElementBoundsChange(
+                    created_element.id, ElementBoundsChangeType.Created, compute_element_bounding_box(created_element)
+                )
+            ],
         )
 
     async def _handle_delete_element_message(
@@ -136,7 +203,7 @@ class WebsocketHandler:
     ) -> None:
         self._logger.info(execute_service_method(self))
         delete_element_message_payload = await self._validate_payload(
-            payload, WebSocketMessagePayload.DeleteElementMessagePayload
+            design_project_id, payload, WebSocketMessagePayload.DeleteElementMessagePayload
         )
         if not delete_element_message_payload:
             return
@@ -147,20 +214,14 @@ class WebsocketHandler:
             project_id=design_project_id,
             element_id=element_id,
         )
-        base_delete_element_response = await self._base_delete_element.aexecute(base_delete_element_request)
-        if not base_delete_element_response.success:
-            error_message = WebSocketMessage.ErrorMessage(
-                payload=WebSocketMessagePayload.ErrorMessagePayload(message="Failed to delete element")
-            )
-            await self.send_message(error_message)
-            return
+        await self._base_delete_element.aexecute(base_delete_element_request)
 
         element_deleted_message = WebSocketMessage.ElementDeletedMessage(
             payload=WebSocketMessagePayload.ElementDeletedMessagePayload(
                 deleted_element_id=element_id,
             )
         )
-        await self.send_message(element_deleted_message)
+        await self.send_message(design_project_id, element_deleted_message)
 
         receive_element_deleted_message = WebSocketMessage.ReceiveElementDeletedMessage(
             payload=WebSocketMessagePayload.ReceiveElementDeletedMessagePayload(
@@ -168,10 +229,11 @@ class WebsocketHandler:
                 deleted_element_id=element_id,
             )
         )
-        await self.broadcast_message(
+        await self.broadcast_element_message(
             design_project_id,
             client_id,
             receive_element_deleted_message,
+            [ElementBoundsChange(element_id, ElementBoundsChangeType.Removed)],
         )
 
     async def _handle_update_element_message(
@@ -179,7 +241,7 @@ class WebsocketHandler:
     ) -> None:
         self._logger.info(execute_service_method(self))
         update_element_message_payload = await self._validate_payload(
-            payload, WebSocketMessagePayload.UpdateElementMessagePayload
+            design_project_id, payload, WebSocketMessagePayload.UpdateElementMessagePayload
         )
         if not update_element_message_payload:
             return
@@ -193,12 +255,6 @@ class WebsocketHandler:
             element=element,
         )
         base_update_element_response = await self._base_update_element.aexecute(base_delete_element_request)
-        if not base_update_element_response:
-            error_message = WebSocketMessage.ErrorMessage(
-                payload=WebSocketMessagePayload.ErrorMessagePayload(message="Failed to update element")
-            )
-            await self.send_message(error_message)
-            return
 
         updated_element = base_update_element_response.updated_element
         element_updated_message = WebSocketMessage.ElementUpdatedMessage(
@@ -206,7 +262,7 @@ class WebsocketHandler:
                 updated_element_id=updated_element.id, updated_element=updated_element
             )
         )
-        await self.send_message(element_updated_message)
+        await self.send_message(design_project_id, element_updated_message)
 
         receive_element_updated_message = WebSocketMessage.ReceiveElementUpdatedMessage(
             payload=WebSocketMessagePayload.ReceiveElementUpdatedMessagePayload(
@@ -215,10 +271,326 @@ class WebsocketHandler:
                 updated_element=updated_element,
             )
         )
-        await self.broadcast_message(
+        await self.broadcast_element_message(
             design_project_id,
             client_id,
             receive_element_updated_message,
+            [
+                ElementBoundsChange(
+                    updated_element.id, ElementBoundsChangeType.Moved, compute_element_bounding_box(updated_element)
+                )
+            ],
+        )
+
+    async def _handle_patch_element_message(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, payload: dict
+    ) -> None:
+        self._logger.info(execute_service_method(self))
+        patch_element_message_payload = await self._validate_payload(
+            design_project_id, payload, WebSocketMessagePayload.PatchElementMessagePayload
+        )
+        if not patch_element_message_payload:
+            return
+
+        base_patch_element_request = BasePatchElement.Request(
+            organization_id=self._user_context.organization_id,
+            project_id=design_project_id,
+            element_id=patch_element_message_payload.element_id,
+            patch=patch_element_message_payload.patch,
+        )
+        base_patch_element_response = await self._base_patch_element.aexecute(base_patch_element_request)
+
+        patched_element_id = base_patch_element_response.patched_element_id
+        patch = base_patch_element_response.patch
+        element_patched_message = WebSocketMessage.ElementPatchedMessage(
+            payload=WebSocketMessagePayload.ElementPatchedMessagePayload(
+                patched_element_id=patched_element_id, patch=patch
+            )
+        )
+        await self.send_message(design_project_id, element_patched_message)
+
+        # NOTE: a patch that leaves the geometry alone keeps the element where the room last saw it
+        if GEOMETRY_FIELDS.isdisjoint(patch.changes):
+            element_bounds_change = ElementBoundsChange(patched_element_id, ElementBoundsChangeType.Touched)
+        else:
+            element_bounds_change = ElementBoundsChange(
+                patched_element_id, ElementBoundsChangeType.Moved, base_patch_element_response.bbox
+            )
+        # NOTE: receivers only get the changed fields, not the whole element
+        receive_element_patched_message = WebSocketMessage.ReceiveElementPatchedMessage(
+            payload=WebSocketMessagePayload.ReceiveElementPatchedMessagePayload(
+                sender=self._create_sender(),
+                patched_element_id=patched_element_id,
+                patch=patch,
+            )
+        )
+        await self.broadcast_element_message(
+            design_project_id,
+            client_id,
+            receive_element_patched_message,
+            [element_bounds_change],
+        )
+
+    async def _handle_reorder_element_message(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, payload: dict
+    ) -> None:
+        self._logger.info(execute_service_method(self))
+        reorder_element_message_payload = await self._validate_payload(
+            design_project_id, payload, WebSocketMessagePayload.ReorderElementMessagePayload
+        )
+        if not reorder_element_message_payload:
+            return
+
+        base_reorder_element_request = BaseReorderElement.Request(
+            organization_id=self._user_context.organization_id,
+            project_id=design_project_id,
+            element_id=reorder_element_message_payload.element_id,
+            placement=ElementPlacementModel(
+                placement=reorder_element_message_payload.placement,
+                target_element_id=reorder_element_message_payload.target_element_id,
+            ),
+        )
+        base_reorder_element_response = await self._base_reorder_element.aexecute(base_reorder_element_request)
+
+        reordered_element_id = base_reorder_element_response.reordered_element_id
+        order_key = base_reorder_element_response.order_key
+        element_reordered_message = WebSocketMessage.ElementReorderedMessage(
+            payload=WebSocketMessagePayload.ElementReorderedMessagePayload(
+                reordered_element_id=reordered_element_id, order_key=order_key
+            )
+        )
+        await self.send_message(design_project_id, element_reordered_message)
+
+        receive_element_reordered_message = WebSocketMessage.ReceiveElementReorderedMessage(
+            payload=WebSocketMessagePayload.ReceiveElementReorderedMessagePayload(
+                sender=self._create_sender(),
+                reordered_element_id=reordered_element_id,
+                order_key=order_key,
+            )
+        )
+        await self.broadcast_element_message(
+            design_project_id,
+            client_id,
+            receive_element_reordered_message,
+            [ElementBoundsChange(reordered_element_id, ElementBoundsChangeType.Touched)],
+        )
+
+    async def _handle_create_batch_elements_message(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, payload: dict
+    ) -> None:
+        self._logger.info(execute_service_method(self))
+        create_batch_elements_message_payload = await self._validate_payload(
+            design_project_id, payload, WebSocketMessagePayload.CreateBatchElementsMessagePayload
+        )
+        if not create_batch_elements_message_payload:
+            return
+
+        base_create_batch_elements_request = BaseCreateBatchElements.Request(
+            base_elements=[
+                element_payload.element for element_payload in create_batch_elements_message_payload.elements
+            ],
+            organization_id=self._user_context.organization_id,
+            project_id=design_project_id,
+        )
+        base_create_batch_elements_response = await self._base_create_batch_elements.aexecute(
+            base_create_batch_elements_request
+        )
+        created_elements = base_create_batch_elements_response.created_elements
+        # NOTE: created elements keep the order of the request, a failed batch creates none of them
+        temporary_element_ids = [
+            element_payload.temporary_element_id for element_payload in create_batch_elements_message_payload.elements
+        ]
+        batch_elements_created_message = WebSocketMessage.BatchElementsCreatedMessage(
+            payload=WebSocketMessagePayload.BatchElementsCreatedMessagePayload(
+                temporary_element_id_element_map=dict(zip(temporary_element_ids, created_elements)),
+            )
+        )
+        await self.send_message(design_project_id, batch_elements_created_message)
+        if not created_elements:
+            return
+
+        receive_batch_elements_created_message = WebSocketMessage.ReceiveBatchElementsCreatedMessage(
+            payload=WebSocketMessagePayload.ReceiveBatchElementsCreatedMessagePayload(
+                sender=self._create_sender(),
+                elements=created_elements,
+            )
+        )
+        await self.broadcast_element_message(
+            design_project_id,
+            client_id,
+            receive_batch_elements_created_message,
+            [
+                ElementBoundsChange(element.id, ElementBoundsChangeType.Created, compute_element_bounding_box(element))
+                for element in created_elements
+            ],
+        )
+
+    async def _handle_update_batch_elements_message(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, payload: dict
+    ) -> None:
+        self._logger.info(execute_service_method(self))
+        update_batch_elements_message_payload = await self._validate_payload(
+            design_project_id, payload, WebSocketMessagePayload.UpdateBatchElementsMessagePayload
+        )
+        if not update_batch_elements_message_payload:
+            return
+
+        base_update_batch_elements_request = BaseUpdateBatchElements.Request(
+            elements=update_batch_elements_message_payload.elements,
+            organization_id=self._user_context.organization_id,
+            project_id=design_project_id,
+        )
+        base_update_batch_elements_response = await self._base_update_batch_elements.aexecute(
+            base_update_batch_elements_request
+        )
+        updated_elements = base_update_batch_elements_response.updated_elements
+        batch_elements_updated_message = WebSocketMessage.BatchElementsUpdatedMessage(
+            payload=WebSocketMessagePayload.BatchElementsUpdatedMessagePayload(updated_elements=updated_elements)
+        )
+        await self.send_message(design_project_id, batch_elements_updated_message)
+        if not updated_elements:
+            return
+
+        receive_batch_elements_updated_message = WebSocketMessage.ReceiveBatchElementsUpdatedMessage(
+            payload=WebSocketMessagePayload.ReceiveBatchElementsUpdatedMessagePayload(
+                sender=self._create_sender(),
+                updated_elements=updated_elements,
+            )
+        )
+        await self.broadcast_element_message(
+            design_project_id,
+            client_id,
+            receive_batch_elements_updated_message,
+            [
+                ElementBoundsChange(element.id, ElementBoundsChangeType.Moved, compute_element_bounding_box(element))
+                for element in updated_elements
+            ],
+        )
+
+    async def _handle_delete_batch_elements_message(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, payload: dict
+    ) -> None:
+        self._logger.info(execute_service_method(self))
+        delete_batch_elements_message_payload = await self._validate_payload(
+            design_project_id, payload, WebSocketMessagePayload.DeleteBatchElementsMessagePayload
+        )
+        if not delete_batch_elements_message_payload:
+            return
+
+        base_delete_batch_elements_request = BaseDeleteBatchElements.Request(
+            element_ids=delete_batch_elements_message_payload.element_ids,
+            organization_id=self._user_context.organization_id,
+            project_id=design_project_id,
+        )
+        base_delete_batch_elements_response = await self._base_delete_batch_elements.aexecute(
+            base_delete_batch_elements_request
+        )
+        deleted_element_ids = base_delete_batch_elements_response.deleted_element_ids
+        batch_elements_deleted_message = WebSocketMessage.BatchElementsDeletedMessage(
+            payload=WebSocketMessagePayload.BatchElementsDeletedMessagePayload(deleted_element_ids=deleted_element_ids)
+        )
+        await self.send_message(design_project_id, batch_elements_deleted_message)
+        if not deleted_element_ids:
+            return
+
+        receive_batch_elements_deleted_message = WebSocketMessage.ReceiveBatchElementsDeletedMessage(
+            payload=WebSocketMessagePayload.ReceiveBatchElementsDeletedMessagePayload(
+                sender=self._create_sender(),
+                deleted_element_ids=deleted_element_ids,
+            )
+        )
+        await self.broadcast_element_message(
+            design_project_id,
+            client_id,
+            receive_batch_elements_deleted_message,
+            [ElementBoundsChange(element_id, ElementBoundsChangeType.Removed) for element_id in deleted_element_ids],
+        )
+
+    async def _handle_transform_elements_message(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, payload: dict
+    ) -> None:
+        self._logger.info(execute_service_method(self))
+        transform_elements_message_payload = await self._validate_payload(
+            design_project_id, payload, WebSocketMessagePayload.TransformElementsMessagePayload
+        )
+        if not transform_elements_message_payload:
+            return
+
+        base_transform_elements_request = BaseTransformElements.Request(
+            organization_id=self._user_context.organization_id,
+            project_id=design_project_id,
+            element_ids=transform_elements_message_payload.element_ids,
+            transform=transform_elements_message_payload.transform,
+        )
+        base_transform_elements_response = await self._base_transform_elements.aexecute(base_transform_elements_request)
+        transformed_element_ids = base_transform_elements_response.transformed_element_ids
+        elements_transformed_message = WebSocketMessage.ElementsTransformedMessage(
+            payload=WebSocketMessagePayload.ElementsTransformedMessagePayload(
+                transformed_element_ids=transformed_element_ids,
+                transform=base_transform_elements_response.transform,
+            )
+        )
+        await self.send_message(design_project_id, elements_transformed_message)
+        if not transformed_element_ids:
+            return
+
+        receive_elements_transformed_message = WebSocketMessage.ReceiveElementsTransformedMessage(
+            payload=WebSocketMessagePayload.ReceiveElementsTransformedMessagePayload(
+                sender=self._create_sender(),
+                transformed_element_ids=transformed_element_ids,
+                transform=base_transform_elements_response.transform,
+            )
+        )
+        await self.broadcast_element_message(
+            design_project_id,
+            client_id,
+            receive_elements_transformed_message,
+            [
+                ElementBoundsChange(element_id, ElementBoundsChangeType.Moved, bounding_box)
+                for element_id, bounding_box in zip(
+                    transformed_element_ids, base_transform_elements_response.bounding_boxes
+                )
+            ],
+        )
+
+    async def _handle_append_points_message(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, payload: dict
+    ) -> None:
+        self._logger.info(execute_service_method(self))
+        append_points_message_payload = await self._validate_payload(
+            design_project_id, payload, WebSocketMessagePayload.AppendPointsMessagePayload
+        )
+        if not append_points_message_payload:
+            return
+
+        base_append_points_request = BaseAppendPoints.Request(
+            organization_id=self._user_context.organization_id,
+            project_id=design_project_id,
+            element_id=append_points_message_payload.element_id,
+            points=append_points_message_payload.points,
+        )
+        base_append_points_response = await self._base_append_points.aexecute(base_append_points_request)
+        element_id = base_append_points_response.element_id
+        points_appended_message = WebSocketMessage.PointsAppendedMessage(
+            payload=WebSocketMessagePayload.PointsAppendedMessagePayload(
+                element_id=element_id,
+                appended_count=len(base_append_points_response.points),
+            )
+        )
+        await self.send_message(design_project_id, points_appended_message)
+
+        receive_points_appended_message = WebSocketMessage.ReceivePointsAppendedMessage(
+            payload=WebSocketMessagePayload.ReceivePointsAppendedMessagePayload(
+                sender=self._create_sender(),
+                element_id=element_id,
+                points=base_append_points_response.points,
+            )
+        )
+        await self.broadcast_element_message(
+            design_project_id,
+            client_id,
+            receive_points_appended_message,
+            [ElementBoundsChange(element_id, ElementBoundsChangeType.Moved, base_append_points_response.bbox)],
         )
 
     async def _handle_join_user_cursor_message(
@@ -226,7 +598,7 @@ class WebsocketHandler:
     ) -> None:
         self._logger.info(execute_service_method(self))
         join_project_message = await self._validate_payload(
-            payload, WebSocketMessagePayload.JoinUserCursorMessagePayload
+            design_project_id, payload, WebSocketMessagePayload.JoinUserCursorMessagePayload
         )
         if not join_project_message:
             return
@@ -235,7 +607,7 @@ class WebsocketHandler:
         current_users_message = WebSocketMessage.CurrentUsersMessage(
             payload=WebSocketMessagePayload.CurrentUsersMessagePayload(users=broadcast_clients)
         )
-        await self.send_message(current_users_message)
+        await self.send_message(design_project_id, current_users_message)
 
         receive_user_joined_project_message = WebSocketMessage.ReceiveUserCursorJoinedMessage(
             payload=WebSocketMessagePayload.ReceiveUserCursorJoinedMessagePayload(
@@ -252,22 +624,20 @@ class WebsocketHandler:
         self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, payload: dict
     ) -> None:
         move_cursor_message_payload = await self._validate_payload(
-            payload, WebSocketMessagePayload.UpdateUserCursorMessagePayload
+            design_project_id, payload, WebSocketMessagePayload.UpdateUserCursorMessagePayload
         )
         if not move_cursor_message_payload:
             return
 
-        receive_user_cursor_moved_message = WebSocketMessage.ReceiveUserCursorUpdatedMessage(
-            payload=WebSocketMessagePayload.ReceiveUserCursorUpdatedMessagePayload(
-                sender=self._create_sender(),
-                user_cursor=move_cursor_message_payload.user_cursor,
-            )
-        )
-        await self.broadcast_message(
-            design_project_id,
-            client_id,
-            receive_user_cursor_moved_message,
+        # NOTE: the batched cursor frames carry no sender, the cursor itself names the user it belongs to
+        user_cursor = move_cursor_message_payload.user_cursor.model_copy(
+            update={
+                "user_id": self._user_context.user_id,
+                "email": self._user_context.email,
+                "username": self._user_context.username,
+            }
         )
+        client_connection_manager.update_user_cursor(design_project_id, client_id, user_cursor)
 
     async def handle_disconnected_client(self, design_project_id: PyObjectUUID) -> None:
         self._logger.info(execute_service_method(self))
@@ -285,13 +655,27 @@ class WebsocketHandler:
 
         await client_connection_manager.disconnect(design_project_id, client_id)
 
+    async def _handle_update_viewport_message(
+        self, design_project_id: PyObjectUUID, client_id: PyObjectUUID, payload: dict
+    ) -> None:
+        self._logger.info(execute_service_method(self))
+        update_viewport_message_payload = await self._validate_payload(
+            design_project_id, payload, WebSocketMessagePayload.UpdateViewportMessagePayload
+        )
+        if not update_viewport_message_payload:
+            return
+
+        await client_connection_manager.update_viewport(
+            design_project_id, client_id, update_viewport_message_payload.viewport
+        )
+
     async def handle_event(self, design_project_id: PyObjectUUID, message: dict) -> None:
         client_id = self._user_context.user_id
         # TODO: validate message
         event = t.cast(WebSocketEvent, message.get("event"))
         payload = t.cast(dict, message.get("payload"))
         if event == WebSocketEvent.Ping:
-            await self._handle_ping_message()
+            await self._handle_ping_message(design_project_id)
         elif event == WebSocketEvent.Broadcast:
             await self._handle_broadcast_message(
                 design_project_id,
@@ -303,15 +687,31 @@ class WebsocketHandler:
             await self._handle_delete_element_message(design_project_id, client_id, payload)
         elif event == WebSocketEvent.UpdateElement:
             await self._handle_update_element_message(design_project_id, client_id, payload)
+        elif event == WebSocketEvent.PatchElement:
+            await self._handle_patch_element_message(design_project_id, client_id, payload)
+        elif event == WebSocketEvent.CreateBatchElements:
+            await self._handle_create_batch_elements_message(design_project_id, client_id, payload)
+        elif event == WebSocketEvent.UpdateBatchElements:
+            await self._handle_update_batch_elements_message(design_project_id, client_id, payload)
+        elif event == WebSocketEvent.DeleteBatchElements:
+            await self._handle_delete_batch_elements_message(design_project_id, client_id, payload)
+        elif event == WebSocketEvent.ReorderElement:
+            await self._handle_reorder_element_message(design_project_id, client_id, payload)
+        elif event == WebSocketEvent.TransformElements:
+            await self._handle_transform_elements_message(design_project_id, client_id, payload)
+        elif event == WebSocketEvent.AppendPoints:
+            await self._handle_append_points_message(design_project_id, client_id, payload)
         elif event == WebSocketEvent.JoinUserCursor:
             await self._handle_join_user_cursor_message(design_project_id, client_id, payload)
+        elif event == WebSocketEvent.UpdateViewport:
+            await self._handle_update_viewport_message(design_project_id, client_id, payload)
         elif event == WebSocketEvent.UpdateUserCursor:
             return await self._handle_update_user_cursor_message(design_project_id, client_id, payload)
         else:
             error_message = WebSocketMessage.ErrorMessage(
                 payload=WebSocketMessagePayload.ErrorMessagePayload(message="Unknown event")
             )
-            await self._websocket.send_json(error_message.model_dump(mode="json", by_alias=False, exclude_none=True))
+            await self.send_message(design_project_id, error_message)
 
 
 WebsocketHandlerDep = t.Annotated[WebsocketHandler, Depends()]
@@ -326,20 +726,47 @@ async def websocket_client_endpoitn(
     websocket_handler: WebsocketHandlerDep,
     websocket_user_context: WebsocketUserContextDep,
     design_project_id: PyObjectUUID,
+    logger: LoggerDep,
 ) -> None:
+    if owner_url := room_affinity.get_owner_url(design_project_id, websocket):
+        # NOTE: the room lives in another worker, which serves the client through this relay
+        await room_affinity.proxy(websocket, owner_url)
+        return
+
     client_id = websocket_user_context.user_id
     await client_connection_manager.connect(design_project_id, create_client(websocket_user_context), websocket)
     try:
         while True:
             try:
                 message = await websocket.receive_json()
-                await websocket_handler.handle_event(design_project_id, message)
             except json.JSONDecodeError:
                 error_message = WebSocketMessage.ErrorMessage(
                     payload=WebSocketMessagePayload.ErrorMessagePayload(message="Invalid JSON payload")
                 )
-                await websocket_handler.send_message(error_message)
-    except WebSocketDisconnect as e:
+                await websocket_handler.send_message(design_project_id, error_message)
+                continue
+            except (WebSocketDisconnect, RuntimeError):
+                # NOTE: starlette raises a `RuntimeError` when the websocket was closed on this side, e.g. by the
+                # outbound queue of the client on overflow
+                return
+
+            try:
+                await websocket_handler.handle_event(design_project_id, message)
+            except AppException as e:
+                # NOTE: element writes report not found / forbidden / conflicting changes as app exceptions
+                error_message = WebSocketMessage.ErrorMessage(
+                    payload=WebSocketMessagePayload.ErrorMessagePayload(message=e.error_message)
+                )
+                await websocket_handler.send_message(design_project_id, error_message)
+            except Exception as e:
+                # NOTE: one failing event must not end the connection of the client
+                logger.error(f"Failed to handle websocket event of client {client_id}: {e!r}")
+                error_message = WebSocketMessage.ErrorMessage(
+                    payload=WebSocketMessagePayload.ErrorMessagePayload(message="Failed to handle the event")
+                )
+                await websocket_handler.send_message(design_project_id, error_message)
+    finally:
+        # NOTE: however the loop ends, the client leaves its room so that it can join it again
         await websocket_handler.handle_disconnected_client(design_project_id)
         disconnect_message = WebSocketMessage.DisconnectMessage(
             payload=WebSocketMessagePayload.DisconnectMessagePayload(
@@ -0,0 +1,330 @@
+"""
+Vectorized affine transforms of element geometry.
+
+An element is drawn through its node transform `translate(x, y) * rotate * skew * scale`, applying a selection
+transform `M` on top of it gives the node transform `M * node`. The translation part moves `(x, y)`, the linear part
+is decomposed back into rotation, skew and scale so that no element field other than the geometry ones changes.
+Lines and arrows instead get the linear part baked into their `points`, which keeps their stroke width unscaled.
+"""
+
+import datetime
+import math
+import typing as t
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from ..common.models import (
+    APPENDED_POINTS_FIELD,
+    AffineTransformModel,
+    BoundingBox,
+    PackedPoints,
+    ShapeType,
+    get_element_points_array,
+)
+from .bounding_box import compute_bounding_box, get_local_rect
+
+FloatArray = npt.NDArray[np.float64]
+
+# NOTE: lines and arrows keep their node transform and get the transform baked into their points instead
+POINTS_SHAPE_TYPES = (ShapeType.Line, ShapeType.Arrow)
+# NOTE: decomposed skews smaller than this are float noise of pure rotations and scales
+SKEW_EPSILON = 1e-12
+
+
+@dataclass
+class NodeGeometry:
+    """
+    Columns of node transform fields, one row per element.
+    """
+
+    x: FloatArray
+    y: FloatArray
+    rotation: FloatArray
+    scale_x: FloatArray
+    scale_y: FloatArray
+    skew_x: FloatArray
+    skew_y: FloatArray
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+
+def get_linear_matrix(transform: AffineTransformModel) -> FloatArray:
+    return np.array([[transform.a, transform.c], [transform.b, transform.d]], dtype=np.float64)
+
+
+def get_node_linear_matrices(geometry: NodeGeometry) -> FloatArray:
+    """Return the `(n, 2, 2)` stack of the `rotate * skew * scale` matrices of the nodes."""
+    radians = np.radians(geometry.rotation)
+    cos, sin = np.cos(radians), np.sin(radians)
+    matrices = np.empty((len(geometry), 2, 2), dtype=np.float64)
+    matrices[:, 0, 0] = (cos - sin * geometry.skew_y) * geometry.scale_x
+    matrices[:, 1, 0] = (sin + cos * geometry.skew_y) * geometry.scale_x
+    matrices[:, 0, 1] = (cos * geometry.skew_x - sin) * geometry.scale_y
+    matrices[:, 1, 1] = (sin * geometry.skew_x + cos) * geometry.scale_y
+    return matrices
+
+
+def transform_positions(transform: AffineTransformModel, x: FloatArray, y: FloatArray) -> tuple[FloatArray, FloatArray]:
+    return (
+        transform.a * x + transform.c * y + transform.e,
+        transform.b * x + transform.d * y + transform.f,
+    )
+
+
+def transform_node_geometry(transform: AffineTransformModel, geometry: NodeGeometry) -> NodeGeometry:
+    """
+    Apply `transform` on top of the node transforms of `geometry`, decomposing the result as `rotate * skewX * scale`.
+
+    Nodes whose transform is singular (a zero scale) only have their position moved.
+    """
+    x, y = transform_positions(transform, geometry.x, geometry.y)
+    matrices = get_linear_matrix(transform) @ get_node_linear_matrices(geometry)
+    a, b, c, d = matrices[:, 0, 0], matrices[:, 1, 0], matrices[:, 0, 1], matrices[:, 1, 1]
+
+    scale_x = np.hypot(a, b)
+    is_invertible = (scale_x != 0) & (a * d - b * c != 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scale_y = (a * d - b * c) / scale_x
+        skew_x = (a * c + b * d) / (scale_x * scale_y)
+    rotation = np.degrees(np.arctan2(b, a))
+    skew_x = np.where(np.abs(skew_x) < SKEW_EPSILON, 0.0, skew_x)
+
+    return NodeGeometry(
+        x=x,
+        y=y,
+        rotation=np.where(is_invertible, rotation, geometry.rotation),
+        scale_x=np.where(is_invertible, scale_x, geometry.scale_x),
+        scale_y=np.where(is_invertible, scale_y, geometry.scale_y),
+        skew_x=np.where(is_invertible, skew_x, geometry.skew_x),
+        skew_y=np.where(is_invertible, 0.0, geometry.skew_y),
+    )
+
+
+def transform_local_points(
+    transform: AffineTransformModel,
+    geometry: NodeGeometry,
+    points: FloatArray,
+    point_counts: npt.NDArray[np.intp],
+    offsets: FloatArray | None = None,
+) -> FloatArray:
+    """
+    Bake the linear part of `transform` into the local points of the nodes, keeping their node transform.
+
+    `points` holds the `(x, y)` pairs of every node back to back, `point_counts` the number of pairs of each node and
+    `offsets` the `(n, 2)` offsets of the nodes, if any. The points of nodes with a singular transform are returned
+    unchanged.
+    """
+    node_matrices = get_node_linear_matrices(geometry)
+    determinants = np.linalg.det(node_matrices)
+    is_invertible = determinants != 0
+    # NOTE: a node draws `position + node * (point - offset)`, so `node^-1 * M * node` maps the old local points minus
+    # the offset to the new ones minus the offset
+    inverse_node_matrices = np.linalg.inv(np.where(is_invertible[:, None, None], node_matrices, np.eye(2)))
+    local_matrices = inverse_node_matrices @ get_linear_matrix(transform) @ node_matrices
+    local_matrices[~is_invertible] = np.eye(2)
+
+    point_matrices = np.repeat(local_matrices, point_counts, axis=0)
+    if offsets is None:
+        return np.einsum("nij,nj->ni", point_matrices, points.reshape(-1, 2))
+
+    point_offsets = np.repeat(offsets, point_counts, axis=0)
+    return np.einsum("nij,nj->ni", point_matrices, points.reshape(-1, 2) - point_offsets) + point_offsets
+
+
+def transform_local_rects(
+    local_rects: FloatArray, x: FloatArray, y: FloatArray, node_matrices: FloatArray
+) -> FloatArray:
+    """
+    Return the `(n, 4)` canvas bounding boxes `(min_x, min_y, max_x, max_y)` of local rects drawn through node
+    transforms, rows of NaN stay NaN.
+    """
+    centers = (local_rects[:, :2] + local_rects[:, 2:]) / 2
+    half_extents = (local_rects[:, 2:] - local_rects[:, :2]) / 2
+    # NOTE: the box of a transformed rect is its transformed center plus the absolute matrix times its half extents
+    canvas_centers = np.einsum("nij,nj->ni", node_matrices, centers) + np.stack([x, y], axis=1)
+    canvas_half_extents = np.einsum("nij,nj->ni", np.abs(node_matrices), half_extents)
+    return np.concatenate([canvas_centers - canvas_half_extents, canvas_centers + canvas_half_extents], axis=1)
+
+
+def to_float_array(values: t.Iterable[float], count: int) -> FloatArray:
+    return np.fromiter(values, dtype=np.float64, count=count)
+
+
+def _get_float(element_data: t.Mapping[str, t.Any], field: str, default: float) -> float:
+    value = element_data.get(field)
+    # NOTE: exact type checks, `bool` is an `int` and mapping ABC checks are slow on large selections
+    if type(value) is float or type(value) is int:
+        return value
+    return default
+
+
+def _get_vector_component(element_data: dict[str, t.Any], field: str, component: str, default: float) -> float:
+    # NOTE: the flat `scaleX`-like fields win over the `scale` vector, like the Konva setters
+    vector = element_data.get(field)
+    vector_default = _get_float(vector, component, default) if type(vector) is dict else default
+    return _get_float(element_data, f"{field}{component.upper()}", vector_default)
+
+
+def _get_rotation(element_data: dict[str, t.Any]) -> float:
+    return _get_float(element_data, "rotation", _get_float(element_data, "rotationDeg", 0.0))
+
+
+def _get_points(element_data: dict[str, t.Any]) -> npt.NDArray[np.floating] | None:
+    points = get_element_points_array(element_data)
+    if points is None or len(points) == 0 or len(points) % 2 != 0:
+        return None
+    return points
+
+
+def _to_node_geometry(elements_data: list[dict[str, t.Any]]) -> NodeGeometry:
+    count = len(elements_data)
+    return NodeGeometry(
+        x=to_float_array((_get_float(element_data, "x", 0.0) for element_data in elements_data), count),
+        y=to_float_array((_get_float(element_data, "y", 0.0) for element_data in elements_data), count),
+        rotation=to_float_array((_get_rotation(element_data) for element_data in elements_data), count),
+        scale_x=to_float_array(
+            (_get_vector_component(element_data, "scale", "x", 1.0) for element_data in elements_data), count
+        ),
+        scale_y=to_float_array(
+            (_get_vector_component(element_data, "scale", "y", 1.0) for element_data in elements_data), count
+        ),
+        skew_x=to_float_array((_get_float(element_data, "skewX", 0.0) for element_data in elements_data), count),
+        skew_y=to_float_array((_get_float(element_data, "skewY", 0.0) for element_data in elements_data), count),
+    )
+
+
+def _slice_node_geometry(geometry: NodeGeometry, mask: npt.NDArray[np.bool_]) -> NodeGeometry:
+    return NodeGeometry(
+        x=geometry.x[mask],
+        y=geometry.y[mask],
+        rotation=geometry.rotation[mask],
+        scale_x=geometry.scale_x[mask],
+        scale_y=geometry.scale_y[mask],
+        skew_x=geometry.skew_x[mask],
+        skew_y=geometry.skew_y[mask],
+    )
+
+
+def _to_bounding_box_document(bounds: list[float]) -> dict[str, float] | None:
+    if not all(math.isfinite(bound) for bound in bounds):
+        return None
+    min_x, min_y, max_x, max_y = bounds
+    return {"min_x": min_x, "min_y": min_y, "max_x": max_x, "max_y": max_y}
+
+
+def make_transform_updates(
+    elements_data: list[dict[str, t.Any]],
+    transform: AffineTransformModel,
+    updated_at: datetime.datetime,
+) -> tuple[list[dict[str, t.Any]], list[BoundingBox | None]]:
+    """
+    Transform the geometry of element documents in place and return the update and new bounding box of each.
+
+    Node transforms and bounding boxes are computed as columns over the whole selection, only reading the fields and
+    building the updates is done element by element.
+    """
+    geometry = _to_node_geometry(elements_data)
+    points_by_index = {
+        index: points
+        for index, element_data in enumerate(elements_data)
+        if element_data.get("shapeType") in POINTS_SHAPE_TYPES and (points := _get_points(element_data)) is not None
+    }
+    is_points_shape = np.zeros(len(elements_data), dtype=bool)
+    is_points_shape[list(points_by_index)] = True
+    is_node_shape = ~is_points_shape
+
+    transformed_x, transformed_y = transform_positions(transform, geometry.x, geometry.y)
+    transformed_geometry = transform_node_geometry(transform, _slice_node_geometry(geometry, is_node_shape))
+    # NOTE: the local rect of a node only depends on fields the transform leaves alone
+    local_rects = np.array(
+        [
+            get_local_rect(element_data) or (math.nan,) * 4
+            for element_data, is_node in zip(elements_data, is_node_shape)
+            if is_node
+        ],
+        dtype=np.float64,
+    ).reshape(-1, 4)
+    node_bounds = transform_local_rects(
+        local_rects,
+        transformed_x[is_node_shape],
+        transformed_y[is_node_shape],
+        get_node_linear_matrices(transformed_geometry),
+    ).tolist()
+
+    transformed_points: FloatArray = np.empty(0, dtype=np.float64)
+    if points_by_index:
+        point_counts = np.fromiter((len(points) // 2 for points in points_by_index.values()), dtype=np.intp)
+        offsets = np.array(
+            [
+                (
+                    _get_vector_component(elements_data[index], "offset", "x", 0.0),
+                    _get_vector_component(elements_data[index], "offset", "y", 0.0),
+                )
+                for index in points_by_index
+            ],
+            dtype=np.float64,
+        )
+        transformed_points = transform_local_points(
+            transform,
+            _slice_node_geometry(geometry, is_points_shape),
+            np.concatenate(list(points_by_index.values()), dtype=np.float64),
+            point_counts,
+            offsets,
+        ).ravel()
+
+    x_list, y_list = transformed_x.tolist(), transformed_y.tolist()
+    rotations, scales_x, scales_y = (
+        transformed_geometry.rotation.tolist(),
+        transformed_geometry.scale_x.tolist(),
+        transformed_geometry.scale_y.tolist(),
+    )
+    skews_x, skews_y = transformed_geometry.skew_x.tolist(), transformed_geometry.skew_y.tolist()
+
+    updates: list[dict[str, t.Any]] = []
+    bounding_boxes: list[BoundingBox | None] = []
+    node_index = 0
+    points_offset = 0
+    for index, element_data in enumerate(elements_data):
+        fields: dict[str, t.Any] = {"x": x_list[index], "y": y_list[index]}
+        unset_fields: dict[str, t.Any] = {}
+        if is_points_shape[index]:
+            points_count = len(points_by_index[index])
+            fields["points"] = PackedPoints.from_values(
+                transformed_points[points_offset : points_offset + points_count]
+            ).to_binary()
+            points_offset += points_count
+            # NOTE: the appended chunks are folded into the transformed points
+            if APPENDED_POINTS_FIELD in element_data:
+                unset_fields[APPENDED_POINTS_FIELD] = ""
+                element_data.pop(APPENDED_POINTS_FIELD)
+            element_data.update(fields)
+            # NOTE: new points mean a new local rect, lines and arrows are bounded one by one
+            bounding_box = compute_bounding_box(element_data)
+            bounding_box_document = bounding_box.model_dump(by_alias=True) if bounding_box else None
+        else:
+            fields["rotation"] = rotations[node_index]
+            fields["scaleX"] = scales_x[node_index]
+            fields["scaleY"] = scales_y[node_index]
+            if skews_x[node_index] != 0 or "skewX" in element_data:
+                fields["skewX"] = skews_x[node_index]
+            if skews_y[node_index] != 0 or "skewY" in element_data:
+                fields["skewY"] = skews_y[node_index]
+            # NOTE: the flat fields now carry the whole node transform
+            unset_fields = {field: "" for field in ("scale", "rotationDeg") if field in element_data}
+            for field in unset_fields:
+                element_data.pop(field)
+            element_data.update(fields)
+            bounding_box_document = _to_bounding_box_document(node_bounds[node_index])
+            # NOTE: the bounds are ordered by construction, validating tens of thousands of boxes would dominate
+            bounding_box = BoundingBox.model_construct(**bounding_box_document) if bounding_box_document else None
+            node_index += 1
+
+        update: dict[str, t.Any] = {"$set": {**fields, "bbox": bounding_box_document, "updated_at": updated_at}}
+        if unset_fields:
+            update["$unset"] = unset_fields
+        updates.append(update)
+        bounding_boxes.append(bounding_box)
+    return updates, bounding_boxes
@@ -0,0 +1,228 @@
+"""
+Axis-aligned bounding boxes of design elements, computed the way Konva lays the shapes out.
+
+The local box of a shape is mapped through the node transform (translate, rotate, skew, scale, then offset) and the
+box of its four transformed corners is kept, so rotated and scaled elements stay fully covered.
+"""
+
+import math
+import typing as t
+
+import numpy as np
+
+from ..common.models import APPENDED_POINTS_FIELD, BoundingBox, ElementModel, ShapeType, get_element_points_array
+
+# NOTE: any change of these fields can move or resize an element, the others never affect its bounding box
+GEOMETRY_FIELDS = frozenset(
+    {
+        "shapeType",
+        "x",
+        "y",
+        "width",
+        "height",
+        "scale",
+        "scaleX",
+        "scaleY",
+        "skewX",
+        "skewY",
+        "rotation",
+        "rotationDeg",
+        "offset",
+        "offsetX",
+        "offsetY",
+        "radius",
+        "radiusX",
+        "radiusY",
+        "innerRadius",
+        "outerRadius",
+        "points",
+        APPENDED_POINTS_FIELD,
+        "pointerLength",
+        "pointerWidth",
+        "strokeWidth",
+        "strokeEnabled",
+        "text",
+        "fontSize",
+        "lineHeight",
+        "padding",
+    }
+)
+
+# NOTE: Konva draws text with a 12px font and a line height of 1 unless told otherwise
+DEFAULT_FONT_SIZE = 12.0
+DEFAULT_LINE_HEIGHT = 1.0
+
+Rect = tuple[float, float, float, float]
+
+
+def _get_number(element_data: t.Mapping[str, t.Any], field: str) -> float | None:
+    value = element_data.get(field)
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+        return None
+    return float(value)
+
+
+def _get_vector_component(element_data: t.Mapping[str, t.Any], field: str, component: str) -> float | None:
+    # NOTE: the flat `scaleX`-like fields win over the `scale` vector, like the Konva setters
+    value = _get_number(element_data, f"{field}{component.upper()}")
+    if value is not None:
+        return value
+    vector = element_data.get(field)
+    if vector is not None and isinstance(vector, t.Mapping):
+        return _get_number(vector, component)
+    return None
+
+
+def _get_radius_rect(radius: float | None) -> Rect | None:
+    if radius is None:
+        return None
+    return (-radius, -radius, radius, radius)
+
+
+def _get_points_rect(element_data: t.Mapping[str, t.Any]) -> Rect | None:
+    points = get_element_points_array(element_data)
+    if points is None or len(points) < 2 or not np.isfinite(points).all():
+        return None
+    xs, ys = points[0::2], points[1::2]
+    return (float(xs.min()), float(ys.min()), float(xs.max()), float(ys.max()))
+
+
+def _get_text_rect(element_data: t.Mapping[str, t.Any]) -> Rect | None:
+    width = _get_number(element_data, "width")
+    if width is None:
+        # NOTE: auto-sized text depends on font metrics, it is left unbounded
+        return None
+    height = _get_number(element_data, "height")
+    if height is None:
+        text = element_data.get("text")
+        line_count = text.count("\n") + 1 if isinstance(text, str) else 1
+        font_size = _get_number(element_data, "fontSize") or DEFAULT_FONT_SIZE
+        line_height = _get_number(element_data, "lineHeight") or DEFAULT_LINE_HEIGHT
+        padding = _get_number(element_data, "padding") or 0.0
+        height = line_count * font_size * line_height + 2 * padding
+    return (0.0, 0.0, width, height)
+
+
+def _get_self_rect(element_data: t.Mapping[str, t.Any]) -> Rect | None:
+    shape_type = element_data.get("shapeType")
+    if shape_type in (ShapeType.Circle, ShapeType.RegularPolygon):
+        radius = _get_number(element_data, "radius")
+        if radius is None and (width := _get_number(element_data, "width")) is not None:
+            radius = width / 2
+        return _get_radius_rect(radius)
+    if shape_type == ShapeType.Ellipse:
+        radius_x = _get_number(element_data, "radiusX")
+        radius_y = _get_number(element_data, "radiusY")
+        if radius_x is None or radius_y is None:
+            return None
+        return (-radius_x, -radius_y, radius_x, radius_y)
+    if shape_type in (ShapeType.Ring, ShapeType.Star):
+        return _get_radius_rect(_get_number(element_data, "outerRadius"))
+    if shape_type in (ShapeType.Line, ShapeType.Arrow):
+        rect = _get_points_rect(element_data)
+        if rect is None or shape_type == ShapeType.Line:
+            return rect
+        # NOTE: arrow heads stick out of the points by up to their length or half their width
+        pointer = max(
+            _get_number(element_data, "pointerLength") or 0.0, (_get_number(element_data, "pointerWidth") or 0.0) / 2
+        )
+        return (rect[0] - pointer, rect[1] - pointer, rect[2] + pointer, rect[3] + pointer)
+    if shape_type == ShapeType.Text:
+        return _get_text_rect(element_data)
+
+    width = _get_number(element_data, "width")
+    height = _get_number(element_data, "height")
+    if width is None or height is None:
+        return None
+    return (min(0.0, width), min(0.0, height), max(0.0, width), max(0.0, height))
+
+
+def get_local_rect(element_data: t.Mapping[str, t.Any]) -> Rect | None:
+    """
+    Return the box an element covers in its own coordinates, stroke included and moved by its offset, i.e. the box
+    its node transform maps onto the canvas.
+    """
+    rect = _get_self_rect(element_data)
+    if rect is None:
+        return None
+    min_x, min_y, max_x, max_y = rect
+
+    if element_data.get("strokeEnabled") is not False:
+        half_stroke_width = (_get_number(element_data, "strokeWidth") or 0.0) / 2
+        min_x, min_y, max_x, max_y = (
+            min_x - half_stroke_width,
+            min_y - half_stroke_width,
+            max_x + half_stroke_width,
+            max_y + half_stroke_width,
+        )
+
+    offset_x = _get_vector_component(element_data, "offset", "x") or 0.0
+    offset_y = _get_vector_component(element_data, "offset", "y") or 0.0
+    return (min_x - offset_x, min_y - offset_y, max_x - offset_x, max_y - offset_y)
+
+
+def compute_bounding_box(element_data: t.Mapping[str, t.Any]) -> BoundingBox | None:
+    """
+    Compute the canvas bounding box of an element document, keyed by field aliases.
+
+    Returns `None` when the extent of the element cannot be known from its fields, such elements are treated as
+    visible in every viewport.
+    """
+    rect = get_local_rect(element_data)
+    if rect is None:
+        return None
+    min_x, min_y, max_x, max_y = rect
+
+    x = _get_number(element_data, "x") or 0.0
+    y = _get_number(element_data, "y") or 0.0
+    rotation = _get_number(element_data, "rotation")
+    if rotation is None:
+        rotation = _get_number(element_data, "rotationDeg") or 0.0
+    scale_x = _get_vector_component(element_data, "scale", "x")
+    scale_y = _get_vector_component(element_data, "scale", "y")
+    skew_x = _get_number(element_data, "skewX") or 0.0
+    skew_y = _get_number(element_data, "skewY") or 0.0
+
+    # NOTE: the linear part of translate(x, y) * rotate * skew * scale
+    radians = math.radians(rotation)
+    cos, sin = math.cos(radians), math.sin(radians)
+    scale_x = 1.0 if scale_x is None else scale_x
+    scale_y = 1.0 if scale_y is None else scale_y
+    a = (cos + -sin * skew_y) * scale_x
+    b = (sin + cos * skew_y) * scale_x
+    c = (cos * skew_x - sin) * scale_y
+    d = (sin * skew_x + cos) * scale_y
+
+    corners = [(corner_x, corner_y) for corner_x in (min_x, max_x) for corner_y in (min_y, max_y)]
+    xs = [x + a * corner_x + c * corner_y for corner_x, corner_y in corners]
+    ys = [y + b * corner_x + d * corner_y for corner_x, corner_y in corners]
+    if not all(math.isfinite(coordinate) for coordinate in (*xs, *ys)):
+        return None
+    return BoundingBox(min_x=min(xs), min_y=min(ys), max_x=max(xs), max_y=max(ys))
+
+
+def compute_element_bounding_box(element: ElementModel) -> BoundingBox | None:
+    return compute_bounding_box(element.model_dump(by_alias=True, exclude_none=True))
+
+
+def to_bounding_box_document(element_data: t.Mapping[str, t.Any]) -> dict[str, float] | None:
+    bounding_box = compute_bounding_box(element_data)
+    return bounding_box.model_dump(by_alias=True) if bounding_box else None
+
+
+def make_viewport_filter(viewport: BoundingBox) -> dict[str, t.Any]:
+    """
+    Match the elements whose stored bounding box intersects `viewport`, plus the unbounded ones.
+    """
+    return {
+        "$or": [
+            # NOTE: `null` also matches elements stored before bounding boxes existed
+            {"bbox.min_x": None},
+            {
+                "bbox.min_x": {"$lte": viewport.max_x},
+                "bbox.max_x": {"$gte": viewport.min_x},
+                "bbox.min_y": {"$lte": viewport.max_y},
+                "bbox.max_y": {"$gte": viewport.min_y},
+            },
+        ]
+    }
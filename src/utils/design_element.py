@@ -1,9 +1,13 @@
 import typing as t
 from dataclasses import dataclass
+from uuid import UUID
 
 import pydantic as p
+from pymongo import DESCENDING
 
 from ..common.models import (
+    APPENDED_POINTS_FIELD,
+    ELEMENT_MODEL_BY_SHAPE_TYPE,
     ArrowModel,
     BaseArrowModel,
     BaseCircleModel,
@@ -21,6 +25,7 @@ from ..common.models import (
     EllipseModel,
     ImageModel,
     LineModel,
+    PackedPoints,
     RectangleModel,
     RegularPolygonModel,
     RingModel,
@@ -28,7 +33,10 @@ from ..common.models import (
     ShapeType,
     StarModel,
     TextModel,
+    get_element_points_array,
 )
+from .bounding_box import to_bounding_box_document
+from .fractional_index import generate_n_keys_between, is_valid_order_key
 
 
 @dataclass(frozen=True)
@@ -136,3 +144,83 @@ def create_element(base_element: BaseElementModel) -> ElementModel | None:
         return RegularPolygonModel(**base_element.model_dump())
 
     return None
+
+
+ELEMENT_TYPE_ADAPTER: p.TypeAdapter[ElementModel] = p.TypeAdapter(ElementModel)
+
+
+def to_element_document(element: ElementModel, project_id: UUID, organization_id: UUID) -> dict[str, t.Any]:
+    """
+    Dump an element into its `design_elements` document.
+
+    The organization is stored next to the project so element reads and writes can be authorized by their own filter,
+    and the bounding box is derived from the geometry so viewport reads can be served by an index.
+    """
+    element_data = element.model_dump(by_alias=True, exclude_none=True)
+    return {
+        **element_data,
+        "bbox": to_bounding_box_document(element_data),
+        "project_id": project_id,
+        "organization_id": organization_id,
+    }
+
+
+def to_element(element_data: t.Mapping[str, t.Any]) -> ElementModel:
+    if element_data.get(APPENDED_POINTS_FIELD):
+        # NOTE: points appended while drawing are only folded back into the document now and then
+        points = get_element_points_array(element_data)
+        element_data = {field: value for field, value in element_data.items() if field != APPENDED_POINTS_FIELD}
+        if points is not None:
+            element_data["points"] = PackedPoints.from_values(points)
+    return ELEMENT_TYPE_ADAPTER.validate_python(element_data)
+
+
+# NOTE: front-most elements first, elements created before order keys existed come last
+ELEMENT_ORDER_SORT: list[tuple[str, int]] = [("order_key", DESCENDING), ("created_at", DESCENDING)]
+
+# NOTE: fields owned by the server, a full element update never overwrites them
+PRESERVED_ELEMENT_FIELDS = frozenset({"_id", "order_key", "created_at"})
+
+# NOTE: the appended points are replaced along with the points they extend
+ELEMENT_FIELD_ALIASES = (
+    frozenset(
+        field.alias or name
+        for element_model in ELEMENT_MODEL_BY_SHAPE_TYPE.values()
+        for name, field in element_model.model_fields.items()
+    )
+    | {APPENDED_POINTS_FIELD}
+) - PRESERVED_ELEMENT_FIELDS
+
+
+def to_element_update(element: ElementModel, project_id: UUID, organization_id: UUID) -> dict[str, t.Any]:
+    """
+    Build the update replacing every element field of a stored element while keeping its server-owned fields.
+    """
+    element_document = {
+        field: value
+        for field, value in to_element_document(element, project_id, organization_id).items()
+        if field not in PRESERVED_ELEMENT_FIELDS
+    }
+    update: dict[str, t.Any] = {"$set": element_document}
+    unset_fields = {field: "" for field in ELEMENT_FIELD_ALIASES if field not in element_document}
+    if unset_fields:
+        update["$unset"] = unset_fields
+    return update
+
+
+def with_order_keys(elements: t.Sequence[ElementModel], back_order_key: str | None = None) -> list[ElementModel]:
+    """
+    Give front-to-back `elements` descending order keys above `back_order_key`.
+
+    Elements that already carry an order key keep it when all of them carry a valid one, so copies keep their
+    stacking. Otherwise every element gets a fresh key, a malformed key from a client would break every later key
+    generation of the project.
+    """
+    if all(element.order_key is not None and is_valid_order_key(element.order_key) for element in elements):
+        return list(elements)
+
+    order_keys = generate_n_keys_between(back_order_key, None, len(elements))
+    return [
+        element.model_copy(update={"order_key": order_key})
+        for element, order_key in zip(elements, reversed(order_keys))
+    ]
@@ -0,0 +1,178 @@
+"""
+Fractional indexing: order keys that always leave room for another key between any two of them.
+
+Keys are base 62 strings made of a variable length integer part, whose length is encoded by its first character, and
+a fractional part without trailing zeros. They compare correctly as plain strings, so MongoDB can sort and index them,
+and inserting an element anywhere only ever writes the key of that element.
+
+Port of https://observablehq.com/@dgreensp/implementing-fractional-indexing.
+"""
+
+BASE_62_DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+SMALLEST_INTEGER = "A" + BASE_62_DIGITS[0] * 26
+ZERO_KEY = "a" + BASE_62_DIGITS[0]
+
+
+def _midpoint(a: str, b: str | None) -> str:
+    """Return a fractional part strictly between `a` and `b`, where `None` stands for 1."""
+    zero = BASE_62_DIGITS[0]
+    if b is not None and a >= b:
+        raise ValueError(f"{a!r} is not less than {b!r}")
+    if a.endswith(zero) or (b is not None and b.endswith(zero)):
+        raise ValueError("Fractional part has a trailing zero")
+
+    if b:
+        # NOTE: keep the common prefix, padding `a` with zeros
+        n = 0
+        while (a[n] if n < len(a) else zero) == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = BASE_62_DIGITS.index(a[0]) if a else 0
+    digit_b = BASE_62_DIGITS.index(b[0]) if b is not None else len(BASE_62_DIGITS)
+    if digit_b - digit_a > 1:
+        # NOTE: rounds half up like `Math.round` so that keys match the ones the reference implementation makes
+        return BASE_62_DIGITS[(digit_a + digit_b + 1) // 2]
+
+    if b is not None and len(b) > 1:
+        return b[:1]
+    return BASE_62_DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def _get_integer_length(head: str) -> int:
+    if "a" <= head <= "z":
+        return ord(head) - ord("a") + 2
+    if "A" <= head <= "Z":
+        return ord("Z") - ord(head) + 2
+    raise ValueError(f"Invalid order key head {head!r}")
+
+
+def _get_integer_part(key: str) -> str:
+    integer_length = _get_integer_length(key[0])
+    if integer_length > len(key):
+        raise ValueError(f"Invalid order key {key!r}")
+    return key[:integer_length]
+
+
+def _increment_integer(integer: str) -> str | None:
+    head, digits = integer[0], list(integer[1:])
+    for i in reversed(range(len(digits))):
+        digit = BASE_62_DIGITS.index(digits[i]) + 1
+        if digit < len(BASE_62_DIGITS):
+            digits[i] = BASE_62_DIGITS[digit]
+            return head + "".join(digits)
+        digits[i] = BASE_62_DIGITS[0]
+
+    if head == "Z":
+        return "a" + BASE_62_DIGITS[0]
+    if head == "z":
+        return None
+    next_head = chr(ord(head) + 1)
+    if next_head > "a":
+        digits.append(BASE_62_DIGITS[0])
+    else:
+        digits.pop()
+    return next_head + "".join(digits)
+
+
+def _decrement_integer(integer: str) -> str | None:
+    head, digits = integer[0], list(integer[1:])
+    for i in reversed(range(len(digits))):
+        digit = BASE_62_DIGITS.index(digits[i]) - 1
+        if digit >= 0:
+            digits[i] = BASE_62_DIGITS[digit]
+            return head + "".join(digits)
+        digits[i] = BASE_62_DIGITS[-1]
+
+    if head == "a":
+        return "Z" + BASE_62_DIGITS[-1]
+    if head == "A":
+        return None
+    previous_head = chr(ord(head) - 1)
+    if previous_head < "Z":
+        digits.append(BASE_62_DIGITS[-1])
+    else:
+        digits.pop()
+    return previous_head + "".join(digits)
+
+
+def validate_order_key(key: str) -> None:
+    if not key or key == SMALLEST_INTEGER or any(char not in BASE_62_DIGITS for char in key):
+        raise ValueError(f"Invalid order key {key!r}")
+    integer = _get_integer_part(key)
+    if key[len(integer) :].endswith(BASE_62_DIGITS[0]):
+        raise ValueError(f"Invalid order key {key!r}")
+
+
+def is_valid_order_key(key: str) -> bool:
+    try:
+        validate_order_key(key)
+    except ValueError:
+        return False
+    return True
+
+
+def generate_key_between(a: str | None, b: str | None) -> str:
+    """Return an order key strictly between `a` and `b`, `None` meaning the start or the end of the list."""
+    if a is not None:
+        validate_order_key(a)
+    if b is not None:
+        validate_order_key(b)
+    if a is not None and b is not None and a >= b:
+        raise ValueError(f"{a!r} is not less than {b!r}")
+
+    if a is None:
+        if b is None:
+            return ZERO_KEY
+        integer_b = _get_integer_part(b)
+        fraction_b = b[len(integer_b) :]
+        if integer_b == SMALLEST_INTEGER:
+            return integer_b + _midpoint("", fraction_b)
+        if integer_b < b:
+            return integer_b
+        decremented = _decrement_integer(integer_b)
+        if decremented is None:
+            raise ValueError("Cannot generate an order key before the smallest one")
+        return decremented
+
+    integer_a = _get_integer_part(a)
+    fraction_a = a[len(integer_a) :]
+    if b is None:
+        incremented = _increment_integer(integer_a)
+        return integer_a + _midpoint(fraction_a, None) if incremented is None else incremented
+
+    integer_b = _get_integer_part(b)
+    fraction_b = b[len(integer_b) :]
+    if integer_a == integer_b:
+        return integer_a + _midpoint(fraction_a, fraction_b)
+    incremented = _increment_integer(integer_a)
+    if incremented is None:
+        raise ValueError("Cannot generate an order key after the largest one")
+    if incremented < b:
+        return incremented
+    return integer_a + _midpoint(fraction_a, None)
+
+
+def generate_n_keys_between(a: str | None, b: str | None, n: int) -> list[str]:
+    """Return `n` ascending order keys strictly between `a` and `b`, keeping them as short as possible."""
+    if n <= 0:
+        return []
+    if n == 1:
+        return [generate_key_between(a, b)]
+
+    if b is None:
+        keys = [generate_key_between(a, None)]
+        for _ in range(n - 1):
+            keys.append(generate_key_between(keys[-1], None))
+        return keys
+
+    if a is None:
+        keys = [generate_key_between(None, b)]
+        for _ in range(n - 1):
+            keys.append(generate_key_between(None, keys[-1]))
+        return list(reversed(keys))
+
+    middle = n // 2
+    key = generate_key_between(a, b)
+    return [*generate_n_keys_between(a, key, middle), key, *generate_n_keys_between(key, b, n - middle - 1)]